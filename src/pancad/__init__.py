@@ -1,3 +1,6 @@
 """A CAD (Computer-Aided Design) File Translator"""
 
-from pancad.io.api import read_freecad
+from pancad.io.api import (
+    convert_freecad_many, read_freecad, read_freecad_incremental,
+    read_freecad_many
+)
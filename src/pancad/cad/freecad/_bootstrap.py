@@ -2,6 +2,7 @@
 application.
 """
 
+from functools import cache
 from logging import getLogger
 from pathlib import Path
 from platform import system
@@ -10,7 +11,9 @@ from importlib.util import find_spec
 from tkinter import messagebox, filedialog
 import tomllib
 
-from pancad.utils.initialize import get_user_config, get_cache, write_cache
+from pancad.utils.initialize import (
+    get_user_config, get_cache, get_cache_path, write_cache
+)
 
 FREECAD_TOML = Path(find_spec("pancad.resources").origin).parent / "freecad.toml"
 FREECAD = "freecad"
@@ -22,6 +25,17 @@ FREECAD_PYD = "FreeCAD.pyd"
 
 logger = getLogger(__name__)
 
+_discovered: dict[bool, tuple[tuple[int, int, int] | None, Path]] = {}
+"""The validated application directory found by get_app_dir in this process,
+keyed by search_environment, with the stamp of the cache file it was found with.
+"""
+
+@cache
+def _load_freecad_config() -> dict:
+    """Returns the contents of pancad's freecad config file."""
+    with open(FREECAD_TOML, "rb") as file:
+        return tomllib.load(file)
+
 def _check_freecad_config() -> str:
     """Returns the settings inside the pancad freecad config file.
     
@@ -29,8 +43,7 @@ def _check_freecad_config() -> str:
     :raises FileNotFoundError: If none of the defaults are directories or if the 
         freecad config file is missing.
     """
-    with open(FREECAD_TOML, "rb") as file:
-        system_defaults = tomllib.load(file)[DEFAULT_INSTALL]
+    system_defaults = _load_freecad_config()[DEFAULT_INSTALL]
     try:
         defaults = system_defaults[system()]
     except KeyError as err:
@@ -44,17 +57,26 @@ def get_app_dir(search_environment: bool=False) -> Path:
     """Returns the freecad application directory. Checks whether the directory 
     is valid. Updates the cache if the directory doesn't match the one in the 
     cache.
+
+    The validated directory is reused by later calls in the same process until 
+    the cache file is replaced or the directory no longer contains FreeCAD, so 
+    repeated calls only stat two files.
     
     :param search_environment: Sets whether to look in the user's PATH.
     """
+    if (found := _discovered.get(search_environment)) is not None:
+        stamp, path = found
+        if stamp == _get_cache_stamp() and (path / FREECAD_PYD).exists():
+            return path
     path = find_app_dir(search_environment)
     path = _validate_app_path(path)
-    cache = get_cache()
-    stored = cache.setdefault(APPLICATION_PATHS, {}).setdefault(FREECAD, "")
+    cache_ = get_cache()
+    stored = cache_.setdefault(APPLICATION_PATHS, {}).setdefault(FREECAD, "")
     if str(path) != stored:
         # Update cache with new path
-        cache.setdefault(APPLICATION_PATHS, {})[FREECAD] = str(path)
-        write_cache(cache)
+        cache_.setdefault(APPLICATION_PATHS, {})[FREECAD] = str(path)
+        write_cache(cache_)
+    _discovered[search_environment] = (_get_cache_stamp(), path)
     return path
 
 def find_app_dir(search_environment: bool=False) -> Path:
@@ -110,6 +132,16 @@ def find_app_dir(search_environment: bool=False) -> Path:
                     )
                     return _ask_for_freecad()
 
+def _get_cache_stamp() -> tuple[int, int, int] | None:
+    """Returns a stamp of the cache file that changes whenever it is replaced,
+    or None if there is no cache file.
+    """
+    try:
+        stat = get_cache_path().stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
 def _ask_for_freecad() -> Path:
     """Asks the user for the bin path. Exits pancad if they cancel.
     
@@ -157,8 +189,7 @@ def _correct_install_dir(path: Path) -> Path:
     rather than the bin directory and modifies the path to the bin directory 
     if necessary.
     """
-    with open(FREECAD_TOML, "rb") as file:
-        install_dir = tomllib.load(file)[FOLDERS][INSTALL_DIR]
+    install_dir = _load_freecad_config()[FOLDERS][INSTALL_DIR]
     if path.name in install_dir:
         path = path / "bin"
     return path
@@ -4,9 +4,11 @@ FreeCAD.
 from __future__ import annotations
 
 from collections import deque
+from dataclasses import dataclass, field
 from functools import singledispatch
+from itertools import groupby
+from operator import itemgetter
 from typing import TYPE_CHECKING
-from math import pi, cos, sin
 import warnings
 import logging
 
@@ -32,10 +34,14 @@ from pancad.filetypes.part_file import PartFile
 from pancad.cad.freecad import api_utils
 from pancad.cad.freecad.api_utils import FreeCADConstraintGeoRef
 from pancad.cad.freecad import xml_utils
+from pancad.cad.freecad import write_xml
+from pancad.cad.freecad.translation_map import TranslationMap
+from pancad.cad.freecad.translation_registry import FEATURE_TRANSLATORS
 from pancad.cad.freecad.xml_utils import FreeCADUID
+from pancad.cad.freecad._xml_translation import (
+    constraint_from_freecad, geometry_from_freecad_arrays
+)
 from pancad.cad.freecad.constants import (
-    ConstraintType as CT,
-    ConstraintSubPart as CSP,
     InternalGeometryType as IGT,
     PadType as PT,
 )
@@ -55,7 +61,6 @@ from pancad.cad.freecad._application_types import (
 from pancad.cad.freecad.api import freecad, freecad_sketcher, freecad_part
 
 if TYPE_CHECKING:
-    from typing import Literal
     from collections.abc import Container, Collection
 
     from pancad.abstract import AbstractConstraint, PancadThing
@@ -63,15 +68,17 @@ if TYPE_CHECKING:
     from pancad.cad.freecad._application_types import (
         FreeCADDocument, FreeCADPlacement, FreeCADConstraint,
     )
+    from pancad.cad.freecad.xml_geometry_arrays import GeometryListArrays
     from pancad.cad.freecad.read_xml import (
         FCStd,
-        FreeCADConstraintXML,
         FreeCADDocumentXML,
-        FreeCADGeometryXML,
-        FreeCADLink,
         FreeCADObjectXML,
-        ConstraintGeoRef,
     )
+    from pancad.cad.freecad.xml_properties import (
+        FreeCADConstraintXML,
+        FreeCADGeometryXML,
+    )
+    from pancad.cad.freecad.xml_utils import ConstraintGeoRef, FreeCADLink
 
 logger = logging.getLogger(__name__)
 
@@ -90,8 +97,55 @@ def new_placement_from_pose(pose: Pose) -> FreeCADPlacement:
 ################################################################################
 # FreeCAD ---> pancad Features
 ################################################################################
+@dataclass
+class FreeCADTranslation:
+    """A PartFile translated from a FreeCAD file, along with what is needed to
+    translate a later version of the same file incrementally.
+
+    :param part: The translated PartFile.
+    :param uid_map: The map from FreeCAD uids to the pancad things they were
+        translated into. FreeCAD objects are indexed by their type.
+    :param fingerprints: The fingerprint of each FreeCAD object in the file by
+        its uid.
+    :param features: The pancad feature translated from each FreeCAD feature by
+        the FreeCAD feature's uid, in translation order.
+    :param object_uids: The uids each translated FreeCAD feature added to the
+        uid_map, by the FreeCAD feature's uid.
+    """
+    part: PartFile
+    uid_map: TranslationMap[FreeCADUID, PancadThing]
+    fingerprints: dict[FreeCADUID, str]
+    features: dict[FreeCADUID, AbstractFeature] = field(default_factory=dict)
+    object_uids: dict[FreeCADUID, list[FreeCADUID]] = field(default_factory=dict)
+
 def new_part_from_document(file: FCStd) -> PartFile:
     """Returns a new PartFile from a FreeCAD FCStd file"""
+    return translate_document(file).part
+
+def translate_document(file: FCStd, previous: FreeCADTranslation=None
+                       ) -> FreeCADTranslation:
+    """Translates a FreeCAD FCStd file into a PartFile. When the translation of
+    an earlier version of the same file is provided, only the objects whose xml
+    changed and the objects depending on them are translated again. The pancad
+    features of every other object are reused.
+
+    Changes to objects that are not translated as features, like the Body or its
+    Origin, and added objects fall back to translating the whole file.
+
+    :param file: The FCStd file to translate.
+    :param previous: The translation of an earlier version of the file. Its part
+        and uid_map are updated in place, so it must not be used afterwards,
+        including when the translation raises an exception.
+    :raises ValueError: When the FreeCAD file is using features that pancad
+        recognizes but cannot parse.
+    :raises NotImplementedError: When the FreeCAD file is using known
+        unsupported application features.
+    """
+    fingerprints = file.document.get_fingerprints()
+    if previous is not None:
+        stale = _get_stale_features(file, previous, fingerprints)
+        if stale is not None:
+            return _update_translation(file, previous, fingerprints, stale)
     part = PartFile(file.metadata.label)
     object_uids = deque(file.get_topo_uids())
     top = file.get_by_uid(object_uids.popleft())
@@ -99,49 +153,111 @@ def new_part_from_document(file: FCStd) -> PartFile:
         msg = (f"Incompatible with PartFile: FCStd starts with {top.type_},"
                " expected a PartDesign::Body.")
         raise ValueError(msg)
-    uid_map = {file.uid: part}
+    uid_map = TranslationMap({file.uid: part})
     map_container_from_freecad(top, part, uid_map)
-    while object_uids:
-        uid = object_uids.popleft()
+    translation = FreeCADTranslation(part, uid_map, fingerprints)
+    _translate_features(file, object_uids, translation)
+    return translation
+
+def _translate_features(file: FCStd, uids: Collection[FreeCADUID],
+                        translation: FreeCADTranslation) -> None:
+    """Translates the file's objects into features in the order of the uids,
+    recording the uids each one adds to the translation's uid_map. Objects
+    already in the uid_map are skipped.
+    """
+    uid_map = translation.uid_map
+    for uid in uids:
         if uid in uid_map:
             continue
         obj = file.get_by_uid(uid)
-        try:
-            new_feature_from_freecad(obj, uid_map)
-        except (ValueError, NotImplementedError) as exc:
-            msg = (f"On FreeCAD Object type {obj.type_} named '{obj.name}',"
-                   f" labeled '{obj.label}'")
-            exc.add_note(msg)
-            raise
-    return part
+        with uid_map.transaction():
+            try:
+                feature = new_feature_from_freecad(obj, uid_map)
+            except (ValueError, NotImplementedError) as exc:
+                msg = (f"On FreeCAD Object type {obj.type_} named"
+                       f" '{obj.name}', labeled '{obj.label}'")
+                exc.add_note(msg)
+                raise
+            translation.features[uid] = feature
+            translation.object_uids[uid] = uid_map.get_added_keys()
+
+def _get_stale_features(file: FCStd, previous: FreeCADTranslation,
+                        fingerprints: dict[FreeCADUID, str]
+                        ) -> set[FreeCADUID] | None:
+    """Returns the uids of the previously translated features that have to be
+    translated again: the changed and removed ones and every feature depending
+    on them. Returns None when the whole file has to be translated again.
+    """
+    if file.uid not in previous.uid_map:
+        return None # Not a version of the same file
+    changed = {uid for uid, fingerprint in fingerprints.items()
+               if previous.fingerprints.get(uid) != fingerprint}
+    changed.update(previous.fingerprints.keys() - fingerprints.keys())
+    if any(uid not in previous.features for uid in changed):
+        return None
+    document = file.document
+    stale_names = set()
+    for name in document.get_topo_order():
+        obj = document.get_object(name)
+        if obj.uid in changed or document.get_object_parents(name) & stale_names:
+            stale_names.add(name)
+    changed.update(document.get_object(name).uid for name in stale_names)
+    return changed
+
+def _update_translation(file: FCStd, previous: FreeCADTranslation,
+                        fingerprints: dict[FreeCADUID, str],
+                        stale: set[FreeCADUID]) -> FreeCADTranslation:
+    """Removes the stale features from the previous translation, then
+    translates their current versions into the same PartFile.
+    """
+    uid_map = previous.uid_map
+    # Remove in reverse translation order so dependents are removed first
+    for uid in reversed(list(previous.features)):
+        if uid not in stale:
+            continue
+        _remove_feature(previous.features.pop(uid))
+        for owned_uid in previous.object_uids.pop(uid):
+            del uid_map[owned_uid]
+    previous.part.name = file.metadata.label
+    translation = FreeCADTranslation(previous.part, uid_map, fingerprints,
+                                     previous.features, previous.object_uids)
+    _translate_features(file, [uid for uid in file.get_topo_uids()
+                               if uid in stale], translation)
+    return translation
+
+def _remove_feature(feature: AbstractFeature) -> None:
+    """Removes a feature and the constraints on it from its system."""
+    system = feature.system
+    for constraint in system.get_constraints_on(feature):
+        system.constraints.remove(constraint)
+    system.features.remove(feature)
 
 def new_feature_from_freecad(feature: FreeCADObjectXML,
-                             uid_map: dict[FreeCADUID, PancadThing]
+                             uid_map: TranslationMap[FreeCADUID, PancadThing]
                              ) -> AbstractFeature:
     """Creates a new pancad feature from a FreeCAD one and adds it to the
-    PartFile.
+    PartFile. Dispatches on the FreeCAD object type through FEATURE_TRANSLATORS.
+
+    :raises NotImplementedError: When no translator is registered for the type.
     """
-    type_to_func = {
-        "Sketcher::SketchObject": _sketch_from_freecad,
-        "PartDesign::Pad": _extrude_from_freecad,
-    }
-    try:
-        func = type_to_func[feature.type_]
-    except KeyError as exc:
-        msg = f"Object translation for {feature.type_} has not been implemented."
-        raise NotImplementedError(msg) from exc
-    return func(feature, uid_map)
+    return FEATURE_TRANSLATORS.translate(feature.type_, feature, uid_map)
 
+@FEATURE_TRANSLATORS.register("Sketcher::SketchObject", default=True)
 def _sketch_from_freecad(feature: FreeCADObjectXML,
-                         uid_map: dict[FreeCADUID, PancadThing]
+                         uid_map: TranslationMap[FreeCADUID, PancadThing]
                          ) -> Sketch:
-    new_uids = uid_map.copy() # Copy so it's still possible to error out.
+    with uid_map.transaction(): # Rolled back if the sketch errors out.
+        return _map_sketch_from_freecad(feature, uid_map)
+
+def _map_sketch_from_freecad(feature: FreeCADObjectXML,
+                             uid_map: TranslationMap[FreeCADUID, PancadThing]
+                             ) -> Sketch:
     sketch = Sketch(name=feature.get_property("Label").value)
-    new_uids[feature.uid] = sketch
+    uid_map.add(feature.uid, sketch, feature.type_)
 
     # Find the pancad equivalent support from FreeCAD objects
     fc_plane = _get_sketch_support(feature)
-    body = _get_origin_feature_body(fc_plane, new_uids)
+    body = _get_origin_feature_body(fc_plane, uid_map)
     container = uid_map[body.uid]
     plane = uid_map[fc_plane.uid]
 
@@ -157,14 +273,14 @@ def _sketch_from_freecad(feature: FreeCADObjectXML,
                         sketch.pose.coordinate_system),
     ]
     container.feature_system.constraints.extend(feature_constraints)
-    _add_sketch_geometry_from_freecad(feature, sketch, new_uids)
-    _add_sketch_constraints_from_freecad(feature, sketch, new_uids)
-    uid_map.update(new_uids)
+    _add_sketch_geometry_from_freecad(feature, sketch, uid_map)
+    _add_sketch_constraints_from_freecad(feature, sketch, uid_map)
     return sketch
 
 def _add_sketch_geometry_from_freecad(fc_sketch: FreeCADObjectXML,
                                       pc_sketch: Sketch,
-                                      uid_map: dict[FreeCADUID, PancadThing]
+                                      uid_map: TranslationMap[FreeCADUID,
+                                                              PancadThing]
                                       ) -> None:
     """Creates pancad sketch geometry from FreeCAD geometry and adds it to the
     uid_map.
@@ -175,14 +291,16 @@ def _add_sketch_geometry_from_freecad(fc_sketch: FreeCADObjectXML,
         raise NotImplementedError(msg)
     for i in range(0, 2): # Map 2D Coordinate System
         uid_map[fc_ext_geo[i].uid] = pc_sketch.geometry_system.coordinate_system
-    for fc_geo in fc_sketch.get_property("Geometry").value:
-        pc_geo = geometry_from_freecad(fc_geo)
+    fc_geometry = fc_sketch.get_property("Geometry")
+    pc_geometry = geometry_from_freecad_arrays(fc_geometry.get_geometry_arrays())
+    for fc_geo, pc_geo in zip(fc_geometry.value, pc_geometry):
         uid_map[fc_geo.uid] = pc_geo
-        pc_sketch.geometry_system.geometry.append(pc_geo)
+    pc_sketch.geometry_system.geometry.extend(pc_geometry)
 
 def _add_sketch_constraints_from_freecad(fc_sketch: FreeCADObjectXML,
                                          pc_sketch: Sketch,
-                                         uid_map: dict[FreeCADUID, PancadThing]
+                                         uid_map: TranslationMap[FreeCADUID,
+                                                                 PancadThing]
                                          ) -> None:
     """Creates pancad sketch constraints from FreeCAD constraints and adds it to
     the uid_map.
@@ -205,7 +323,7 @@ def _get_sketch_support(sketch: FreeCADObjectXML) -> FreeCADObjectXML:
     return sketch.document.get_object(support.name)
 
 def _get_origin_feature_body(feature: FreeCADObjectXML,
-                             uid_map: dict[FreeCADUID, PancadThing]
+                             uid_map: TranslationMap[FreeCADUID, PancadThing]
                              ) -> FreeCADObjectXML:
     """Returns the body containing the origin subfeature."""
     origin = None
@@ -221,17 +339,14 @@ def _get_origin_feature_body(feature: FreeCADObjectXML,
             return obj
     raise ValueError(f"No Body found with origin '{origin.name}'")
 
+@FEATURE_TRANSLATORS.register("PartDesign::Pad", default=True)
 def _extrude_from_freecad(feature: FreeCADObjectXML,
-                          uid_map: dict[FreeCADUID, PancadThing]
+                          uid_map: TranslationMap[FreeCADUID, PancadThing]
                           ) -> Extrude:
     # Determine the equivalent FeatureType.
     pc_type = _get_extrude_type_from_freecad(feature)
     settings_params = {"type_": pc_type, "unit": "mm"} # FreeCAD always uses mm
-    prop_map = {
-        "length": "Length", "opposite_length": "Length2",
-        "taper_angle": "TaperAngle", "opposite_taper_angle": "TaperAngle2"
-    }
-    for pc_prop, fc_prop in prop_map.items():
+    for pc_prop, fc_prop in _EXTRUDE_PROPERTIES.items():
         settings_params[pc_prop] = feature.get_property(fc_prop).value
     settings = ExtrudeSettings(**settings_params)
     profile_link = feature.get_property("Profile").value
@@ -251,34 +366,42 @@ def _extrude_from_freecad(feature: FreeCADObjectXML,
 
 def _get_extrude_type_from_freecad(extrude: FreeCADObjectXML) -> FT:
     """Returns the equivalent pancad extrude type from a freecad pad type."""
-    reversible = {PT.LENGTH, PT.TWO_LENGTHS}
-    midplanable = {PT.LENGTH}
     fc_type = PT(extrude.get_property("Type").value)
     key = [fc_type]
-    if fc_type in reversible:
+    if fc_type in _REVERSIBLE_PAD_TYPES:
         key.append(extrude.get_property("Reversed").value)
-    if fc_type in midplanable:
+    if fc_type in _MIDPLANABLE_PAD_TYPES:
         key.append(extrude.get_property("Midplane").value)
-    type_map = {
-        # PadType, is_reversed, is_midplane
-        (PT.LENGTH, False, False): FT.DIMENSION,
-        (PT.LENGTH, True, False): FT.ANTI_DIMENSION,
-        (PT.LENGTH, True, True): FT.SYMMETRIC,
-        (PT.LENGTH, False, True): FT.SYMMETRIC,
-        # PadType, is_reversed
-        (PT.TWO_LENGTHS, False): FT.TWO_DIMENSIONS,
-        (PT.TWO_LENGTHS, True): FT.ANTI_TWO_DIMENSIONS,
-    }
     try:
-        return type_map[tuple(key)]
+        return _PAD_TYPES[tuple(key)]
     except KeyError as exc:
         msg = f"No equivalent type found for freecad pad type {fc_type.name}"
-        if fc_type in reversible:
+        if fc_type in _REVERSIBLE_PAD_TYPES:
             msg = msg + f", Reversed: {extrude.get_property('Reversed').value}"
-        if fc_type in midplanable:
+        if fc_type in _MIDPLANABLE_PAD_TYPES:
             msg = msg + f", Midplane: {extrude.get_property('Midplane').value}"
         raise ValueError(msg) from exc
 
+_EXTRUDE_PROPERTIES = {
+    "length": "Length", "opposite_length": "Length2",
+    "taper_angle": "TaperAngle", "opposite_taper_angle": "TaperAngle2"
+}
+"""The FreeCAD Pad property of each pancad ExtrudeSettings parameter."""
+_REVERSIBLE_PAD_TYPES = frozenset({PT.LENGTH, PT.TWO_LENGTHS})
+_MIDPLANABLE_PAD_TYPES = frozenset({PT.LENGTH})
+_PAD_TYPES = {
+    # PadType, is_reversed, is_midplane
+    (PT.LENGTH, False, False): FT.DIMENSION,
+    (PT.LENGTH, True, False): FT.ANTI_DIMENSION,
+    (PT.LENGTH, True, True): FT.SYMMETRIC,
+    (PT.LENGTH, False, True): FT.SYMMETRIC,
+    # PadType, is_reversed
+    (PT.TWO_LENGTHS, False): FT.TWO_DIMENSIONS,
+    (PT.TWO_LENGTHS, True): FT.ANTI_TWO_DIMENSIONS,
+}
+"""The pancad FeatureType of each FreeCAD PadType and its Reversed and Midplane
+properties, when they apply to the PadType.
+"""
 
 def in_links(feature: FreeCADObjectXML, links: Collection[FreeCADLink]) -> bool:
     """Returns whether a FreeCAD Object is in a Collection fo FreeCADLinks"""
@@ -294,14 +417,20 @@ def get_typed_objects(types: str | Container[str],
 
     :param type_: A string or a Container of FreeCAD object TypeIds.
     :param doc: A FreeCAD document.
-    :param uids: A Container of FreeCADUIDs.
+    :param uids: A Container of FreeCADUIDs. When it is a TranslationMap, its
+        type index is used instead of checking every object in the document.
     :param empty_allowed: Whether the list can be empty and valid.
     :raises ValueError: When not_empty is False and there are no objects of the
         type in the document while also having a uid in the uids Container.
     """
     if isinstance(types, str):
         types = {types}
-    objects = [o for o in doc.objects if o.type_ in types and o.uid in uids]
+    if isinstance(uids, TranslationMap):
+        objects = [doc.get_object(uid.data.feature_id)
+                   for uid in uids.get_typed_keys(*types)]
+    else:
+        objects = [o for o in doc.objects
+                   if o.type_ in types and o.uid in uids]
     if objects or empty_allowed:
         return objects
     msg = (f"No objects of the types in '{types}' found with a uid in"
@@ -309,24 +438,24 @@ def get_typed_objects(types: str | Container[str],
     raise ValueError(msg)
 
 def map_container_from_freecad(feature: FreeCADObjectXML, part: PartFile,
-                               uid_map: dict[FreeCADUID, PancadThing]
+                               uid_map: TranslationMap[FreeCADUID, PancadThing]
                                ) -> None:
     """Maps the PartFile's top level container to a FreeCAD Body."""
     container = part.container
-    new_uids = {feature.uid: container}
-
-    origin = feature.document.get_object(
-        feature.get_property("Origin").value.name
-    )
-    _map_origin_features_from_freecad(origin, container, new_uids)
-    placement = feature.get_property("Placement").value
-    container.pose.rotate(placement.quat)
-    container.pose.move_to_point(placement.location)
-    uid_map.update(new_uids)
+    with uid_map.transaction():
+        uid_map.add(feature.uid, container, feature.type_)
+        origin = feature.document.get_object(
+            feature.get_property("Origin").value.name
+        )
+        _map_origin_features_from_freecad(origin, container, uid_map)
+        placement = feature.get_property("Placement").value
+        container.pose.rotate(placement.quat)
+        container.pose.move_to_point(placement.location)
 
 def _map_origin_features_from_freecad(origin: FreeCADObjectXML,
                                       container: FeatureContainer,
-                                      uid_map: dict[FreeCADUID, PancadThing]
+                                      uid_map: TranslationMap[FreeCADUID,
+                                                              PancadThing]
                                       ) -> None:
     """Maps the origin and its origin features to a feature container and adds
     them to the uid map.
@@ -345,7 +474,9 @@ def _map_origin_features_from_freecad(origin: FreeCADObjectXML,
         except KeyError as exc:
             msg = f"No '{map_name}' found in Origin '{origin.name}'"
             raise ValueError(msg) from exc
-        uid_map[sub_feat.uid] = container.feature_system.get_reference(reference)
+        uid_map.add(sub_feat.uid,
+                    container.feature_system.get_reference(reference),
+                    sub_feat.type_)
 
 
 ################################################################################
@@ -357,35 +488,44 @@ def new_document_from_part(part: PartFile) -> FreeCADDocument:
     api_utils.relabel_object(document, part.name)
 
     uid_map = {part.uid: api_utils.read_document_uid(document)}
-    new_feature_from_pancad(part.container, document, uid_map)
+    index = api_utils.DocumentIndex(document)
+    new_feature_from_pancad(part.container, document, uid_map, index)
     return document
 
 def new_feature_from_pancad(feature: AbstractFeature,
                             document: FreeCADDocument,
-                            uid_map: dict[str, FreeCADUID]) -> FreeCADFeature:
+                            uid_map: dict[str, FreeCADUID],
+                            index: api_utils.DocumentIndex | None=None
+                            ) -> FreeCADFeature:
     """Creates a new FreeCAD Feature from a pancad feature and adds it to the
     provided uid_map.
+
+    :param index: An index of the document to look up uids with. Created from
+        the document if None.
     """
-    funcs = [
-        (FeatureContainer, _new_body_from_container),
-        (Sketch, _new_sketch_from_pancad_sketch),
-        (Extrude, _new_pad_from_pancad_extrude),
-    ]
-    try:
-        feature_func = next(f for f in funcs if isinstance(feature, f[0]))[1]
-    except StopIteration as exc:
+    feature_func = _PANCAD_FEATURE_FUNCS.get(type(feature))
+    if feature_func is None:
+        # Subclasses of the supported features use their base class' function
+        feature_func = next((_PANCAD_FEATURE_FUNCS[cls]
+                             for cls in type(feature).__mro__
+                             if cls in _PANCAD_FEATURE_FUNCS), None)
+    if feature_func is None:
         msg = f"Unsupported feature type '{feature.__class__}'"
-        raise TypeError(msg, feature) from exc
-    return feature_func(feature, document, uid_map)
+        raise TypeError(msg, feature)
+    if index is None:
+        index = api_utils.DocumentIndex(document)
+    return feature_func(feature, document, uid_map, index)
 
 def _new_body_from_container(feature: FeatureContainer,
                              document: FreeCADDocument,
-                             uid_map: dict[str, FreeCADUID]) -> FreeCADBody:
+                             uid_map: dict[str, FreeCADUID],
+                             index: api_utils.DocumentIndex) -> FreeCADBody:
     """Adds a new body to the FreeCADDocument from a FeatureContainer"""
     if feature.uid in uid_map:
         msg = "pancad uid of container already in uid map"
         raise ValueError(msg, feature)
     body = document.addObject("PartDesign::Body")
+    index.add_objects(body, body.Origin, *body.Origin.OriginFeatures)
     api_utils.relabel_object(body, feature.name)
 
     body.Placement = new_placement_from_pose(feature.pose)
@@ -417,12 +557,13 @@ def _new_body_from_container(feature: FeatureContainer,
 
     # Moving deeper down into to the subfeatures
     for sub_feature in system.features:
-        new_feature_from_pancad(sub_feature, document, uid_map)
+        new_feature_from_pancad(sub_feature, document, uid_map, index)
     return body
 
 def _new_sketch_from_pancad_sketch(feature: Sketch,
                                    document: FreeCADDocument,
-                                   uid_map: dict[str, FreeCADUID]
+                                   uid_map: dict[str, FreeCADUID],
+                                   index: api_utils.DocumentIndex
                                    ) -> FreeCADSketch:
     # Get relevant pancad mapping info
     fc_parent_uid = uid_map[feature.system.feature.uid]
@@ -430,9 +571,10 @@ def _new_sketch_from_pancad_sketch(feature: Sketch,
 
     # Add equivalent objects to freecad
     fc_sketch = document.addObject("Sketcher::SketchObject")
+    index.add_objects(fc_sketch)
     api_utils.relabel_object(fc_sketch, feature.name)
-    api_utils.get_by_uid(fc_parent_uid, document).addObject(fc_sketch)
-    fc_sketch.AttachmentSupport = api_utils.get_by_uid(fc_plane_uid, document)
+    index.get_by_uid(fc_parent_uid).addObject(fc_sketch)
+    fc_sketch.AttachmentSupport = index.get_by_uid(fc_plane_uid)
     fc_sketch.MapMode = "FlatFace"
 
     new_uid_map_items = {}
@@ -443,28 +585,28 @@ def _new_sketch_from_pancad_sketch(feature: Sketch,
         (0, geo_sys.x_axis),
         (1, geo_sys.y_axis),
     ]
-    for index, pc_geo in sys_pairs:
-        fc_geo = fc_sketch.ExternalGeo[index]
-        new_uid_map_items[pc_geo.uid] = api_utils.read_geometry_uid(
-            fc_geo, "ExternalGeo", fc_sketch, document
-        )
+    external_uids = index.read_geometry(fc_sketch, "ExternalGeo")
+    for geo_index, pc_geo in sys_pairs:
+        new_uid_map_items[pc_geo.uid] = external_uids[geo_index]
     new_uid_map_items[feature.uid] = api_utils.read_feature_uid(fc_sketch,
                                                                 document)
     uid_map.update(new_uid_map_items)
-    _add_sketch_geometry_from_pancad(feature, document, uid_map)
-    _add_sketch_constraints_from_pancad(feature, document, uid_map)
+    references = _add_sketch_geometry_from_pancad(feature, uid_map, index)
+    _add_sketch_constraints_from_pancad(feature, uid_map, index, references)
     return fc_sketch
 
 def _new_pad_from_pancad_extrude(feature: Extrude,
                                  document: FreeCADDocument,
-                                 uid_map: dict[str, FreeCADUID]) -> FreeCADPad:
+                                 uid_map: dict[str, FreeCADUID],
+                                 index: api_utils.DocumentIndex) -> FreeCADPad:
     fc_parent_uid = uid_map[feature.system.feature.uid]
     fc_profile_uid = uid_map[feature.profile.uid]
-    fc_profile = api_utils.get_by_uid(fc_profile_uid, document)
+    fc_profile = index.get_by_uid(fc_profile_uid)
 
     pad = document.addObject("PartDesign::Pad")
+    index.add_objects(pad)
     api_utils.relabel_object(pad, feature.name)
-    api_utils.get_by_uid(fc_parent_uid, document).addObject(pad)
+    index.get_by_uid(fc_parent_uid).addObject(pad)
     pad.Profile = fc_profile
 
     if feature.unit is None:
@@ -481,14 +623,7 @@ def _new_pad_from_pancad_extrude(feature: Extrude,
     pad.TaperAngle2 = f"{feature.opposite_taper_angle} {angle_unit}"
     pad.UseCustomVector = False
     pad.ReferenceAxis = (fc_profile, ["N_Axis"])
-    pad_type_map = { # Type name, Reversed bool, Midplane bool
-        FT.DIMENSION: ("Length", False, False),
-        FT.ANTI_DIMENSION: ("Length", True, False),
-        FT.SYMMETRIC: ("Length", False, True),
-        FT.TWO_DIMENSIONS: ("TwoLengths", False, False),
-        FT.ANTI_TWO_DIMENSIONS: ("TwoLengths", True, False),
-    }
-    pad.Type, pad.Reversed, pad.Midplane = pad_type_map[feature.type_]
+    pad.Type, pad.Reversed, pad.Midplane = _FREECAD_PAD_TYPES[feature.type_]
 
     pad.UpToFace = None
     pad.Offset = 0
@@ -497,45 +632,95 @@ def _new_pad_from_pancad_extrude(feature: Extrude,
     uid_map[feature.uid] = api_utils.read_feature_uid(pad, document)
     return pad
 
+_FREECAD_PAD_TYPES = { # Type name, Reversed bool, Midplane bool
+    FT.DIMENSION: ("Length", False, False),
+    FT.ANTI_DIMENSION: ("Length", True, False),
+    FT.SYMMETRIC: ("Length", False, True),
+    FT.TWO_DIMENSIONS: ("TwoLengths", False, False),
+    FT.ANTI_TWO_DIMENSIONS: ("TwoLengths", True, False),
+}
+"""The FreeCAD Pad Type, Reversed and Midplane values of each FeatureType."""
+_PANCAD_FEATURE_FUNCS = {
+    FeatureContainer: _new_body_from_container,
+    Sketch: _new_sketch_from_pancad_sketch,
+    Extrude: _new_pad_from_pancad_extrude,
+}
+"""Functions creating FreeCAD features from each type of pancad feature."""
 
 def _add_sketch_geometry_from_pancad(sketch: Sketch,
-                                     document: FreeCADDocument,
-                                     uid_map: dict[str, FreeCADUID]
-                                     ) -> FreeCADSketch:
+                                     uid_map: dict[str, FreeCADUID],
+                                     index: api_utils.DocumentIndex
+                                     ) -> dict[str, tuple[int, str]]:
     """Adds all the sketch geometry in a pancad sketch to the mapped FreeCAD
-    sketch.
+    sketch. The geometry is added in as few calls as possible since every call
+    recomputes the sketch.
+
+    :returns: The constraint reference index and FreeCAD geometry tag of the
+        sketch's coordinate system and geometry, keyed by pancad uid.
     """
-    fc_sketch = api_utils.get_by_uid(uid_map[sketch.uid], document)
+    fc_sketch = index.get_by_uid(uid_map[sketch.uid])
 
     system = sketch.geometry_system
-    new_uid_map_items = {}
-    for pc_geo, is_construction in zip(system.geometry, system.construction):
-        fc_geo = pancad_to_freecad_geometry(pc_geo)
-        fc_sketch.addGeometry(fc_geo, is_construction)
-        new_uid_map_items[pc_geo.uid] = api_utils.read_geometry_uid(
-            fc_geo, "Geometry", fc_sketch, document
+    fc_geometry = _new_freecad_geometry_list(system.geometry)
+    # addGeometry takes one construction flag per call, so consecutive
+    # geometry with the same flag is added together to keep the order.
+    indices = []
+    pairs = zip(fc_geometry, system.construction)
+    for is_construction, group in groupby(pairs, key=itemgetter(1)):
+        indices.extend(
+            fc_sketch.addGeometry([fc_geo for fc_geo, _ in group],
+                                  is_construction)
         )
+
+    references = write_xml.get_sketch_references(sketch)
+    geometry_uids = index.read_geometry(fc_sketch, "Geometry")
+    for pc_geo, geo_index in zip(system.geometry, indices):
+        uid_map[pc_geo.uid] = geometry_uids[geo_index]
+        references[pc_geo.uid] = (geo_index, references[pc_geo.uid][1])
+    return references
+
+def _new_freecad_geometry_list(geometry: list[AbstractGeometry]
+                               ) -> list[FreeCADGeometry]:
+    """Returns the FreeCAD geometry equivalent to each pancad sketch geometry.
+
+    :raises NotImplementedError: When the geometry includes an Ellipse.
+    """
+    fc_geometry = []
+    for pc_geo in geometry:
+        fc_geo = pancad_to_freecad_geometry(pc_geo)
         if fc_geo.TypeId == "Part::GeomEllipse":
             msg = "Ellipse mapping hasn't been implemented yet. See #235"
             raise NotImplementedError(msg, fc_geo)
-    uid_map.update(new_uid_map_items)
-    return fc_sketch
+        fc_geometry.append(fc_geo)
+    return fc_geometry
 
 def _add_sketch_constraints_from_pancad(sketch: Sketch,
-                                        document: FreeCADDocument,
-                                        uid_map: dict[str, FreeCADUID]
+                                        uid_map: dict[str, FreeCADUID],
+                                        index: api_utils.DocumentIndex,
+                                        references: dict[str, tuple[int, str]]
                                         ) -> FreeCADSketch:
     """Adds all the sketch constraints in a pancad sketch to the mapped FreeCAD
-    sketch.
+    sketch in a single call.
+
+    :param references: The output of _add_sketch_geometry_from_pancad.
     """
-    fc_sketch = api_utils.get_by_uid(uid_map[sketch.uid], document)
-    new_uid_map_items = {}
-    for pc_cons in sketch.geometry_system.constraints:
-        fc_cons = new_constraint_from_pancad(pc_cons, document, uid_map)
-        fc_sketch.addConstraint(fc_cons)
-        fc_cons_uid = api_utils.read_constraint_uid(fc_cons, fc_sketch, document)
-        new_uid_map_items[pc_cons.uid] = fc_cons_uid
-    uid_map.update(new_uid_map_items)
+    fc_sketch = index.get_by_uid(uid_map[sketch.uid])
+    constraints = sketch.geometry_system.constraints
+    definitions = []
+    for pc_cons in constraints:
+        refs = [write_xml.get_constraint_ref(g, references)
+                for g in pc_cons.get_geometry()]
+        definitions.append(write_xml.get_constraint_definition(pc_cons, refs))
+    fc_sketch.addConstraint(
+        [_new_freecad_constraint(pc_cons, definition)
+         for pc_cons, definition in zip(constraints, definitions)]
+    )
+    fc_cons_uids = index.add_constraints(
+        fc_sketch, [(int(d.type_), d.pairs) for d in definitions]
+    )
+    uid_map.update(
+        {pc_cons.uid: uid for pc_cons, uid in zip(constraints, fc_cons_uids)}
+    )
     return fc_sketch
 
 ################################################################################
@@ -570,105 +755,38 @@ def _circular_arc(arc: CircularArc) -> FreeCADCircularArc:
     center = freecad.Vector(tuple(arc.center) + (0,))
     normal = freecad.Vector((0, 0, 1))
     circle =  freecad_part.Circle(center, normal, arc.radius)
-
-    if arc.is_clockwise:
-        # All FreeCAD circular arcs are drawn counterclockwise
-        end = arc.start_angle
-        start = arc.end_angle
-    else:
-        start = arc.start_angle
-        end = arc.end_angle
-
-    # FreeCAD's circular arc angles are all positive
-    if start < 0:
-        start += 2 * pi
-    if end < 0:
-        end += 2 * pi
-    if end < start:
-        # FreeCAD forces the end angle to be larger than the start angle
-        end += 2 * pi
+    start, end = write_xml.get_arc_angles(arc)
     return freecad_part.ArcOfCircle(circle, start, end)
 
 ################################################################################
 # pancad ---> FreeCAD Constraints
 ################################################################################
 
-def get_constraint_type_from_pancad(constraint: AbstractConstraint) -> CT:
-    """Returns the equivalent FreeCAD constraint type from pancad constraints"""
-    type_map = {
-        SC.ANGLE: CT.ANGLE,
-        SC.DISTANCE: CT.DISTANCE,
-        SC.DISTANCE_HORIZONTAL: CT.DISTANCE_X,
-        SC.DISTANCE_VERTICAL: CT.DISTANCE_Y,
-        SC.DISTANCE_DIAMETER: CT.DIAMETER,
-        SC.DISTANCE_RADIUS: CT.RADIUS,
-        SC.EQUAL: CT.EQUAL,
-        SC.HORIZONTAL: CT.HORIZONTAL,
-        SC.PARALLEL: CT.PARALLEL,
-        SC.PERPENDICULAR: CT.PERPENDICULAR,
-        SC.VERTICAL: CT.VERTICAL,
-    }
-    if constraint.type_name in type_map: # One-to-one checks
-        return type_map[constraint.type_name]
-    if constraint.type_name == SC.TANGENT:
-        msg = "Tangent constraints aren't available for translation yet."
-        raise NotImplementedError(msg, constraint)
-
-    geometries = constraint.get_geometry()
-    if constraint.type_name == SC.COINCIDENT:
-        if all(isinstance(g, Point) for g in geometries):
-            return CT.COINCIDENT
-        if any(isinstance(g, Point) for g in geometries):
-            return CT.POINT_ON_OBJECT
-        return CT.TANGENT
-    msg = f"Unrecognized constraint type '{constraint.__class__}'"
-    raise TypeError(msg, constraint)
-
 def new_constraint_from_pancad(constraint: AbstractConstraint,
                                document: FreeCADDocument,
-                               uid_map: dict[str, FreeCADUID]) -> FreeCADConstraint:
+                               uid_map: dict[str, FreeCADUID],
+                               index: api_utils.DocumentIndex | None=None
+                               ) -> FreeCADConstraint:
     """Creates a new FreeCAD Constraint from a pancad constraint and adds it to
     the provided uid_map.
-    """
-    input_map = {
-        # If present, the integer is the number of points in the references.
-        CT.ANGLE: "quadrant_order",
-        CT.COINCIDENT: "original_order",
-        CT.DIAMETER: "indexes_only",
-        CT.RADIUS: "indexes_only",
-        CT.EQUAL: "indexes_only",
-        CT.HORIZONTAL: "indexes_only",
-        CT.VERTICAL: "indexes_only",
-        CT.PARALLEL: "indexes_only",
-        CT.PERPENDICULAR: "indexes_only",
-        CT.POINT_ON_OBJECT: "points_first",
-        (CT.TANGENT, 0): "indexes_only",
-        (CT.TANGENT, 1): "points_first",
-        (CT.TANGENT, 2): "original_order",
-        (CT.DISTANCE, 0): "bugged_distance",
-        (CT.DISTANCE_X, 0): "bugged_distance",
-        (CT.DISTANCE_Y, 0): "bugged_distance",
-        (CT.DISTANCE, 1): "points_first",
-        (CT.DISTANCE_X, 1): "points_first",
-        (CT.DISTANCE_Y, 1): "points_first",
-        (CT.DISTANCE, 2): "original_order",
-        (CT.DISTANCE_X, 2): "original_order",
-        (CT.DISTANCE_Y, 2): "original_order",
-    }
-    type_ = get_constraint_type_from_pancad(constraint)
-    key = _get_constraint_write_key(constraint, document, uid_map)
-    try:
-        input_type = input_map[key]
-    except KeyError as exc:
-        msg = f"Unsupported constraint type and/or point count: {key}"
-        raise NotImplementedError(msg) from exc
 
-    refs = [get_constraint_pair_from_pancad(g, document, uid_map)
+    :param index: An index of the document to look up uids with. Created from
+        the document if None.
+    """
+    if index is None:
+        index = api_utils.DocumentIndex(document)
+    refs = [get_constraint_pair_from_pancad(g, document, uid_map, index)
             for g in constraint.get_geometry()]
-
-    indicies = _get_freecad_constraint_indices(
-        input_type, refs, getattr(constraint, "quadrant", None)
-    )
+    definition = write_xml.get_constraint_definition(constraint, refs)
+    return _new_freecad_constraint(constraint, definition)
+
+def _new_freecad_constraint(constraint: AbstractConstraint,
+                            definition: write_xml.ConstraintDefinition
+                            ) -> FreeCADConstraint:
+    """Creates a new FreeCAD Constraint from a pancad constraint and its FreeCAD
+    definition.
+    """
+    type_, indicies, _ = definition
     pc_value = getattr(constraint, "value", None)
     if pc_value is None:
         return freecad_sketcher.Constraint(type_.human_name, *indicies)
@@ -678,71 +796,19 @@ def new_constraint_from_pancad(constraint: AbstractConstraint,
     return freecad_sketcher.Constraint(type_.human_name, *indicies,
                                        freecad.Units.Quantity(f"{pc_value} {unit}"))
 
-def _get_freecad_constraint_indices(
-            input_type: Literal["quadrant_order", "original_order",
-                                "indexes_only", "points_first",
-                                "bugged_distance"],
-            refs: list[FreeCADConstraintGeoRef],
-            quadrant: Literal[1, 2, 3, 4]=None
-        ) -> list[int]:
-    """Returns the list of indicies FreeCAD requires for constraint definition.
-
-    :param input_type: A string for the reading type required for the references
-    :param refs: The geometry reference pairs read from pancad objects.
-    :param quadrant: The quadrant of an angle constraint. Should be None if not
-        an angle.
-    :raises ValueError: When input_type or quadrant is an unexpected value.
-    """
-    match input_type:
-        case "indexes_only":
-            return [r.index for r in refs]
-        case "original_order":
-            return [i for r in refs for i in r.pair]
-        case "points_first":
-            sorted_refs = sorted(refs, key=lambda r: int(r.is_point),
-                                 reverse=True)
-            first, second = sorted_refs
-            return [first.index, first.part, second.index]
-        case "bugged_distance":
-            first, second = refs
-            return [first.index, CSP.START, second.index]
-        case "quadrant_order":
-            first, second = refs
-            quadrant_map = {
-                1: (first.index, CSP.START, second.index, CSP.START),
-                2: (second.index, CSP.START, first.index, CSP.END),
-                3: (first.index, CSP.END, second.index, CSP.START),
-                4: (second.index, CSP.START, first.index, CSP.START),
-            }
-            try:
-                return quadrant_map[quadrant]
-            except KeyError as exc:
-                msg = f"Unexpected value for angle quadrant: {quadrant}"
-                raise ValueError(msg) from exc
-    raise ValueError(f"Unexpected input type '{input_type}'")
-
-def _get_constraint_write_key(constraint: AbstractConstraint,
-                              document: FreeCADDocument,
-                              uid_map: dict[str, FreeCADUID]
-                              ) -> CT | tuple[CT, int]:
-    """Returns a key to dispatch how to write the constraint to FreeCAD."""
-    # Some constraint types in FreeCAD depend on the # of points in the refs
-    point_dependent = {CT.TANGENT, CT.DISTANCE, CT.DISTANCE_X, CT.DISTANCE_Y}
-    type_ = get_constraint_type_from_pancad(constraint)
-    if type_ in point_dependent:
-        refs = []
-        for geo in constraint.get_geometry():
-            refs.append(get_constraint_pair_from_pancad(geo, document, uid_map))
-        return (type_, [r.is_point for r in refs].count(True))
-    return type_
-
 def get_constraint_pair_from_pancad(geometry: AbstractGeometry,
                                     document: FreeCADDocument,
-                                    uid_map: dict[str, FreeCADUID]
+                                    uid_map: dict[str, FreeCADUID],
+                                    index: api_utils.DocumentIndex | None=None
                                     ) -> FreeCADConstraintGeoRef:
     """Finds the equivalent constraint index and edge sub part to constrain the
     pancad equivalent geometry in FreeCAD.
+
+    :param index: An index of the document to look up uids with. Created from
+        the document if None.
     """
+    if index is None:
+        index = api_utils.DocumentIndex(document)
     # The FreeCAD UID is mapped directly to the geometry or the parent geometry.
     # Get the geometry uid and the api geometry element.
     if geometry.uid in uid_map:
@@ -753,193 +819,13 @@ def get_constraint_pair_from_pancad(geometry: AbstractGeometry,
         except KeyError as exc:
             msg = "Neither the geometry or parent geometry is in the uid_map"
             raise LookupError(msg, geometry) from exc
-    fc_geo = api_utils.get_by_uid(fc_geo_uid, document)
+    fc_geo = index.get_by_uid(fc_geo_uid)
     geo_type = api_utils.get_geometry_type(fc_geo)
 
-    # Get the sub part corresponding to the geometry and its parent.
-    if geo_type == "GeomPoint":
-        sub_part_key = (geometry.self_reference, geo_type)
-    elif getattr(geometry, "is_clockwise", False):
-        sub_part_key = (geometry.self_reference, "clockwise")
-    else:
-        sub_part_key = geometry.self_reference
-    sub_part_map = {
-        CR.CORE: CSP.EDGE,
-        CR.ORIGIN: CSP.START, # Sketch Origin is at start of x-axis.
-        CR.X_MIN: CSP.START,
-        CR.Y_MIN: CSP.START,
-        CR.X_MAX: CSP.END,
-        CR.Y_MAX: CSP.END,
-        CR.X: CSP.EDGE, # Either sketch or ellipse x-axis.
-        CR.Y: CSP.EDGE, # Either sketch or ellipse y-axis.
-        CR.CENTER: CSP.CENTER,
-        CR.START: CSP.START,
-        CR.END: CSP.END,
-        # Standalone Points are always START.
-        (CR.CORE, "GeomPoint"): CSP.START,
-        # All FreeCAD arcs are counterclockwise. Clockwise arcs must be reversed
-        (CR.START, "clockwise"): CSP.END,
-        (CR.END, "clockwise"): CSP.START,
-    }
-    ref_index = api_utils.get_reference_index_by_uid(fc_geo_uid, document)
-    sub_part = sub_part_map[sub_part_key]
+    ref_index = index.get_reference_index(fc_geo_uid)
+    sub_part = write_xml.get_constraint_sub_part(geometry, geo_type)
     return FreeCADConstraintGeoRef(ref_index, sub_part, geo_type)
 
-################################################################################
-# FreeCAD ---> pancad Geometry
-################################################################################
-
-def geometry_from_freecad(data: FreeCADGeometryXML) -> AbstractGeometry:
-    """Creates a pancad geometry object from a FreeCAD object."""
-    tag_funcs = {
-        "Part::GeomPoint": _from_freecad_point,
-        "Part::GeomLineSegment": _from_freecad_line_segment,
-        "Part::GeomArcOfCircle": _from_freecad_circular_arc,
-        "Part::GeomCircle": _from_freecad_circle,
-        "Part::GeomEllipse": _from_freecad_ellipse,
-    }
-    try:
-        func = tag_funcs[data.type_]
-    except KeyError as exc:
-        msg = f"Sketch geometry type {data.type_} is not supported yet"
-        raise NotImplementedError(msg) from exc
-    return func(data)
-
-def _from_freecad_point(data: FreeCADGeometryXML) -> Point:
-    return Point(data.geometry.location)
-
-def _from_freecad_line_segment(data: FreeCADGeometryXML) -> LineSegment:
-    return LineSegment(data.geometry.start, data.geometry.end)
-
-def _from_freecad_circle(data: FreeCADGeometryXML) -> Circle:
-    return Circle(data.geometry.center, data.geometry.radius)
-
-def _from_freecad_circular_arc(data: FreeCADGeometryXML) -> CircularArc:
-    geo = data.geometry
-    start_vector = (cos(geo.start_angle), sin(geo.start_angle))
-    end_vector = (cos(geo.end_angle), sin(geo.end_angle))
-    return CircularArc(geo.center, geo.radius, start_vector, end_vector, False)
-
-def _from_freecad_ellipse(data: FreeCADGeometryXML) -> Ellipse:
-    geo = data.geometry
-    return Ellipse.from_angle(geo.center, geo.major_radius, geo.minor_radius,
-                              geo.major_axis_angle)
-
-################################################################################
-# FreeCAD ---> pancad Constraints
-################################################################################
-
-def constraint_from_freecad(constraint: FreeCADConstraintXML,
-                            uid_map: dict[xml_utils.FreeCADUID, PancadThing]
-                            ) -> AbstractConstraint:
-    """Returns a pancad constraint from a FreeCAD constraint."""
-    pc_type = sketch_constraint_from_freecad(constraint)
-    pc_geometry = []
-    for geo_ref in constraint.get_references():
-        pc_ref = reference_from_freecad(geo_ref)
-        fc_geo, _ = geo_ref.get_geometry()
-        if fc_geo.internal_type != IGT.NOT_INTERNAL:
-            fc_geo = fc_geo.get_defining_geometry()
-        pc_parent_geo = uid_map[fc_geo.uid]
-        pc_geometry.append(pc_parent_geo.get_reference(pc_ref))
-    kwargs = {}
-    if constraint.type_.requires_value:
-        # Only some constraints like distance require a value.
-        kwargs["value"] = constraint.value
-        if constraint.type_ == CT.ANGLE:
-            points_pos = []
-            for geo_ref in constraint.get_references():
-                fc_geo, part = geo_ref.get_geometry()
-                if fc_geo.type_ != "Part::GeomLineSegment":
-                    msg = f"FreeCAD angles on {fc_geo.type_} not yet supported"
-                    raise NotImplementedError(msg)
-                points_pos.append(
-                    ((fc_geo.geometry.start, fc_geo.geometry.end), part)
-                )
-            if len(points_pos) != 2:
-                msg = (f"FreeCAD angles constraining {len(points_pos)}"
-                       " elements not yet supported")
-                raise NotImplementedError(msg)
-            kwargs["quadrant"] = xml_utils.read_angle_quadrant(tuple(points_pos))
-        else:
-            # All FreeCAD value constraints are in mm except Angles. pancad
-            # doesn't take a unit parameter for angles, so it shouldn't be
-            # included here.
-            kwargs["unit"] = "mm"
-    return make_constraint(pc_type, *pc_geometry, **kwargs)
-
-def reference_from_freecad(geo_ref: ConstraintGeoRef) -> CR:
-    """Returns a pancad ConstraintReference from a FreeCAD constraint geometry
-    reference.
-    """
-    geo, part = geo_ref.get_geometry()
-    ref_key = [part, geo.internal_type]
-    if geo.internal_type == IGT.NOT_INTERNAL and geo.type_ == "Part::GeomPoint":
-        # FreeCAD points are always referred to as Start.
-        ref_key.append(geo.type_)
-    # Account for FreeCAD x and y axes being in the ExternalGeo list.
-    index_map = {-1: "x_axis", -2: "y_axis"}
-    if geo_ref.index in index_map:
-        ref_key.append(index_map[geo_ref.index])
-    ref_map = {
-        (CSP.EDGE, IGT.NOT_INTERNAL): CR.CORE,
-        (CSP.START, IGT.NOT_INTERNAL, "Part::GeomPoint"): CR.CORE,
-        (CSP.START, IGT.NOT_INTERNAL): CR.START,
-        (CSP.END, IGT.NOT_INTERNAL): CR.END,
-        (CSP.CENTER, IGT.NOT_INTERNAL): CR.CENTER,
-        (CSP.EDGE, IGT.NOT_INTERNAL, "x_axis"): CR.X,
-        (CSP.START, IGT.NOT_INTERNAL, "x_axis"): CR.ORIGIN,
-        (CSP.EDGE, IGT.NOT_INTERNAL, "y_axis"): CR.Y,
-        (CSP.EDGE, IGT.ELLIPSE_MAJOR_DIAMETER): CR.MAJOR_AXIS,
-        (CSP.START, IGT.ELLIPSE_MAJOR_DIAMETER): CR.X_MIN,
-        (CSP.END, IGT.ELLIPSE_MAJOR_DIAMETER): CR.X_MAX,
-        (CSP.START, IGT.ELLIPSE_MINOR_DIAMETER): CR.Y_MIN,
-        (CSP.END, IGT.ELLIPSE_MINOR_DIAMETER): CR.Y_MAX,
-        (CSP.START, IGT.ELLIPSE_FOCUS_1): CR.FOCAL_PLUS,
-        (CSP.START, IGT.ELLIPSE_FOCUS_2): CR.FOCAL_MINUS,
-    }
-    try:
-        return ref_map[tuple(ref_key)]
-    except KeyError as exc:
-        msg = (f"Unrecognized reference combo: Geo Type: '{geo.type_}',"
-               f" SubPart: '{part.name}',"
-               f" Internal Type: '{geo.internal_type.name}',"
-               f" List/Index: {geo_ref.list_name}[{geo_ref.index}]"
-               f" Failed Ref Key: {ref_key}")
-        raise ValueError(msg) from exc
-
-def sketch_constraint_from_freecad(constraint: FreeCADConstraintXML) -> SC:
-    """Returns the equivalent pancad SketchConstraint from a freecad
-    constraint.
-    """
-    type_map = {
-        CT.ANGLE: SC.ANGLE,
-        CT.DISTANCE: SC.DISTANCE,
-        CT.DISTANCE_X: SC.DISTANCE_HORIZONTAL,
-        CT.DISTANCE_Y: SC.DISTANCE_VERTICAL,
-        CT.DIAMETER: SC.DISTANCE_DIAMETER,
-        CT.RADIUS: SC.DISTANCE_RADIUS,
-        CT.EQUAL: SC.EQUAL,
-        CT.HORIZONTAL: SC.HORIZONTAL,
-        CT.PERPENDICULAR: SC.PERPENDICULAR,
-        CT.PARALLEL: SC.PARALLEL,
-        CT.VERTICAL: SC.VERTICAL,
-        CT.COINCIDENT: SC.COINCIDENT,
-        CT.POINT_ON_OBJECT: SC.COINCIDENT,
-    }
-    if constraint.type_ in type_map:
-        return type_map[constraint.type_]
-    if constraint.type_ == CT.TANGENT:
-        geo_pairs = [r.get_geometry() for r in constraint.get_references()]
-        if all(g.type_ == "Part::GeomLineSegment" and not p.is_point
-               for g, p in geo_pairs):
-            return SC.COINCIDENT
-        combo = "; ".join([f"{g.type_} {p.name}" for g, p in geo_pairs])
-        msg = f"Tangent with geometry combo '{combo}' is not supported yet"
-        raise NotImplementedError(msg)
-    msg = f"Constraint type '{constraint.type_.name}' is not supported yet"
-    raise NotImplementedError(msg)
-
 @singledispatch
 def _freecad_to_pancad_geometry(geometry: FreeCADGeometry) -> AbstractGeometry:
     """Returns pancad geometry from FreeCAD geometry elements."""
@@ -963,7 +849,7 @@ def _circular_arc(arc: FreeCADCircularArc) -> CircularArc:
 
 @_freecad_to_pancad_geometry.register
 def _point(point: FreeCADPoint) -> Point:
-    return Point(point.X, point.Y)
+    return Point._from_trusted(point.X, point.Y) # pylint: disable=protected-access
 
 @_freecad_to_pancad_geometry.register
 def _ellipse(ellipse: FreeCADEllipse) -> Ellipse:
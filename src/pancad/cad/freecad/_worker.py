@@ -0,0 +1,82 @@
+"""The script run by each process of a
+:class:`~pancad.cad.freecad.worker_pool.FreeCADWorkerPool`. Like
+error_detection, it runs with FreeCAD's Python executable, so it must be
+independent of the rest of pancad.
+
+Each request and response is a JSON object preceded by its length in bytes as
+a 4 byte big-endian unsigned integer. Requests have an 'op' of 'ping', 'call',
+or 'exit'. 'call' requests load the python file at 'path' and return the result
+of calling its 'function' with 'args'.
+"""
+import importlib.util
+import json
+import os
+import struct
+import sys
+import traceback
+
+HEADER = struct.Struct(">I")
+"""The length prefix of every message."""
+
+def read_message(stream) -> dict | None:
+    """Returns the next message in the stream, or None when the stream has
+    ended.
+    """
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    (length,) = HEADER.unpack(header)
+    data = stream.read(length)
+    if len(data) < length:
+        return None
+    return json.loads(data.decode("utf-8"))
+
+def write_message(stream, message: dict) -> None:
+    """Writes a message to the stream and flushes it."""
+    data = json.dumps(message).encode("utf-8")
+    stream.write(HEADER.pack(len(data)) + data)
+    stream.flush()
+
+def _load(path: str, modules: dict):
+    """Returns the module at the path, loading it on the first request."""
+    if path not in modules:
+        name = f"_pancad_worker_{len(modules)}"
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules[path] = module
+    return modules[path]
+
+def _respond(request: dict, modules: dict) -> dict:
+    """Returns the response to a ping or call request."""
+    if request.get("op") == "ping":
+        return {"ok": True, "result": os.getpid()}
+    try:
+        module = _load(request["path"], modules)
+        result = getattr(module, request["function"])(*request["args"])
+        # Check the result can be sent before responding
+        json.dumps(result)
+    except Exception as exc: # pylint: disable=broad-exception-caught
+        return {"ok": False,
+                "error": "".join(traceback.format_exception_only(exc)).strip(),
+                "traceback": traceback.format_exc()}
+    return {"ok": True, "result": result}
+
+def main():
+    """Answers requests from stdin until it is closed or an exit request is
+    received.
+    """
+    # FreeCAD and the called functions may print to stdout, so the responses
+    # use a duplicate of the original stdout and stdout is sent to stderr.
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    requests = sys.stdin.buffer
+    modules = {}
+    write_message(responses, {"ok": True, "result": os.getpid()})
+    while (request := read_message(requests)) is not None:
+        if request.get("op") == "exit":
+            break
+        write_message(responses, _respond(request, modules))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""A module providing functions to translate the geometry and constraints read
+from FreeCAD xml into pancad. Nothing here needs the FreeCAD application, since
+it only reads the dataclasses of :mod:`pancad.cad.freecad.xml_properties` and
+:mod:`pancad.cad.freecad.xml_geometry_arrays`.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from math import cos, sin
+
+import numpy as np
+
+from pancad.constants import ConstraintReference as CR, SketchConstraint as SC
+from pancad.constraints._generator import make_constraint
+from pancad.geometry.circle import Circle
+from pancad.geometry.circular_arc import CircularArc
+from pancad.geometry.ellipse import Ellipse
+from pancad.geometry.line_segment import LineSegment
+from pancad.geometry.point import Point
+
+from pancad.cad.freecad import xml_utils
+from pancad.cad.freecad.translation_registry import (
+    CONSTRAINT_TRANSLATORS, GEOMETRY_TRANSLATORS
+)
+from pancad.cad.freecad.constants import (
+    ConstraintType as CT,
+    ConstraintSubPart as CSP,
+    InternalGeometryType as IGT,
+)
+
+if TYPE_CHECKING:
+    from pancad.abstract import (
+        AbstractConstraint, AbstractGeometry, PancadThing,
+    )
+    from pancad.cad.freecad.xml_geometry_arrays import GeometryListArrays
+    from pancad.cad.freecad.xml_properties import (
+        FreeCADConstraintXML,
+        FreeCADGeometryXML,
+    )
+    from pancad.cad.freecad.xml_utils import ConstraintGeoRef
+
+################################################################################
+# FreeCAD ---> pancad Geometry
+################################################################################
+
+def geometry_from_freecad(data: FreeCADGeometryXML) -> AbstractGeometry:
+    """Creates a pancad geometry object from a FreeCAD object."""
+    try:
+        func = _GEOMETRY_FUNCS[data.type_]
+    except KeyError as exc:
+        msg = f"Sketch geometry type {data.type_} is not supported yet"
+        raise NotImplementedError(msg) from exc
+    return func(data)
+
+def geometry_from_freecad_arrays(arrays: GeometryListArrays
+                                 ) -> list[AbstractGeometry]:
+    """Creates pancad geometry objects from all the geometry of a FreeCAD
+    geometry list at once. Equivalent to calling geometry_from_freecad on each
+    geometry of the list, but the math is done on whole arrays of each type.
+    Dispatches on each geometry type through GEOMETRY_TRANSLATORS.
+
+    :param arrays: The arrays read from a sketch's geometry list property.
+    :returns: The pancad geometry in the same order as the arrays' rows.
+    :raises NotImplementedError: When no translator is registered for a type.
+    """
+    geometry = [None] * len(arrays)
+    for type_, index in arrays.indices.items():
+        pc_geometry = GEOMETRY_TRANSLATORS.translate(type_, arrays)
+        for i, pc_geo in zip(index.tolist(), pc_geometry):
+            geometry[i] = pc_geo
+    return geometry
+
+# The xml geometry dataclasses already hold validated float tuples, so points
+# are created through Point's trusted fast path.
+# pylint: disable=protected-access
+def _from_freecad_point(data: FreeCADGeometryXML) -> Point:
+    return Point._from_trusted(*data.geometry.location)
+
+def _from_freecad_line_segment(data: FreeCADGeometryXML) -> LineSegment:
+    return LineSegment(Point._from_trusted(*data.geometry.start),
+                       Point._from_trusted(*data.geometry.end))
+
+def _from_freecad_circle(data: FreeCADGeometryXML) -> Circle:
+    return Circle(Point._from_trusted(*data.geometry.center),
+                  data.geometry.radius)
+
+def _from_freecad_circular_arc(data: FreeCADGeometryXML) -> CircularArc:
+    geo = data.geometry
+    start_vector = (cos(geo.start_angle), sin(geo.start_angle))
+    end_vector = (cos(geo.end_angle), sin(geo.end_angle))
+    return CircularArc(Point._from_trusted(*geo.center), geo.radius,
+                       start_vector, end_vector, False)
+
+def _from_freecad_ellipse(data: FreeCADGeometryXML) -> Ellipse:
+    geo = data.geometry
+    return Ellipse.from_angle(geo.center, geo.major_radius, geo.minor_radius,
+                              geo.major_axis_angle)
+
+_GEOMETRY_FUNCS = {
+    "Part::GeomPoint": _from_freecad_point,
+    "Part::GeomLineSegment": _from_freecad_line_segment,
+    "Part::GeomArcOfCircle": _from_freecad_circular_arc,
+    "Part::GeomCircle": _from_freecad_circle,
+    "Part::GeomEllipse": _from_freecad_ellipse,
+}
+"""Functions creating a pancad geometry from a FreeCAD geometry element."""
+
+@GEOMETRY_TRANSLATORS.register("Part::GeomPoint", default=True)
+def _points_from_arrays(arrays: GeometryListArrays) -> list[Point]:
+    xy = arrays.get_values("Part::GeomPoint", "X", "Y")
+    return [Point._from_trusted(x, y) for x, y in xy.tolist()]
+
+@GEOMETRY_TRANSLATORS.register("Part::GeomLineSegment", default=True)
+def _line_segments_from_arrays(arrays: GeometryListArrays
+                               ) -> list[LineSegment]:
+    ends = arrays.get_values("Part::GeomLineSegment",
+                             "StartX", "StartY", "EndX", "EndY")
+    return [LineSegment(Point._from_trusted(sx, sy), Point._from_trusted(ex, ey))
+            for sx, sy, ex, ey in ends.tolist()]
+
+@GEOMETRY_TRANSLATORS.register("Part::GeomCircle", default=True)
+def _circles_from_arrays(arrays: GeometryListArrays) -> list[Circle]:
+    values = arrays.get_values("Part::GeomCircle", "CenterX", "CenterY", "Radius")
+    return [Circle(Point._from_trusted(x, y), radius)
+            for x, y, radius in values.tolist()]
+
+@GEOMETRY_TRANSLATORS.register("Part::GeomArcOfCircle", default=True)
+def _circular_arcs_from_arrays(arrays: GeometryListArrays
+                               ) -> list[CircularArc]:
+    values = arrays.get_values("Part::GeomArcOfCircle", "CenterX", "CenterY",
+                               "Radius", "StartAngle", "EndAngle")
+    angles = values[:, 3:5]
+    vectors = np.column_stack((np.cos(angles[:, 0]), np.sin(angles[:, 0]),
+                               np.cos(angles[:, 1]), np.sin(angles[:, 1])))
+    return [CircularArc(Point._from_trusted(x, y), radius,
+                        (start_x, start_y), (end_x, end_y), False)
+            for (x, y, radius), (start_x, start_y, end_x, end_y)
+            in zip(values[:, 0:3].tolist(), vectors.tolist())]
+# pylint: enable=protected-access
+
+@GEOMETRY_TRANSLATORS.register("Part::GeomEllipse", default=True)
+def _ellipses_from_arrays(arrays: GeometryListArrays
+                          ) -> list[Ellipse]:
+    values = arrays.get_values("Part::GeomEllipse", "CenterX", "CenterY",
+                               "MajorRadius", "MinorRadius", "AngleXU")
+    return [Ellipse.from_angle((x, y), major, minor, angle)
+            for x, y, major, minor, angle in values.tolist()]
+
+################################################################################
+# FreeCAD ---> pancad Constraints
+################################################################################
+
+def constraint_from_freecad(constraint: FreeCADConstraintXML,
+                            uid_map: dict[xml_utils.FreeCADUID, PancadThing]
+                            ) -> AbstractConstraint:
+    """Returns a pancad constraint from a FreeCAD constraint. Dispatches on the
+    FreeCAD constraint type through CONSTRAINT_TRANSLATORS.
+
+    :raises NotImplementedError: When no translator is registered for the type.
+    """
+    return CONSTRAINT_TRANSLATORS.translate(constraint.type_, constraint,
+                                            uid_map)
+
+def _constraint_from_freecad(constraint: FreeCADConstraintXML,
+                             uid_map: dict[xml_utils.FreeCADUID, PancadThing]
+                             ) -> AbstractConstraint:
+    pc_type = sketch_constraint_from_freecad(constraint)
+    pc_geometry = []
+    for geo_ref in constraint.get_references():
+        pc_ref = reference_from_freecad(geo_ref)
+        fc_geo, _ = geo_ref.get_geometry()
+        if fc_geo.internal_type != IGT.NOT_INTERNAL:
+            fc_geo = fc_geo.get_defining_geometry()
+        pc_parent_geo = uid_map[fc_geo.uid]
+        pc_geometry.append(pc_parent_geo.get_reference(pc_ref))
+    kwargs = {}
+    if constraint.type_.requires_value:
+        # Only some constraints like distance require a value.
+        kwargs["value"] = constraint.value
+        if constraint.type_ == CT.ANGLE:
+            points_pos = []
+            for geo_ref in constraint.get_references():
+                fc_geo, part = geo_ref.get_geometry()
+                if fc_geo.type_ != "Part::GeomLineSegment":
+                    msg = f"FreeCAD angles on {fc_geo.type_} not yet supported"
+                    raise NotImplementedError(msg)
+                points_pos.append(
+                    ((fc_geo.geometry.start, fc_geo.geometry.end), part)
+                )
+            if len(points_pos) != 2:
+                msg = (f"FreeCAD angles constraining {len(points_pos)}"
+                       " elements not yet supported")
+                raise NotImplementedError(msg)
+            kwargs["quadrant"] = xml_utils.read_angle_quadrant(tuple(points_pos))
+        else:
+            # All FreeCAD value constraints are in mm except Angles. pancad
+            # doesn't take a unit parameter for angles, so it shouldn't be
+            # included here.
+            kwargs["unit"] = "mm"
+    return make_constraint(pc_type, *pc_geometry, **kwargs)
+
+def reference_from_freecad(geo_ref: ConstraintGeoRef) -> CR:
+    """Returns a pancad ConstraintReference from a FreeCAD constraint geometry
+    reference.
+    """
+    geo, part = geo_ref.get_geometry()
+    ref_key = [part, geo.internal_type]
+    if geo.internal_type == IGT.NOT_INTERNAL and geo.type_ == "Part::GeomPoint":
+        # FreeCAD points are always referred to as Start.
+        ref_key.append(geo.type_)
+    # Account for FreeCAD x and y axes being in the ExternalGeo list.
+    if geo_ref.index in _EXTERNAL_AXES:
+        ref_key.append(_EXTERNAL_AXES[geo_ref.index])
+    try:
+        return _REFERENCES[tuple(ref_key)]
+    except KeyError as exc:
+        msg = (f"Unrecognized reference combo: Geo Type: '{geo.type_}',"
+               f" SubPart: '{part.name}',"
+               f" Internal Type: '{geo.internal_type.name}',"
+               f" List/Index: {geo_ref.list_name}[{geo_ref.index}]"
+               f" Failed Ref Key: {ref_key}")
+        raise ValueError(msg) from exc
+
+def sketch_constraint_from_freecad(constraint: FreeCADConstraintXML) -> SC:
+    """Returns the equivalent pancad SketchConstraint from a freecad
+    constraint.
+    """
+    if constraint.type_ in _CONSTRAINT_TYPES:
+        return _CONSTRAINT_TYPES[constraint.type_]
+    if constraint.type_ == CT.TANGENT:
+        geo_pairs = [r.get_geometry() for r in constraint.get_references()]
+        if all(g.type_ == "Part::GeomLineSegment" and not p.is_point
+               for g, p in geo_pairs):
+            return SC.COINCIDENT
+        combo = "; ".join([f"{g.type_} {p.name}" for g, p in geo_pairs])
+        msg = f"Tangent with geometry combo '{combo}' is not supported yet"
+        raise NotImplementedError(msg)
+    msg = f"Constraint type '{constraint.type_.name}' is not supported yet"
+    raise NotImplementedError(msg)
+
+_CONSTRAINT_TYPES = {
+    CT.ANGLE: SC.ANGLE,
+    CT.DISTANCE: SC.DISTANCE,
+    CT.DISTANCE_X: SC.DISTANCE_HORIZONTAL,
+    CT.DISTANCE_Y: SC.DISTANCE_VERTICAL,
+    CT.DIAMETER: SC.DISTANCE_DIAMETER,
+    CT.RADIUS: SC.DISTANCE_RADIUS,
+    CT.EQUAL: SC.EQUAL,
+    CT.HORIZONTAL: SC.HORIZONTAL,
+    CT.PERPENDICULAR: SC.PERPENDICULAR,
+    CT.PARALLEL: SC.PARALLEL,
+    CT.VERTICAL: SC.VERTICAL,
+    CT.COINCIDENT: SC.COINCIDENT,
+    CT.POINT_ON_OBJECT: SC.COINCIDENT,
+}
+"""The pancad SketchConstraint of each FreeCAD ConstraintType. Tangents depend
+on their geometry, so they are decided by sketch_constraint_from_freecad.
+"""
+_EXTERNAL_AXES = {-1: "x_axis", -2: "y_axis"}
+"""The sketch axes at the start of FreeCAD's ExternalGeo list by index."""
+_REFERENCES = {
+    (CSP.EDGE, IGT.NOT_INTERNAL): CR.CORE,
+    (CSP.START, IGT.NOT_INTERNAL, "Part::GeomPoint"): CR.CORE,
+    (CSP.START, IGT.NOT_INTERNAL): CR.START,
+    (CSP.END, IGT.NOT_INTERNAL): CR.END,
+    (CSP.CENTER, IGT.NOT_INTERNAL): CR.CENTER,
+    (CSP.EDGE, IGT.NOT_INTERNAL, "x_axis"): CR.X,
+    (CSP.START, IGT.NOT_INTERNAL, "x_axis"): CR.ORIGIN,
+    (CSP.EDGE, IGT.NOT_INTERNAL, "y_axis"): CR.Y,
+    (CSP.EDGE, IGT.ELLIPSE_MAJOR_DIAMETER): CR.MAJOR_AXIS,
+    (CSP.START, IGT.ELLIPSE_MAJOR_DIAMETER): CR.X_MIN,
+    (CSP.END, IGT.ELLIPSE_MAJOR_DIAMETER): CR.X_MAX,
+    (CSP.START, IGT.ELLIPSE_MINOR_DIAMETER): CR.Y_MIN,
+    (CSP.END, IGT.ELLIPSE_MINOR_DIAMETER): CR.Y_MAX,
+    (CSP.START, IGT.ELLIPSE_FOCUS_1): CR.FOCAL_PLUS,
+    (CSP.START, IGT.ELLIPSE_FOCUS_2): CR.FOCAL_MINUS,
+}
+"""The pancad ConstraintReference of each FreeCAD sub part and internal type,
+with the geometry type for points and the axis name for the sketch axes.
+"""
+CONSTRAINT_TRANSLATORS.register(*_CONSTRAINT_TYPES, CT.TANGENT,
+                                default=True)(_constraint_from_freecad)
@@ -18,6 +18,7 @@ from pancad.cad.freecad.xml_utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import NamedTuple
 
     from pancad.cad.freecad._application_types import (
@@ -245,6 +246,21 @@ def read_geometry_uid(geometry: FreeCADGeometry,
     return FreeCADUID.from_parts(document.Uid, "sketchgeo",
                                  sketch.ID, list_int, id_)
 
+def read_geometry_uids(sketch: FreeCADSketch,
+                       list_: Literal["Geometry", "ExternalGeo"],
+                       document: FreeCADDocument) -> list[FreeCADUID]:
+    """Returns sketchgeo type FreeCADUIDs for all the geometry in a sketch list
+    in index order, reading the sketch xml once.
+
+    :param sketch: A FreeCAD API sketch object.
+    :param list_: The name of the list to read.
+    :param document: A FreeCAD API document object containing the sketch.
+    """
+    list_int = LIST_NAME_INT_MAP[list_]
+    return [FreeCADUID.from_parts(document.Uid, "sketchgeo",
+                                  sketch.ID, list_int, id_)
+            for id_ in get_sketch_geometry_ids(sketch, list_)]
+
 def read_constraint_uid(constraint: FreeCADConstraint,
                         sketch: FreeCADSketch,
                         document: FreeCADDocument) -> FreeCADUID:
@@ -260,29 +276,61 @@ def read_constraint_uid(constraint: FreeCADConstraint,
     if element is None:
         msg = "Could not read Constrain element from the constraint xml"
         raise TypeError(msg, element)
-    parts = [document.Uid, "sketchcons", sketch.ID, element.attrib["Type"]]
+    pairs = [(int(element.attrib[name]), element.attrib[name + "Pos"])
+             for name in ["First", "Second", "Third"]]
+
+    def get_geo_id(list_name: str, index: int) -> int:
+        if list_name == "ExternalGeo":
+            geometry = sketch.ExternalGeo[index]
+        else:
+            geometry = sketch.Geometry[index]
+        return get_geometry_sketch_id(geometry, list_name, sketch)
+    return _new_constraint_uid(element.attrib["Type"], pairs, get_geo_id,
+                               sketch, document)
+
+def read_constraint_uids(constraints: list[tuple[int, list[tuple[int, int]]]],
+                         sketch: FreeCADSketch,
+                         document: FreeCADDocument) -> list[FreeCADUID]:
+    """Returns sketchcons type FreeCADUIDs for constraints already added to a
+    sketch, reading the sketch's geometry ids once for all of them.
+
+    :param constraints: The type integer and the (reference index, sub part)
+        pairs of the First, Second, and Third geometry of each constraint.
+    :param sketch: A FreeCAD API sketch object containing the constraints.
+    :param document: A FreeCAD API document object containing the sketch.
+    """
+    geometry_ids = {list_name: get_sketch_geometry_ids(sketch, list_name)
+                    for list_name in ("Geometry", "ExternalGeo")}
+
+    def get_geo_id(list_name: str, index: int) -> int:
+        return geometry_ids[list_name][index]
+    return [_new_constraint_uid(type_, pairs, get_geo_id, sketch, document)
+            for type_, pairs in constraints]
+
+def _new_constraint_uid(type_: int | str, pairs: list[tuple[int, int | str]],
+                        get_geo_id: Callable[[str, int], int],
+                        sketch: FreeCADSketch,
+                        document: FreeCADDocument) -> FreeCADUID:
+    """Returns a sketchcons type FreeCADUID from a constraint's type and its
+    (reference index, sub part) pairs.
+
+    :param get_geo_id: A function returning the geometry id at an index of a
+        sketch geometry list.
+    """
+    parts = [document.Uid, "sketchcons", sketch.ID, str(type_)]
     # Get the geometry ids for each constrained geometry since indexes
     # can/will change.
-    for constrained in ["First", "Second", "Third"]:
-        index = int(element.attrib[constrained])
+    for index, sub_part in pairs:
         if index == EMPTY_CONSTRAINED:
             list_name = "Geometry"
             geo_id = EMPTY_CONSTRAINED
+        elif index < 0:
+            list_name = "ExternalGeo"
+            geo_id = get_geo_id(list_name, -1 - index)
         else:
-            if index < 0:
-                list_name = "ExternalGeo"
-                geometry = sketch.ExternalGeo[-1 - index]
-            else:
-                list_name = "Geometry"
-                geometry = sketch.Geometry[index]
-            geo_id = get_geometry_sketch_id(geometry, list_name, sketch)
-        parts.extend(
-            [
-                LIST_NAME_INT_MAP[list_name],
-                geo_id,
-                element.attrib[constrained + "Pos"]
-            ]
-        )
+            list_name = "Geometry"
+            geo_id = get_geo_id(list_name, index)
+        parts.extend([LIST_NAME_INT_MAP[list_name], geo_id, str(int(sub_part))])
     return FreeCADUID.from_parts(*parts)
 
 
@@ -329,28 +377,43 @@ def get_geometry_sketch_id(geometry: FreeCADGeometry,
         msg = "Invalid geometry, no 'id' found in extension"
         raise TypeError(msg, ext) from exc
 
-def get_geometry_index_by_sketch_id(id_: int,
-                                    list_: Literal["Geometry", "ExternalGeo"],
-                                    sketch) -> int:
-    """Returns the index of geometry corresponding to the id from the sketch.
+def get_sketch_geometry_ids(sketch: FreeCADSketch,
+                            list_: Literal["Geometry", "ExternalGeo"]
+                            ) -> list[int]:
+    """Returns the id of each geometry in a sketch list in index order. The
+    sketch xml is only read once, so this is much faster than reading the id of
+    each geometry separately.
 
-    :param id_: The geometry id integer.
-    :param list_: The name of the list the geometry is in.
     :param sketch: A sketch FreeCAD API object.
+    :param list_: The name of the list to read.
+    :raises TypeError: If an id cannot be read from the sketch xml.
     """
     ext_type = "Sketcher::SketchGeometryExtension"
     ext_match = GEO_EXT_TYPE_XPATH.format(type_=ext_type)
-
-    for index, element in enumerate(get_sketch_geometry_list_xml(sketch, list_)):
+    ids = []
+    for element in get_sketch_geometry_list_xml(sketch, list_):
         ext = element.find(ext_match)
         try:
-            element_id = int(ext.attrib["id"])
+            ids.append(int(ext.attrib["id"]))
         except (AttributeError, KeyError) as exc:
             msg = "Could not read id from sketch geometry xml"
             raise TypeError(msg, element) from exc
-        if id_ == element_id:
-            return index
-    raise LookupError("Could not find geometry with id in sketch", id_)
+    return ids
+
+def get_geometry_index_by_sketch_id(id_: int,
+                                    list_: Literal["Geometry", "ExternalGeo"],
+                                    sketch) -> int:
+    """Returns the index of geometry corresponding to the id from the sketch.
+
+    :param id_: The geometry id integer.
+    :param list_: The name of the list the geometry is in.
+    :param sketch: A sketch FreeCAD API object.
+    """
+    try:
+        return get_sketch_geometry_ids(sketch, list_).index(id_)
+    except ValueError as exc:
+        msg = "Could not find geometry with id in sketch"
+        raise LookupError(msg, id_) from exc
 
 def get_geometry_index_by_uid(uid: FreeCADUID,
                               document: FreeCADDocument) -> int:
@@ -452,3 +515,188 @@ def get_reference_index_by_uid(uid: FreeCADUID,
     """
     index = get_geometry_index_by_uid(uid, document)
     return get_reference_index(index, uid.data.list_name)
+
+
+################################################################################
+# Document Index
+################################################################################
+
+class DocumentIndex:
+    """An index of a FreeCAD document for resolving uids without searching the
+    document each time. The document's objects are read once when the index is
+    created, and each sketch's geometry ids and constraint uids are read on the
+    first lookup into that sketch. The index is updated as items are added with
+    add_objects, read_geometry, and add_constraints. Removed items are not
+    tracked, so a new index should be made after removing items.
+
+    :param document: A FreeCAD API document object.
+    """
+
+    def __init__(self, document: FreeCADDocument) -> None:
+        self.document = document
+        self._objects = {obj.ID: obj for obj in document.Objects}
+        self._geometry_ids = {}
+        self._geometry_indices = {}
+        self._constraint_indices = {}
+
+    def add_objects(self, *objects: FreeCADFeature) -> None:
+        """Adds objects that were added to the document to the index."""
+        self._objects.update((obj.ID, obj) for obj in objects)
+
+    def read_geometry(self, sketch: FreeCADSketch,
+                      list_: Literal["Geometry", "ExternalGeo"]
+                      ) -> list[FreeCADUID]:
+        """Reads the geometry ids of a sketch list into the index. Should be
+        called once after geometry is added to the list.
+
+        :param sketch: A FreeCAD API sketch object in the document.
+        :param list_: The name of the list to read.
+        :returns: The sketchgeo FreeCADUIDs of the list's geometry in index
+            order.
+        """
+        ids = get_sketch_geometry_ids(sketch, list_)
+        self._geometry_ids[sketch.ID, list_] = ids
+        self._geometry_indices[sketch.ID, list_] = {
+            id_: index for index, id_ in enumerate(ids)
+        }
+        list_int = LIST_NAME_INT_MAP[list_]
+        return [FreeCADUID.from_parts(self.document.Uid, "sketchgeo",
+                                      sketch.ID, list_int, id_)
+                for id_ in ids]
+
+    def add_constraints(self,
+                        sketch: FreeCADSketch,
+                        constraints: list[tuple[int, list[tuple[int, int]]]]
+                        ) -> list[FreeCADUID]:
+        """Adds constraints that were appended to a sketch to the index.
+
+        :param sketch: A FreeCAD API sketch object containing the constraints.
+        :param constraints: The type integer and the (reference index, sub part)
+            pairs of the First, Second, and Third geometry of each constraint.
+        :returns: The sketchcons FreeCADUIDs of the constraints.
+        """
+        uids = self._get_constraint_uids(constraints, sketch)
+        if sketch.ID not in self._constraint_indices:
+            # The sketch's constraint list already has the new constraints.
+            self._read_constraints(sketch)
+        else:
+            # Duplicate constraints share a uid, so the new constraints'
+            # indices are counted back from the end of the sketch's list.
+            indices = self._constraint_indices[sketch.ID]
+            start = len(sketch.Constraints) - len(uids)
+            for offset, uid in enumerate(uids):
+                indices.setdefault(uid, start + offset)
+        return uids
+
+    def get_by_uid(self, uid: str | FreeCADUID) -> FreeCADAPIObject:
+        """Returns the corresponding FreeCAD API object from the document.
+        Equivalent to the module's get_by_uid function.
+
+        :param uid: A FreeCADUID or a compatible str.
+        :raises LookupError: If the uid is not in the document.
+        """
+        if not isinstance(uid, FreeCADUID):
+            uid = FreeCADUID(uid)
+        if uid.file_uid != self.document.Uid:
+            raise LookupError("uid is not in the document", uid)
+        data = uid.data
+        match data.type_:
+            case "document":
+                return self.document
+            case "feature":
+                return self.get_object(data.feature_id)
+            case "sketchgeo":
+                sketch = self.get_object(data.feature_id)
+                index = self.get_geometry_index(uid)
+                if data.list_name == "ExternalGeo":
+                    return sketch.ExternalGeo[index]
+                return sketch.Geometry[index]
+            case "sketchcons":
+                sketch = self.get_object(data.feature_id)
+                return sketch.Constraints[self.get_constraint_index(uid)]
+        msg = f"uid type '{data.type_}' is not yet supported"
+        raise NotImplementedError(msg, uid)
+
+    def get_object(self, id_: int) -> FreeCADFeature:
+        """Returns the document object with the ID.
+
+        :raises LookupError: If there is no object with the ID.
+        """
+        if id_ not in self._objects:
+            # Objects added without add_objects are found by reading again.
+            self._objects = {obj.ID: obj for obj in self.document.Objects}
+        try:
+            return self._objects[id_]
+        except KeyError as exc:
+            msg = f"uid's feature id '{id_}' is not in the document"
+            raise LookupError(msg, id_) from exc
+
+    def get_geometry_index(self, uid: FreeCADUID) -> int:
+        """Returns the sketch list index of the geometry with the uid.
+
+        :param uid: A sketchgeo FreeCADUID.
+        :raises LookupError: If the geometry is not in the sketch.
+        """
+        data = uid.data
+        key = (data.feature_id, data.list_name)
+        if data.geometry_id not in self._geometry_indices.get(key, {}):
+            self.read_geometry(self.get_object(data.feature_id), data.list_name)
+        try:
+            return self._geometry_indices[key][data.geometry_id]
+        except KeyError as exc:
+            msg = "Could not find geometry with id in sketch"
+            raise LookupError(msg, data.geometry_id) from exc
+
+    def get_reference_index(self, uid: FreeCADUID) -> int:
+        """Returns the index that FreeCAD constraints use to reference the
+        geometry with the uid. Equivalent to get_reference_index_by_uid.
+
+        :param uid: A sketchgeo FreeCADUID.
+        """
+        return get_reference_index(self.get_geometry_index(uid),
+                                   uid.data.list_name)
+
+    def get_constraint_index(self, uid: FreeCADUID) -> int:
+        """Returns the index of the constraint with the uid in its sketch.
+
+        :param uid: A sketchcons FreeCADUID.
+        :raises LookupError: If the constraint is not in the sketch.
+        """
+        sketch_id = uid.data.feature_id
+        if uid not in self._constraint_indices.get(sketch_id, {}):
+            self._read_constraints(self.get_object(sketch_id))
+        try:
+            return self._constraint_indices[sketch_id][uid]
+        except KeyError as exc:
+            raise LookupError("Could not find constraint in sketch",
+                              uid) from exc
+
+    # Private Methods
+    def _read_constraints(self, sketch: FreeCADSketch) -> None:
+        """Reads the uids of all the constraints in a sketch into the index."""
+        constraints = []
+        for element in get_sketch_constraint_list_xml(sketch):
+            pairs = [(int(element.attrib[name]),
+                      int(element.attrib[name + "Pos"]))
+                     for name in ["First", "Second", "Third"]]
+            constraints.append((element.attrib["Type"], pairs))
+        indices = {}
+        for index, uid in enumerate(self._get_constraint_uids(constraints,
+                                                              sketch)):
+            indices.setdefault(uid, index)
+        self._constraint_indices[sketch.ID] = indices
+
+    def _get_constraint_uids(self,
+                             constraints: list[tuple[int | str,
+                                                     list[tuple[int, int]]]],
+                             sketch: FreeCADSketch) -> list[FreeCADUID]:
+        def get_geo_id(list_name: str, index: int) -> int:
+            ids = self._geometry_ids.get((sketch.ID, list_name), [])
+            if index >= len(ids):
+                # The list hasn't been read yet or geometry was added since.
+                self.read_geometry(sketch, list_name)
+                ids = self._geometry_ids[sketch.ID, list_name]
+            return ids[index]
+        return [_new_constraint_uid(type_, pairs, get_geo_id, sketch,
+                                    self.document)
+                for type_, pairs in constraints]
@@ -3,7 +3,11 @@ errors or unattached geometry. These functions must be independent of other
 pancad FreeCAD functionality to allow them to be called using the FreeCAD 
 version of Python. This module is meant to be called as a script, so it is one 
 of the freecad module's public modules.
+
+ErrorCategory can be imported without FreeCAD so that other validators can
+report with the same categories.
 """
+from __future__ import annotations
 
 import argparse
 from enum import StrEnum, auto
@@ -11,12 +15,8 @@ import json
 
 try:
     import FreeCAD as freecad
-except ImportError as exc:
-    raise RuntimeError(
-        "error_detection.py can only be run by the FreeCAD api Python"
-        " executable with the api already available. Running it outside of that"
-        " context is not supported."
-    ) from exc
+except ImportError:
+    freecad = None
 
 class ErrorCategory(StrEnum):
     """An enumeration used to define FreeCAD error categories for model validation.
@@ -50,28 +50,39 @@ def _key(object_: freecad.DocumentObject) -> str:
     """Returns the report key for the FreeCAD object/"""
     return f"{object_.ID}: {object_.Label}"
 
-def main():
-    """This function receives arguments from the primary pancad instance to 
-    check a .FCStd file for errors. It then reports the results into a 
-    temporary json file so the primary pancad process can read it.
+def check_document(filepath: str) -> dict:
+    """Opens, recomputes and checks a FreeCAD document for errors, then closes
+    it again so that long running FreeCAD processes can check many files.
+
+    :param filepath: Filepath of the FreeCAD file to check.
+    :returns: The report of the errors found, keyed by ErrorCategory.
+    :raises RuntimeError: When the FreeCAD api is not available.
     """
-    args = _parse_args()
-    document = freecad.open(args.filepath)
-    # Recompute the FreeCAD document before checking
-    document.recompute()
-    data = []
-    for obj in document.Objects:
-        if not obj.isValid():
-            # Log errors on features
-            data.append(
-                (ErrorCategory.ERROR, (_key(obj), obj.getStatusString()))
-            )
-        if hasattr(obj, "AttachmentSupport") and not obj.AttachmentSupport:
-            # Log objects detached from geometry
-            data.append((ErrorCategory.DETACHED, _key(obj)))
-        if hasattr(obj, "FullyConstrained") and not obj.FullyConstrained:
-            # Log sketches that are not fully constrained
-            data.append((ErrorCategory.UNCONSTRAINED, _key(obj)))
+    if freecad is None:
+        raise RuntimeError(
+            "error_detection.py can only be run by the FreeCAD api Python"
+            " executable with the api already available. Running it outside of"
+            " that context is not supported."
+        )
+    document = freecad.open(filepath)
+    try:
+        # Recompute the FreeCAD document before checking
+        document.recompute()
+        data = []
+        for obj in document.Objects:
+            if not obj.isValid():
+                # Log errors on features
+                data.append(
+                    (ErrorCategory.ERROR, (_key(obj), obj.getStatusString()))
+                )
+            if hasattr(obj, "AttachmentSupport") and not obj.AttachmentSupport:
+                # Log objects detached from geometry
+                data.append((ErrorCategory.DETACHED, _key(obj)))
+            if hasattr(obj, "FullyConstrained") and not obj.FullyConstrained:
+                # Log sketches that are not fully constrained
+                data.append((ErrorCategory.UNCONSTRAINED, _key(obj)))
+    finally:
+        freecad.closeDocument(document.Name)
     report = {}
     for category, item in data:
         if isinstance(item, str):
@@ -79,6 +90,15 @@ def main():
         else:
             name, status = item
             report.setdefault(category, {})[name] = status
+    return report
+
+def main():
+    """This function receives arguments from the primary pancad instance to 
+    check a .FCStd file for errors. It then reports the results into a 
+    temporary json file so the primary pancad process can read it.
+    """
+    args = _parse_args()
+    report = check_document(args.filepath)
     with open(args.temp_file_name, "w", encoding="utf-8") as file:
         json.dump(report, file)
 
@@ -2,15 +2,21 @@
 pancad-independent actions on those models.
 """
 
+from __future__ import annotations
+
 from pathlib import Path
 from pprint import pformat
 from subprocess import Popen
+from typing import TYPE_CHECKING
 import os
 import tempfile
 import json
 
 from pancad.cad.freecad import error_detection
-from pancad.cad.freecad._bootstrap import find_app_dir
+from pancad.cad.freecad._bootstrap import get_app_dir
+
+if TYPE_CHECKING:
+    from pancad.cad.freecad.worker_pool import FreeCADWorkerPool
 
 def call_freecad_python(program: str | Path, *args) -> dict:
     """Calls a python program using the FreeCAD python executable. Assumes that 
@@ -20,7 +26,7 @@ def call_freecad_python(program: str | Path, *args) -> dict:
     :param args: The arguments for the python program.
     :returns: The dictionary read from the program's json output file.
     """
-    exe = find_app_dir() / "python.exe"
+    exe = get_app_dir() / "python.exe"
     with tempfile.NamedTemporaryFile(delete=False) as file:
         temp_file_name = file.name
     with Popen([exe, program, temp_file_name, *args]) as proc:
@@ -31,20 +37,41 @@ def call_freecad_python(program: str | Path, *args) -> dict:
     return result
 
 def validate_freecad(fcstd_filepath: str | Path,
-                     unconstrained_error: bool=False) -> None:
+                     unconstrained_error: bool=False,
+                     pool: FreeCADWorkerPool | None=None) -> None:
     """Uses the FreeCAD Python executable to raise an error if a FreeCAD model 
     has errors.
     
     :param fcstd_filepath: Path to a FCStd
     :param unconstrained_error: Sets whether containing an unconstrained sketch 
         counts as an error.
+    :param pool: A pool of running FreeCAD workers to check the file with. If 
+        None, a new FreeCAD process is started for the check.
     :raises ValueError: Raised when the FreeCAD file contains an error.
     """
-    report = call_freecad_python(error_detection.__file__, fcstd_filepath)
+    if pool is None:
+        report = call_freecad_python(error_detection.__file__, fcstd_filepath)
+    else:
+        report = pool.call(error_detection.__file__, "check_document",
+                           str(fcstd_filepath))
+    raise_for_report(report, fcstd_filepath, unconstrained_error)
+
+def raise_for_report(report: dict, fcstd_filepath: str | Path,
+                     unconstrained_error: bool=False) -> None:
+    """Raises an error if an error detection report contains any errors.
+
+    :param report: A report keyed by error_detection.ErrorCategory.
+    :param fcstd_filepath: Path to the FCStd the report is for.
+    :param unconstrained_error: Sets whether containing an unconstrained sketch
+        counts as an error.
+    :raises ValueError: Raised when the report contains an error.
+    """
     if not unconstrained_error:
-        report.pop(error_detection.ErrorCategory.UNCONSTRAINED, None)
+        report = {category: values for category, values in report.items()
+                  if category != error_detection.ErrorCategory.UNCONSTRAINED}
     for _, values in report.items():
         if values:
             report_str = pformat(report)
+            name = Path(fcstd_filepath).name
             raise ValueError("Errors found in FreeCAD file"
-                             f" {fcstd_filepath.name}! Report:\n{report_str}")
+                             f" {name}! Report:\n{report_str}")
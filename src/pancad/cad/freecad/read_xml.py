@@ -1,56 +1,106 @@
 """A module providing functions for reading FreeCAD xml directly."""
 from __future__ import annotations
 
-from functools import partialmethod
 from collections import namedtuple
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 import logging
+import mmap
+import struct
 from xml.etree import ElementTree as ET
-from zipfile import ZipFile
+from zipfile import (
+    BadZipFile, ZipFile, ZIP_STORED, sizeFileHeader, stringFileHeader,
+    structFileHeader,
+)
 from pathlib import Path
 import graphlib
 
-from pancad.cad.freecad import xml_utils
-from pancad.cad.freecad.xml_utils import (
-    FCMetadata,
-    FreeCADLink,
-    FreeCADExpression,
-    FreeCADPlacement,
-    GeomData,
-    GeomPoint,
-    GeomLineSegment,
-    GeomCircle,
-    GeomEllipse,
-    GeomArcOfCircle,
-    PropertyPartShape,
-    SketchGeoExt,
-    ConstraintData,
+from pancad.cad.freecad import xml_cache, xml_streaming, xml_utils
+from pancad.cad.freecad.xml_utils import FCMetadata
+from pancad.cad.freecad.xml_appearance import (
+    AppearanceProperty, HashedString, STRING_HASHER_FILE, read_gui_appearance,
+    read_string_hasher,
+)
+from pancad.cad.freecad.xml_properties import (
+    FreeCADConstraintXML, FreeCADGeometryXML, FreeCADPropertyXML,
 )
-from pancad.cad.freecad.constants import ConstraintType, InternalGeometryType
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from typing import Any, NoReturn
+    from collections.abc import Callable, Collection, Iterable, Iterator
+    from typing import Any, IO, Self
+    from zipfile import ZipInfo
     from os import PathLike
     from xml.etree.ElementTree import Element, ElementTree
 
-    from pancad.cad.freecad.xml_utils import FreeCADUID, ConstraintGeoRef
+    from pancad.cad.freecad.xml_utils import (
+        FreeCADUID, PropertyPartShape,
+    )
 
 logger = logging.getLogger(__name__)
 
 ObjectIdInfo = namedtuple("ObjectIdInfo", ["name", "id_", "type_"])
-
+ShapeMembers = namedtuple("ShapeMembers", ["brp", "txt"])
+"""The archive members storing a PropertyPartShape's BREP and element map text.
+The txt member is None when the shape does not have one.
+"""
+
+def _map_properties(properties: list[FreeCADPropertyXML]
+                    ) -> dict[str, FreeCADPropertyXML]:
+    """Returns a map of the property names to the properties. The first
+    property is kept if a name is repeated.
+    """
+    name_map = {}
+    for prop in properties:
+        name_map.setdefault(prop.name, prop)
+    return name_map
 
 class FCStd:
-    """A class providing interfaces to a FreeCAD FCStd file."""
-    def __init__(self, zip_file: ZipFile):
+    """A class providing interfaces to a FreeCAD FCStd file. The Document.xml is
+    only parsed once it is needed, and metadata and select only parse the parts
+    of it they need.
+
+    :param zip_file: The opened FCStd zip file.
+    :param use_cache: Whether to read and store the parsed document in the
+        on-disk document cache. Defaults to None, which uses the user config.
+    :param mapping: A memory map of the zip file, if any. Stored (uncompressed)
+        members are read as slices of the map without copying.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # Each lazily read part of the file is cached in its own attribute
+
+    def __init__(self, zip_file: ZipFile, use_cache: bool=None, *,
+                 mapping: mmap.mmap=None):
         self._archive = zip_file
-        self._document = FreeCADDocumentXML.from_fcstd(self)
+        self._use_cache = use_cache
+        self._mapping = mapping
+        self._views = []
+        self._document = None
+        self._header = None
+        self._uid_map = None
+        self._appearance = None
 
     @classmethod
-    def from_path(cls, path: PathLike) -> FCStd:
-        """Returns a new FCStd object from the path."""
-        return cls(ZipFile(path))
+    def from_path(cls, path: PathLike, use_cache: bool=None,
+                  memory_map: bool=False) -> FCStd:
+        """Returns a new FCStd object from the path.
+
+        :param path: The path to the FCStd file.
+        :param use_cache: Whether to use the on-disk document cache. Defaults to
+            None, which uses the user config.
+        :param memory_map: Whether to memory map the file instead of reading it
+            through file reads. Stored members are then read without copying.
+        """
+        if not memory_map:
+            return cls(ZipFile(path), use_cache)
+        # The zip file still reads the directory and compressed members, the map
+        # is only used to view stored members.
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(ZipFile(path), use_cache, mapping=mapping)
+        except BaseException:
+            mapping.close()
+            raise
 
     @property
     def path(self) -> Path:
@@ -65,6 +115,9 @@ class FCStd:
     @property
     def document(self) -> FreeCADDocumentXML:
         """The parsed xml data object with the file's parametric info."""
+        if self._document is None:
+            self._document = FreeCADDocumentXML.from_fcstd(self,
+                                                           self._use_cache)
         return self._document
 
     @property
@@ -77,7 +130,8 @@ class FCStd:
             "LastModifiedDate": "last_modified_date",
             "Id": "user_id",
         }
-        inputs = {i: self.document.get_property(p).value
+        header = self._get_header()
+        inputs = {i: header.get_property(p).value
                   for p, i in doc_props.items()}
         return FCMetadata(**inputs)
 
@@ -86,7 +140,126 @@ class FCStd:
         """The has-to-be-unique pancad calculated id for the file. This uid
         is the same as the uid of the file as a whole.
         """
-        return self._document.uid
+        return self._get_header().uid
+
+    def select(self, types: Collection[str]=None, names: Collection[str]=None,
+               dependencies: bool=True) -> list[FreeCADObjectXML]:
+        """Returns the objects in the file matching the filters without reading
+        the rest of the objects, unless the full document has already been read.
+
+        :param types: The TypeIds of the objects to select, e.g.
+            'Sketcher::SketchObject'. Defaults to None, which selects any type.
+        :param names: The unique names of the objects to select. Defaults to
+            None, which selects any name.
+        :param dependencies: Whether to also return the objects the selected
+            objects link to, recursively. Defaults to True.
+        :returns: The selected objects in document order. When the full document
+            has not been read, the objects are in a partial document that only
+            contains the returned objects.
+        """
+        def is_match(info: ObjectIdInfo) -> bool:
+            return ((types is None or info.type_ in types)
+                    and (names is None or info.name in names))
+        selected = {info.name
+                    for info in self._get_header().get_object_info()
+                    if is_match(info)}
+        if dependencies:
+            selected = xml_streaming.get_link_closure(selected,
+                                                      self._get_link_graph())
+        if self._document is not None:
+            document = self._document
+        else:
+            document = self._read_document(lambda i: i.name in selected)
+        return [o for o in document.objects if o.name in selected]
+
+    def get_member(self, name: str) -> ArchiveMember:
+        """Returns a lazy handle to a file inside the archive. No data is read
+        until the member is read or opened.
+
+        :raises KeyError: When there is no member with the name in the archive.
+        """
+        return ArchiveMember(self, self.archive.getinfo(name))
+
+    def get_shape_members(self, shape: PropertyPartShape) -> ShapeMembers:
+        """Returns lazy handles to the sidecar files of a PropertyPartShape, so
+        BREP data is only loaded if it is asked for.
+        """
+        txt = None if shape.txt is None else self.get_member(shape.txt)
+        return ShapeMembers(self.get_member(shape.brp), txt)
+
+    def get_appearance(self) -> dict[str, dict[str, AppearanceProperty]]:
+        """Returns lazy handles to the appearance files of each object's view
+        provider, by object name and then property name. Only GuiDocument.xml
+        is read, each appearance file is read when its handle is. Returns an
+        empty dict when the file has no GuiDocument.xml, like files saved
+        without the FreeCAD gui.
+        """
+        if self._appearance is None:
+            try:
+                self._appearance = read_gui_appearance(self)
+            except KeyError:
+                self._appearance = {}
+        return self._appearance
+
+    def get_string_table(self) -> list[HashedString] | None:
+        """Returns the entries of the document's StringHasher table, or None
+        when the file does not have one.
+        """
+        try:
+            member = self.get_member(STRING_HASHER_FILE)
+        except KeyError:
+            return None
+        return read_string_hasher(member.read())
+
+    def read_member(self, name: str) -> memoryview | bytes:
+        """Returns the data of a file inside the archive. When memory mapped, a
+        stored member is returned as a memoryview of the map without copying.
+        Otherwise the data is decompressed into bytes.
+
+        :raises KeyError: When there is no member with the name in the archive.
+        """
+        return self.get_member(name).read()
+
+    def get_member_view(self, info: ZipInfo) -> memoryview | None:
+        """Returns a memoryview of a member's data in the memory map, or None
+        when the member cannot be viewed without decompressing or copying it.
+        The view is released when the file is closed.
+
+        :param info: The zip info of the member.
+        :raises BadZipFile: When the member's local file header is invalid.
+        """
+        if (self._mapping is None or info.compress_type != ZIP_STORED
+                or info.flag_bits & 0x1): # Encrypted
+            return None
+        offset = info.header_offset
+        header = struct.unpack(structFileHeader,
+                               self._mapping[offset:offset + sizeFileHeader])
+        if header[0] != stringFileHeader:
+            raise BadZipFile(f"Bad local file header for member {info.filename}")
+        start = offset + sizeFileHeader + header[10] + header[11]
+        # Views keep the map from closing, so they are released in close
+        view = memoryview(self._mapping)[start:start + info.file_size]
+        self._views.append(view)
+        return view
+
+    def close(self) -> None:
+        """Closes the archive and its memory map. Memoryviews of the map returned
+        by the file are released, so they cannot be used after closing.
+
+        :raises BufferError: When buffers exported from a memoryview of the map,
+            like numpy arrays made with frombuffer, are still alive. The archive
+            is closed regardless, and the map is closed by calling close again
+            once they have been deleted.
+        """
+        try:
+            if self._mapping is not None:
+                for view in self._views:
+                    view.release()
+                self._views.clear()
+                self._mapping.close()
+                self._mapping = None
+        finally:
+            self.archive.close()
 
     def get_topo_uids(self) -> list[FreeCADUID]:
         """Returns the topologically ordered (roughly the required creation
@@ -103,8 +276,91 @@ class FCStd:
         :param uid: A FreeCADUID compatible string to search for.
         :raises LookupError: When the uid cannot be found in the file.
         """
-        if not isinstance(uid, xml_utils.FreeCADUID):
-            uid = xml_utils.FreeCADUID(uid)
+        uid = xml_utils.FreeCADUID(uid)
+        try:
+            return self._get_uid_map()[uid]
+        except KeyError:
+            pass
+        # Not in the map, so search step by step to find where the uid fails
+        return self._find_by_uid(uid)
+
+    def _get_header(self) -> FreeCADDocumentXML:
+        """Returns the document with its properties and object list, but none of
+        its objects. Uses the full document when it has already been read.
+        """
+        if self._document is not None:
+            return self._document
+        if self._header is None:
+            self._header = self._read_document(lambda _: False)
+        return self._header
+
+    def _get_link_graph(self) -> dict[str, set[str]]:
+        """Returns the names of the objects each object links to. Uses the full
+        document when it has already been read, otherwise streams Document.xml
+        once without reading any object.
+        """
+        if self._document is not None:
+            return {o.name: o.get_child_names() | o.get_parent_names()
+                    for o in self._document.objects}
+        with self.open_xml("Document.xml") as document:
+            return xml_streaming.read_link_graph(document)
+
+    def _read_document(self, select: Callable[[ObjectIdInfo], bool]
+                       ) -> FreeCADDocumentXML:
+        """Reads a partial document with only the selected objects."""
+        with self.open_xml("Document.xml") as document:
+            return FreeCADDocumentXML.from_stream(document, self, select)
+
+    @contextmanager
+    def open_xml(self, name: str) -> Iterator[IO[bytes] | memoryview]:
+        """Opens an xml member for incremental parsing. Yields a memoryview of
+        the memory map for stored members of memory mapped files, otherwise a
+        decompressing stream.
+        """
+        member = self.get_member(name)
+        view = member.get_view()
+        if view is not None:
+            try:
+                yield view
+            finally:
+                view.release()
+            return
+        with member.open() as file:
+            yield file
+
+    def _get_uid_map(self) -> dict[FreeCADUID, (FCStd | FreeCADObjectXML
+                                                | FreeCADGeometryXML
+                                                | FreeCADConstraintXML)]:
+        """Returns the map of the uids in the file to their elements. The map is
+        built the first time it is needed. Sketch lists that fail to read are
+        left out of the map.
+        """
+        if self._uid_map is not None:
+            return self._uid_map
+        list_types = {"Part::PropertyGeometryList",
+                      "Sketcher::PropertyConstraintList"}
+        uid_map = {self.uid: self}
+        for obj in self.document.objects:
+            uid_map.setdefault(obj.uid, obj)
+            for prop in obj.properties:
+                if prop.type_ not in list_types or prop.is_private:
+                    continue
+                try:
+                    elements = {e.uid: e for e in reversed(prop.value)}
+                except (ValueError, NotImplementedError):
+                    continue
+                for element_uid, element in elements.items():
+                    uid_map.setdefault(element_uid, element)
+        self._uid_map = uid_map
+        return uid_map
+
+    def _find_by_uid(self, uid: FreeCADUID
+                     ) -> (FCStd | FreeCADObjectXML
+                           | FreeCADGeometryXML | FreeCADConstraintXML):
+        """Searches the file for the uid one level at a time.
+
+        :raises LookupError: When the uid cannot be found in the file.
+        """
         data = uid.data
         if self.uid.file_uid != data.file_uid:
             msg = f"UID not found: Document uid '{self.uid.file_uid}' mismatch"
@@ -133,22 +389,87 @@ class FCStd:
                    f" feature '{feature.name}' {data.list_name} list")
             raise LookupError(msg, uid) from exc
 
+    # Dunders
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} '{self.metadata.label}'>"
 
 
+class ArchiveMember:
+    """A lazy handle to a file inside an FCStd archive. The member's data is only
+    read when read or open is called.
+
+    :param fcstd: The FCStd file the member is inside of.
+    :param info: The zip info of the member.
+    """
+    def __init__(self, fcstd: FCStd, info: ZipInfo):
+        self._fcstd = fcstd
+        self._info = info
+
+    @property
+    def name(self) -> str:
+        """The file name of the member inside the archive."""
+        return self._info.filename
+
+    @property
+    def size(self) -> int:
+        """The uncompressed size of the member in bytes."""
+        return self._info.file_size
+
+    @property
+    def is_stored(self) -> bool:
+        """Whether the member is stored in the archive without compression."""
+        return self._info.compress_type == ZIP_STORED
+
+    def get_view(self) -> memoryview | None:
+        """Returns a memoryview of the member's data without copying it, or None
+        when the file is not memory mapped or the member is compressed.
+        """
+        return self._fcstd.get_member_view(self._info)
+
+    def read(self) -> memoryview | bytes:
+        """Returns the member's data. A memoryview of the memory map is returned
+        when possible, otherwise the data is read into bytes.
+        """
+        view = self.get_view()
+        if view is None:
+            return self._fcstd.archive.read(self._info)
+        return view
+
+    def open(self) -> IO[bytes]:
+        """Opens the member as a binary stream."""
+        return self._fcstd.archive.open(self._info)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} '{self.name}' {self.size}B>"
+
 class FreeCADDocumentXML:
     """A class providing an interface to FCStd Document.xml files.
 
     :param tree: An xml ElementTree read from a FCStd Document.xml file.
     :param file: The FCStd file this document is part of. Supports being None so
         this object can be used in the API.
+    :param objects: The ObjectData Object elements to read. Defaults to None,
+        which reads the ObjectData list of the tree.
+    :param select: An optional function called with the Objects list info of
+        each object that returns whether to read the object. Reading stops once
+        every selected object has been read. Defaults to None, which reads every
+        object.
     :raises ValueError: When the xml tree is an invalid Document.xml format.
     """
+    # pylint: disable=too-many-instance-attributes
+    # The objects and properties are each kept with the lookups indexing them
     tag = "Document"
     """The nominal tag of the element in xml."""
 
-    def __init__(self, tree: ElementTree, file: FCStd=None):
+    def __init__(self, tree: ElementTree, file: FCStd=None,
+                 objects: Iterable[Element]=None,
+                 select: Callable[[ObjectIdInfo], bool]=None):
         schema_version_name = "SchemaVersion"
         self._tree = tree
         self._file = file
@@ -167,8 +488,19 @@ class FreeCADDocumentXML:
             logger.warning("SchemaVersion %s not recognized,"
                            " invalid translation behavior may occur",
                            self.schema_version)
-        self._objects = self._read_all_objectdata()
+        self._object_info = {}
+        self._object_names_by_id = {}
+        for info in self._read_object_id_info():
+            self._object_info[info.name] = info
+            self._object_names_by_id[int(info.id_)] = info.name
+        self._objects = []
+        self._objects_by_name = {}
+        if objects is None:
+            objects = self._tree.iterfind("ObjectData/Object")
+        self._read_objects(objects, select)
+        self._parents_by_name = None
         self._properties = self._read_properties()
+        self._properties_by_name = _map_properties(self._properties)
 
     @classmethod
     def from_string(cls, string: str) -> FreeCADDocumentXML:
@@ -182,15 +514,53 @@ class FreeCADDocumentXML:
         """Creates a document from a zipped file structured like an FCStd file.
         """
         with file.open("Document.xml") as document:
-            return cls.from_string(document.read())
+            return cls.from_stream(document)
 
     @classmethod
-    def from_fcstd(cls, fcstd: FCStd) -> FreeCADDocumentXML:
+    def from_fcstd(cls, fcstd: FCStd, use_cache: bool=None
+                   ) -> FreeCADDocumentXML:
         """Creates a document from the FCStd object and sets it as the document's
         file.
+
+        Parsed documents are cached on disk by the SHA-256 hash of their
+        Document.xml, the pancad version and xml_cache.DOCUMENT_CACHE_SCHEMA,
+        so an unchanged file is only parsed once. Cached documents that cannot
+        be read or are from another schema are parsed again.
+
+        :param fcstd: The FCStd file to read the Document.xml from.
+        :param use_cache: Whether to use the on-disk document cache. Defaults to
+            None, which uses the user config.
+        """
+        return xml_cache.read_cached_document(fcstd, cls._read_fcstd,
+                                              use_cache)
+
+    @classmethod
+    def from_stream(cls, source: IO[bytes] | PathLike | memoryview,
+                    file: FCStd=None,
+                    select: Callable[[ObjectIdInfo], bool]=None
+                    ) -> FreeCADDocumentXML:
+        """Creates a document by incrementally parsing Document.xml data.
+
+        Unlike from_string, the full xml is never held in memory at once. The
+        document Properties and Objects lists are kept since they are small, but
+        each ObjectData Object element is read into a FreeCADObjectXML as soon
+        as it has been parsed and is then cleared from the tree.
+
+        :param source: A binary file object, path, or in-memory bytes-like data
+            to read the xml from.
+        :param file: The FCStd file this document is part of.
+        :param select: An optional function called with the Objects list info of
+            each object that returns whether to read the object. Objects that
+            are not selected are cleared without being read, and parsing stops
+            once every selected object has been read. Defaults to None, which
+            reads every object.
+        :raises ValueError: When the xml is an invalid Document.xml format.
         """
-        with fcstd.archive.open("Document.xml") as document:
-            return cls(ET.fromstring(document.read()), fcstd)
+        elements = xml_streaming.iter_document_elements(source)
+        root = next(elements, None)
+        if root is None:
+            raise ValueError("Document.xml has no root element")
+        return cls(root, file, objects=elements, select=select)
 
     # Properties
     @property
@@ -200,9 +570,15 @@ class FreeCADDocumentXML:
 
     @property
     def file(self) -> FCStd:
-        """The file this document is inside of."""
+        """The file this document is inside of. Set again on documents read
+        from the cache, since the file is not pickled with them.
+        """
         return self._file
 
+    @file.setter
+    def file(self, value: FCStd | None) -> None:
+        self._file = value
+
     @property
     def objects(self) -> list[FreeCADObjectXML]:
         """Returns all objects inside this document."""
@@ -228,18 +604,17 @@ class FreeCADDocumentXML:
         :raises LookupError: When the id_ is not in the document.
         """
         try:
-            id_info = self._get_object_id_info(id_)
+            id_info = self.get_object_info(id_)
+            return self._objects_by_name[id_info.name]
         except LookupError as exc:
             exc.add_note(f"Could not find Object id '{id_}' the document")
             raise
-        # If this gets a StopIteration error, the xml and object are out of sync
-        return next(obj for obj in self.objects if obj.name == id_info.name)
 
     def get_property(self, name: str) -> FreeCADPropertyXML:
         """Returns the FreeCADPropertyXML object with the provided name."""
         try:
-            return next(p for p in self.properties if p.name == name)
-        except StopIteration as exc:
+            return self._properties_by_name[name]
+        except KeyError as exc:
             msg = f"Could not find property '{name}'"
             raise LookupError(msg, name) from exc
 
@@ -250,27 +625,17 @@ class FreeCADDocumentXML:
         would be if there are two independent sketches then the order that
         they appear in the document is arbitrary.
         """
-        child_graph = {obj.name: self.get_object_parents(obj.name)
-                       for obj in self.objects}
-        sorter = graphlib.TopologicalSorter(child_graph)
+        sorter = graphlib.TopologicalSorter(self._get_parent_map())
         return list(sorter.static_order())
 
-    def get_object_parents(self, id_: str | int) -> list[str]:
-        """Returns the direct parents of the object by its name or id. Does not
-        return all parents recursively up the tree.
-        """
-        obj = self.get_object(id_)
-        parents = obj.get_parent_names()
-        all_parents = {o.name: o.get_child_names() for o in self.objects}
-        for parent, children_by_parent in all_parents.items():
-            if obj.name in children_by_parent:
-                parents.add(parent)
-        return parents
+    def get_fingerprints(self) -> dict[FreeCADUID, str]:
+        """Returns the fingerprint of each object in the document by its uid."""
+        return {obj.uid: obj.fingerprint for obj in self.objects}
 
-    # Private Methods
-    def _get_object_id_info(self, id_: str | int=None
-                           ) -> ObjectIdInfo | list[ObjectIdInfo]:
-        """Finds one or all object info tuples in the document
+    def get_object_info(self, id_: str | int=None
+                        ) -> ObjectIdInfo | list[ObjectIdInfo]:
+        """Returns the Objects list info of one or all objects in the document,
+        without reading the objects.
 
         :param id_: Either the integer id or the string unique name of an
             object. The integer id can be a string digit.
@@ -278,31 +643,80 @@ class FreeCADDocumentXML:
             None, or the one ObjectIdInfo when id_ is not None.
         :raises LookupError: When the id could not be found in the document.
         """
-        xpath = "Objects/Object"
-        props = ["name", "id", "type"]
         if id_ is None:
-            all_info = []
-            for obj in self._tree.findall(xpath):
-                all_info.append(ObjectIdInfo(*[obj.attrib[p] for p in props]))
-            return all_info
-        # Single ObjectIdInfo
+            return list(self._object_info.values())
+        name = id_
         if isinstance(id_, int) or (isinstance(id_, str) and id_.isdigit()):
-            xpath = xpath + f"[@id='{id_}']"
-        else:
-            xpath = xpath + f"[@name='{id_}']"
-        obj = xml_utils.find_single(self._tree, xpath)
-        return ObjectIdInfo(*[obj.attrib[p] for p in props])
+            name = self._object_names_by_id.get(int(id_))
+        try:
+            return self._object_info[name]
+        except KeyError as exc:
+            raise LookupError("No Objects element has the id", id_) from exc
 
-    def _read_all_objectdata(self) -> FreeCADObjectXML:
-        """Reads all objects from the ObjectData/Object list into
-        FreeCADObjectXML objects.
+    def get_object_parents(self, id_: str | int) -> set[str]:
+        """Returns the direct parents of the object by its name or id. Does not
+        return all parents recursively up the tree.
         """
-        name_map = {info.name: info for info in self._get_object_id_info()}
-        objects = []
-        for obj in self._tree.findall("ObjectData/Object"):
-            info = name_map[obj.attrib["name"]]
-            objects.append(FreeCADObjectXML(obj, info.id_, info.type_, self))
-        return objects
+        obj = self.get_object(id_)
+        return set(self._get_parent_map()[obj.name])
+
+    # Private Methods
+    @classmethod
+    def _read_fcstd(cls, fcstd: FCStd) -> FreeCADDocumentXML:
+        """Streams the Document.xml of the file into a document."""
+        with fcstd.open_xml("Document.xml") as document:
+            return cls.from_stream(document, fcstd)
+
+    def _read_object_id_info(self) -> list[ObjectIdInfo]:
+        """Reads the info tuples of every element in the Objects list."""
+        props = ["name", "id", "type"]
+        return [ObjectIdInfo(*[obj.attrib[p] for p in props])
+                for obj in self._tree.findall("Objects/Object")]
+
+    def _get_parent_map(self) -> dict[str, set[str]]:
+        """Returns the map of each object name to its direct parent names. The
+        map is built the first time it is needed from the links defined by
+        both the children and the parents.
+        """
+        if self._parents_by_name is not None:
+            return self._parents_by_name
+        parents_by_name = {obj.name: obj.get_parent_names()
+                           for obj in self.objects}
+        for obj in self.objects:
+            for child in obj.get_child_names():
+                if child in parents_by_name:
+                    parents_by_name[child].add(obj.name)
+        self._parents_by_name = parents_by_name
+        return parents_by_name
+
+    def _read_objects(self, elements: Iterable[Element],
+                      select: Callable[[ObjectIdInfo], bool] | None) -> None:
+        """Reads the selected ObjectData Object elements into FreeCADObjectXML
+        objects. Stops taking elements once every selected object is read.
+        """
+        remaining = None
+        if select is not None:
+            remaining = {info.name for info in self.get_object_info()
+                         if select(info)}
+            if not remaining:
+                return
+        for element in elements:
+            name = element.get("name")
+            if remaining is None or name in remaining:
+                obj = self._read_objectdata(element)
+                self._objects.append(obj)
+                self._objects_by_name[obj.name] = obj
+            if remaining is not None:
+                remaining.discard(name)
+                if not remaining:
+                    return
+
+    def _read_objectdata(self, element: Element) -> FreeCADObjectXML:
+        """Reads one ObjectData/Object element into a FreeCADObjectXML object
+        using the id and type from the matching Objects list element.
+        """
+        info = self._object_info[xml_utils.read_attr(element, "name")]
+        return FreeCADObjectXML(element, info.id_, info.type_, self)
 
     def _read_properties(self) -> list[FreeCADPropertyXML]:
         """Reads the properties of the document into a list of interfacing
@@ -323,6 +737,16 @@ class FreeCADDocumentXML:
                                str(exc.__reduce__()))
         return properties
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the state to pickle. The file is left out since an open zip
+        file cannot be pickled. It is set again when read from the cache. The
+        cache schema is added so documents from other schemas are not used.
+        """
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_cache_schema"] = xml_cache.DOCUMENT_CACHE_SCHEMA
+        return state
+
 class FreeCADObjectXML:
     """A class providing an interface to FCStd Document.xml xml object elements.
 
@@ -341,10 +765,11 @@ class FreeCADObjectXML:
         self._name = xml_utils.read_attr(element, "name")
         self._id = int(id_)
         self._type = type_
-        self._element = element
-        # Some properties depend on others (Constraints), so initialize the list
+        # Fingerprinted now since streamed reads clear the element afterwards
+        self._fingerprint = xml_utils.fingerprint_element(element)
         self._properties = []
-        self._read_properties()
+        self._properties_by_name = {}
+        self._read_properties(element)
 
     @property
     def id_(self) -> int:
@@ -361,6 +786,14 @@ class FreeCADObjectXML:
                            self.name, self.type_)
             return f"NO LABEL, NAME: {self.name}"
 
+    @property
+    def fingerprint(self) -> str:
+        """A hash of the object's xml that only changes when its content
+        changes. Used to find the objects that changed between two versions of a
+        file.
+        """
+        return self._fingerprint
+
     @property
     def name(self) -> str:
         """The file-unique FreeCAD string name of the object."""
@@ -389,13 +822,13 @@ class FreeCADObjectXML:
 
     def has_property(self, name: str) -> bool:
         """Returns whether the object has a property with the given name."""
-        return name in {p.name for p in self.properties}
+        return name in self._properties_by_name
 
     def get_property(self, name: str) -> FreeCADPropertyXML:
         """Returns the FreeCADPropertyXML object with the provided name."""
         try:
-            return next(p for p in self.properties if p.name == name)
-        except StopIteration as exc:
+            return self._properties_by_name[name]
+        except KeyError as exc:
             msg = f"Could not find property '{name}' on Object '{self.name}'"
             raise LookupError(msg, name) from exc
 
@@ -424,25 +857,31 @@ class FreeCADObjectXML:
                 names.update(p.name for p in prop.value)
         return names
 
-    def _read_properties(self) -> list[FreeCADPropertyXML]:
+    def _read_properties(self, element: Element) -> list[FreeCADPropertyXML]:
         """Reads the properties of the object into a list of interfacing
         objects.
+
+        :param element: The xml ObjectData Object element of the object.
         """
         self._properties = [] # Clear the property list
         try:
-            property_list = list(self._element.find("Properties"))
+            property_list = list(element.find("Properties"))
         except TypeError as exc:
             msg = "Unexpected Object format: could not find Properties element"
-            raise ValueError(msg, self._element) from exc
+            raise ValueError(msg, element) from exc
         property_list.sort(key=self._property_read_sort_key)
+        self._properties_by_name = {}
         for prop in property_list:
             try:
-                self._properties.append(FreeCADPropertyXML(prop, self))
+                prop_xml = FreeCADPropertyXML(prop, self)
             except (ValueError, NotImplementedError) as exc:
                 filename = self.document.file.path.name
                 exc.add_note(f"On Object '{self.name}' in file '{filename}'")
                 logger.warning("Object '%s' property read failed. Reason:\n%s",
                                self.name, str(exc.__reduce__()))
+                continue
+            self._properties.append(prop_xml)
+            self._properties_by_name.setdefault(prop_xml.name, prop_xml)
         return self._properties
 
     @staticmethod
@@ -463,472 +902,3 @@ class FreeCADObjectXML:
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} '{self.name}'>"
-
-class FreeCADPropertyXML:
-    """A class providing interfaces to FCStd Document.xml element properties.
-
-    :param element: The xml Property element inside a FCStd Properties xml
-        element list.
-    :param parent: The object this property is inside of.
-    """
-    tag = "Property"
-    """The nominal tag of the element in xml. If is_private is True, then it's
-    actually _Property, but if that matters in a specific application then
-    properties should be filtered based on that boolean rather than depending on
-    the specific tag format.
-    """
-
-    def __init__(self, element: Element, parent: FreeCADObjectXML):
-        try:
-            self._name = element.attrib["name"]
-        except KeyError as exc:
-            msg = "Invalid Property element, could not find 'name' attribute"
-            raise ValueError(msg, element) from exc
-        try:
-            self._type = element.attrib["type"]
-        except KeyError as exc:
-            msg = "Invalid Property element, could not find 'type' attribute"
-            raise ValueError(msg, element) from exc
-        self._is_private = element.tag.startswith("_")
-        self._element = element
-        self._parent = parent
-        func_to_types = {
-            self._read_single_str: ["App::PropertyUUID", "App::PropertyString"],
-            self._read_single_uuid: ["Materials::PropertyMaterial"],
-            self._read_single_bool: ["App::PropertyBool"],
-            self._read_single_float: [
-                "App::PropertyPrecision",
-                "App::PropertyAngle",
-                "App::PropertyLength",
-                "App::PropertyFloat",
-            ],
-            self._read_property_part_shape: ["Part::PropertyPartShape"],
-            self._read_value_vector: ["App::PropertyVector"],
-            self._read_link_list: [
-                "App::PropertyLinkList",
-                "App::PropertyLinkListHidden",
-            ],
-            self._read_link: ["App::PropertyLink", "App::PropertyLinkHidden"],
-            self._read_link_sub: ["App::PropertyLinkSub"],
-            self._read_enum: ["App::PropertyEnumeration"],
-            self._read_link_sub_list: ["App::PropertyLinkSubList"],
-            self._read_geometry: ["Part::PropertyGeometryList"],
-            self._read_constraints: ["Sketcher::PropertyConstraintList"],
-            self._read_expressions: ["App::PropertyExpressionEngine"],
-            self._read_placement: ["App::PropertyPlacement"],
-            self._read_property_map: ["App::PropertyMap"],
-        }
-        self._type_func_dispatch = {}
-        for func, types in func_to_types.items():
-            self._type_func_dispatch.update({t: func for t in types})
-
-        try:
-            value_func = self._type_func_dispatch[self.type_]
-        except KeyError as exc:
-            msg = f"Property type '{self.type_}' has not been implemented."
-            not_imp_exc = NotImplementedError(msg)
-            not_imp_exc.add_note(f"On Property '{self.name}'")
-            raise not_imp_exc from exc
-        try:
-            if self.is_private:
-                # Private properties appear to be derived from elsewhere.
-                self._value = None
-            else:
-                self._value = value_func()
-        except (ValueError, NotImplementedError) as exc:
-            exc.add_note(f"While reading values on Property '{self.name}'")
-            raise
-
-    @property
-    def name(self) -> str:
-        """The name attribute of the property in the file's xml."""
-        return self._name
-
-    @property
-    def type_(self) -> str:
-        """The type attribute of the property in the file's xml."""
-        return self._type
-
-    @property
-    def is_private(self) -> bool:
-        """Whether the property tag is marked with a private underscore in the
-        xml file.
-        """
-        return self._is_private
-
-    @property
-    def parent(self) -> FreeCADObjectXML:
-        """The object this property is inside of."""
-        return self._parent
-
-    @property
-    def value(self) -> Any:
-        """The value of the property in its xml."""
-        return self._value
-
-    def _read_single(self, element: Element) -> Element:
-        """Reads the first element of an element inside the property when the
-        element must have at least one subelement to be possible to read.
-
-        :param element: An xml Element.
-        :raises ValueError: When element does not have exactly 1 subelement.
-        """
-        if (no_subelements := len(element)) != 1:
-            msg = (f"Unexpected Property format for {self.type_}:"
-                   f"Expected 1 subelement but found {no_subelements}")
-            raise ValueError(msg, element)
-        return element[0]
-
-    def _read_first(self) -> Element:
-        """Reads the first property subelement."""
-        return self._read_single(self._element)
-
-    def _read_single_attr(self, name: str,
-                          converter: Callable[str, Any]=str) -> Any:
-        """Read property type that has a single element with a value attr."""
-        return xml_utils.read_attr(self._read_first(), name, converter)
-
-    _read_single_str = partialmethod(_read_single_attr, "value")
-    _read_single_uuid = partialmethod(_read_single_attr, "uuid")
-    _read_single_bool = partialmethod(_read_single_attr, "value",
-                                      xml_utils.read_bool)
-    _read_single_float = partialmethod(_read_single_attr, "value", float)
-
-    def _read_single_vector(self, names: tuple[str, str, str],
-                            prefix: str=None, is_2d: bool=False
-                            ) -> tuple[float, float, float]:
-        """Reads the vector inside the first subelement."""
-        element = self._read_first()
-        return xml_utils.read_vector(element, names, prefix, is_2d)
-
-    _read_value_vector = partialmethod(_read_single_vector,
-                                       ("X", "Y", "Z"), "value")
-
-    def _read_enum(self) -> int | str:
-        """Reads enumerations. If there's a custom list it converts the option to
-        its selected string.
-        """
-        select = xml_utils.find_single(self._element, "Integer")
-        selection = xml_utils.read_attr(select, "value", int)
-        is_custom = select.get("CustomEnum")
-        if is_custom is not None and xml_utils.read_bool(is_custom):
-            options = xml_utils.find_single(self._element, "CustomEnumList")
-            return xml_utils.read_attr(options[selection], "value")
-        return selection
-
-    def _read_nested_attr_list(self, attr: str) -> list[str]:
-        """Read property type that has a list of value attr subelements."""
-        return [xml_utils.read_attr(e, attr) for e in self._read_first()]
-
-    _read_str_list = partialmethod(_read_nested_attr_list, "value")
-
-    def _read_property_part_shape(self) -> PropertyPartShape:
-        return PropertyPartShape.from_element(self._element)
-
-    def _read_link_sub(self) -> list[FreeCADLink]:
-        """Read property type with child-to-parent links to one object."""
-        links = []
-        element = self._read_first()
-        obj_name = xml_utils.read_attr(element, "value")
-        if obj_name == "": # Empty element means no links
-            return links
-        for subelement in element:
-            sub_name = xml_utils.read_attr(subelement, "value")
-            shadow = subelement.get("shadow")
-            if sub_name == "":
-                sub_name = None
-            links.append(FreeCADLink(obj_name, sub_name, shadow))
-        if len(links) == 0: # Name is not empty, so just the link to the object.
-            links.append(FreeCADLink(obj_name))
-        return links
-
-    def _read_link(self) -> FreeCADLink | None:
-        """Read property type with parent-to-child link to one object."""
-        element = self._read_first()
-        name = xml_utils.read_attr(element, "value")
-        if name == "":
-            return None
-        return FreeCADLink(name)
-
-    def _read_link_list(self) -> list[FreeCADLink]:
-        """Read property type with parent-to-child links to one object."""
-        links = []
-        element = self._read_first()
-        for subelement in element:
-            name = xml_utils.read_attr(subelement, "value")
-            links.append(FreeCADLink(name))
-        return links
-
-    def _read_placement(self) -> FreeCADPlacement:
-        element = self._read_first()
-        return FreeCADPlacement.from_element(element)
-
-    def _read_property_map(self) -> list:
-        """If any property maps add elements, this will raise a better
-        NotImplementedError to make it clear that it's something to
-        implement.
-        """
-        if len(self._read_first()) > 0:
-            num = len(self._read_first())
-            msg = (f"Expected PropertyMap to have 0 elements, found {num}. any"
-                  " Nested Map elements have not been implemented.")
-            raise NotImplementedError(msg)
-        return [] # element = self._read_first() # Not used since always empty
-
-    def _read_link_sub_list(self) -> list[FreeCADLink]:
-        """Read property type with child-to-parent links to multiple objects."""
-        links = []
-        element = self._read_first()
-        for subelement in element:
-            obj_name = xml_utils.read_attr(subelement, "obj")
-            if obj_name == "":
-                continue
-            sub_name = xml_utils.read_attr(subelement, "sub")
-            shadow = subelement.get("shadow")
-            if sub_name == "":
-                sub_name = None
-            links.append(FreeCADLink(obj_name, sub_name, shadow))
-        return links
-
-    def _read_geometry(self) -> list[FreeCADGeometryXML]:
-        geometry = []
-        for element in self._read_first():
-            try:
-                geometry.append(FreeCADGeometryXML(element, self))
-            except NotImplementedError as exc:
-                logger.warning("Failed to read geometry element: %s", exc)
-        return geometry
-
-    def _read_expressions(self) -> list[FreeCADExpression]:
-        element = self._read_first()
-        expressions = []
-        attrs = ["path", "expression"]
-        for exp in element:
-            inputs = {name: xml_utils.read_attr(exp, name) for name in attrs}
-            expressions.append(FreeCADExpression(**inputs))
-        return expressions
-
-    def _read_constraints(self) -> list[FreeCADConstraintXML]:
-        constraints = []
-        for element in self._read_first():
-            constraints.append(FreeCADConstraintXML(element, self))
-        return constraints
-
-    def __repr__(self) -> str:
-        type_wo_ns = self.type_.split("::")[-1]
-        return f"<FreeCADPropertyXML {self.name} {type_wo_ns}>"
-
-class FreeCADGeometryXML:
-    """A class providing interfaces to FCStd Document.xml sketch geometry
-    elements.
-
-    :param element: The xml Geometry element inside an FCStd
-        Part::PropertyGeometryList type xml property list.
-    :param parent: The FreeCADPropertyXML this geometry is inside of.
-    """
-    tag = "Geometry"
-
-    def __init__(self, element: Element, parent: FreeCADPropertyXML):
-        self._parent = parent
-        self._type = xml_utils.read_attr(element, "type")
-        self._id = int(xml_utils.read_attr(element, "id"))
-        self._element = element
-        self._sketch_ext = self._get_sketch_geometry_extension()
-        self._is_construction = self._get_construction()
-        self._geometry = self._get_geom()
-
-    @property
-    def type_(self) -> str:
-        """The TypeId string of the geometry."""
-        return self._type
-
-    @property
-    def internal_type(self) -> InternalGeometryType:
-        """The internal alignment type of the geometry specified in the xml."""
-        return self._sketch_ext.internal_geometry_type
-
-    @property
-    def id_(self) -> int:
-        """The sketch-unique FreeCAD integer id of the geometry."""
-        return self._id
-
-    @property
-    def parent(self) -> FreeCADPropertyXML:
-        """The object this geometry is inside of."""
-        return self._parent
-
-    @property
-    def is_construction(self) -> bool:
-        """Whether the geometry is sketch construction geometry."""
-        return self._is_construction
-
-    @property
-    def uid(self) -> FreeCADUID:
-        """The has-to-be-unique pancad calculated id for this element."""
-        feature = self.parent.parent
-        document = feature.document
-        parts = [
-            document.get_property('Uid').value,
-            "sketchgeo",
-            feature.id_,
-            int(self.id_ < 0), # 0 for Geometry, 1 for ExternalGeo
-            self.id_,
-        ]
-        return xml_utils.FreeCADUID("_".join(map(str, parts)))
-
-    @property
-    def geometry(self) -> GeomData:
-        """The geometric data of the geometry represented by this xml element."""
-        return self._geometry
-
-    def get_defining_geometry(self) -> FreeCADGeometryXML:
-        """Returns the geometry defining this geometry. If non-internal
-        geometry, this echos the geometry. If this is internal geometry
-        (e.g. an Ellipse major axis), this returns the Ellipse.
-        """
-        if self.internal_type == InternalGeometryType.NOT_INTERNAL:
-            return self
-        sketch = self.parent.parent
-        constraints = sketch.get_property("Constraints").value
-        id_type = (self.id_, self.internal_type)
-        for constraint in constraints:
-            cons_id_type = (constraint.data.pairs.first.id_, self.internal_type)
-            if id_type == cons_id_type:
-                geo, _ = constraint.data.pairs.second.get_geometry()
-                return geo
-        msg = (f"Could not find the internal aligning constraint for"
-               f" id, type: {id_type} in {sketch.name}")
-        raise ValueError(msg)
-
-    def _get_geo_extension(self, type_: str) -> Element:
-        """Returns the GeoExtension of the provided type.
-
-        :raises LookupError: When the extension is not found.
-        """
-        xpath = f"GeoExtensions/GeoExtension[@type='{type_}']"
-        return xml_utils.find_single(self._element, xpath)
-
-    def _get_geom(self) -> Element:
-        tag = self.type_.removeprefix("Part::")
-        if tag != "GeomPoint": # Point is the only one that keeps the 'Geom'
-            tag = tag.removeprefix("Geom")
-        element = xml_utils.find_single(self._element, tag)
-        tag_to_dataclass = {
-            "GeomPoint": GeomPoint,
-            "LineSegment": GeomLineSegment,
-            "Circle": GeomCircle,
-            "Ellipse": GeomEllipse,
-            "ArcOfCircle": GeomArcOfCircle,
-        }
-        try:
-            geom_class = tag_to_dataclass[tag]
-        except KeyError as exc:
-            msg = f"Reading func for {exc.args[0]} types not yet implemented"
-            raise NotImplementedError(msg) from exc
-        return geom_class.from_element(self, element)
-
-    def _get_sketch_geometry_extension(self) -> SketchGeoExt:
-        """Returns the Sketcher::SketchGeometryExtension that all geometry has
-        to have.
-        """
-        type_ = "Sketcher::SketchGeometryExtension"
-        try:
-            element = self._get_geo_extension(type_)
-        except LookupError as exc:
-            msg = "Unexpected Geometry format: No SketchGeometryExtension found"
-            raise ValueError(msg, self._element) from exc
-        return SketchGeoExt.from_element(self, element)
-
-    def _get_construction(self) -> bool:
-        try:
-            element = xml_utils.find_single(self._element, "Construction")
-        except LookupError as exc:
-            msg = "Unexpected Geometry format: No Construction element found"
-            raise ValueError(msg, self._element) from exc
-        try:
-            value = xml_utils.read_attr(element, "value")
-        except ValueError as exc:
-            msg ="Exception from reading Geometry element"
-            exc.add_note(msg)
-            raise
-        return xml_utils.read_bool(value)
-
-    def __repr__(self) -> str:
-        geo_type = self.geometry.__class__.__name__
-        sketch_name = self.parent.parent.name
-        return f"<{self.__class__.__name__} {geo_type} {sketch_name} {self.id_}>"
-
-class FreeCADConstraintXML:
-    """A class providing interfaces to FCStd Document.xml geometry elements.
-
-    :param element: The xml Constrain element inside an FCStd
-        Sketcher::PropertyConstraintList type xml property list.
-    :param parent: The FreeCADPropertyXML this constraint is inside of.
-    """
-    tag = "Constrain"
-
-    def __init__(self, element: Element, parent: FreeCADPropertyXML):
-        self._parent = parent
-        self._element = element
-        self._data = ConstraintData.from_element(self, element)
-
-    @property
-    def parent(self) -> FreeCADPropertyXML:
-        """The object this constraint is inside of."""
-        return self._parent
-
-    @property
-    def data(self) -> ConstraintData:
-        """The detailed constraint data structure."""
-        return self._data
-
-    @property
-    def type_(self) -> ConstraintType:
-        """The constraint type number."""
-        return self.data.type_
-
-    @property
-    def value(self) -> float:
-        """The value of the constraint stored in xml. All FreeCAD constraints
-        have a value, but it's normally 0 unless the constraint actually
-        uses it (distance, diameter, etc).
-        """
-        return self.data.value
-
-    @property
-    def internal_type(self) -> InternalGeometryType:
-        """The internal alignment type of the constraint."""
-        if self.data.internal_alignment is None:
-            return InternalGeometryType.NOT_INTERNAL
-        return self.data.internal_alignment.type_
-
-    @property
-    def uid(self) -> FreeCADUID:
-        """The has-to-be-unique pancad calculated id for this element."""
-        feature = self.parent.parent
-        document = feature.document
-        parts = [document.get_property('Uid').value, "sketchcons",
-                 feature.id_, self.type_]
-        pairs = self._data.pairs
-        for pair in [pairs.first, pairs.second, pairs.third]:
-            if pair.id_ is None:
-                id_ = -2000
-            else:
-                id_ = pair.id_
-            list_int_map = {None: 0, "Geometry": 0, "ExternalGeo": 1}
-            try:
-                list_int = list_int_map[pair.list_name]
-            except KeyError as exc:
-                msg = f"Unexpected value for list_name: {pair.list_name}"
-                raise ValueError(msg) from exc
-            parts.extend([list_int, id_, pair.part])
-        return xml_utils.FreeCADUID("_".join(map(str, parts)))
-
-    def get_references(self) -> list[ConstraintGeoRef]:
-        """Returns the geometry and subpart references constrained by this
-        constraint.
-        """
-        return self.data.pairs.as_list()
-
-    def __repr__(self) -> str:
-        return f"<{self.__class__.__name__} {self.data.type_.human_name}>"
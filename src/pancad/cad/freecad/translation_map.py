@@ -0,0 +1,197 @@
+"""A module providing the map used to record which uids a translation created
+which pancad things from. Translations add to the map as they go and have to be
+able to undo what a failed feature added, so the map records changes made after
+a savepoint instead of being copied before each feature.
+"""
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
+    from typing import Self
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_MISSING = object()
+
+class TranslationMap(MutableMapping[K, V], Generic[K, V]):
+    """A mapping from source uids to the things translated from them, with
+    constant time reverse lookup, a per-type index, and nested savepoints.
+
+    Several keys can map to the same value, so reverse lookups return every key
+    of a value. Values are compared by identity for reverse lookups since
+    geometry can compare equal without being the same element.
+
+    :param items: The initial keys and values.
+    """
+
+    def __init__(self, items: Iterable[tuple[K, V]] | dict[K, V]=()) -> None:
+        self._values: dict[K, V] = {}
+        self._keys_by_value: dict[int, dict[K, None]] = {}
+        self._types: dict[K, Hashable] = {}
+        self._keys_by_type: dict[Hashable, dict[K, None]] = {}
+        self._journal: list[tuple[K, object, Hashable]] = []
+        self._savepoints: list[int] = []
+        self.update(items)
+
+    # Public Methods
+    def add(self, key: K, value: V, type_: Hashable=None) -> None:
+        """Maps the key to the value and records the key under a type.
+
+        :param key: The source uid.
+        :param value: The thing translated from the source.
+        :param type_: The type to index the key under, like the FreeCAD object
+            type of the source. Not indexed when None.
+        """
+        self._record(key)
+        if key in self._values:
+            self._unindex(key)
+        self._insert(key, value, type_)
+
+    def get_keys(self, value: V) -> list[K]:
+        """Returns every key mapped to the value, in the order they were added.
+        Returns an empty list if the value is not in the map.
+        """
+        return list(self._keys_by_value.get(id(value), ()))
+
+    def get_typed_keys(self, *types: Hashable) -> list[K]:
+        """Returns the keys added with any of the types."""
+        keys = []
+        for type_ in types:
+            keys.extend(self._keys_by_type.get(type_, ()))
+        return keys
+
+    def get_type(self, key: K) -> Hashable:
+        """Returns the type the key was added with, or None if it has none.
+
+        :raises KeyError: When the key is not in the map.
+        """
+        if key not in self._values:
+            raise KeyError(key)
+        return self._types.get(key)
+
+    def savepoint(self) -> int:
+        """Starts recording changes so they can be undone by rollback.
+        Savepoints can be nested.
+
+        :returns: The number of open savepoints, including the new one.
+        """
+        self._savepoints.append(len(self._journal))
+        return len(self._savepoints)
+
+    def rollback(self) -> None:
+        """Undoes the changes made since the last savepoint and closes it.
+        Replaced keys keep their place in the iteration order, but deleted keys
+        are added back at the end.
+
+        :raises RuntimeError: When there is no open savepoint.
+        """
+        start = self._pop_savepoint()
+        while len(self._journal) > start:
+            key, value, type_ = self._journal.pop()
+            if value is _MISSING:
+                self._remove(key)
+                continue
+            if key in self._values:
+                self._unindex(key)
+            self._insert(key, value, type_)
+
+    def release(self) -> None:
+        """Keeps the changes made since the last savepoint and closes it. The
+        changes can still be undone by rolling back an enclosing savepoint.
+
+        :raises RuntimeError: When there is no open savepoint.
+        """
+        self._pop_savepoint()
+        if not self._savepoints:
+            self._journal.clear()
+
+    def get_added_keys(self) -> list[K]:
+        """Returns the keys that were not in the map at the last savepoint and
+        still are, in the order they were added.
+
+        :raises RuntimeError: When there is no open savepoint.
+        """
+        if not self._savepoints:
+            raise RuntimeError("No savepoint is open")
+        previous = {}
+        for key, value, _ in self._journal[self._savepoints[-1]:]:
+            previous.setdefault(key, value)
+        return [key for key, value in previous.items()
+                if value is _MISSING and key in self._values]
+
+    @contextmanager
+    def transaction(self) -> Iterator[Self]:
+        """Returns a context manager that opens a savepoint, releases it when
+        the block finishes and rolls it back when the block raises.
+        """
+        self.savepoint()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.release()
+
+    # Private Methods
+    def _record(self, key: K) -> None:
+        """Records the current state of the key if a savepoint is open."""
+        if self._savepoints:
+            self._journal.append((key, self._values.get(key, _MISSING),
+                                  self._types.get(key)))
+
+    def _insert(self, key: K, value: V, type_: Hashable) -> None:
+        self._values[key] = value
+        self._keys_by_value.setdefault(id(value), {})[key] = None
+        if type_ is not None:
+            self._types[key] = type_
+            self._keys_by_type.setdefault(type_, {})[key] = None
+
+    def _unindex(self, key: K) -> None:
+        """Removes the key from the reverse and type indices."""
+        value_id = id(self._values[key])
+        keys = self._keys_by_value[value_id]
+        del keys[key]
+        if not keys:
+            del self._keys_by_value[value_id]
+        if (type_ := self._types.pop(key, None)) is not None:
+            del self._keys_by_type[type_][key]
+
+    def _remove(self, key: K) -> None:
+        self._unindex(key)
+        del self._values[key]
+
+    def _pop_savepoint(self) -> int:
+        try:
+            return self._savepoints.pop()
+        except IndexError as exc:
+            raise RuntimeError("No savepoint is open") from exc
+
+    # Dunders
+    def __getitem__(self, key: K) -> V:
+        return self._values[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.add(key, value, self._types.get(key))
+
+    def __delitem__(self, key: K) -> None:
+        if key not in self._values:
+            raise KeyError(key)
+        self._record(key)
+        self._remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._values!r})"
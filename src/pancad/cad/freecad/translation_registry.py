@@ -0,0 +1,192 @@
+"""A module providing the tables that FreeCAD to pancad translation dispatches
+through. Each table maps a FreeCAD type to the function translating it, so
+support for more FreeCAD types, like PartDesign::Pocket or
+PartDesign::Revolution, can be added without changing pancad:
+
+    from pancad.cad.freecad.translation_registry import FEATURE_TRANSLATORS
+
+    @FEATURE_TRANSLATORS.register("PartDesign::Pocket")
+    def pocket_from_freecad(feature, uid_map):
+        ...
+
+The tables also count the translations of each type and the time spent in
+them, so slow types can be found when profiling:
+
+    reset_translation_stats()
+    read_freecad("part.FCStd")
+    print(get_translation_stats())
+
+This module does not import FreeCAD. pancad's own translators are registered
+as defaults when pancad.cad.freecad._feature_translation and
+pancad.cad.freecad._xml_translation are imported, and a translator registered
+here always takes precedence over a default, whichever is registered first.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+import time
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+K = TypeVar("K")
+F = TypeVar("F")
+
+@dataclass
+class TranslationStats:
+    """The translations of one type made through a TranslatorRegistry.
+
+    :param count: The number of translations.
+    :param seconds: The total seconds spent in the translations, including the
+        translations they made through other registries.
+    """
+    count: int = 0
+    seconds: float = 0.0
+
+class TranslatorRegistry(Generic[K, F]):
+    """A table from FreeCAD types to the functions translating them, with
+    constant time dispatch and per-type translation stats.
+
+    :param name: What the registry translates, used in error messages and
+        the stats of get_translation_stats.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._funcs: dict[K, F] = {}
+        self._defaults: set[K] = set()
+        self._stats: dict[K, TranslationStats] = {}
+
+    # Public Methods
+    def register(self, *keys: K, replace: bool=False, default: bool=False
+                 ) -> Callable[[F], F]:
+        """Returns a decorator registering a function as the translator of the
+        keys. The function is returned unchanged.
+
+        :param keys: The FreeCAD types the function translates.
+        :param replace: Whether to replace translators already registered for
+            the keys. Default translators are always replaced.
+        :param default: Whether the function is a default translator, which
+            does not replace any translator already registered for a key.
+        :raises ValueError: When a key already has a non-default translator and
+            replace and default are both False.
+        """
+        def decorator(func: F) -> F:
+            for key in keys:
+                self.add(key, func, replace=replace, default=default)
+            return func
+        return decorator
+
+    def add(self, key: K, func: F, *, replace: bool=False, default: bool=False
+            ) -> None:
+        """Registers a function as the translator of a key. See register."""
+        registered = key in self._funcs and key not in self._defaults
+        if registered and default:
+            return
+        if registered and not replace:
+            msg = (f"{self.name} for {_format_key(key)} is already registered"
+                   f" to {self._funcs[key]!r}")
+            raise ValueError(msg)
+        self._funcs[key] = func
+        if default:
+            self._defaults.add(key)
+        else:
+            self._defaults.discard(key)
+
+    def remove(self, key: K) -> None:
+        """Removes the translator of a key.
+
+        :raises KeyError: When the key has no translator.
+        """
+        del self._funcs[key]
+        self._defaults.discard(key)
+
+    def get(self, key: K) -> F:
+        """Returns the translator of a key.
+
+        :raises NotImplementedError: When the key has no translator.
+        """
+        try:
+            return self._funcs[key]
+        except KeyError as exc:
+            msg = f"{self.name} for {_format_key(key)} is not supported yet"
+            raise NotImplementedError(msg) from exc
+
+    def translate(self, key: K, *args, **kwargs):
+        """Calls the translator of a key with the arguments and records the
+        translation in the key's stats.
+
+        :raises NotImplementedError: When the key has no translator.
+        """
+        func = self.get(key)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = TranslationStats()
+            stats.count += 1
+            stats.seconds += time.perf_counter() - start
+
+    def get_stats(self) -> dict[K, TranslationStats]:
+        """Returns a copy of the stats of each key translated since the last
+        reset, including failed translations.
+        """
+        return {key: TranslationStats(stats.count, stats.seconds)
+                for key, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Clears the translation stats."""
+        self._stats.clear()
+
+    # Dunders
+    def __contains__(self, key: object) -> bool:
+        return key in self._funcs
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._funcs)
+
+    def __len__(self) -> int:
+        return len(self._funcs)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, {list(self._funcs)})"
+
+FEATURE_TRANSLATORS: TranslatorRegistry[str, Callable] = TranslatorRegistry(
+    "Object translation"
+)
+"""Translators from FreeCAD object types, like PartDesign::Pad, to functions
+called with the FreeCADObjectXML and the uid map. They add the pancad feature to
+its system and the uid map, then return it.
+"""
+GEOMETRY_TRANSLATORS: TranslatorRegistry[str, Callable] = TranslatorRegistry(
+    "Sketch geometry translation"
+)
+"""Translators from FreeCAD sketch geometry types, like Part::GeomCircle, to
+functions called with the GeometryListArrays of a sketch. They return the
+pancad geometry of every row of their type, in row order.
+"""
+CONSTRAINT_TRANSLATORS: TranslatorRegistry[Hashable, Callable] = (
+    TranslatorRegistry("Constraint translation")
+)
+"""Translators from FreeCAD ConstraintTypes to functions called with the
+FreeCADConstraintXML and the uid map. They return the pancad constraint.
+"""
+
+_REGISTRIES = (FEATURE_TRANSLATORS, GEOMETRY_TRANSLATORS, CONSTRAINT_TRANSLATORS)
+
+def get_translation_stats() -> dict[str, dict[Hashable, TranslationStats]]:
+    """Returns the translation stats of every registry by its name."""
+    return {registry.name: registry.get_stats() for registry in _REGISTRIES}
+
+def reset_translation_stats() -> None:
+    """Clears the translation stats of every registry."""
+    for registry in _REGISTRIES:
+        registry.reset_stats()
+
+# Private Functions #
+def _format_key(key: Hashable) -> str:
+    """Returns the name of enum keys, like ConstraintTypes, or the key."""
+    return str(getattr(key, "name", key))
@@ -0,0 +1,316 @@
+"""A module providing a pool of long running FreeCAD Python processes. Starting
+FreeCAD takes several seconds, so starting it once per checked or exported file
+dominates the time spent on batches of files. The pool starts its workers once
+and reuses them for each call.
+
+Workers run the _worker script and exchange length-prefixed JSON messages with
+the pool over their stdin and stdout pipes. Workers that crash or time out are
+killed and restarted before their next call.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import getLogger
+from pathlib import Path
+from subprocess import Popen, PIPE
+from typing import TYPE_CHECKING
+import os
+import queue
+import threading
+
+from pancad.cad.freecad import _worker
+from pancad.cad.freecad._bootstrap import get_app_dir
+from pancad.exceptions import FreeCADWorkerError, FreeCADWorkerCrashedError
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from typing import Any, Self
+
+WORKER_SCRIPT = Path(_worker.__file__)
+"""The script each worker process runs."""
+
+logger = getLogger(__name__)
+
+class _Worker:
+    """A single worker process. A daemon thread reads its responses into a
+    queue so that waiting on a response can time out on every platform.
+
+    :param command: The command that starts the worker process.
+    """
+
+    def __init__(self, command: list[str]) -> None:
+        # The process outlives this call and is ended by close or kill, so it
+        # cannot be opened in a with block
+        self.process = Popen( # pylint: disable=consider-using-with
+            command, stdin=PIPE, stdout=PIPE
+        )
+        self.pid = self.process.pid
+        self._responses = queue.Queue()
+        try:
+            threading.Thread(target=self._read, daemon=True).start()
+        except BaseException:
+            self.kill()
+            raise
+
+    def wait_ready(self, timeout: float | None) -> Self:
+        """Waits for the worker to report that it is ready for requests.
+
+        :raises FreeCADWorkerCrashedError: When the worker exits during startup.
+        :raises TimeoutError: When the worker does not start in time.
+        """
+        self._receive(timeout)
+        return self
+
+    def request(self, message: dict, timeout: float | None) -> dict:
+        """Sends a request to the worker and returns its response.
+
+        :raises FreeCADWorkerCrashedError: When the worker exits before
+            responding.
+        :raises TimeoutError: When the worker does not respond in time.
+        """
+        try:
+            _worker.write_message(self.process.stdin, message)
+        except OSError as exc:
+            raise FreeCADWorkerCrashedError(
+                f"FreeCAD worker {self.pid} is not accepting requests"
+            ) from exc
+        return self._receive(timeout)
+
+    def is_alive(self) -> bool:
+        """Returns whether the worker process is still running."""
+        return self.process.poll() is None
+
+    def close(self, timeout: float | None) -> None:
+        """Asks the worker to exit, killing it if it does not exit in time."""
+        try:
+            _worker.write_message(self.process.stdin, {"op": "exit"})
+            self.process.stdin.close()
+            self.process.wait(timeout)
+        except Exception: # pylint: disable=broad-exception-caught
+            self.kill()
+
+    def kill(self) -> None:
+        """Kills the worker process."""
+        self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def _read(self) -> None:
+        stream = self.process.stdout
+        while True:
+            try:
+                message = _worker.read_message(stream)
+            except (OSError, ValueError):
+                message = None
+            self._responses.put(message)
+            if message is None:
+                return
+
+    def _receive(self, timeout: float | None) -> dict:
+        try:
+            message = self._responses.get(timeout=timeout)
+        except queue.Empty as exc:
+            raise TimeoutError(
+                f"FreeCAD worker did not respond within {timeout} seconds"
+            ) from exc
+        if message is None:
+            raise FreeCADWorkerCrashedError(
+                f"FreeCAD worker exited with code {self.process.wait()}"
+            )
+        return message
+
+class FreeCADWorkerPool:
+    """A pool of persistent FreeCAD Python processes that call functions in
+    FreeCAD-independent python files, like error_detection. Arguments and
+    return values must be JSON serializable.
+
+    :param size: The number of worker processes. Defaults to the cpu count.
+    :param executable: The Python executable the workers run with. Defaults to
+        FreeCAD's python executable.
+    :param timeout: The default number of seconds to wait for a call. Defaults
+        to no limit.
+    :param startup_timeout: The number of seconds to wait for a worker to start.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # The settings are public, the processes and call threads are tracked apart
+
+    def __init__(self,
+                 size: int | None=None,
+                 executable: str | PathLike | None=None,
+                 *,
+                 timeout: float | None=None,
+                 startup_timeout: float | None=120) -> None:
+        if executable is None:
+            executable = get_app_dir() / "python.exe"
+        self.size = size or os.cpu_count() or 1
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self._command = [str(executable), str(WORKER_SCRIPT)]
+        self._idle = queue.Queue()
+        self._workers = []
+        self._executor = None
+        self._lock = threading.Lock()
+
+    # Public Methods
+    def start(self) -> Self:
+        """Starts the worker processes if they have not been started yet. The
+        processes start in parallel.
+
+        :raises FreeCADWorkerCrashedError: When a worker exits during startup.
+        :raises TimeoutError: When a worker does not start in time.
+        """
+        with self._lock:
+            if self._workers:
+                return self
+            workers = [_Worker(self._command) for _ in range(self.size)]
+            try:
+                for worker in workers:
+                    worker.wait_ready(self.startup_timeout)
+            except BaseException:
+                for worker in workers:
+                    worker.kill()
+                raise
+            self._workers = workers
+            for worker in workers:
+                self._idle.put(worker)
+        return self
+
+    def call(self,
+             path: str | PathLike,
+             function: str,
+             *args,
+             timeout: float | None=None) -> Any:
+        """Calls a function in a python file using one of the workers and
+        returns its result. The file is imported once per worker.
+
+        :param path: The path to the python file defining the function.
+        :param function: The name of the function.
+        :param args: The JSON serializable arguments for the function.
+        :param timeout: Seconds to wait for the result. Defaults to the pool's
+            timeout.
+        :raises FreeCADWorkerError: When the function raises an error.
+        :raises FreeCADWorkerCrashedError: When the worker exits during the
+            call.
+        :raises TimeoutError: When the worker does not respond in time. The
+            worker is restarted before its next call.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        request = {"op": "call", "path": str(path), "function": function,
+                   "args": list(args)}
+        worker = self._checkout()
+        try:
+            response = worker.request(request, timeout)
+        except (FreeCADWorkerCrashedError, TimeoutError):
+            worker.kill()
+            raise
+        finally:
+            self._idle.put(worker)
+        if not response["ok"]:
+            exc = FreeCADWorkerError(response["error"])
+            exc.add_note(f"FreeCAD worker traceback:\n{response['traceback']}")
+            raise exc
+        return response["result"]
+
+    def submit(self,
+               path: str | PathLike,
+               function: str,
+               *args,
+               timeout: float | None=None) -> Future:
+        """Schedules a call on the next available worker. See
+        :meth:`call` for the parameters.
+
+        :returns: A Future for the result of the call.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.size, thread_name_prefix="FreeCADWorkerPool"
+                )
+        return self._executor.submit(self.call, path, function, *args,
+                                     timeout=timeout)
+
+    def check_health(self, timeout: float | None=10) -> int:
+        """Pings every idle worker and restarts the ones that do not respond.
+        Workers busy with a call are checked when they finish it.
+
+        :param timeout: Seconds to wait for each worker to respond.
+        :returns: The number of workers that were restarted.
+        """
+        self.start()
+        restarted = 0
+        checked = []
+        try:
+            while True:
+                try:
+                    worker = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                checked.append(worker)
+                try:
+                    if not worker.is_alive():
+                        raise FreeCADWorkerCrashedError("FreeCAD worker exited")
+                    worker.request({"op": "ping"}, timeout)
+                except (FreeCADWorkerCrashedError, TimeoutError):
+                    logger.warning("Restarting unresponsive FreeCAD worker %s",
+                                   worker.pid)
+                    worker.kill()
+                    checked[-1] = self._replace(worker)
+                    restarted += 1
+        finally:
+            for worker in checked:
+                self._idle.put(worker)
+        return restarted
+
+    def close(self) -> None:
+        """Stops the worker processes. Waits for running calls to finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close(self.startup_timeout)
+        self._idle = queue.Queue()
+
+    # Private Methods
+    def _checkout(self) -> _Worker:
+        """Returns the next idle worker, restarting it if it has exited."""
+        self.start()
+        worker = self._idle.get()
+        if not worker.is_alive():
+            try:
+                worker = self._replace(worker)
+            except BaseException:
+                self._idle.put(worker)
+                raise
+        return worker
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        """Starts a new worker in place of a dead worker."""
+        new = _Worker(self._command)
+        try:
+            new.wait_ready(self.startup_timeout)
+        except BaseException:
+            new.kill()
+            raise
+        with self._lock:
+            if worker in self._workers:
+                self._workers[self._workers.index(worker)] = new
+        return new
+
+    # Dunders
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        running = sum(worker.is_alive() for worker in self._workers)
+        return f"<FreeCADWorkerPool {running}/{self.size} running>"
@@ -0,0 +1,878 @@
+"""A module providing a writer for FreeCAD FCStd files that builds the
+Document.xml of a pancad PartFile directly, without starting the FreeCAD
+application.
+
+The written document mirrors the structures read by
+:mod:`pancad.cad.freecad.read_xml`. Shapes are not written, so FreeCAD builds
+them on the first recompute after opening the file.
+"""
+from __future__ import annotations
+
+from collections import namedtuple
+from datetime import datetime, timezone
+from math import acos, pi, radians, sqrt
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element, SubElement
+from zipfile import ZipFile, ZIP_DEFLATED
+import warnings
+
+from pancad.constants import (
+    ConstraintReference as CR,
+    SketchConstraint as SC,
+    FeatureType as FT,
+)
+from pancad.geometry.circle import Circle
+from pancad.geometry.circular_arc import CircularArc
+from pancad.geometry.ellipse import Ellipse
+from pancad.geometry.extrude import Extrude
+from pancad.geometry.feature_container import FeatureContainer
+from pancad.geometry.line_segment import LineSegment
+from pancad.geometry.point import Point
+from pancad.geometry.sketch import Sketch
+
+from pancad.cad.freecad.api_utils import FreeCADConstraintGeoRef
+from pancad.cad.freecad.constants import (
+    ConstraintType as CT,
+    ConstraintSubPart as CSP,
+    PadType as PT,
+)
+from pancad.cad.freecad.xml_utils import EMPTY_CONSTRAINED
+
+if TYPE_CHECKING:
+    from typing import Literal
+    from os import PathLike
+
+    from pancad.abstract import (
+        AbstractConstraint, AbstractFeature, AbstractGeometry,
+    )
+    from pancad.filetypes.part_file import PartFile
+    from pancad.geometry.coordinate_system import Pose
+    from pancad.geometry.system import FeatureSystem
+
+SCHEMA_VERSION = "4"
+"""The Document.xml schema version written to files."""
+PROGRAM_VERSION = "1.0"
+"""The FreeCAD version the written files are formatted for."""
+UNIT_SYSTEMS = (
+    "Standard (mm, kg, s, °)",
+    "MKS (m, kg, s, °)",
+    "US customary (in, lb)",
+    "Imperial decimal (in, lb)",
+    "Building Euro (cm, m², m³)",
+    "Building US (ft-in, sqft, cft)",
+    "Metric small parts & CNC (mm, mm/min)",
+    "Imperial for Civil Eng (ft, ft/s)",
+    "FEM (mm, N, s)",
+    "Meter decimal (m, m², m³)",
+)
+"""The options of the document UnitSystem property, in FreeCAD's order."""
+
+CONSTRAINT_INPUT_TYPES = {
+    # If present, the integer is the number of points in the references.
+    CT.ANGLE: "quadrant_order",
+    CT.COINCIDENT: "original_order",
+    CT.DIAMETER: "indexes_only",
+    CT.RADIUS: "indexes_only",
+    CT.EQUAL: "indexes_only",
+    CT.HORIZONTAL: "indexes_only",
+    CT.VERTICAL: "indexes_only",
+    CT.PARALLEL: "indexes_only",
+    CT.PERPENDICULAR: "indexes_only",
+    CT.POINT_ON_OBJECT: "points_first",
+    (CT.TANGENT, 0): "indexes_only",
+    (CT.TANGENT, 1): "points_first",
+    (CT.TANGENT, 2): "original_order",
+    (CT.DISTANCE, 0): "bugged_distance",
+    (CT.DISTANCE_X, 0): "bugged_distance",
+    (CT.DISTANCE_Y, 0): "bugged_distance",
+    (CT.DISTANCE, 1): "points_first",
+    (CT.DISTANCE_X, 1): "points_first",
+    (CT.DISTANCE_Y, 1): "points_first",
+    (CT.DISTANCE, 2): "original_order",
+    (CT.DISTANCE_X, 2): "original_order",
+    (CT.DISTANCE_Y, 2): "original_order",
+}
+"""How the geometry references of each FreeCAD constraint type are ordered,
+keyed by the output of :func:`get_constraint_write_key`.
+"""
+
+CONSTRAINT_SUB_PARTS = {
+    CR.CORE: CSP.EDGE,
+    CR.ORIGIN: CSP.START, # Sketch Origin is at start of x-axis.
+    CR.X_MIN: CSP.START,
+    CR.Y_MIN: CSP.START,
+    CR.X_MAX: CSP.END,
+    CR.Y_MAX: CSP.END,
+    CR.X: CSP.EDGE, # Either sketch or ellipse x-axis.
+    CR.Y: CSP.EDGE, # Either sketch or ellipse y-axis.
+    CR.CENTER: CSP.CENTER,
+    CR.START: CSP.START,
+    CR.END: CSP.END,
+    # Standalone Points are always START.
+    (CR.CORE, "GeomPoint"): CSP.START,
+    # All FreeCAD arcs are counterclockwise. Clockwise arcs must be reversed
+    (CR.START, "clockwise"): CSP.END,
+    (CR.END, "clockwise"): CSP.START,
+}
+"""The FreeCAD edge sub part equivalent to each pancad self reference."""
+
+ConstraintDefinition = namedtuple("ConstraintDefinition",
+                                  ["type_", "indices", "pairs"])
+"""The FreeCAD definition of a pancad constraint. indices are the arguments to
+FreeCAD's Constraint constructor and pairs are the (reference index, sub part)
+of its First, Second, and Third geometry.
+"""
+
+ORIGIN_FEATURES = {
+    # Reference: (Object name, type, Label, (Q0, Q1, Q2, Q3), A, (Ox, Oy, Oz))
+    CR.X: ("X_Axis", "App::Line", "X-axis", (0, 0, 0, 1), 0, (0, 0, 1)),
+    CR.Y: ("Y_Axis", "App::Line", "Y-axis",
+           (0.5, 0.5, 0.5, 0.5000000000000001), 2.0943951023931953, (1, 1, 1)),
+    CR.Z: ("Z_Axis", "App::Line", "Z-axis",
+           (0.5, -0.5, 0.5, 0.5), 2.0943951023931953, (1, -1, 1)),
+    CR.XY: ("XY_Plane", "App::Plane", "XY-plane", (0, 0, 0, 1), 0, (0, 0, 1)),
+    CR.XZ: ("XZ_Plane", "App::Plane", "XZ-plane",
+            (0.7071067811865476, 0, 0, 0.7071067811865475),
+            1.5707963267948968, (1, 0, 0)),
+    CR.YZ: ("YZ_Plane", "App::Plane", "YZ-plane",
+            (0.5, 0.5, 0.5, 0.5000000000000001), 2.0943951023931953,
+            (1, 1, 1)),
+}
+"""The objects FreeCAD creates under the Origin of every body, with their
+fixed placements.
+"""
+
+_LENGTH_UNITS = {None: 1, "mm": 1, "cm": 10, "m": 1000, "in": 25.4,
+                 "inch": 25.4, "ft": 304.8}
+"""The number of millimeters in each supported length unit. FreeCAD documents
+store all lengths in millimeters.
+"""
+_PAD_TYPES = { # Type, Reversed, Midplane
+    FT.DIMENSION: (PT.LENGTH, False, False),
+    FT.ANTI_DIMENSION: (PT.LENGTH, True, False),
+    FT.SYMMETRIC: (PT.LENGTH, False, True),
+    FT.TWO_DIMENSIONS: (PT.TWO_LENGTHS, False, False),
+    FT.ANTI_TWO_DIMENSIONS: (PT.TWO_LENGTHS, True, False),
+}
+_GEOMETRY_TYPES = {
+    Point: ("Part::GeomPoint", "GeomPoint"),
+    LineSegment: ("Part::GeomLineSegment", "LineSegment"),
+    Circle: ("Part::GeomCircle", "Circle"),
+    CircularArc: ("Part::GeomArcOfCircle", "ArcOfCircle"),
+    Ellipse: ("Part::GeomEllipse", "Ellipse"),
+}
+_CONSTRUCTION_FLAGS = "0" * 30 + "10"
+_NO_FLAGS = "0" * 32
+
+################################################################################
+# Writing Files
+################################################################################
+
+def write_fcstd(part: PartFile, path: PathLike) -> None:
+    """Writes a PartFile to a FreeCAD FCStd file without the FreeCAD
+    application.
+
+    :param part: The PartFile to write.
+    :param path: The path to write the FCStd file to.
+    :raises NotImplementedError: When the PartFile uses features or geometry
+        that cannot be written to FreeCAD yet.
+    """
+    document = document_xml_from_part(part)
+    with ZipFile(path, "w", ZIP_DEFLATED) as file:
+        file.writestr("Document.xml", document)
+
+def document_xml_from_part(part: PartFile) -> bytes:
+    """Returns the contents of the Document.xml file equivalent to a PartFile.
+
+    :param part: The PartFile to write.
+    :raises NotImplementedError: When the PartFile uses features or geometry
+        that cannot be written to FreeCAD yet.
+    """
+    writer = _DocumentWriter(part)
+    writer.add_feature(part.container)
+    return writer.to_bytes()
+
+class _DocumentWriter:
+    """Accumulates the objects of one FreeCAD document.
+
+    :param part: The PartFile being written.
+    """
+
+    def __init__(self, part: PartFile) -> None:
+        self.root = Element("Document", SchemaVersion=SCHEMA_VERSION,
+                            ProgramVersion=PROGRAM_VERSION, FileVersion="1")
+        properties = SubElement(self.root, "Properties")
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        strings = {"Label": part.name, "Id": "", "CreationDate": now,
+                   "LastModifiedDate": now}
+        for name, value in strings.items():
+            _add_property(properties, name, "App::PropertyString", "String",
+                          value=value)
+        _add_property(properties, "Uid", "App::PropertyUUID", "Uuid",
+                      value=_get_document_uuid(part.uid))
+        unit_system = _add_property(properties, "UnitSystem",
+                                    "App::PropertyEnumeration", "Integer",
+                                    value="0", CustomEnum="true")
+        enums = SubElement(unit_system, "CustomEnumList",
+                           count=str(len(UNIT_SYSTEMS)))
+        for option in UNIT_SYSTEMS:
+            SubElement(enums, "Enum", value=option)
+        _finish_properties(properties)
+        self.objects = []
+        """The type, name, and property element of each object."""
+        self.names = {}
+        """The FreeCAD object name of each written pancad feature uid."""
+        self.bodies = {}
+        """The name of the last solid feature in each body. None if the body
+        does not have any solid features yet.
+        """
+        self.origin_references = {}
+        """The ConstraintReference of each written origin object, by object
+        name.
+        """
+
+    def add_object(self, type_: str, name: str, label: str,
+                   extension: str=None) -> tuple[str, Element]:
+        """Adds a new object and returns its unique name and Properties element.
+
+        :param type_: The FreeCAD object type, like 'Sketcher::SketchObject'.
+        :param name: The preferred object name. A number is added to the end
+            when the name is already used, the same as FreeCAD.
+        :param label: The user facing name of the object.
+        :param extension: The FreeCAD extension type of the object, if any.
+        """
+        used = {object_name for _, object_name, _ in self.objects}
+        unique_name, count = name, 0
+        while unique_name in used:
+            count += 1
+            unique_name = f"{name}{count:03d}"
+        data = Element("Object", name=unique_name)
+        if extension is not None:
+            data.set("Extensions", "True")
+            extensions = SubElement(data, "Extensions", Count="1")
+            SubElement(extensions, "Extension", type=extension,
+                       name=extension.split("::")[-1])
+        properties = SubElement(data, "Properties")
+        _add_property(properties, "Label", "App::PropertyString", "String",
+                      value=label)
+        self.objects.append((type_, unique_name, data))
+        return unique_name, properties
+
+    def add_feature(self, feature: AbstractFeature) -> str:
+        """Adds the objects for a pancad feature and returns its object name.
+
+        :raises TypeError: When the feature's type is not supported.
+        """
+        funcs = [
+            (FeatureContainer, _write_body),
+            (Sketch, _write_sketch),
+            (Extrude, _write_pad),
+        ]
+        try:
+            feature_func = next(f for f in funcs if isinstance(feature, f[0]))[1]
+        except StopIteration as exc:
+            msg = f"Unsupported feature type '{feature.__class__}'"
+            raise TypeError(msg, feature) from exc
+        name = feature_func(feature, self)
+        self.names[feature.uid] = name
+        return name
+
+    def to_bytes(self) -> bytes:
+        """Returns the finished Document.xml contents."""
+        objects = SubElement(self.root, "Objects", Count=str(len(self.objects)),
+                             Dependencies="1")
+        for _, name, data in self.objects:
+            deps = _get_link_names(data)
+            object_deps = SubElement(objects, "ObjectDeps", Name=name,
+                                     Count=str(len(deps)))
+            for dep in deps:
+                SubElement(object_deps, "Dep", Name=dep)
+        for id_, (type_, name, _) in enumerate(self.objects, start=1):
+            SubElement(objects, "Object", type=type_, name=name, id=str(id_))
+        object_data = SubElement(self.root, "ObjectData",
+                                 Count=str(len(self.objects)))
+        for _, _, data in self.objects:
+            _finish_properties(data.find("Properties"))
+            object_data.append(data)
+        ElementTree.indent(self.root, space="    ")
+        return ElementTree.tostring(self.root, encoding="utf-8",
+                                    xml_declaration=True)
+
+################################################################################
+# Writing Features
+################################################################################
+
+def _write_body(feature: FeatureContainer, writer: _DocumentWriter) -> str:
+    """Adds a body, its origin, and all of its sub features to the document."""
+    if feature.uid in writer.names:
+        msg = "pancad uid of container already written"
+        raise ValueError(msg, feature)
+    body, properties = writer.add_object("PartDesign::Body", "Body",
+                                         feature.name,
+                                         "App::OriginGroupExtension")
+    origin = _write_origin(feature.feature_system, writer)
+    writer.names[feature.uid] = body
+    writer.bodies[body] = None
+
+    # Moving deeper down into to the subfeatures
+    group = [writer.add_feature(sub_feature)
+             for sub_feature in feature.feature_system.features]
+    _add_link(properties, "Origin", origin)
+    _add_link_list(properties, "Group", group)
+    _add_pose_placement(properties, feature.pose)
+    _add_link(properties, "Tip", writer.bodies[body])
+    return body
+
+def _write_origin(system: FeatureSystem, writer: _DocumentWriter) -> str:
+    """Adds the Origin of a body and its axes and planes to the document and
+    returns the Origin object name.
+    """
+    origin, properties = writer.add_object(
+        "App::Origin", "Origin", "Origin", "App::GeoFeatureGroupExtension"
+    )
+    origin_features = []
+    for reference, (name, type_, label, quat, angle, axis) \
+            in ORIGIN_FEATURES.items():
+        feature_name, feature_properties = writer.add_object(type_, name,
+                                                             label)
+        _add_placement(feature_properties, "Placement", (0, 0, 0), quat, angle,
+                       axis)
+        _add_property(feature_properties, "Role", "App::PropertyString",
+                      "String", value=name)
+        writer.names[system.children[reference].uid] = feature_name
+        writer.origin_references[feature_name] = reference
+        origin_features.append(feature_name)
+    # There is no center point on the Origin object, so the origin point is
+    # mapped to the Origin where other systems can derive the location.
+    for reference in (CR.CS, CR.ORIGIN):
+        writer.names[system.children[reference].uid] = origin
+    _add_link_list(properties, "OriginFeatures", origin_features)
+    return origin
+
+def _write_sketch(feature: Sketch, writer: _DocumentWriter) -> str:
+    """Adds a sketch with all of its geometry and constraints to the
+    document.
+
+    :raises NotImplementedError: When the sketch is not supported by an origin
+        plane.
+    """
+    support_name = writer.names.get(feature.get_support().uid)
+    reference = writer.origin_references.get(support_name)
+    if ORIGIN_FEATURES.get(reference, (None, None))[1] != "App::Plane":
+        msg = (f"Sketch '{feature.name}' support is not an origin plane,"
+               f" got '{support_name}'")
+        raise NotImplementedError(msg, feature)
+    sketch, properties = writer.add_object("Sketcher::SketchObject", "Sketch",
+                                           feature.name,
+                                           "Part::AttachExtension")
+    _add_link_sub_list(properties, "AttachmentSupport", [(support_name, "")])
+    _add_property(properties, "MapMode", "App::PropertyEnumeration", "Integer",
+                  value="5") # FlatFace
+    _, _, _, quat, angle, axis = ORIGIN_FEATURES[reference]
+    _add_placement(properties, "Placement", (0, 0, 0), quat, angle, axis)
+    _add_sketch_geometry(properties, feature)
+    constraints = SubElement(
+        SubElement(properties, "Property", name="Constraints",
+                   type="Sketcher::PropertyConstraintList"),
+        "ConstraintList"
+    )
+    references = get_sketch_references(feature)
+    for constraint in feature.geometry_system.constraints:
+        constraints.append(_new_constraint_element(constraint, references))
+    _set_count(constraints)
+    return sketch
+
+def _add_sketch_geometry(properties: Element, feature: Sketch) -> None:
+    """Adds the ExternalGeo and Geometry properties of a sketch, with the sketch
+    axes as the external geometry.
+    """
+    geo_sys = feature.geometry_system
+    external = _add_geometry_list(properties, "ExternalGeo")
+    for id_, end in ((-1, (1, 0)), (-2, (0, 1))):
+        element = _add_line_segment(external, id_, (0, 0), end, True)
+        SubElement(element.find("GeoExtensions"), "GeoExtension",
+                   type="Sketcher::ExternalGeometryExtension", Ref="", Flags="0")
+    geometry = _add_geometry_list(properties, "Geometry")
+    for index, (pc_geo, is_construction) in enumerate(
+                zip(geo_sys.geometry, geo_sys.construction)
+            ):
+        _add_geometry(geometry, index + 1, pc_geo, is_construction)
+    _set_count(external)
+    _set_count(geometry)
+
+def _write_pad(feature: Extrude, writer: _DocumentWriter) -> str:
+    """Adds a pad to the document."""
+    body = writer.names[feature.system.feature.uid]
+    profile = writer.names[feature.profile.uid]
+    pad, properties = writer.add_object("PartDesign::Pad", "Pad", feature.name,
+                                        "App::SuppressibleExtension")
+    if feature.unit is None:
+        msg = f"The unit of Extrude '{feature.name}' is not set, assuming mm"
+        warnings.warn(msg)
+    type_, reversed_, midplane = _PAD_TYPES[feature.type_]
+    _add_link(properties, "BaseFeature", writer.bodies[body])
+    _add_link_sub(properties, "Profile", profile, [""])
+    _add_link_sub(properties, "ReferenceAxis", profile, ["N_Axis"])
+    lengths = (("Length", feature.length), ("Length2", feature.opposite_length),
+               ("Offset", 0))
+    for name, length in lengths:
+        _add_property(properties, name, "App::PropertyLength", "Float",
+                      value=to_millimeters(length, feature.unit))
+    angles = (("TaperAngle", feature.taper_angle),
+              ("TaperAngle2", feature.opposite_taper_angle))
+    for name, angle in angles:
+        # Angle properties are stored in degrees, unlike constraints
+        _add_property(properties, name, "App::PropertyAngle", "Float",
+                      value=angle)
+    _add_property(properties, "Type", "App::PropertyEnumeration", "Integer",
+                  value=str(int(type_)))
+    _add_property(properties, "Reversed", "App::PropertyBool", "Bool",
+                  value=reversed_)
+    _add_property(properties, "Midplane", "App::PropertyBool", "Bool",
+                  value=midplane)
+    _add_property(properties, "UseCustomVector", "App::PropertyBool", "Bool",
+                  value=False)
+    writer.bodies[body] = pad
+    return pad
+
+################################################################################
+# Writing Geometry
+################################################################################
+
+def get_sketch_references(sketch: Sketch) -> dict[str, tuple[int, str]]:
+    """Returns the constraint reference index and FreeCAD geometry tag of the
+    sketch's coordinate system and geometry, keyed by pancad uid. The geometry
+    indices are the ones FreeCAD assigns when the geometry is added to an empty
+    sketch in order.
+
+    :raises TypeError: When the sketch has geometry that is not sketch geometry.
+    """
+    geo_sys = sketch.geometry_system
+    references = {
+        geo_sys.coordinate_system.uid: (-1, "LineSegment"),
+        geo_sys.origin.uid: (-1, "LineSegment"),
+        geo_sys.x_axis.uid: (-1, "LineSegment"),
+        geo_sys.y_axis.uid: (-2, "LineSegment"),
+    }
+    for index, geometry in enumerate(geo_sys.geometry):
+        references[geometry.uid] = (index, get_geometry_type(geometry)[1])
+    return references
+
+def get_geometry_type(geometry: AbstractGeometry) -> tuple[str, str]:
+    """Returns the FreeCAD type and xml tag of the geometry equivalent to
+    pancad geometry, like ('Part::GeomLineSegment', 'LineSegment').
+
+    :raises TypeError: When the geometry type is not sketch geometry.
+    """
+    try:
+        return next(value for class_, value in _GEOMETRY_TYPES.items()
+                    if isinstance(geometry, class_))
+    except StopIteration as exc:
+        raise TypeError(f"Unsupported pancad element type: {geometry}") from exc
+
+def _add_geometry(geometry_list: Element, id_: int,
+                  geometry: AbstractGeometry, is_construction: bool) -> None:
+    """Adds a Geometry element equivalent to pancad geometry to a
+    GeometryList.
+
+    :raises NotImplementedError: When the geometry is an Ellipse.
+    :raises TypeError: When the geometry type is not sketch geometry.
+    """
+    type_, tag = get_geometry_type(geometry)
+    if tag == "LineSegment":
+        _add_line_segment(geometry_list, id_, tuple(geometry.start),
+                          tuple(geometry.end), is_construction)
+        return
+    if tag == "Ellipse":
+        msg = "Ellipse mapping hasn't been implemented yet. See #235"
+        raise NotImplementedError(msg, geometry)
+    element = _new_geometry_element(geometry_list, type_, id_, is_construction)
+    if tag == "GeomPoint":
+        x, y = tuple(geometry)
+        attrs = {"X": x, "Y": y, "Z": 0}
+    else:
+        x, y = tuple(geometry.center)
+        attrs = {"CenterX": x, "CenterY": y, "CenterZ": 0,
+                 "NormalX": 0, "NormalY": 0, "NormalZ": 1,
+                 "AngleXU": 0, "Radius": geometry.radius}
+        if tag == "ArcOfCircle":
+            attrs["StartAngle"], attrs["EndAngle"] = get_arc_angles(geometry)
+    SubElement(element, tag, _format_attrs(attrs))
+    SubElement(element, "Construction", value=str(int(is_construction)))
+
+def _add_line_segment(geometry_list: Element, id_: int,
+                      start: tuple[float, float], end: tuple[float, float],
+                      is_construction: bool) -> Element:
+    """Adds a LineSegment Geometry element to a GeometryList."""
+    element = _new_geometry_element(geometry_list, "Part::GeomLineSegment", id_,
+                                    is_construction)
+    attrs = {"StartX": start[0], "StartY": start[1], "StartZ": 0,
+             "EndX": end[0], "EndY": end[1], "EndZ": 0}
+    SubElement(element, "LineSegment", _format_attrs(attrs))
+    SubElement(element, "Construction", value=str(int(is_construction)))
+    return element
+
+def _new_geometry_element(geometry_list: Element, type_: str, id_: int,
+                          is_construction: bool=False) -> Element:
+    """Adds a Geometry element with its sketch extension to a GeometryList."""
+    element = SubElement(geometry_list, "Geometry", type=type_, id=str(id_),
+                         migrated="1")
+    extensions = SubElement(element, "GeoExtensions")
+    SubElement(extensions, "GeoExtension",
+               type="Sketcher::SketchGeometryExtension", id=str(id_),
+               internalGeometryType="0",
+               geometryModeFlags=(_CONSTRUCTION_FLAGS if is_construction
+                                  else _NO_FLAGS),
+               geometryLayer="0")
+    return element
+
+def get_arc_angles(arc: CircularArc) -> tuple[float, float]:
+    """Returns the start and end angles of the equivalent FreeCAD arc. FreeCAD
+    arcs are always counterclockwise with positive angles and the end angle
+    larger than the start angle.
+    """
+    if arc.is_clockwise:
+        # All FreeCAD circular arcs are drawn counterclockwise
+        end = arc.start_angle
+        start = arc.end_angle
+    else:
+        start = arc.start_angle
+        end = arc.end_angle
+
+    # FreeCAD's circular arc angles are all positive
+    if start < 0:
+        start += 2 * pi
+    if end < 0:
+        end += 2 * pi
+    if end < start:
+        # FreeCAD forces the end angle to be larger than the start angle
+        end += 2 * pi
+    return start, end
+
+################################################################################
+# Writing Constraints
+################################################################################
+
+def get_constraint_type_from_pancad(constraint: AbstractConstraint) -> CT:
+    """Returns the equivalent FreeCAD constraint type from pancad constraints"""
+    type_map = {
+        SC.ANGLE: CT.ANGLE,
+        SC.DISTANCE: CT.DISTANCE,
+        SC.DISTANCE_HORIZONTAL: CT.DISTANCE_X,
+        SC.DISTANCE_VERTICAL: CT.DISTANCE_Y,
+        SC.DISTANCE_DIAMETER: CT.DIAMETER,
+        SC.DISTANCE_RADIUS: CT.RADIUS,
+        SC.EQUAL: CT.EQUAL,
+        SC.HORIZONTAL: CT.HORIZONTAL,
+        SC.PARALLEL: CT.PARALLEL,
+        SC.PERPENDICULAR: CT.PERPENDICULAR,
+        SC.VERTICAL: CT.VERTICAL,
+    }
+    if constraint.type_name in type_map: # One-to-one checks
+        return type_map[constraint.type_name]
+    if constraint.type_name == SC.TANGENT:
+        msg = "Tangent constraints aren't available for translation yet."
+        raise NotImplementedError(msg, constraint)
+
+    geometries = constraint.get_geometry()
+    if constraint.type_name == SC.COINCIDENT:
+        if all(isinstance(g, Point) for g in geometries):
+            return CT.COINCIDENT
+        if any(isinstance(g, Point) for g in geometries):
+            return CT.POINT_ON_OBJECT
+        return CT.TANGENT
+    msg = f"Unrecognized constraint type '{constraint.__class__}'"
+    raise TypeError(msg, constraint)
+
+def get_constraint_write_key(type_: CT, refs: list[FreeCADConstraintGeoRef]
+                             ) -> CT | tuple[CT, int]:
+    """Returns a key to dispatch how to write the constraint to FreeCAD."""
+    # Some constraint types in FreeCAD depend on the # of points in the refs
+    point_dependent = {CT.TANGENT, CT.DISTANCE, CT.DISTANCE_X, CT.DISTANCE_Y}
+    if type_ in point_dependent:
+        return (type_, [r.is_point for r in refs].count(True))
+    return type_
+
+def get_constraint_indices(
+            input_type: Literal["quadrant_order", "original_order",
+                                "indexes_only", "points_first",
+                                "bugged_distance"],
+            refs: list[FreeCADConstraintGeoRef],
+            quadrant: Literal[1, 2, 3, 4]=None
+        ) -> list[int]:
+    """Returns the list of indicies FreeCAD requires for constraint definition.
+
+    :param input_type: A string for the reading type required for the references
+    :param refs: The geometry reference pairs read from pancad objects.
+    :param quadrant: The quadrant of an angle constraint. Should be None if not
+        an angle.
+    :raises ValueError: When input_type or quadrant is an unexpected value.
+    """
+    match input_type:
+        case "indexes_only":
+            return [r.index for r in refs]
+        case "original_order":
+            return [i for r in refs for i in r.pair]
+        case "points_first":
+            sorted_refs = sorted(refs, key=lambda r: int(r.is_point),
+                                 reverse=True)
+            first, second = sorted_refs
+            return [first.index, first.part, second.index]
+        case "bugged_distance":
+            first, second = refs
+            return [first.index, CSP.START, second.index]
+        case "quadrant_order":
+            first, second = refs
+            quadrant_map = {
+                1: (first.index, CSP.START, second.index, CSP.START),
+                2: (second.index, CSP.START, first.index, CSP.END),
+                3: (first.index, CSP.END, second.index, CSP.START),
+                4: (second.index, CSP.START, first.index, CSP.START),
+            }
+            try:
+                return quadrant_map[quadrant]
+            except KeyError as exc:
+                msg = f"Unexpected value for angle quadrant: {quadrant}"
+                raise ValueError(msg) from exc
+    raise ValueError(f"Unexpected input type '{input_type}'")
+
+def get_constraint_sub_part(geometry: AbstractGeometry, geo_type: str) -> CSP:
+    """Returns the FreeCAD edge sub part equivalent to pancad geometry.
+
+    :param geometry: The constrained pancad geometry.
+    :param geo_type: The FreeCAD geometry tag of the geometry or its parent,
+        like 'LineSegment' or 'GeomPoint'.
+    """
+    if geo_type == "GeomPoint":
+        return CONSTRAINT_SUB_PARTS[(geometry.self_reference, geo_type)]
+    if getattr(geometry, "is_clockwise", False):
+        return CONSTRAINT_SUB_PARTS[(geometry.self_reference, "clockwise")]
+    return CONSTRAINT_SUB_PARTS[geometry.self_reference]
+
+def to_millimeters(value: float, unit: str | None) -> float:
+    """Returns a length value in millimeters, the unit FreeCAD stores lengths
+    in. Values without a unit are assumed to be millimeters.
+
+    :raises ValueError: When the unit is not recognized.
+    """
+    try:
+        return value * _LENGTH_UNITS[unit]
+    except KeyError as exc:
+        raise ValueError(f"Unrecognized length unit '{unit}'") from exc
+
+def get_constraint_definition(constraint: AbstractConstraint,
+                              refs: list[FreeCADConstraintGeoRef]
+                              ) -> ConstraintDefinition:
+    """Returns the FreeCAD definition of a pancad constraint.
+
+    :param constraint: A pancad sketch constraint.
+    :param refs: The FreeCAD reference of each of the constraint's geometry.
+    :raises NotImplementedError: When the constraint type and geometry
+        combination cannot be written to FreeCAD yet.
+    """
+    type_ = get_constraint_type_from_pancad(constraint)
+    key = get_constraint_write_key(type_, refs)
+    try:
+        input_type = CONSTRAINT_INPUT_TYPES[key]
+    except KeyError as exc:
+        msg = f"Unsupported constraint type and/or point count: {key}"
+        raise NotImplementedError(msg) from exc
+    indices = get_constraint_indices(input_type, refs,
+                                     getattr(constraint, "quadrant", None))
+    # The flat index list is the order FreeCAD's Constraint constructor takes
+    if input_type == "indexes_only":
+        pairs = [(index, CSP.EDGE) for index in indices]
+    else:
+        pairs = list(zip(indices[0::2], indices[1::2]))
+        if len(indices) % 2:
+            pairs.append((indices[-1], CSP.EDGE))
+    pairs.extend([(EMPTY_CONSTRAINED, CSP.EDGE)] * (3 - len(pairs)))
+    return ConstraintDefinition(type_, list(indices), tuple(pairs))
+
+def get_constraint_ref(geometry: AbstractGeometry,
+                       references: dict[str, tuple[int, str]]
+                       ) -> FreeCADConstraintGeoRef:
+    """Returns the FreeCAD constraint index and edge sub part of the pancad
+    geometry or its parent geometry.
+
+    :param geometry: The constrained pancad geometry.
+    :param references: The output of :func:`get_sketch_references`.
+    :raises LookupError: When neither the geometry or parent geometry is in the
+        references.
+    """
+    if geometry.uid in references:
+        index, geo_type = references[geometry.uid]
+    else:
+        try:
+            index, geo_type = references[geometry.parent.uid]
+        except KeyError as exc:
+            msg = "Neither the geometry or parent geometry is in the sketch"
+            raise LookupError(msg, geometry) from exc
+    return FreeCADConstraintGeoRef(index,
+                                   get_constraint_sub_part(geometry, geo_type),
+                                   geo_type)
+
+def _new_constraint_element(constraint: AbstractConstraint,
+                            references: dict[str, tuple[int, str]]
+                            ) -> Element:
+    """Returns a Constrain element equivalent to a pancad constraint.
+
+    :param constraint: A pancad sketch constraint.
+    :param references: The output of :func:`get_sketch_references`.
+    """
+    refs = [get_constraint_ref(g, references)
+            for g in constraint.get_geometry()]
+    type_, _, pairs = get_constraint_definition(constraint, refs)
+    (first, first_pos), (second, second_pos), (third, third_pos) = pairs
+
+    value = getattr(constraint, "value", None)
+    if value is None:
+        value = 0
+    elif type_ == CT.ANGLE:
+        # Angle constraints are stored in radians
+        value = radians(value)
+    else:
+        value = to_millimeters(value, constraint.unit)
+    attrs = {"Name": "", "Type": int(type_), "Value": _format_float(value),
+             "First": first, "FirstPos": int(first_pos),
+             "Second": second, "SecondPos": int(second_pos),
+             "Third": third, "ThirdPos": int(third_pos),
+             "LabelDistance": _format_float(10), "LabelPosition": _format_float(0),
+             "IsDriving": 1, "IsInVirtualSpace": 0, "IsActive": 1}
+    return Element("Constrain", {name: str(value) for name, value in attrs.items()})
+
+################################################################################
+# Writing Properties
+################################################################################
+
+def _add_property(properties: Element, name: str, type_: str, tag: str,
+                  **attrs) -> Element:
+    """Adds a Property element with a single value element.
+
+    :param properties: The Properties element to add to.
+    :param name: The name of the property.
+    :param type_: The FreeCAD property type, like 'App::PropertyString'.
+    :param tag: The tag of the value element, like 'String'.
+    :param attrs: The attributes of the value element. Numbers and bools are
+        formatted the same as FreeCAD.
+    """
+    prop = SubElement(properties, "Property", name=name, type=type_)
+    SubElement(prop, tag, _format_attrs(attrs))
+    return prop
+
+def _add_link(properties: Element, name: str, target: str | None) -> None:
+    """Adds a Link property. Empty when the target is None."""
+    _add_property(properties, name, "App::PropertyLink", "Link",
+                  value="" if target is None else target)
+
+def _add_link_list(properties: Element, name: str, targets: list[str]) -> None:
+    """Adds a LinkList property."""
+    prop = SubElement(properties, "Property", name=name,
+                      type="App::PropertyLinkList")
+    link_list = SubElement(prop, "LinkList", count=str(len(targets)))
+    for target in targets:
+        SubElement(link_list, "Link", value=target)
+
+def _add_link_sub(properties: Element, name: str, target: str,
+                  subs: list[str]) -> None:
+    """Adds a LinkSub property."""
+    prop = SubElement(properties, "Property", name=name,
+                      type="App::PropertyLinkSub")
+    link_sub = SubElement(prop, "LinkSub", value=target, count=str(len(subs)))
+    for sub in subs:
+        SubElement(link_sub, "Sub", value=sub)
+
+def _add_link_sub_list(properties: Element, name: str,
+                       links: list[tuple[str, str]]) -> None:
+    """Adds a LinkSubList property from (object name, sub name) pairs."""
+    prop = SubElement(properties, "Property", name=name,
+                      type="App::PropertyLinkSubList")
+    link_sub_list = SubElement(prop, "LinkSubList", count=str(len(links)))
+    for target, sub in links:
+        SubElement(link_sub_list, "Link", obj=target, sub=sub)
+
+def _add_geometry_list(properties: Element, name: str) -> Element:
+    """Adds an empty GeometryList property and returns the GeometryList."""
+    prop = SubElement(properties, "Property", name=name,
+                      type="Part::PropertyGeometryList")
+    return SubElement(prop, "GeometryList")
+
+def _add_placement(properties: Element, name: str,
+                   position: tuple[float, float, float],
+                   quat: tuple[float, float, float, float],
+                   angle: float, axis: tuple[float, float, float]) -> None:
+    """Adds a Placement property.
+
+    :param quat: The rotation quaternion with its real component at the end.
+    :param angle: The rotation angle around the axis in radians.
+    """
+    attrs = dict(zip(("Px", "Py", "Pz"), position))
+    attrs.update(zip(("Q0", "Q1", "Q2", "Q3"), quat))
+    attrs["A"] = angle
+    attrs.update(zip(("Ox", "Oy", "Oz"), axis))
+    _add_property(properties, name, "App::PropertyPlacement",
+                  "PropertyPlacement", **attrs)
+
+def _add_pose_placement(properties: Element, pose: Pose) -> None:
+    """Adds the Placement property equivalent to a pancad Pose."""
+    quat = pose.coordinate_system.get_quaternion()
+    # FreeCAD Quaternions have their real component at the end.
+    w = min(max(quat.w, -1), 1)
+    angle = 2 * acos(w)
+    sin_half = sqrt(1 - w**2)
+    if sin_half == 0:
+        axis = (0, 0, 1)
+    else:
+        axis = (quat.x / sin_half, quat.y / sin_half, quat.z / sin_half)
+    _add_placement(properties, "Placement", tuple(pose.origin),
+                   (quat.x, quat.y, quat.z, quat.w), angle, axis)
+
+def _set_count(element: Element) -> None:
+    """Sets the count attribute of a list element to its number of children."""
+    element.set("count", str(len(element)))
+
+def _finish_properties(properties: Element) -> None:
+    """Sorts Properties by name like FreeCAD and sets their counts."""
+    children = sorted(properties, key=lambda prop: prop.get("name"))
+    properties[:] = children
+    properties.set("Count", str(len(children)))
+    properties.set("TransientCount", "0")
+    for child in properties.iter("GeoExtensions"):
+        _set_count(child)
+
+def _get_link_names(data: Element) -> list[str]:
+    """Returns the names of the objects linked to by an object's properties."""
+    names = []
+    for element in data.iter():
+        if element.tag in ("Link", "LinkSub"):
+            name = element.get("value", element.get("obj"))
+            if name:
+                names.append(name)
+    return names
+
+def _get_document_uuid(uid: str | UUID | None) -> str:
+    """Returns the pancad uid as a document Uuid, or a new Uuid if the uid is
+    not formatted as one.
+    """
+    try:
+        return str(UUID(str(uid)))
+    except ValueError:
+        return str(uuid4())
+
+def _format_attrs(attrs: dict[str, float | bool | str]) -> dict[str, str]:
+    """Returns attribute values formatted the same as FreeCAD."""
+    formatted = {}
+    for name, value in attrs.items():
+        if isinstance(value, bool):
+            formatted[name] = "true" if value else "false"
+        elif isinstance(value, (int, float)):
+            formatted[name] = _format_float(value)
+        else:
+            formatted[name] = str(value)
+    return formatted
+
+def _format_float(value: float) -> str:
+    """Returns a float formatted the same as FreeCAD."""
+    return f"{value:.16f}"
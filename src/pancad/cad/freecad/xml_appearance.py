@@ -1,108 +1,259 @@
-"""A module providing functions for reading and writing FreeCAD appearance
-files.
+"""A module providing functions for reading FreeCAD appearance files.
+
+FreeCAD stores the appearance of each object's view provider in binary sidecar
+files of the FCStd archive, referenced from GuiDocument.xml. Parts can have a
+color and material per face, so the files are decoded into numpy arrays in one
+pass instead of one color at a time.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+import struct
+
+import numpy as np
+
+from pancad.cad.freecad.xml_streaming import iter_xml_events
+
+if TYPE_CHECKING:
+    from pancad.cad.freecad.read_xml import ArchiveMember, FCStd
+
+MATERIAL_LIST_TYPE = "App::PropertyMaterialList"
+"""The property type of ShapeAppearance material lists."""
+COLOR_LIST_TYPE = "App::PropertyColorList"
+"""The property type of color lists like LineColorArray and DiffuseColor."""
+STRING_HASHER_FILE = "StringHasher.Table.txt"
+"""The archive member FreeCAD saves the document's string table to."""
+GUI_DOCUMENT_FILE = "GuiDocument.xml"
+"""The archive member FreeCAD saves the view providers of the objects to."""
+
+_APPEARANCE_LIST_TAGS = frozenset({"MaterialList", "ColorList"})
+"""The GuiDocument.xml property elements referencing appearance files."""
+
+_COUNT = struct.Struct("<I")
+_MATERIAL_DTYPE = np.dtype([
+    ("ambient", "<u4"), ("diffuse", "<u4"), ("specular", "<u4"),
+    ("emissive", "<u4"), ("shininess", "<f4"), ("transparency", "<f4"),
+])
+"""The fixed size part of each material in a MaterialList file."""
+_MATERIAL_STRINGS = 3
+"""The number of strings saved for each material after all the fixed size
+parts: the image, the image path and the material uuid.
 """
-# This file is stored for later when appearance files need to be read and
-# written. Currently for future planned functionality
-
-# from __future__ import annotations
-
-# from itertools import islice
-# from typing import TYPE_CHECKING
-# import struct
-
-
-# if TYPE_CHECKING:
-    # from zipfile import ZipFile, ZipInfo
-
-# def batched(iterable, n, *, strict=False):
-    # # batched('ABCDEFG', 2) → AB CD EF G
-    # if n < 1:
-        # raise ValueError('n must be at least one')
-    # iterator = iter(iterable)
-    # while batch := tuple(islice(iterator, n)):
-        # if strict and len(batch) != n:
-            # raise ValueError('batched(): incomplete batch')
-        # yield batch
-
-# def read_shape_appearance(archive: ZipFile,
-                          # filename: str | ZipInfo
-                          # ) -> dict[str, float | tuple[int]]:
-    # """Reads shape appearance file data.
-
-    # :param archive: A ZipFile of a FreeCAD file.
-    # :param filename: The name of the ShapeAppearance file to read.
-    # :returns: A dictionary of labels to either their float values or their RGBA
-        # color integer tuples.
-    # """
-    # with archive.open(filename) as file:
-        # data = bytes(file.read())
-
-    # parsed = {}
-
-    # if len(data) > 40:
-        # parsed["uid"] = data[40:].decode()
-        # data = data[:40]
-
-    # LABELS = [
-        # "header",
-        # "ambient",
-        # "diffuse",
-        # "specular",
-        # "emissive",
-        # "shininess",
-        # "transparency",
-        # "blank0",
-        # "blank1",
-        # "uuid_sync",
-    # ]
-    # COLORS = ["ambient", "diffuse", "specular", "emissive"]
-    # FLOATS = ["shininess", "transparency"]
-    # for label, entry in zip(LABELS, batched(data, 4)):
-        # if label in COLORS:
-            # parsed[label] = entry[::-1]
-        # elif label in FLOATS:
-            # parsed[label] = struct.unpack("<f", bytes(entry))[0]
-        # elif label == "header":
-            # assert entry == (1, 0, 0, 0)
-        # elif label == "uuid_sync":
-            # assert entry == (0, 0, 0, 0) or entry == (36, 0, 0, 0)
-        # elif label.startswith("blank"):
-            # assert entry == (0, 0, 0, 0)
-        # else:
-            # raise ValueError(f"Unhandled label {label}")
-    # return parsed
-
-# def read_color_array(archive: ZipFile, filename: str | ZipInfo) -> tuple[int]:
-    # """Reads color array file data.
-
-    # :param archive: A ZipFile of a FreeCAD file.
-    # :param filename: The name of the Point or Line ColorArray file to read.
-    # :returns: A tuple of ARGB integer values.
-    # """
-    # with archive.open(filename) as file:
-        # data = bytes(file.read())
-
-    # header, color = list(batched(data, 4))
-    # assert header == (1, 0, 0, 0)
-    # return color
-
-# def read_string_hasher(archive: ZipFile, filename: str | ZipInfo):
-    # """Reads data from StringHasher files"""
-    # with archive.open(filename) as file:
-        # lines = [line.rstrip() for line in file]
-    # title, version, count = lines.pop(0).split()
-    # assert title.decode() == "StringTableStart"
-
-# Possible Future implementation for color reading:
-# ARGB = namedtuple("ARGB", ["a", "r", "g", "b"])
-# """Typing for alpha red blue green color data"""
-# def unpack_argb(packed: int) -> ARGB:
-    # """Returns a tuple of ARGB values from an integer."""
-    # return ARGB(*[(packed >> shift_by) & 0xFF for shift_by in [24, 16, 8, 0]])
-
-# def _read_color(element: Element) -> tuple[int, int, int, int]:
-    # """Returns the ARGB values from the integer in the element as a tuple."""
-    # if len(element) != 1: raise ValueError(f"Found {len(element)}")
-    # ARGB = namedtuple("ARGB", ["a", "r", "g", "b"])
-    # integer = int(element.find(Tag.PROPERTY_COLOR).attrib[Attr.VALUE])
-    # return unpack_argb(integer)
+
+@dataclass(frozen=True, eq=False)
+class ShapeAppearance:
+    """The materials of a ShapeAppearance file, one row per material. Shapes
+    with a single material have one row, otherwise there is a row per face.
+
+    Colors are (n, 4) uint8 arrays of red, green, blue and the fourth channel
+    as FreeCAD packs it.
+
+    :param ambient: The ambient colors.
+    :param diffuse: The diffuse colors, the main color of each face.
+    :param specular: The specular colors.
+    :param emissive: The emissive colors.
+    :param shininess: The shininess of each material from 0 to 1.
+    :param transparency: The transparency of each material from 0 to 1.
+    :param images: The texture image data of each material, usually empty.
+    :param image_paths: The texture image path of each material, usually empty.
+    :param uuids: The uuid of each material in FreeCAD's material library, or
+        an empty string when the material is not from the library.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # One field per value FreeCAD saves for each material in a MaterialList
+
+    ambient: np.ndarray
+    diffuse: np.ndarray
+    specular: np.ndarray
+    emissive: np.ndarray
+    shininess: np.ndarray
+    transparency: np.ndarray
+    images: tuple[str, ...]
+    image_paths: tuple[str, ...]
+    uuids: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.shininess)
+
+@dataclass(frozen=True)
+class HashedString:
+    """An entry of a FreeCAD StringHasher table, which stores the element
+    names of the document's shapes once and refers to them by id.
+
+    :param id_: The id of the string.
+    :param flags: FreeCAD's StringID flags.
+    :param sids: The encoded references to the strings this one is built from,
+        as FreeCAD saves them.
+    :param data: The saved text of the string, empty when it is built from its
+        sids.
+    """
+    id_: int
+    flags: int
+    sids: tuple[int, ...]
+    data: str
+
+@dataclass(frozen=True)
+class AppearanceProperty:
+    """A lazy handle to the sidecar file of a view provider appearance
+    property. The file is only read when read is called.
+
+    :param name: The property name, e.g. ShapeAppearance or LineColorArray.
+    :param type_: The FreeCAD property type.
+    :param member: The archive member storing the property's data.
+    """
+    name: str
+    type_: str
+    member: ArchiveMember
+
+    def read(self) -> ShapeAppearance | np.ndarray:
+        """Returns the decoded ShapeAppearance for material lists and the
+        (n, 4) RGBA array for color lists.
+
+        :raises NotImplementedError: When the property type is not supported.
+        """
+        data = self.member.read()
+        if self.type_ == MATERIAL_LIST_TYPE:
+            return read_shape_appearance(data)
+        if self.type_ == COLOR_LIST_TYPE:
+            return read_color_array(data)
+        msg = f"Reading appearance property type {self.type_} is not supported"
+        raise NotImplementedError(msg)
+
+def read_gui_appearance(fcstd: FCStd
+                        ) -> dict[str, dict[str, AppearanceProperty]]:
+    """Reads the appearance file references of each object's view provider out
+    of the file's GuiDocument.xml, by object name and then property name.
+
+    :param fcstd: The FCStd file to read the GuiDocument.xml of.
+    :raises KeyError: When there is no GuiDocument.xml in the archive.
+    """
+    appearance = {}
+    provider_name = prop = None
+    with fcstd.open_xml(GUI_DOCUMENT_FILE) as gui_document:
+        for event, element in iter_xml_events(gui_document):
+            if event == "end":
+                if element.tag == "ViewProvider":
+                    element.clear()
+                continue
+            if element.tag == "ViewProvider":
+                provider_name = element.get("name")
+            elif element.tag == "Property":
+                prop = element
+            elif (element.tag in _APPEARANCE_LIST_TAGS
+                  and provider_name is not None and prop is not None
+                  and element.get("file")):
+                name = prop.get("name")
+                appearance.setdefault(provider_name, {})[name] = (
+                    AppearanceProperty(name, prop.get("type"),
+                                       fcstd.get_member(element.get("file")))
+                )
+    return appearance
+
+def read_shape_appearance(data: bytes | memoryview) -> ShapeAppearance:
+    """Reads the data of a ShapeAppearance file.
+
+    :param data: The bytes of a MaterialList file from an FCStd archive.
+    :raises ValueError: When the data is shorter than its material count says.
+    """
+    count = _read_count(data)
+    end = _COUNT.size + count * _MATERIAL_DTYPE.itemsize
+    if len(data) < end:
+        msg = (f"ShapeAppearance data has {len(data)} bytes, expected at least"
+               f" {end} for {count} materials")
+        raise ValueError(msg)
+    records = np.frombuffer(data, _MATERIAL_DTYPE, count, _COUNT.size)
+    strings = _read_strings(data, end, count * _MATERIAL_STRINGS)
+    return ShapeAppearance(
+        *(_unpack_colors(records[name])
+          for name in ("ambient", "diffuse", "specular", "emissive")),
+        shininess=records["shininess"].astype(np.float32),
+        transparency=records["transparency"].astype(np.float32),
+        images=tuple(strings[0::_MATERIAL_STRINGS]),
+        image_paths=tuple(strings[1::_MATERIAL_STRINGS]),
+        uuids=tuple(strings[2::_MATERIAL_STRINGS]),
+    )
+
+def read_color_array(data: bytes | memoryview) -> np.ndarray:
+    """Reads the data of a ColorList file, like LineColorArray,
+    PointColorArray or a per-face DiffuseColor.
+
+    :param data: The bytes of a ColorList file from an FCStd archive.
+    :returns: An (n, 4) uint8 array of red, green, blue and the fourth channel
+        as FreeCAD packs it.
+    :raises ValueError: When the data is not as long as its color count says.
+    """
+    count = _read_count(data)
+    expected = _COUNT.size + 4 * count
+    if len(data) != expected:
+        msg = (f"ColorList data has {len(data)} bytes, expected {expected}"
+               f" for {count} colors")
+        raise ValueError(msg)
+    return _unpack_colors(np.frombuffer(data, "<u4", count, _COUNT.size))
+
+def read_string_hasher(data: bytes | memoryview) -> list[HashedString]:
+    """Reads the data of a StringHasher table file.
+
+    :param data: The bytes of the StringHasher.Table.txt file.
+    :raises ValueError: When the table header or an entry cannot be read.
+    """
+    lines = bytes(data).decode().splitlines()
+    header = lines[0].split() if lines else []
+    if len(header) != 3 or header[:2] != ["StringTableStart", "v1"]:
+        raise ValueError(f"Unrecognized StringHasher table header: {header}")
+    count = int(header[2])
+    if len(lines) - 1 < count:
+        msg = f"StringHasher table has {len(lines) - 1} of {count} entries"
+        raise ValueError(msg)
+    entries = []
+    id_ = 0
+    for line in lines[1:count + 1]:
+        fields, _, text = line.partition(" ")
+        try:
+            numbers = fields.split(".")
+            # Ids starting with - are saved relative to the previous id
+            if numbers[0].startswith("-"):
+                id_ += int(numbers[0][1:], 16)
+            else:
+                id_ = int(numbers[0], 16)
+            entries.append(HashedString(id_, int(numbers[1], 16),
+                                        tuple(int(n, 16) for n in numbers[2:]),
+                                        text))
+        except (IndexError, ValueError) as exc:
+            msg = f"Unrecognized StringHasher table entry: {line!r}"
+            raise ValueError(msg) from exc
+    return entries
+
+# Private Functions #
+def _read_count(data: bytes | memoryview) -> int:
+    """Returns the element count at the start of an appearance file."""
+    try:
+        return _COUNT.unpack_from(data)[0]
+    except struct.error as exc:
+        raise ValueError("Appearance data is missing its count") from exc
+
+def _unpack_colors(packed: np.ndarray) -> np.ndarray:
+    """Returns an (n, 4) RGBA uint8 array from FreeCAD's packed colors, which
+    hold red in the high byte and the fourth channel in the low byte.
+    """
+    channels = packed.astype("<u4").view(np.uint8).reshape(-1, 4)
+    return np.ascontiguousarray(channels[:, ::-1])
+
+def _read_strings(data: bytes | memoryview, offset: int, count: int
+                  ) -> list[str]:
+    """Returns the length prefixed strings starting at the offset. Older files
+    end before the strings, which are then read as empty.
+    """
+    if offset >= len(data):
+        return [""] * count
+    strings = []
+    for _ in range(count):
+        if offset + _COUNT.size > len(data):
+            raise ValueError("ShapeAppearance strings end before their count")
+        length = _COUNT.unpack_from(data, offset)[0]
+        offset += _COUNT.size
+        if offset + length > len(data):
+            raise ValueError("ShapeAppearance string runs past the end of data")
+        strings.append(bytes(data[offset:offset + length]).decode())
+        offset += length
+    return strings
@@ -0,0 +1,96 @@
+"""A module providing the on-disk cache of parsed FreeCAD documents.
+
+Parsing Document.xml is the slowest part of reading an FCStd file, so parsed
+documents can be pickled to a cache keyed by the hash of their Document.xml and
+read back instead of parsing an unchanged file again.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+import hashlib
+import logging
+
+from pancad.__about__ import __version__
+from pancad.utils.disk_cache import DiskCache
+from pancad.utils.initialize import get_document_cache_dir, get_user_config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pancad.cad.freecad.read_xml import FCStd
+
+logger = logging.getLogger(__name__)
+
+D = TypeVar("D")
+
+DOCUMENT_CACHE_SCHEMA = 2
+"""The format version of documents in the document cache. It is part of every
+cache key and is checked on cached documents, so it must be incremented whenever
+an attribute of FreeCADDocumentXML or a class it pickles changes.
+"""
+
+def get_document_cache(enabled: bool=None) -> DiskCache | None:
+    """Returns the on-disk cache of parsed documents configured in the user
+    config document_cache table, or None when the cache is not enabled or the
+    user config cannot be read. The cache is disabled by default.
+
+    :param enabled: Whether to use the cache regardless of the user config
+        enabled setting. Defaults to None, which uses the user config.
+    """
+    if enabled is False:
+        return None
+    try:
+        settings = get_user_config().get("document_cache", {})
+    except OSError as exc:
+        logger.debug("Document cache disabled, could not read user config: %s",
+                     exc)
+        return None
+    if enabled is None and not settings.get("enabled", False):
+        return None
+    max_bytes = int(float(settings.get("max_size_mb", 256)) * 2**20)
+    return DiskCache(get_document_cache_dir(), max_bytes)
+
+def get_cache_key(fcstd: FCStd) -> str:
+    """Returns the document cache key of the Document.xml in the file, the
+    SHA-256 hash of the pancad version, DOCUMENT_CACHE_SCHEMA and the xml.
+    """
+    version = f"{__version__}:{DOCUMENT_CACHE_SCHEMA}"
+    digest = hashlib.sha256(version.encode())
+    with fcstd.open_xml("Document.xml") as document:
+        if isinstance(document, memoryview):
+            digest.update(document)
+        else:
+            while chunk := document.read(2**20):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def read_cached_document(fcstd: FCStd, read: Callable[[FCStd], D],
+                         use_cache: bool=None) -> D:
+    """Returns the parsed document of the file from the document cache, or reads
+    it and stores it in the cache when it is not there. Cached documents that
+    cannot be read or are from another schema are read again.
+
+    :param fcstd: The FCStd file to read the document of.
+    :param read: The function parsing the document of the file.
+    :param use_cache: Whether to use the on-disk document cache. Defaults to
+        None, which uses the user config.
+    """
+    cache = get_document_cache(use_cache)
+    if cache is None:
+        return read(fcstd)
+    key = get_cache_key(fcstd)
+    try:
+        document = cache.get(key)
+    except OSError as exc:
+        logger.warning("Could not read the document cache: %s", exc)
+        document = None
+    if getattr(document, "_cache_schema", None) == DOCUMENT_CACHE_SCHEMA:
+        # The file is left out of the pickled document
+        document.file = fcstd
+        return document
+    document = read(fcstd)
+    try:
+        cache.put(key, document)
+    except OSError as exc:
+        logger.warning("Could not write to the document cache: %s", exc)
+    return document
@@ -0,0 +1,241 @@
+"""A module providing functions for decoding whole FreeCAD sketch geometry lists.
+
+Sketches imported from DXF files can have tens of thousands of Geometry
+elements, so the elements of a GeometryList are read into numpy arrays in one
+pass instead of one geometry at a time.
+"""
+from __future__ import annotations
+
+import dataclasses
+from collections import namedtuple
+from operator import itemgetter
+from typing import TYPE_CHECKING
+import logging
+
+import numpy as np
+
+from pancad.cad.freecad.constants import InternalGeometryType
+from pancad.cad.freecad.xml_utils import (
+    GeomArcOfCircle,
+    GeomCircle,
+    GeomEllipse,
+    GeomLineSegment,
+    GeomPoint,
+    read_attr,
+    read_bool,
+)
+
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element
+
+logger = logging.getLogger(__name__)
+
+GeomArraySpec = namedtuple("GeomArraySpec", ["tag", "geom_class", "attrs"])
+"""How a geometry type is stored in a GeometryListArrays value array. The tag is
+the name of the geometry's data element, geom_class is the GeomData subclass it
+decodes to, and attrs are the float attributes stored as the array columns.
+"""
+_GeometryRow = namedtuple("_GeometryRow", ["type_", "id_", "is_construction",
+                                           "extension", "values"])
+"""The decoded attributes of one Geometry element, before they are stacked
+into the arrays of its list.
+"""
+_XYZ = ("X", "Y", "Z")
+_CENTER_NORMAL = (*("Center" + c for c in _XYZ), *("Normal" + c for c in _XYZ))
+GEOMETRY_ARRAY_SPECS = {
+    "Part::GeomPoint": GeomArraySpec("GeomPoint", GeomPoint, _XYZ),
+    "Part::GeomLineSegment": GeomArraySpec(
+        "LineSegment", GeomLineSegment,
+        (*("Start" + c for c in _XYZ), *("End" + c for c in _XYZ))
+    ),
+    "Part::GeomCircle": GeomArraySpec(
+        "Circle", GeomCircle, (*_CENTER_NORMAL, "AngleXU", "Radius")
+    ),
+    "Part::GeomEllipse": GeomArraySpec(
+        "Ellipse", GeomEllipse,
+        (*_CENTER_NORMAL, "MajorRadius", "MinorRadius", "AngleXU")
+    ),
+    "Part::GeomArcOfCircle": GeomArraySpec(
+        "ArcOfCircle", GeomArcOfCircle,
+        (*_CENTER_NORMAL, "AngleXU", "Radius", "StartAngle", "EndAngle")
+    ),
+}
+"""The geometry types GeometryListArrays can decode, by Geometry type attribute.
+"""
+_GEOMETRY_ARRAY_ZEROS = {
+    "Part::GeomPoint": ("Z",),
+    "Part::GeomLineSegment": ("StartZ", "EndZ"),
+    "Part::GeomCircle": ("CenterZ", "AngleXU"),
+    "Part::GeomEllipse": ("CenterZ",),
+    "Part::GeomArcOfCircle": ("CenterZ", "AngleXU"),
+}
+"""The columns of each geometry type that pancad expects to be exactly zero."""
+_SKETCH_EXT_ATTRS = itemgetter("id", "internalGeometryType",
+                               "geometryModeFlags", "geometryLayer")
+_INTERNAL_GEOMETRY_VALUES = frozenset(InternalGeometryType)
+
+@dataclasses.dataclass
+class GeometryListArrays:
+    """Dataclass holding every geometry of a FreeCAD GeometryList element as
+    typed numpy arrays. Decoding all the geometry in one pass is much faster
+    than decoding each Geometry element on its own.
+
+    Row i of the per-geometry arrays is the i-th decoded geometry of the list.
+    Unsupported geometry is skipped with a warning, the same as when decoding
+    elements one at a time.
+    """
+    types: tuple[str, ...]
+    """The type attribute of each geometry."""
+    ids: np.ndarray
+    """The sketch-unique integer id of each geometry."""
+    is_construction: np.ndarray
+    """Whether each geometry is sketch construction geometry."""
+    extensions: np.ndarray
+    """An (n, 4) int array of each geometry's SketchGeometryExtension id,
+    internalGeometryType, geometryModeFlags and geometryLayer.
+    """
+    indices: dict[str, np.ndarray]
+    """The rows of the geometry of each type, by type attribute."""
+    values: dict[str, np.ndarray]
+    """An (n, m) float array for each type with the columns listed in that
+    type's GEOMETRY_ARRAY_SPECS attrs.
+    """
+
+    def get_values(self, type_: str, *names: str) -> np.ndarray:
+        """Returns the columns of a geometry type's value array.
+
+        :param type_: The Geometry type attribute, like 'Part::GeomCircle'.
+        :param names: The xml attribute names of the columns, like 'Radius'.
+        :raises KeyError: When the type has no geometry in the list.
+        :raises ValueError: When a name is not stored for the type.
+        """
+        attrs = GEOMETRY_ARRAY_SPECS[type_].attrs
+        columns = [attrs.index(name) for name in names]
+        return self.values[type_][:, columns]
+
+    @classmethod
+    def from_element(cls, element: Element) -> GeometryListArrays:
+        """Returns the arrays of a GeometryList xml element.
+
+        :param element: A GeometryList element of a Part::PropertyGeometryList
+            property.
+        :raises ValueError: When a Geometry element is missing data or has
+            values pancad does not support yet.
+        :raises LookupError: When a Geometry element is missing its data element.
+        """
+        decoded = [row for row in map(_read_geometry_row, element)
+                   if row is not None]
+        indices = {type_: [] for type_ in GEOMETRY_ARRAY_SPECS}
+        rows = {type_: [] for type_ in GEOMETRY_ARRAY_SPECS}
+        for i, row in enumerate(decoded):
+            indices[row.type_].append(i)
+            rows[row.type_].append(row.values)
+        arrays = cls(
+            tuple(row.type_ for row in decoded),
+            np.array([row.id_ for row in decoded], dtype=np.int64),
+            np.array([row.is_construction for row in decoded], dtype=bool),
+            np.array([row.extension for row in decoded],
+                     dtype=np.int64).reshape(-1, 4),
+            {t: np.array(i, dtype=np.intp) for t, i in indices.items() if i},
+            {t: _to_float_array(r, t) for t, r in rows.items() if r},
+        )
+        arrays._check_constants()
+        return arrays
+
+    def _check_constants(self) -> None:
+        """Checks that the columns pancad does not support yet hold their only
+        supported values.
+
+        :raises ValueError: When a value does not match.
+        """
+        for type_, values in self.values.items():
+            zeros = self.get_values(type_, *_GEOMETRY_ARRAY_ZEROS[type_])
+            bad = np.any(zeros != 0, axis=1)
+            if "NormalZ" in GEOMETRY_ARRAY_SPECS[type_].attrs:
+                normals = self.get_values(type_, "NormalX", "NormalY", "NormalZ")
+                bad |= ~np.all(np.isclose(normals, (0, 0, 1)), axis=1)
+            if np.any(bad):
+                row = np.flatnonzero(bad)[0]
+                id_ = self.ids[self.indices[type_][row]]
+                msg = (f"Unexpected {GEOMETRY_ARRAY_SPECS[type_].tag} values:"
+                       f" got {values[row].tolist()}")
+                exc = ValueError(msg, id_)
+                exc.add_note(f"Occurred on Geometry id {id_}")
+                raise exc
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+# Private Functions #
+def _read_geometry_row(geometry: Element) -> _GeometryRow | None:
+    """Returns the decoded attributes of a Geometry element, or None when the
+    geometry is not supported yet and is skipped with a warning.
+
+    :raises ValueError: When the element is missing data.
+    :raises LookupError: When the element is missing its data element.
+    """
+    type_ = read_attr(geometry, "type")
+    id_ = read_attr(geometry, "id", int)
+    try:
+        spec = GEOMETRY_ARRAY_SPECS[type_]
+    except KeyError:
+        logger.warning("Failed to read geometry element: Reading func"
+                       " for %s types not yet implemented", type_)
+        return None
+    try:
+        ext, data, is_construction = _read_geometry_children(geometry, spec)
+    except NotImplementedError as exc:
+        logger.warning("Failed to read geometry element: %s", exc)
+        return None
+    try:
+        values = itemgetter(*spec.attrs)(data.attrib)
+    except KeyError as exc:
+        msg = (f"Unexpected {spec.tag} format: could not find"
+               f" '{exc.args[0]}' attribute")
+        raise ValueError(msg, data) from exc
+    return _GeometryRow(type_, id_, is_construction, ext, values)
+
+def _read_geometry_children(geometry: Element, spec: GeomArraySpec
+                            ) -> tuple[tuple[int, int, int, int], Element, bool]:
+    """Returns the SketchGeometryExtension integers, the data element, and the
+    construction value of a Geometry element by walking its children once.
+
+    :raises NotImplementedError: When the internalGeometryType is unknown.
+    """
+    ext = data = construction = None
+    for child in geometry:
+        if child.tag == "GeoExtensions":
+            for extension in child:
+                if extension.get("type") == "Sketcher::SketchGeometryExtension":
+                    ext = extension
+        elif child.tag == spec.tag:
+            data = child
+        elif child.tag == "Construction":
+            construction = child
+    if ext is None:
+        msg = "Unexpected Geometry format: No SketchGeometryExtension found"
+        raise ValueError(msg, geometry)
+    if construction is None:
+        msg = "Unexpected Geometry format: No Construction element found"
+        raise ValueError(msg, geometry)
+    if data is None:
+        raise LookupError("No element was found using the xpath", spec.tag)
+    try:
+        ext_id, internal, flags, layer = _SKETCH_EXT_ATTRS(ext.attrib)
+        ext_values = (int(ext_id), int(internal), int(flags, base=2), int(layer))
+    except (KeyError, ValueError) as exc:
+        msg = "Unexpected GeoExtension format for Sketcher::SketchGeometryExtension"
+        raise ValueError(msg, ext) from exc
+    if ext_values[1] not in _INTERNAL_GEOMETRY_VALUES:
+        msg = f"Unsupported internalGeometryType value: {ext_values[1]}"
+        raise NotImplementedError(msg)
+    is_construction = read_bool(read_attr(construction, "value"))
+    return ext_values, data, is_construction
+
+def _to_float_array(rows: list[tuple[str, ...]], type_: str) -> np.ndarray:
+    """Converts rows of float attribute strings into an (n, m) float array."""
+    try:
+        return np.array(rows, dtype=np.float64)
+    except ValueError as exc:
+        exc.add_note(f"While converting {type_} geometry attributes to floats")
+        raise
@@ -0,0 +1,576 @@
+"""A module providing interfaces to the properties of FreeCAD Document.xml
+objects, and to the sketch geometry and constraints inside property lists.
+"""
+from __future__ import annotations
+
+from functools import partialmethod
+from typing import TYPE_CHECKING
+
+from pancad.cad.freecad import xml_utils
+from pancad.cad.freecad.xml_utils import (
+    FreeCADLink,
+    FreeCADExpression,
+    FreeCADPlacement,
+    GeomData,
+    GeomPoint,
+    GeomLineSegment,
+    GeomCircle,
+    GeomEllipse,
+    GeomArcOfCircle,
+    PropertyPartShape,
+    SketchGeoExt,
+    ConstraintData,
+)
+from pancad.cad.freecad.constants import ConstraintType, InternalGeometryType
+from pancad.cad.freecad.xml_geometry_arrays import (
+    GeometryListArrays, GEOMETRY_ARRAY_SPECS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+    from xml.etree.ElementTree import Element
+
+    from pancad.cad.freecad.read_xml import FreeCADObjectXML
+    from pancad.cad.freecad.xml_utils import FreeCADUID, ConstraintGeoRef
+
+class FreeCADPropertyXML:
+    """A class providing interfaces to FCStd Document.xml element properties.
+
+    :param element: The xml Property element inside a FCStd Properties xml
+        element list.
+    :param parent: The object this property is inside of.
+    """
+    tag = "Property"
+    """The nominal tag of the element in xml. If is_private is True, then it's
+    actually _Property, but if that matters in a specific application then
+    properties should be filtered based on that boolean rather than depending on
+    the specific tag format.
+    """
+    _value_readers = {
+        "App::PropertyUUID": "_read_single_str",
+        "App::PropertyString": "_read_single_str",
+        "Materials::PropertyMaterial": "_read_single_uuid",
+        "App::PropertyBool": "_read_single_bool",
+        "App::PropertyPrecision": "_read_single_float",
+        "App::PropertyAngle": "_read_single_float",
+        "App::PropertyLength": "_read_single_float",
+        "App::PropertyFloat": "_read_single_float",
+        "Part::PropertyPartShape": "_read_property_part_shape",
+        "App::PropertyVector": "_read_value_vector",
+        "App::PropertyLinkList": "_read_link_list",
+        "App::PropertyLinkListHidden": "_read_link_list",
+        "App::PropertyLink": "_read_link",
+        "App::PropertyLinkHidden": "_read_link",
+        "App::PropertyLinkSub": "_read_link_sub",
+        "App::PropertyEnumeration": "_read_enum",
+        "App::PropertyLinkSubList": "_read_link_sub_list",
+        "Part::PropertyGeometryList": "_read_geometry",
+        "Sketcher::PropertyConstraintList": "_read_constraints",
+        "App::PropertyExpressionEngine": "_read_expressions",
+        "App::PropertyPlacement": "_read_placement",
+        "App::PropertyMap": "_read_property_map",
+    }
+    """The names of the methods reading the values of each property type."""
+
+    def __init__(self, element: Element, parent: FreeCADObjectXML):
+        try:
+            self._name = element.attrib["name"]
+        except KeyError as exc:
+            msg = "Invalid Property element, could not find 'name' attribute"
+            raise ValueError(msg, element) from exc
+        try:
+            self._type = element.attrib["type"]
+        except KeyError as exc:
+            msg = "Invalid Property element, could not find 'type' attribute"
+            raise ValueError(msg, element) from exc
+        self._is_private = element.tag.startswith("_")
+        self._parent = parent
+        if self.type_ not in self._value_readers:
+            msg = f"Property type '{self.type_}' has not been implemented."
+            not_imp_exc = NotImplementedError(msg)
+            not_imp_exc.add_note(f"On Property '{self.name}'")
+            raise not_imp_exc
+        # Only the property's own subtree is kept until its value is decoded,
+        # the rest of a streamed object is cleared. Private properties appear to
+        # be derived from elsewhere, so they are never read
+        self._value = None
+        self._element = None if self.is_private else element
+        self._geometry_arrays = None
+
+    @property
+    def name(self) -> str:
+        """The name attribute of the property in the file's xml."""
+        return self._name
+
+    @property
+    def type_(self) -> str:
+        """The type attribute of the property in the file's xml."""
+        return self._type
+
+    @property
+    def is_private(self) -> bool:
+        """Whether the property tag is marked with a private underscore in the
+        xml file.
+        """
+        return self._is_private
+
+    @property
+    def parent(self) -> FreeCADObjectXML:
+        """The object this property is inside of."""
+        return self._parent
+
+    @property
+    def value(self) -> Any:
+        """The value of the property in its xml. The value is only decoded the
+        first time it is accessed.
+
+        :raises ValueError: When the value's xml is invalid. The value is
+            decoded again on the next access.
+        """
+        if self._element is not None:
+            self._value = self._decode_value()
+            # Decoded, so release the subtree
+            self._element = None
+        return self._value
+
+    def get_geometry_arrays(self) -> GeometryListArrays:
+        """Returns the geometry of a Part::PropertyGeometryList property as
+        numpy arrays, decoded in a single pass over the list. The arrays are
+        kept, so the value's FreeCADGeometryXML objects are built from them
+        instead of decoding the xml again.
+
+        :raises TypeError: When the property is not a geometry list.
+        """
+        if self.type_ != "Part::PropertyGeometryList":
+            msg = f"Property '{self.name}' of type {self.type_} has no geometry"
+            raise TypeError(msg)
+        if self._geometry_arrays is None:
+            try:
+                self._geometry_arrays = GeometryListArrays.from_element(
+                    self._read_first()
+                )
+            except (ValueError, NotImplementedError) as exc:
+                exc.add_note(f"While reading values on Property '{self.name}'")
+                raise
+        return self._geometry_arrays
+
+    def _decode_value(self) -> Any:
+        """Reads the value of the property from its xml element."""
+        value_func = getattr(self, self._value_readers[self.type_])
+        try:
+            return value_func()
+        except (ValueError, NotImplementedError) as exc:
+            exc.add_note(f"While reading values on Property '{self.name}'")
+            raise
+
+    def _read_single(self, element: Element) -> Element:
+        """Reads the first element of an element inside the property when the
+        element must have at least one subelement to be possible to read.
+
+        :param element: An xml Element.
+        :raises ValueError: When element does not have exactly 1 subelement.
+        """
+        if (no_subelements := len(element)) != 1:
+            msg = (f"Unexpected Property format for {self.type_}:"
+                   f"Expected 1 subelement but found {no_subelements}")
+            raise ValueError(msg, element)
+        return element[0]
+
+    def _read_first(self) -> Element:
+        """Reads the first property subelement."""
+        return self._read_single(self._element)
+
+    def _read_single_attr(self, name: str,
+                          converter: Callable[str, Any]=str) -> Any:
+        """Read property type that has a single element with a value attr."""
+        return xml_utils.read_attr(self._read_first(), name, converter)
+
+    _read_single_str = partialmethod(_read_single_attr, "value")
+    _read_single_uuid = partialmethod(_read_single_attr, "uuid")
+    _read_single_bool = partialmethod(_read_single_attr, "value",
+                                      xml_utils.read_bool)
+    _read_single_float = partialmethod(_read_single_attr, "value", float)
+
+    def _read_single_vector(self, names: tuple[str, str, str],
+                            prefix: str=None, is_2d: bool=False
+                            ) -> tuple[float, float, float]:
+        """Reads the vector inside the first subelement."""
+        element = self._read_first()
+        return xml_utils.read_vector(element, names, prefix, is_2d)
+
+    _read_value_vector = partialmethod(_read_single_vector,
+                                       ("X", "Y", "Z"), "value")
+
+    def _read_enum(self) -> int | str:
+        """Reads enumerations. If there's a custom list it converts the option to
+        its selected string.
+        """
+        select = xml_utils.find_single(self._element, "Integer")
+        selection = xml_utils.read_attr(select, "value", int)
+        is_custom = select.get("CustomEnum")
+        if is_custom is not None and xml_utils.read_bool(is_custom):
+            options = xml_utils.find_single(self._element, "CustomEnumList")
+            return xml_utils.read_attr(options[selection], "value")
+        return selection
+
+    def _read_nested_attr_list(self, attr: str) -> list[str]:
+        """Read property type that has a list of value attr subelements."""
+        return [xml_utils.read_attr(e, attr) for e in self._read_first()]
+
+    _read_str_list = partialmethod(_read_nested_attr_list, "value")
+
+    def _read_property_part_shape(self) -> PropertyPartShape:
+        return PropertyPartShape.from_element(self._element)
+
+    def _read_link_sub(self) -> list[FreeCADLink]:
+        """Read property type with child-to-parent links to one object."""
+        links = []
+        element = self._read_first()
+        obj_name = xml_utils.read_attr(element, "value")
+        if obj_name == "": # Empty element means no links
+            return links
+        for subelement in element:
+            sub_name = xml_utils.read_attr(subelement, "value")
+            shadow = subelement.get("shadow")
+            if sub_name == "":
+                sub_name = None
+            links.append(FreeCADLink(obj_name, sub_name, shadow))
+        if len(links) == 0: # Name is not empty, so just the link to the object.
+            links.append(FreeCADLink(obj_name))
+        return links
+
+    def _read_link(self) -> FreeCADLink | None:
+        """Read property type with parent-to-child link to one object."""
+        element = self._read_first()
+        name = xml_utils.read_attr(element, "value")
+        if name == "":
+            return None
+        return FreeCADLink(name)
+
+    def _read_link_list(self) -> list[FreeCADLink]:
+        """Read property type with parent-to-child links to one object."""
+        links = []
+        element = self._read_first()
+        for subelement in element:
+            name = xml_utils.read_attr(subelement, "value")
+            links.append(FreeCADLink(name))
+        return links
+
+    def _read_placement(self) -> FreeCADPlacement:
+        element = self._read_first()
+        return FreeCADPlacement.from_element(element)
+
+    def _read_property_map(self) -> list:
+        """If any property maps add elements, this will raise a better
+        NotImplementedError to make it clear that it's something to
+        implement.
+        """
+        if len(self._read_first()) > 0:
+            num = len(self._read_first())
+            msg = (f"Expected PropertyMap to have 0 elements, found {num}. any"
+                  " Nested Map elements have not been implemented.")
+            raise NotImplementedError(msg)
+        return [] # element = self._read_first() # Not used since always empty
+
+    def _read_link_sub_list(self) -> list[FreeCADLink]:
+        """Read property type with child-to-parent links to multiple objects."""
+        links = []
+        element = self._read_first()
+        for subelement in element:
+            obj_name = xml_utils.read_attr(subelement, "obj")
+            if obj_name == "":
+                continue
+            sub_name = xml_utils.read_attr(subelement, "sub")
+            shadow = subelement.get("shadow")
+            if sub_name == "":
+                sub_name = None
+            links.append(FreeCADLink(obj_name, sub_name, shadow))
+        return links
+
+    def _read_geometry(self) -> list[FreeCADGeometryXML]:
+        return FreeCADGeometryXML.from_arrays(self.get_geometry_arrays(), self)
+
+    def _read_expressions(self) -> list[FreeCADExpression]:
+        element = self._read_first()
+        expressions = []
+        attrs = ["path", "expression"]
+        for exp in element:
+            inputs = {name: xml_utils.read_attr(exp, name) for name in attrs}
+            expressions.append(FreeCADExpression(**inputs))
+        return expressions
+
+    def _read_constraints(self) -> list[FreeCADConstraintXML]:
+        constraints = []
+        for element in self._read_first():
+            constraints.append(FreeCADConstraintXML(element, self))
+        return constraints
+
+    def __repr__(self) -> str:
+        type_wo_ns = self.type_.split("::")[-1]
+        return f"<FreeCADPropertyXML {self.name} {type_wo_ns}>"
+
+class FreeCADGeometryXML:
+    """A class providing interfaces to FCStd Document.xml sketch geometry
+    elements.
+
+    :param element: The xml Geometry element inside an FCStd
+        Part::PropertyGeometryList type xml property list.
+    :param parent: The FreeCADPropertyXML this geometry is inside of.
+    """
+    tag = "Geometry"
+
+    def __init__(self, element: Element, parent: FreeCADPropertyXML):
+        self._parent = parent
+        self._type = xml_utils.read_attr(element, "type")
+        self._id = int(xml_utils.read_attr(element, "id"))
+        self._element = element
+        self._sketch_ext = self._get_sketch_geometry_extension()
+        self._is_construction = self._get_construction()
+        self._geometry = self._get_geom()
+        # Everything has been decoded, so release the element for streamed reads
+        self._element = None
+
+    @classmethod
+    def from_arrays(cls, arrays: GeometryListArrays, parent: FreeCADPropertyXML
+                    ) -> list[FreeCADGeometryXML]:
+        """Returns the geometry held in the arrays of a geometry list property.
+        Equivalent to initializing one geometry per Geometry element, but
+        without searching or converting each element's xml again.
+
+        :param arrays: The arrays read from the property's GeometryList.
+        :param parent: The FreeCADPropertyXML the geometry is inside of.
+        :raises ValueError: When a geometry's internal type is not recognized.
+        """
+        values = [None] * len(arrays)
+        for type_, index in arrays.indices.items():
+            for i, row in zip(index.tolist(), arrays.values[type_].tolist()):
+                values[i] = row
+        fields = zip(arrays.types, arrays.ids.tolist(),
+                     arrays.is_construction.tolist(), arrays.extensions.tolist())
+        return [cls._from_fields(parent, f, v) for f, v in zip(fields, values)]
+
+    @classmethod
+    def _from_fields(cls, parent: FreeCADPropertyXML,
+                     fields: tuple[str, int, bool, list[int]],
+                     values: list[float]) -> FreeCADGeometryXML:
+        """Returns a geometry from the fields already decoded from its element.
+
+        :param parent: The FreeCADPropertyXML the geometry is inside of.
+        :param fields: The type, id, construction value, and the
+            SketchGeometryExtension id, internalGeometryType, geometryModeFlags
+            and geometryLayer of the geometry.
+        :param values: The geometry's row of its type's value array.
+        :raises ValueError: When the internal type is not recognized.
+        """
+        type_, id_, is_construction, (ext_id, internal, flags, layer) = fields
+        geo = cls.__new__(cls)
+        geo._parent = parent
+        geo._type = type_
+        geo._id = id_
+        geo._element = None
+        geo._sketch_ext = SketchGeoExt(geo, "Sketcher::SketchGeometryExtension",
+                                       ext_id, InternalGeometryType(internal),
+                                       flags, layer)
+        geo._is_construction = is_construction
+        spec = GEOMETRY_ARRAY_SPECS[type_]
+        geo._geometry = spec.geom_class.from_row(geo, spec.tag, values)
+        return geo
+
+    @property
+    def type_(self) -> str:
+        """The TypeId string of the geometry."""
+        return self._type
+
+    @property
+    def internal_type(self) -> InternalGeometryType:
+        """The internal alignment type of the geometry specified in the xml."""
+        return self._sketch_ext.internal_geometry_type
+
+    @property
+    def id_(self) -> int:
+        """The sketch-unique FreeCAD integer id of the geometry."""
+        return self._id
+
+    @property
+    def parent(self) -> FreeCADPropertyXML:
+        """The object this geometry is inside of."""
+        return self._parent
+
+    @property
+    def is_construction(self) -> bool:
+        """Whether the geometry is sketch construction geometry."""
+        return self._is_construction
+
+    @property
+    def uid(self) -> FreeCADUID:
+        """The has-to-be-unique pancad calculated id for this element."""
+        feature = self.parent.parent
+        document = feature.document
+        parts = [
+            document.get_property('Uid').value,
+            "sketchgeo",
+            feature.id_,
+            int(self.id_ < 0), # 0 for Geometry, 1 for ExternalGeo
+            self.id_,
+        ]
+        return xml_utils.FreeCADUID("_".join(map(str, parts)))
+
+    @property
+    def geometry(self) -> GeomData:
+        """The geometric data of the geometry represented by this xml element."""
+        return self._geometry
+
+    def get_defining_geometry(self) -> FreeCADGeometryXML:
+        """Returns the geometry defining this geometry. If non-internal
+        geometry, this echos the geometry. If this is internal geometry
+        (e.g. an Ellipse major axis), this returns the Ellipse.
+        """
+        if self.internal_type == InternalGeometryType.NOT_INTERNAL:
+            return self
+        sketch = self.parent.parent
+        constraints = sketch.get_property("Constraints").value
+        id_type = (self.id_, self.internal_type)
+        for constraint in constraints:
+            cons_id_type = (constraint.data.pairs.first.id_, self.internal_type)
+            if id_type == cons_id_type:
+                geo, _ = constraint.data.pairs.second.get_geometry()
+                return geo
+        msg = (f"Could not find the internal aligning constraint for"
+               f" id, type: {id_type} in {sketch.name}")
+        raise ValueError(msg)
+
+    def _get_geo_extension(self, type_: str) -> Element:
+        """Returns the GeoExtension of the provided type.
+
+        :raises LookupError: When the extension is not found.
+        """
+        xpath = f"GeoExtensions/GeoExtension[@type='{type_}']"
+        return xml_utils.find_single(self._element, xpath)
+
+    def _get_geom(self) -> Element:
+        tag = self.type_.removeprefix("Part::")
+        if tag != "GeomPoint": # Point is the only one that keeps the 'Geom'
+            tag = tag.removeprefix("Geom")
+        element = xml_utils.find_single(self._element, tag)
+        tag_to_dataclass = {
+            "GeomPoint": GeomPoint,
+            "LineSegment": GeomLineSegment,
+            "Circle": GeomCircle,
+            "Ellipse": GeomEllipse,
+            "ArcOfCircle": GeomArcOfCircle,
+        }
+        try:
+            geom_class = tag_to_dataclass[tag]
+        except KeyError as exc:
+            msg = f"Reading func for {exc.args[0]} types not yet implemented"
+            raise NotImplementedError(msg) from exc
+        return geom_class.from_element(self, element)
+
+    def _get_sketch_geometry_extension(self) -> SketchGeoExt:
+        """Returns the Sketcher::SketchGeometryExtension that all geometry has
+        to have.
+        """
+        type_ = "Sketcher::SketchGeometryExtension"
+        try:
+            element = self._get_geo_extension(type_)
+        except LookupError as exc:
+            msg = "Unexpected Geometry format: No SketchGeometryExtension found"
+            raise ValueError(msg, self._element) from exc
+        return SketchGeoExt.from_element(self, element)
+
+    def _get_construction(self) -> bool:
+        try:
+            element = xml_utils.find_single(self._element, "Construction")
+        except LookupError as exc:
+            msg = "Unexpected Geometry format: No Construction element found"
+            raise ValueError(msg, self._element) from exc
+        try:
+            value = xml_utils.read_attr(element, "value")
+        except ValueError as exc:
+            msg ="Exception from reading Geometry element"
+            exc.add_note(msg)
+            raise
+        return xml_utils.read_bool(value)
+
+    def __repr__(self) -> str:
+        geo_type = self.geometry.__class__.__name__
+        sketch_name = self.parent.parent.name
+        return f"<{self.__class__.__name__} {geo_type} {sketch_name} {self.id_}>"
+
+class FreeCADConstraintXML:
+    """A class providing interfaces to FCStd Document.xml geometry elements.
+
+    :param element: The xml Constrain element inside an FCStd
+        Sketcher::PropertyConstraintList type xml property list.
+    :param parent: The FreeCADPropertyXML this constraint is inside of.
+    """
+    tag = "Constrain"
+
+    def __init__(self, element: Element, parent: FreeCADPropertyXML):
+        self._parent = parent
+        self._element = element
+        self._data = ConstraintData.from_element(self, element)
+        # Everything has been decoded, so release the element for streamed reads
+        self._element = None
+
+    @property
+    def parent(self) -> FreeCADPropertyXML:
+        """The object this constraint is inside of."""
+        return self._parent
+
+    @property
+    def data(self) -> ConstraintData:
+        """The detailed constraint data structure."""
+        return self._data
+
+    @property
+    def type_(self) -> ConstraintType:
+        """The constraint type number."""
+        return self.data.type_
+
+    @property
+    def value(self) -> float:
+        """The value of the constraint stored in xml. All FreeCAD constraints
+        have a value, but it's normally 0 unless the constraint actually
+        uses it (distance, diameter, etc).
+        """
+        return self.data.value
+
+    @property
+    def internal_type(self) -> InternalGeometryType:
+        """The internal alignment type of the constraint."""
+        if self.data.internal_alignment is None:
+            return InternalGeometryType.NOT_INTERNAL
+        return self.data.internal_alignment.type_
+
+    @property
+    def uid(self) -> FreeCADUID:
+        """The has-to-be-unique pancad calculated id for this element."""
+        feature = self.parent.parent
+        document = feature.document
+        parts = [document.get_property('Uid').value, "sketchcons",
+                 feature.id_, self.type_]
+        pairs = self._data.pairs
+        for pair in [pairs.first, pairs.second, pairs.third]:
+            if pair.id_ is None:
+                id_ = -2000
+            else:
+                id_ = pair.id_
+            list_int_map = {None: 0, "Geometry": 0, "ExternalGeo": 1}
+            try:
+                list_int = list_int_map[pair.list_name]
+            except KeyError as exc:
+                msg = f"Unexpected value for list_name: {pair.list_name}"
+                raise ValueError(msg) from exc
+            parts.extend([list_int, id_, pair.part])
+        return xml_utils.FreeCADUID("_".join(map(str, parts)))
+
+    def get_references(self) -> list[ConstraintGeoRef]:
+        """Returns the geometry and subpart references constrained by this
+        constraint.
+        """
+        return self.data.pairs.as_list()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.data.type_.human_name}>"
@@ -0,0 +1,122 @@
+"""A module providing functions for incrementally parsing FreeCAD xml files.
+
+Document.xml can be hundreds of megabytes for sketches imported from DXF files,
+so it is parsed as a stream of elements that are cleared once they have been
+read instead of being held in memory all at once.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from xml.etree import ElementTree as ET
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from os import PathLike
+    from typing import IO
+    from xml.etree.ElementTree import Element
+
+XML_CHUNK_SIZE = 2**16
+"""The number of bytes fed to the xml parser at a time from in-memory data."""
+_LINK_NAME_ATTRS = {
+    "App::PropertyLink": ("value", False),
+    "App::PropertyLinkList": ("value", True),
+    "App::PropertyLinkSub": ("value", False),
+    "App::PropertyLinkSubList": ("obj", True),
+}
+"""The link property types get_child_names and get_parent_names read, mapped to
+the attribute holding the linked object name and whether it is on the
+subelements of the property's first element instead of the element itself.
+"""
+
+def iter_xml_events(source: IO[bytes] | PathLike | memoryview
+                    ) -> Iterator[tuple[str, Element]]:
+    """Yields the start and end events of incrementally parsed xml. In-memory
+    data is fed to the parser in memoryview slices, so it is never copied.
+    """
+    if not isinstance(source, (bytes, bytearray, memoryview)):
+        yield from ET.iterparse(source, events=("start", "end"))
+        return
+    parser = ET.XMLPullParser(events=("start", "end"))
+    view = memoryview(source)
+    for start in range(0, len(view), XML_CHUNK_SIZE):
+        parser.feed(view[start:start + XML_CHUNK_SIZE])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+def iter_document_elements(source: IO[bytes] | PathLike | memoryview
+                           ) -> Iterator[Element]:
+    """Yields the Document root of Document.xml data, then each ObjectData
+    Object element as soon as it has been parsed.
+
+    The root only holds the complete Properties and Objects lists, since the
+    parser reads ahead and the ObjectData list may already hold incomplete
+    Objects. Each Object is cleared from the tree once the next element is asked
+    for. When there is no ObjectData list, the complete root is yielded once the
+    xml has been parsed.
+
+    :param source: A binary file object, path, or in-memory bytes-like data
+        to read the xml from.
+    """
+    root = None
+    has_object_data = False
+    stack = []
+    for event, element in iter_xml_events(source):
+        if event == "start":
+            if root is None:
+                root = element
+            elif len(stack) == 1 and element.tag == "ObjectData":
+                has_object_data = True
+                skeleton = ET.Element(root.tag, root.attrib)
+                skeleton.extend(e for e in root if e is not element)
+                yield skeleton
+            stack.append(element)
+            continue
+        stack.pop()
+        if (len(stack) == 2 and stack[1].tag == "ObjectData"
+                and element.tag == "Object"):
+            yield element
+            stack[1].remove(element)
+            element.clear()
+    if root is not None and not has_object_data:
+        yield root
+
+def read_link_graph(source: IO[bytes] | PathLike | memoryview
+                    ) -> dict[str, set[str]]:
+    """Returns the names of the objects each ObjectData Object links to, the
+    same names as its get_child_names and get_parent_names, from one streamed
+    pass over Document.xml data without reading any object.
+    """
+    elements = iter_document_elements(source)
+    next(elements, None) # The Document root
+    return {element.get("name"): _read_link_names(element)
+            for element in elements}
+
+def get_link_closure(names: set[str], graph: dict[str, set[str]]) -> set[str]:
+    """Returns the names and the names of every object in the graph they link
+    to, recursively. Links to objects outside the graph are ignored.
+    """
+    closure = set(names)
+    pending = list(names)
+    while pending:
+        for linked in graph.get(pending.pop(), ()):
+            if linked in graph and linked not in closure:
+                closure.add(linked)
+                pending.append(linked)
+    return closure
+
+# Private Functions #
+def _read_link_names(element: Element) -> set[str]:
+    """Returns the names of the objects an ObjectData Object element links to
+    through its public link properties.
+    """
+    names = set()
+    for prop in element.iterfind("Properties/Property"):
+        attr, is_list = _LINK_NAME_ATTRS.get(prop.get("type"), (None, False))
+        value = prop.find("*") if attr is not None else None
+        if value is None:
+            continue
+        links = value if is_list else [value]
+        names.update(link.get(attr, "") for link in links)
+    names.discard("")
+    return names
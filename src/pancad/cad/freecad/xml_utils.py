@@ -7,6 +7,8 @@ from itertools import islice
 from functools import singledispatch, partial
 from typing import TYPE_CHECKING, ClassVar, Literal
 from math import isclose
+from weakref import WeakValueDictionary
+import hashlib
 import re
 
 import numpy as np
@@ -23,7 +25,9 @@ if TYPE_CHECKING:
     from typing import Any, NoReturn
     from xml.etree.ElementTree import Element, ElementTree
 
-    from pancad.cad.freecad.read_xml import FreeCADGeometryXML, FreeCADConstraintXML
+    from pancad.cad.freecad.xml_properties import (
+        FreeCADGeometryXML, FreeCADConstraintXML,
+    )
 
 EMPTY_CONSTRAINED = -2000
 """The integer that FreeCAD uses to indicate a sketch constraint reference is
@@ -138,6 +142,22 @@ def read_float_attr_list(element: Element, names: list[str]) -> list[float]:
     name_map = {n: n for n in names}
     return list(read_float_attrs(element, name_map).values())
 
+def fingerprint_element(element: Element) -> str:
+    """Returns a hash of the element and all of its subelements that only
+    changes when their content changes. Attribute order and the whitespace
+    around text are ignored, so re-saving unchanged xml keeps the fingerprint.
+
+    :param element: An xml Element.
+    """
+    parts = []
+    for subelement in element.iter():
+        # The child count makes the pre-order walk unique to the tree's shape
+        parts.append(f"{subelement.tag}/{len(subelement)}")
+        parts.extend(f"{k}={v}" for k, v in sorted(subelement.attrib.items()))
+        if subelement.text is not None and (text := subelement.text.strip()):
+            parts.append(f"#{text}")
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
 def read_bool(string: str) -> bool:
     """Converts a boolean string value read from xml into a bool"""
     return string.lower() in ["true", "1"]
@@ -347,7 +367,8 @@ class SketchConstraintUidInfo:
 class FreeCADUID(str):
     """A class to make it easy to access freecad uid information from their
     strings. All attributes of this class should stay constant after
-    initialization.
+    initialization. Instances are interned, so creating a uid from a string
+    that is already in use returns the existing uid without parsing again.
 
     :raises ValueError: When the number/type of uid parts are invalid for the uid
         type.
@@ -361,8 +382,18 @@ class FreeCADUID(str):
         "sketchcons": SketchConstraintUidInfo.from_parts,
     }
     """Mapping from type names to their namedtuple types."""
+    _interned: ClassVar[WeakValueDictionary[str, FreeCADUID]] = (
+        WeakValueDictionary()
+    )
+    """The uids currently in use by their strings."""
 
     def __new__(cls, string: str) -> FreeCADUID:
+        if isinstance(string, cls):
+            return string
+        try:
+            return cls._interned[string]
+        except KeyError:
+            pass
         new = super().__new__(cls, string)
         parts = string.split(cls.delim)
         try:
@@ -381,6 +412,7 @@ class FreeCADUID(str):
                                                        *parts)
         except KeyError as exc:
             raise ValueError("Invalid uid type", exc.args[0]) from exc
+        cls._interned[str(string)] = new
         return new
 
     @classmethod
@@ -529,6 +561,12 @@ class GeomPoint(GeomData):
         point = read_vector(element, ("X", "Y", "Z"))
         return cls(parent, parent.type_, element.tag, point)
 
+    @classmethod
+    def from_row(cls, parent: FreeCADGeometryXML, tag: str,
+                 row: list[float]) -> GeomPoint:
+        """Returns a GeomPoint from a row of a GeometryListArrays value array."""
+        return cls(parent, parent.type_, tag, tuple(row[0:2]))
+
 @dataclasses.dataclass
 class GeomLineSegment(GeomData):
     """Dataclass for tracking FreeCAD Sketch Line Segment info."""
@@ -550,6 +588,12 @@ class GeomLineSegment(GeomData):
                 raise
         return cls(parent, parent.type_, element.tag, **points)
 
+    @classmethod
+    def from_row(cls, parent: FreeCADGeometryXML, tag: str,
+                 row: list[float]) -> GeomLineSegment:
+        """Returns a GeomLineSegment from a row of a GeometryListArrays value array."""
+        return cls(parent, parent.type_, tag, tuple(row[0:2]), tuple(row[3:5]))
+
 @dataclasses.dataclass
 class GeomCircle(GeomData):
     """Dataclass for tracking FreeCAD Sketch Circle info."""
@@ -573,6 +617,12 @@ class GeomCircle(GeomData):
                 raise
         return cls(parent, parent.type_, element.tag, center, attrs["radius"])
 
+    @classmethod
+    def from_row(cls, parent: FreeCADGeometryXML, tag: str,
+                 row: list[float]) -> GeomCircle:
+        """Returns a GeomCircle from a row of a GeometryListArrays value array."""
+        return cls(parent, parent.type_, tag, tuple(row[0:2]), row[7])
+
 @dataclasses.dataclass
 class GeomEllipse(GeomData):
     """Dataclass for tracking FreeCAD Sketch Ellipse info."""
@@ -603,6 +653,12 @@ class GeomEllipse(GeomData):
         )
         return cls(parent, parent.type_, element.tag, center, **attrs)
 
+    @classmethod
+    def from_row(cls, parent: FreeCADGeometryXML, tag: str,
+                 row: list[float]) -> GeomEllipse:
+        """Returns a GeomEllipse from a row of a GeometryListArrays value array."""
+        return cls(parent, parent.type_, tag, tuple(row[0:2]), *row[6:9])
+
 @dataclasses.dataclass
 class GeomArcOfCircle(GeomData):
     """Dataclass for tracking FreeCAD Sketch Ellipse info."""
@@ -637,6 +693,12 @@ class GeomArcOfCircle(GeomData):
         del attrs["angle"]
         return cls(parent, parent.type_, element.tag, center, **attrs)
 
+    @classmethod
+    def from_row(cls, parent: FreeCADGeometryXML, tag: str,
+                 row: list[float]) -> GeomArcOfCircle:
+        """Returns a GeomArcOfCircle from a row of a GeometryListArrays value array."""
+        return cls(parent, parent.type_, tag, tuple(row[0:2]), *row[7:10])
+
 @dataclasses.dataclass
 class GeometryExtension:
     """A dataclass for tracking all FreeCAD GeometryExtensions."""
@@ -0,0 +1,743 @@
+"""A module providing a FreeCAD-independent validator for FCStd files. It
+reports the same error categories as error_detection, but reads the files' xml
+instead of opening them with FreeCAD, so it can check files on machines without
+FreeCAD installed.
+
+Sketches are checked by evaluating the residual of each of their constraints at
+the geometry stored in the file and the rank of the constraints' jacobian:
+
+- Constraints with a residual are conflicting, since FreeCAD could not solve
+  the sketch.
+- Constraints whose jacobian rows depend on earlier constraints are redundant.
+- Sketches with fewer independent constraint equations than geometry
+  parameters are unconstrained.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+import logging
+import traceback
+
+import numpy as np
+
+from pancad.cad.freecad.constants import (
+    ConstraintSubPart as CSP,
+    ConstraintType as CT,
+    InternalGeometryType as IGT,
+)
+from pancad.cad.freecad.error_detection import ErrorCategory
+from pancad.cad.freecad.freecad_python import raise_for_report
+from pancad.cad.freecad.read_xml import FCStd
+from pancad.utils.parallel import run_parallel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from os import PathLike
+
+    from pancad.cad.freecad.read_xml import FreeCADObjectXML
+    from pancad.cad.freecad.xml_properties import (
+        FreeCADConstraintXML, FreeCADGeometryXML
+    )
+    from pancad.cad.freecad.xml_utils import ConstraintData
+    from pancad.utils.pancad_types import Numpy1D
+
+    Residual = Callable[[Numpy1D], Numpy1D]
+
+SKETCH_TYPE = "Sketcher::SketchObject"
+RESIDUAL_TOLERANCE = 1e-6
+"""The largest residual a satisfied constraint can have, in mm or radians."""
+RANK_TOLERANCE = 1e-7
+"""The smallest relative part of a jacobian row that must be independent of the
+previous rows for the row to count as independent.
+"""
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """The outcome of checking one file with check_fcstd_many.
+
+    :param path: The path to the FreeCAD file that was checked.
+    :param report: The report of the errors found, keyed by ErrorCategory. None
+        if the check failed.
+    :param error: The exception type and message if the check failed.
+    :param traceback: The formatted traceback if the check failed.
+    """
+    path: Path
+    report: dict | None = None
+    error: str | None = None
+    traceback: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was checked without an exception."""
+        return self.error is None
+
+    def is_valid(self, unconstrained_error: bool=False) -> bool:
+        """Returns whether the file was checked and has no errors.
+
+        :param unconstrained_error: Sets whether containing an unconstrained
+            sketch counts as an error.
+        """
+        if not self.ok:
+            return False
+        return not any(values for category, values in self.report.items()
+                       if unconstrained_error
+                       or category != ErrorCategory.UNCONSTRAINED)
+
+def check_fcstd(filepath: str | PathLike) -> dict:
+    """Checks a FreeCAD file for errors without FreeCAD.
+
+    :param filepath: Filepath of the FreeCAD file to check.
+    :returns: The report of the errors found, keyed by ErrorCategory like
+        error_detection.check_document's report.
+    """
+    fcstd = FCStd.from_path(filepath)
+    try:
+        document = fcstd.document
+        report = {}
+        for obj in document.objects:
+            key = _key(obj)
+            if _is_detached(obj):
+                report.setdefault(ErrorCategory.DETACHED, []).append(key)
+            if obj.type_ == SKETCH_TYPE:
+                sketch = _SketchCheck(obj)
+                if status := sketch.get_status():
+                    report.setdefault(ErrorCategory.ERROR, {})[key] = status
+                if sketch.dof:
+                    report.setdefault(ErrorCategory.UNCONSTRAINED,
+                                      []).append(key)
+            elif obj.has_property("Profile"):
+                if status := _get_profile_status(obj):
+                    report.setdefault(ErrorCategory.ERROR, {})[key] = status
+    finally:
+        fcstd.close()
+    return report
+
+def check_fcstd_many(paths: Iterable[PathLike],
+                     workers: int | None=None,
+                     *,
+                     progress: Callable[[int, int, ValidationResult],
+                                        None]=None
+                     ) -> list[ValidationResult]:
+    """Checks multiple FreeCAD files for errors in parallel processes.
+    Exceptions are captured on each file's result instead of stopping the other
+    checks.
+
+    :param paths: The paths to FreeCAD FCStd files.
+    :param workers: The number of worker processes. Defaults to None, which uses
+        the number of processors on the machine. When 1, the files are checked
+        in this process without starting a pool.
+    :param progress: An optional function called with the number of finished
+        files, the total number of files, and the latest result each time a file
+        finishes. Files can finish out of order.
+    :returns: The results of each check in the same order as the paths.
+    """
+    return run_parallel(_check_fcstd_result, paths, workers, progress,
+                        _error_result)
+
+def validate_fcstd(fcstd_filepath: str | PathLike,
+                   unconstrained_error: bool=False) -> None:
+    """Raises an error if a FreeCAD model has errors, checking it without
+    FreeCAD. See validate_freecad to check it with FreeCAD.
+
+    :param fcstd_filepath: Path to a FCStd
+    :param unconstrained_error: Sets whether containing an unconstrained sketch
+        counts as an error.
+    :raises ValueError: Raised when the FreeCAD file contains an error.
+    """
+    raise_for_report(check_fcstd(fcstd_filepath), fcstd_filepath,
+                     unconstrained_error)
+
+# Private Functions #
+def _key(obj: FreeCADObjectXML) -> str:
+    """Returns the report key for the FreeCAD object, matching error_detection.
+    """
+    return f"{obj.id_}: {obj.label}"
+
+def _is_detached(obj: FreeCADObjectXML) -> bool:
+    """Returns whether the object can be attached but is not. Files from before
+    FreeCAD 1.0 name the attachment property Support.
+    """
+    for name in ("AttachmentSupport", "Support"):
+        if obj.has_property(name):
+            return not obj.get_property(name).value
+    return False
+
+def _get_profile_status(obj: FreeCADObjectXML) -> str | None:
+    """Returns why a feature's profile sketch cannot make a solid, or None if
+    it can or cannot be checked. Every end of the profile's edges has to meet
+    exactly one other end.
+    """
+    links = obj.get_property("Profile").value
+    if not links:
+        return "Profile is missing"
+    profile = obj.document.get_object(links[0].name)
+    if profile.type_ != SKETCH_TYPE:
+        return None
+    ends = []
+    closed = 0
+    for geometry in profile.get_property("Geometry").value:
+        if geometry.is_construction:
+            continue
+        match geometry.type_:
+            case "Part::GeomLineSegment":
+                ends.extend((geometry.geometry.start, geometry.geometry.end))
+            case "Part::GeomArcOfCircle":
+                x = np.array(_get_parameters(geometry))
+                ends.extend((_arc_point(x, 0, CSP.START).tolist(),
+                             _arc_point(x, 0, CSP.END).tolist()))
+            case "Part::GeomCircle" | "Part::GeomEllipse":
+                closed += 1
+            case "Part::GeomPoint":
+                pass
+            case _:
+                return None
+    if not ends:
+        return None if closed else "Profile has no closed wires"
+    grid = np.round(np.array(ends) / RESIDUAL_TOLERANCE)
+    _, counts = np.unique(grid, axis=0, return_counts=True)
+    if np.any(counts != 2):
+        return "Profile is not closed"
+    return None
+
+def _check_fcstd_result(path: Path) -> ValidationResult:
+    """Checks one FreeCAD file into a ValidationResult, capturing any exception.
+    """
+    try:
+        return ValidationResult(path, check_fcstd(path))
+    except Exception as exc: # pylint: disable=broad-exception-caught
+        return _error_result(path, exc)
+
+def _error_result(path: Path, exc: Exception) -> ValidationResult:
+    """Returns a failed ValidationResult for the exception."""
+    error = "".join(traceback.format_exception_only(exc)).strip()
+    return ValidationResult(path, error=error,
+                            traceback="".join(traceback.format_exception(exc)))
+
+_PARAMETERS = {
+    "Part::GeomPoint": lambda g: [*g.location],
+    "Part::GeomLineSegment": lambda g: [*g.start, *g.end],
+    "Part::GeomCircle": lambda g: [*g.center, g.radius],
+    "Part::GeomArcOfCircle": lambda g: [*g.center, g.radius, g.start_angle,
+                                        g.end_angle],
+    "Part::GeomEllipse": lambda g: [*g.center, g.major_radius, g.minor_radius,
+                                    g.major_axis_angle],
+}
+"""Functions returning the solver parameters of each supported geometry type.
+Points on curves are at the start of their parameters.
+"""
+
+def _get_parameters(geometry: FreeCADGeometryXML) -> list[float] | None:
+    """Returns the solver parameters of the geometry, or None if the geometry
+    type is not supported.
+    """
+    try:
+        func = _PARAMETERS[geometry.type_]
+    except KeyError:
+        return None
+    return func(geometry.geometry)
+
+def _arc_point(x: Numpy1D, start: int, part: CSP) -> Numpy1D:
+    """Returns an arc's start or end point from its parameters."""
+    angle = x[start + 3] if part == CSP.START else x[start + 4]
+    return x[start:start + 2] + x[start + 2] * np.array([np.cos(angle),
+                                                          np.sin(angle)])
+
+def _direction(line: tuple[Numpy1D, Numpy1D], part: CSP) -> Numpy1D:
+    """Returns a line's direction pointing away from the referenced end."""
+    start, end = line
+    return start - end if part == CSP.END else end - start
+
+def _cross(a: Numpy1D, b: Numpy1D) -> float:
+    return a[0] * b[1] - a[1] * b[0]
+
+def _signed_distance(point: Numpy1D, line: tuple[Numpy1D, Numpy1D]) -> float:
+    """Returns the signed distance from an infinite line to a point."""
+    start, end = line
+    direction = end - start
+    return _cross(direction, point - start) / np.linalg.norm(direction)
+
+def _wrap(angle: float) -> float:
+    """Returns the angle wrapped to [-pi, pi)."""
+    return (angle + np.pi) % (2 * np.pi) - np.pi
+
+
+_SIZES = {"Part::GeomPoint": 2, "Part::GeomLineSegment": 4,
+          "Part::GeomCircle": 3, "Part::GeomArcOfCircle": 5,
+          "Part::GeomEllipse": 5}
+"""The number of solver parameters of each supported geometry type."""
+_CIRCULAR = {"Part::GeomCircle", "Part::GeomArcOfCircle"}
+
+@dataclass(frozen=True)
+class _Ref:
+    """A constraint's reference to a part of a geometry in the parameters."""
+    type_: str
+    start: int
+    part: CSP
+
+    def get_indices(self) -> range:
+        """Returns the indices of the referenced geometry's parameters."""
+        return range(self.start, self.start + _SIZES[self.type_])
+
+class _SketchCheck:
+    """Checks the constraints of a sketch at its stored geometry. The sketch's
+    geometry parameters are followed by the external geometry's parameters in
+    one vector, and only the sketch's geometry parameters are variables.
+
+    Constraints that cannot be checked are skipped, and the sketch's degrees of
+    freedom are unknown when any are.
+
+    :param sketch: The Sketcher::SketchObject to check.
+    """
+
+    _constraint_funcs = {
+        CT.COINCIDENT: "_coincident",
+        CT.HORIZONTAL: "_horizontal",
+        CT.VERTICAL: "_vertical",
+        CT.PARALLEL: "_parallel",
+        CT.TANGENT: "_tangent",
+        CT.DISTANCE: "_distance",
+        CT.DISTANCE_X: "_distance_x",
+        CT.DISTANCE_Y: "_distance_y",
+        CT.ANGLE: "_angle",
+        CT.PERPENDICULAR: "_perpendicular",
+        CT.RADIUS: "_radius",
+        CT.EQUAL: "_equal",
+        CT.POINT_ON_OBJECT: "_point_on_object",
+        CT.SYMMETRIC: "_symmetric",
+        CT.INTERNAL_ALIGNMENT: "_internal_alignment",
+        CT.BLOCK: "_block",
+        CT.DIAMETER: "_diameter",
+    }
+    """The methods creating the residual function of each constraint type."""
+
+    def __init__(self, sketch: FreeCADObjectXML) -> None:
+        self.sketch = sketch
+        self.unsupported: list[str] = []
+        # The type and first parameter index of each geometry, by geometry
+        # index. Only needed while the constraints are added.
+        starts: dict[int, tuple[str, int] | None] = {}
+        parameters = []
+        for i, geometry in enumerate(sketch.get_property("Geometry").value):
+            self._add_geometry(i, geometry, parameters, starts)
+        self.n_variables = len(parameters)
+        if sketch.has_property("ExternalGeo"):
+            external = sketch.get_property("ExternalGeo").value
+            for i, geometry in enumerate(external):
+                self._add_geometry(-i - 1, geometry, parameters, starts)
+        self.x0 = np.array(parameters, dtype=np.float64)
+        self._constraints: list[tuple[int, Residual, list[int]]] = []
+        for number, constraint in enumerate(
+                sketch.get_property("Constraints").value, start=1):
+            self._add_constraint(number, constraint, starts)
+        self._independent, self._rank = self._read_rank()
+
+    # Public Methods
+    @property
+    def dof(self) -> int | None:
+        """The number of degrees of freedom left in the sketch, or None if the
+        sketch has geometry or constraints that cannot be checked.
+        """
+        if self.unsupported:
+            return None
+        return self.n_variables - self._rank
+
+    def get_status(self) -> str | None:
+        """Returns the sketch's conflicting and redundant constraints as a
+        status string, or None if it has neither. Constraints are numbered from
+        1 like in FreeCAD.
+        """
+        if self.unsupported:
+            logger.warning("Skipped checking %s in sketch %s",
+                           ", ".join(self.unsupported), _key(self.sketch))
+        conflicting = []
+        redundant = []
+        for (number, func, _), independent in zip(self._constraints,
+                                                  self._independent):
+            if np.any(np.abs(func(self.x0)) > RESIDUAL_TOLERANCE):
+                conflicting.append(number)
+            elif not independent:
+                redundant.append(number)
+        status = [f"{name} constraints: {', '.join(map(str, numbers))}"
+                  for name, numbers in [("Conflicting", conflicting),
+                                        ("Redundant", redundant)]
+                  if numbers]
+        return "; ".join(status) or None
+
+    # Private Methods
+    def _add_geometry(self, index: int, geometry: FreeCADGeometryXML,
+                      parameters: list[float],
+                      starts: dict[int, tuple[str, int] | None]) -> None:
+        """Adds the geometry's parameters and its start, or marks it as
+        unsupported.
+        """
+        values = _get_parameters(geometry)
+        if values is None:
+            starts[index] = None
+            if index >= 0:
+                self.unsupported.append(f"{geometry.type_} geometry {index}")
+            return
+        starts[index] = (geometry.type_, len(parameters))
+        parameters.extend(values)
+
+    def _add_constraint(self, number: int, constraint: FreeCADConstraintXML,
+                        starts: dict[int, tuple[str, int] | None]) -> None:
+        """Adds the constraint's residual function if it is driving and can be
+        checked. Reference dimensions do not constrain the sketch.
+        """
+        data = constraint.data
+        if not (data.state.driving and data.state.active):
+            return
+        description = f"{data.type_.human_name} constraint {number}"
+        refs = []
+        for pair in (data.pairs.first, data.pairs.second, data.pairs.third):
+            if pair.index == -2000:
+                continue # FreeCAD's undefined geometry index
+            if (geometry := starts.get(pair.index)) is None:
+                self.unsupported.append(description)
+                return
+            refs.append(_Ref(*geometry, pair.part))
+        try:
+            method = getattr(self, self._constraint_funcs[data.type_])
+            func = method(refs, data)
+        except (KeyError, NotImplementedError):
+            self.unsupported.append(description)
+            return
+        indices = sorted({i for ref in refs for i in ref.get_indices()
+                          if i < self.n_variables})
+        self._constraints.append((number, func, indices))
+
+    def _get_jacobian(self, func: Residual, indices: list[int]) -> np.ndarray:
+        """Returns the jacobian of a residual function at the stored geometry by
+        central differences of the parameters it depends on.
+        """
+        x = self.x0.copy()
+        jacobian = np.zeros((len(func(x)), self.n_variables))
+        for i in indices:
+            value = x[i]
+            step = 1e-6 * max(1.0, abs(value))
+            x[i] = value + step
+            plus = func(x)
+            x[i] = value - step
+            minus = func(x)
+            x[i] = value
+            jacobian[:, i] = (plus - minus) / (2 * step)
+        return jacobian
+
+    def _read_rank(self) -> tuple[list[bool], int]:
+        """Returns whether each constraint's jacobian rows are independent of
+        the rows of the constraints before it, and the rank of the jacobian.
+        The rows are orthogonalized in order with modified Gram-Schmidt.
+        """
+        jacobians = [self._get_jacobian(func, indices)
+                     for _, func, indices in self._constraints]
+        n_rows = sum(len(jacobian) for jacobian in jacobians)
+        basis = np.zeros((min(n_rows, self.n_variables), self.n_variables))
+        rank = 0
+        independent = []
+        for jacobian in jacobians:
+            is_independent = True
+            for row in jacobian:
+                norm = np.linalg.norm(row)
+                if norm == 0 or rank == len(basis):
+                    is_independent = False
+                    continue
+                vector = row / norm
+                for _ in range(2): # Twice for numerical stability
+                    vector -= basis[:rank].T @ (basis[:rank] @ vector)
+                remaining = np.linalg.norm(vector)
+                if remaining <= RANK_TOLERANCE:
+                    is_independent = False
+                    continue
+                basis[rank] = vector / remaining
+                rank += 1
+            independent.append(is_independent)
+        return independent, rank
+
+    def _point(self, x: Numpy1D, ref: _Ref) -> Numpy1D:
+        start = ref.start
+        match ref.type_, ref.part:
+            case "Part::GeomPoint", _:
+                return x[start:start + 2]
+            case "Part::GeomLineSegment", CSP.START:
+                return x[start:start + 2]
+            case "Part::GeomLineSegment", CSP.END:
+                return x[start + 2:start + 4]
+            case "Part::GeomArcOfCircle", CSP.START | CSP.END:
+                return _arc_point(x, start, ref.part)
+            case _, CSP.CENTER if ref.type_ != "Part::GeomLineSegment":
+                return x[start:start + 2]
+        raise NotImplementedError(f"No point at {ref}")
+
+    @staticmethod
+    def _line(x: Numpy1D, ref: _Ref) -> tuple[Numpy1D, Numpy1D]:
+        if ref.type_ != "Part::GeomLineSegment":
+            raise NotImplementedError(f"{ref} is not a line")
+        return x[ref.start:ref.start + 2], x[ref.start + 2:ref.start + 4]
+
+    @staticmethod
+    def _check_refs(refs: list[_Ref], *checks: Callable[[_Ref], bool]) -> None:
+        """Raises NotImplementedError unless each reference passes its check."""
+        if (len(refs) != len(checks)
+                or not all(check(ref) for check, ref in zip(checks, refs))):
+            raise NotImplementedError(f"Unsupported references {refs}")
+
+    # Residual functions, created with the references and the constraint data
+    # and called with the parameter vector.
+    def _coincident(self, refs: list[_Ref], _) -> Residual:
+        self._check_refs(refs, _is_point, _is_point)
+        first, second = refs
+        return lambda x: self._point(x, first) - self._point(x, second)
+
+    def _horizontal(self, refs: list[_Ref], _) -> Residual:
+        return self._aligned(refs, 1)
+
+    def _vertical(self, refs: list[_Ref], _) -> Residual:
+        return self._aligned(refs, 0)
+
+    def _aligned(self, refs: list[_Ref], axis: int) -> Residual:
+        """Returns the residual of a line or two points being aligned with the
+        other axis.
+        """
+        if len(refs) == 1:
+            self._check_refs(refs, _is_line)
+            ref, = refs
+            return lambda x: np.array([x[ref.start + 2 + axis]
+                                       - x[ref.start + axis]])
+        self._check_refs(refs, _is_point, _is_point)
+        first, second = refs
+        return lambda x: np.array([self._point(x, first)[axis]
+                                   - self._point(x, second)[axis]])
+
+    def _parallel(self, refs: list[_Ref], _) -> Residual:
+        self._check_refs(refs, _is_line, _is_line)
+        def residual(x: Numpy1D) -> Numpy1D:
+            first, second = (np.subtract(*self._line(x, r)[::-1]) for r in refs)
+            return np.array([_cross(first, second)
+                             / np.linalg.norm(first) / np.linalg.norm(second)])
+        return residual
+
+    def _perpendicular(self, refs: list[_Ref], _) -> Residual:
+        self._check_refs(refs, _is_line, _is_line)
+        def residual(x: Numpy1D) -> Numpy1D:
+            first, second = (np.subtract(*self._line(x, r)[::-1]) for r in refs)
+            return np.array([first @ second
+                             / np.linalg.norm(first) / np.linalg.norm(second)])
+        return residual
+
+    def _tangent(self, refs: list[_Ref], data: ConstraintData
+                 ) -> Residual:
+        """Tangent lines are collinear. Tangent curves are not checked yet."""
+        parallel = self._parallel(refs, data)
+        first, second = refs
+        return lambda x: np.append(
+            parallel(x), _signed_distance(self._line(x, second)[0],
+                                          self._line(x, first))
+        )
+
+    def _distance(self, refs: list[_Ref], data: ConstraintData
+                  ) -> Residual:
+        value = data.value
+        if len(refs) == 1:
+            self._check_refs(refs, _is_line)
+            ref, = refs
+            return lambda x: np.array([
+                np.linalg.norm(np.subtract(*self._line(x, ref))) - value
+            ])
+        if len(refs) == 2 and all(map(_is_point, refs)):
+            first, second = refs
+            return lambda x: np.array([
+                np.linalg.norm(self._point(x, first) - self._point(x, second))
+                - value
+            ])
+        point, line = sorted(refs, key=_is_line)
+        self._check_refs([point, line], _is_point, _is_line)
+        return lambda x: np.array([
+            abs(_signed_distance(self._point(x, point), self._line(x, line)))
+            - value
+        ])
+
+    def _distance_x(self, refs: list[_Ref], data: ConstraintData
+                    ) -> Residual:
+        return self._axis_distance(refs, data.value, 0)
+
+    def _distance_y(self, refs: list[_Ref], data: ConstraintData
+                    ) -> Residual:
+        return self._axis_distance(refs, data.value, 1)
+
+    def _axis_distance(self, refs: list[_Ref], value: float, axis: int
+                       ) -> Residual:
+        """Returns the residual of a signed distance along an axis, from a
+        line's start to its end, from the origin to a point, or from the first
+        point to the second.
+        """
+        if len(refs) == 1 and _is_line(refs[0]):
+            ref, = refs
+            return lambda x: np.array([x[ref.start + 2 + axis]
+                                       - x[ref.start + axis] - value])
+        if len(refs) == 1:
+            self._check_refs(refs, _is_point)
+            ref, = refs
+            return lambda x: np.array([self._point(x, ref)[axis] - value])
+        self._check_refs(refs, _is_point, _is_point)
+        first, second = refs
+        return lambda x: np.array([self._point(x, second)[axis]
+                                   - self._point(x, first)[axis] - value])
+
+    def _angle(self, refs: list[_Ref], data: ConstraintData
+               ) -> Residual:
+        """Angles of a line from the x axis, of an arc's span, or from one line
+        to another. Lines referenced by an end point point away from it.
+        """
+        value = data.value
+        if len(refs) == 1 and refs[0].type_ == "Part::GeomArcOfCircle":
+            ref, = refs
+            return lambda x: np.array([_wrap(x[ref.start + 4]
+                                             - x[ref.start + 3] - value)])
+        if not 1 <= len(refs) <= 2 or not all(r.type_ == "Part::GeomLineSegment"
+                                              for r in refs):
+            raise NotImplementedError(f"Unsupported references {refs}")
+        def residual(x: Numpy1D) -> Numpy1D:
+            angles = [np.arctan2(*_direction(self._line(x, r), r.part)[::-1])
+                      for r in refs]
+            if len(angles) == 1:
+                return np.array([_wrap(angles[0] - value)])
+            return np.array([_wrap(angles[1] - angles[0] - value)])
+        return residual
+
+    def _radius(self, refs: list[_Ref], data: ConstraintData
+                ) -> Residual:
+        self._check_refs(refs, _is_circular)
+        ref, = refs
+        return lambda x: np.array([x[ref.start + 2] - data.value])
+
+    def _diameter(self, refs: list[_Ref], data: ConstraintData
+                  ) -> Residual:
+        self._check_refs(refs, _is_circular)
+        ref, = refs
+        return lambda x: np.array([2 * x[ref.start + 2] - data.value])
+
+    def _equal(self, refs: list[_Ref], _) -> Residual:
+        if len(refs) == 2 and all(map(_is_line, refs)):
+            return lambda x: np.array([
+                np.subtract(*(np.linalg.norm(np.subtract(*self._line(x, r)))
+                              for r in refs))
+            ])
+        if len(refs) == 2 and all(map(_is_circular, refs)):
+            first, second = refs
+            return lambda x: np.array([x[first.start + 2]
+                                       - x[second.start + 2]])
+        self._check_refs(refs, _is_ellipse, _is_ellipse)
+        first, second = refs
+        return lambda x: (x[first.start + 2:first.start + 4]
+                          - x[second.start + 2:second.start + 4])
+
+    def _point_on_object(self, refs: list[_Ref], _) -> Residual:
+        if len(refs) != 2 or not _is_point(refs[0]):
+            raise NotImplementedError(f"Unsupported references {refs}")
+        point, edge = refs
+        if _is_line(edge):
+            return lambda x: np.array([
+                _signed_distance(self._point(x, point), self._line(x, edge))
+            ])
+        if _is_circular(edge):
+            start = edge.start
+            return lambda x: np.array([
+                np.linalg.norm(self._point(x, point) - x[start:start + 2])
+                - x[start + 2]
+            ])
+        self._check_refs([edge], _is_ellipse)
+        def residual(x: Numpy1D) -> Numpy1D:
+            center = x[edge.start:edge.start + 2]
+            major, minor, angle = x[edge.start + 2:edge.start + 5]
+            u, v = self._point(x, point) - center
+            along = u * np.cos(angle) + v * np.sin(angle)
+            across = v * np.cos(angle) - u * np.sin(angle)
+            return np.array([(along / major)**2 + (across / minor)**2 - 1])
+        return residual
+
+    def _symmetric(self, refs: list[_Ref], _) -> Residual:
+        """Symmetric points about a line or about a third point."""
+        if len(refs) != 3 or not _is_point(refs[0]) or not _is_point(refs[1]):
+            raise NotImplementedError(f"Unsupported references {refs}")
+        first, second, about = refs
+        if _is_line(about):
+            def residual(x: Numpy1D) -> Numpy1D:
+                one, two = self._point(x, first), self._point(x, second)
+                start, end = self._line(x, about)
+                direction = end - start
+                return np.array([
+                    _signed_distance((one + two) / 2, (start, end)),
+                    (two - one) @ direction / np.linalg.norm(direction),
+                ])
+            return residual
+        self._check_refs([about], _is_point)
+        return lambda x: ((self._point(x, first) + self._point(x, second)) / 2
+                          - self._point(x, about))
+
+    def _internal_alignment(self, refs: list[_Ref], data: ConstraintData
+                            ) -> Residual:
+        """Ellipse axes and foci. The axes may run in either direction, so the
+        direction they are stored in is kept.
+        """
+        if len(refs) != 2 or not _is_ellipse(refs[1]):
+            raise NotImplementedError(f"Unsupported references {refs}")
+        aligned, ellipse = refs
+        def get_axes(x: Numpy1D) -> tuple[Numpy1D, Numpy1D, Numpy1D]:
+            center = x[ellipse.start:ellipse.start + 2]
+            major, minor, angle = x[ellipse.start + 2:ellipse.start + 5]
+            u = np.array([np.cos(angle), np.sin(angle)])
+            v = np.array([-np.sin(angle), np.cos(angle)])
+            return center, major * u, minor * v
+        type_ = data.internal_alignment.type_
+        match type_:
+            case IGT.ELLIPSE_MAJOR_DIAMETER | IGT.ELLIPSE_MINOR_DIAMETER:
+                if aligned.type_ != "Part::GeomLineSegment":
+                    raise NotImplementedError(f"Unsupported references {refs}")
+                axis = 1 if type_ == IGT.ELLIPSE_MAJOR_DIAMETER else 2
+                axes = get_axes(self.x0)
+                center, half = axes[0], axes[axis]
+                start = self._line(self.x0, aligned)[0]
+                sign = (1 if np.linalg.norm(start - center - half)
+                        <= np.linalg.norm(start - center + half) else -1)
+                def axis_residual(x: Numpy1D) -> Numpy1D:
+                    axes = get_axes(x)
+                    center, half = axes[0], sign * axes[axis]
+                    start, end = self._line(x, aligned)
+                    return np.concatenate((start - center - half,
+                                           end - center + half))
+                return axis_residual
+            case IGT.ELLIPSE_FOCUS_1 | IGT.ELLIPSE_FOCUS_2:
+                if not _is_point(aligned):
+                    raise NotImplementedError(f"Unsupported references {refs}")
+                sign = 1 if type_ == IGT.ELLIPSE_FOCUS_1 else -1
+                def focus_residual(x: Numpy1D) -> Numpy1D:
+                    center, major, minor = get_axes(x)
+                    distance = np.sqrt(max(major @ major - minor @ minor, 0))
+                    focus = (center
+                             + sign * distance * major / np.linalg.norm(major))
+                    return self._point(x, aligned) - focus
+                return focus_residual
+        raise NotImplementedError(f"Unsupported internal alignment {data}")
+
+    def _block(self, refs: list[_Ref], _) -> Residual:
+        if len(refs) != 1:
+            raise NotImplementedError(f"Unsupported references {refs}")
+        indices = list(refs[0].get_indices())
+        initial = self.x0[indices]
+        return lambda x: x[indices] - initial
+
+def _is_point(ref: _Ref) -> bool:
+    return ref.type_ == "Part::GeomPoint" or ref.part.is_point
+
+def _is_line(ref: _Ref) -> bool:
+    return ref.type_ == "Part::GeomLineSegment" and ref.part == CSP.EDGE
+
+def _is_circular(ref: _Ref) -> bool:
+    return ref.type_ in _CIRCULAR and ref.part == CSP.EDGE
+
+def _is_ellipse(ref: _Ref) -> bool:
+    return ref.type_ == "Part::GeomEllipse" and ref.part == CSP.EDGE
@@ -0,0 +1,117 @@
+"""pancad's command line interface, installed as the ``pancad`` console script.
+
+Examples: ``pancad convert parts/ -o converted/ -j 4 --resume`` and
+``pancad validate parts/ -j 4``
+"""
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from pprint import pformat
+from typing import TYPE_CHECKING
+import sys
+
+from pancad.cad.freecad.xml_validation import check_fcstd_many
+from pancad.io.freecad import convert_freecad_many, find_freecad_files
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+    from collections.abc import Sequence
+
+    from pancad.cad.freecad.xml_validation import ValidationResult
+    from pancad.io.freecad import ConvertResult
+
+def get_parser() -> ArgumentParser:
+    """Returns the argument parser for the pancad command."""
+    parser = ArgumentParser(prog="pancad", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser(
+        "convert",
+        help="Convert FreeCAD files through pancad.",
+        description="Reads FreeCAD files into pancad and writes them to an"
+                    " output directory, logging each result as a JSON line."
+    )
+    convert.add_argument("inputs", nargs="+",
+                         help="FreeCAD files or directories containing them.")
+    convert.add_argument("-o", "--output", required=True,
+                         help="The directory to write the converted files to.")
+    convert.add_argument("-j", "--workers", type=int, default=None,
+                         help="The number of processes reading files."
+                              " Defaults to the number of processors.")
+    convert.add_argument("--log", default=None,
+                         help="The JSON lines result log. Defaults to"
+                              " pancad_convert.jsonl in the output directory.")
+    convert.add_argument("--resume", action="store_true",
+                         help="Skip the files the log records as converted.")
+    convert.add_argument("--max-pending", type=int, default=None,
+                         help="The most files being read or waiting to be"
+                              " written at once.")
+    convert.add_argument("-q", "--quiet", action="store_true",
+                         help="Only print the summary.")
+    convert.set_defaults(func=_convert)
+    validate = commands.add_parser(
+        "validate",
+        help="Check FreeCAD files for errors without FreeCAD.",
+        description="Checks FreeCAD files for detached sketches and sketches"
+                    " with conflicting, redundant or missing constraints by"
+                    " reading their xml."
+    )
+    validate.add_argument("inputs", nargs="+",
+                          help="FreeCAD files or directories containing them.")
+    validate.add_argument("-j", "--workers", type=int, default=None,
+                          help="The number of processes checking files."
+                               " Defaults to the number of processors.")
+    validate.add_argument("--unconstrained-error", action="store_true",
+                          help="Count unconstrained sketches as errors.")
+    validate.add_argument("-q", "--quiet", action="store_true",
+                          help="Only print the invalid files and the summary.")
+    validate.set_defaults(func=_validate)
+    return parser
+
+def main(argv: Sequence[str] | None=None) -> int:
+    """Runs the pancad command and returns its exit code.
+
+    :param argv: The command line arguments. Defaults to sys.argv.
+    """
+    args = get_parser().parse_args(argv)
+    return args.func(args)
+
+# Private Functions #
+def _convert(args: Namespace) -> int:
+    """Runs the convert command. Returns 1 if any file failed to convert."""
+    def progress(done: int, total: int, result: ConvertResult) -> None:
+        status = "ok" if result.ok else f"FAILED {result.error}"
+        print(f"[{done}/{total}] {result.source}: {status}", file=sys.stderr)
+
+    results = convert_freecad_many(args.inputs, args.output, args.workers,
+                                   log=args.log, resume=args.resume,
+                                   max_pending=args.max_pending,
+                                   progress=None if args.quiet else progress)
+    failed = sum(not result.ok for result in results)
+    print(f"Converted {len(results) - failed} of {len(results)} files,"
+          f" {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+def _validate(args: Namespace) -> int:
+    """Runs the validate command. Returns 1 if any file has errors."""
+    def progress(done: int, total: int, result: ValidationResult) -> None:
+        valid = result.is_valid(args.unconstrained_error)
+        if valid and args.quiet:
+            return
+        status = "ok" if valid else "INVALID"
+        print(f"[{done}/{total}] {result.path}: {status}", file=sys.stderr)
+        if not result.ok:
+            print(result.error, file=sys.stderr)
+        elif not valid:
+            report = {str(category): values
+                      for category, values in result.report.items()}
+            print(pformat(report), file=sys.stderr)
+
+    paths = [source for source, _ in find_freecad_files(args.inputs)]
+    results = check_fcstd_many(paths, args.workers, progress=progress)
+    invalid = sum(not result.is_valid(args.unconstrained_error)
+                  for result in results)
+    print(f"Checked {len(results)} files, {invalid} invalid", file=sys.stderr)
+    return 1 if invalid else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
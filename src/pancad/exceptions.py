@@ -32,3 +32,13 @@ class SketchGeometryHasConstraintsError(HasDependentsError):
     """Raised when attempting to remove geometry from a sketch while it still has
     detectable constraints.
     """
+
+class FreeCADWorkerError(RuntimeError):
+    """Raised when a function called in a FreeCAD worker process raises an
+    error. The worker's traceback is added as a note.
+    """
+
+class FreeCADWorkerCrashedError(FreeCADWorkerError):
+    """Raised when a FreeCAD worker process exits while handling a request. The
+    worker is restarted before it handles its next request.
+    """
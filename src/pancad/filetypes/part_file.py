@@ -107,18 +107,17 @@ class PartFile(PancadThing):
         return self._container.get_dependencies()
 
     def to_freecad(self, path: PathLike) -> None:
-        """Writes this PartFile to a FreeCAD FCStd file.
+        """Writes this PartFile to a FreeCAD FCStd file. The file is written
+        directly without starting FreeCAD, so FreeCAD builds the shapes on the
+        first recompute after opening it.
 
         :param path: The path to write the FCStd file to.
         """
         # pylint: disable=import-outside-toplevel, cyclic-import
         # Importing here to minimize impacts of a cyclic import while still
         # allowing part files to be exported with just '.to_freecad'
-        from pancad.cad.freecad._feature_translation import (
-            new_document_from_part
-        )
-        freecad_api_doc = new_document_from_part(self)
-        freecad_api_doc.saveAs(str(path))
+        from pancad.cad.freecad.write_xml import write_fcstd
+        write_fcstd(self, path)
 
     # Dunders
     def __contains__(self, item: AbstractFeature | AbstractGeometry) -> bool:
@@ -124,8 +124,9 @@ class CircularArc(AbstractGeometry):
         # dicts. Arcs just need this many arguments.
         if not isinstance(center, Point):
             center = Point(center)
-        start = Point(center + radius * get_unit_vector(start))
-        end = Point(center + radius * get_unit_vector(end))
+        # pylint: disable=protected-access
+        start = Point._from_trusted(*(center + radius * get_unit_vector(start)).tolist())
+        end = Point._from_trusted(*(center + radius * get_unit_vector(end)).tolist())
         if normal is not None:
             normal = get_unit_vector(normal)
         self._parts = ArcParts(center.copy(), start, end, is_clockwise, normal)
@@ -51,6 +51,35 @@ class Point(AbstractGeometry):
         super().__init__({ConstraintReference.CORE: self})
 
     # Class Methods #
+    @classmethod
+    def from_array(cls, array: npt.ArrayLike) -> list[Point]:
+        """Initializes a point from each row of an (n, 2) or (n, 3) array of
+        cartesian coordinates. The array is validated once as a whole instead of
+        once per point.
+
+        :param array: The array of cartesian coordinates, one point per row.
+        :raises ValueError: When the array is not 2 dimensional with 2 or 3
+            columns.
+        """
+        float_array = np.asarray(array, dtype=np.float64)
+        if float_array.ndim != 2 or float_array.shape[1] not in (2, 3):
+            raise ValueError("Expected an (n, 2) or (n, 3) array,"
+                             f" got shape {float_array.shape}")
+        return [cls._from_trusted(*row) for row in float_array.tolist()]
+
+    @classmethod
+    def _from_trusted(cls, x: float, y: float, z: Optional[float]=None, *,
+                      uid: Optional[str | UUID]=None) -> Point:
+        """Initializes a point from python float components without parsing or
+        validating them. Only for internal callers that already hold validated
+        floats, like the solver, sqlite converters and file readers.
+        """
+        point = cls.__new__(cls)
+        point.uid = uid
+        point._cartesian = (x, y) if z is None else (x, y, z)
+        AbstractGeometry.__init__(point, {ConstraintReference.CORE: point})
+        return point
+
     @classmethod
     def from_polar(cls, *components: float | Collection[float],
                    uid: Optional[str | UUID]=None) -> Point:
@@ -100,6 +129,12 @@ class Point(AbstractGeometry):
         vector = trig.to_1d_tuple(value)
         self._cartesian = vector
 
+    def _set_trusted(self, x: float, y: float, z: Optional[float]=None) -> None:
+        """Sets the cartesian coordinates from python float components without
+        parsing or validating them. See :meth:`_from_trusted`.
+        """
+        self._cartesian = (x, y) if z is None else (x, y, z)
+
     @property
     def x(self) -> float:
         """The point's cartesian x-coordinate."""
@@ -246,7 +281,7 @@ class Point(AbstractGeometry):
     # Public Methods #
     def copy(self) -> Point:
         """Returns a copy of the Point at the same position, different uid."""
-        return Point(self.cartesian)
+        return Point._from_trusted(*self._cartesian)
 
     def is_equal(self, other: Point) -> bool:
         """Returns whether the other geometry is geometrically equal. This is a
@@ -5,21 +5,25 @@ constraints in CAD programs.
 
 Example Relations: Coincident, Parallel, Perpendicular, Skew
 """
+from collections.abc import Callable, Sequence
 from functools import singledispatch
 import math
 
 import numpy as np
 
 from pancad.constants import AngleConvention as AC
-from pancad.geometry import conversion
+from pancad.geometry import conversion, sweep_line
+from pancad.geometry.circle import Circle
+from pancad.geometry.circular_arc import CircularArc
 from pancad.geometry.line import Line
 from pancad.geometry.line_segment import LineSegment
 from pancad.geometry.plane import Plane
 from pancad.geometry.point import Point
-from pancad.utils import trigonometry as trig, solvers
+from pancad.utils import trigonometry as trig, predicates, solvers
 
 RELATIVE_TOLERANCE = 1e-9
 ABSOLUTE_TOLERANCE = 1e-9
+_TOLERANCES = {"rel_tol": RELATIVE_TOLERANCE, "abs_tol": ABSOLUTE_TOLERANCE}
 
 ###############################################################################
 # Single Dispatches
@@ -58,9 +62,20 @@ def coplanar(geometry_a, *geometry_b) -> bool:
     """
     raise NotImplementedError(f"Unsupported 1st type {geometry_a.__class__}")
 
-def crosses():
-    """Returns whether the geometry crosses the other."""
-    raise NotImplementedError("crosses relation has not yet been implemented.")
+def crosses(geometry_a: LineSegment | CircularArc | Circle,
+            geometry_b: LineSegment | CircularArc | Circle) -> bool:
+    """Returns whether the interiors of two 2D curves meet at a point. Curves
+    that only meet at an endpoint of either one touch instead, and curves that
+    share a stretch of their length neither cross nor touch.
+
+    :param geometry_a: A 2D LineSegment, CircularArc, or Circle
+    :param geometry_b: Another 2D LineSegment, CircularArc, or Circle
+    :returns: Whether the geometries cross each other
+    """
+    result = sweep_line.sweep_junctions([geometry_a, geometry_b], **_TOLERANCES)
+    if result.overlaps:
+        return False
+    return any(len(junction.interiors) == 2 for junction in result.junctions)
 
 @singledispatch
 def equal(geometry_a, geometry_b):
@@ -108,13 +123,44 @@ def symmetric():
     """Returns whether geometry is symmetric about a center geometry."""
     raise NotImplementedError("TODO: Future work, not implemented")
 
-def tangent():
-    """Returns whether geometry is tangent to another geometry."""
-    raise NotImplementedError("TODO: Future work, not implemented")
+def tangent(geometry_a: LineSegment | CircularArc | Circle,
+            geometry_b: LineSegment | CircularArc | Circle) -> bool:
+    """Returns whether two 2D curves meet at a point where their directions are
+    parallel. LineSegments only count as tangent to each other when they are
+    collinear and meet end to end.
 
-def touches():
-    """Returns whether geometries are touching."""
-    raise NotImplementedError("TODO: Future work, not implemented")
+    :param geometry_a: A 2D LineSegment, CircularArc, or Circle
+    :param geometry_b: Another 2D LineSegment, CircularArc, or Circle
+    :returns: Whether the geometries are tangent to each other
+    """
+    result = sweep_line.sweep_junctions([geometry_a, geometry_b], **_TOLERANCES)
+    if result.overlaps:
+        return False
+    for junction in result.junctions:
+        meeting = {*map(id, junction.endpoints), *map(id, junction.interiors)}
+        if len(meeting) < 2:
+            continue
+        if predicates.parallel(_get_tangent_direction(geometry_a, junction.point),
+                               _get_tangent_direction(geometry_b, junction.point),
+                               **_TOLERANCES):
+            return True
+    return False
+
+def touches(geometry_a: LineSegment | CircularArc | Circle,
+            geometry_b: LineSegment | CircularArc | Circle) -> bool:
+    """Returns whether two 2D curves meet only at endpoints of either one,
+    like the corners of a closed profile or a T-junction.
+
+    :param geometry_a: A 2D LineSegment, CircularArc, or Circle
+    :param geometry_b: Another 2D LineSegment, CircularArc, or Circle
+    :returns: Whether the geometries are touching
+    """
+    result = sweep_line.sweep_junctions([geometry_a, geometry_b], **_TOLERANCES)
+    if result.overlaps:
+        return False
+    shared = [junction for junction in result.junctions
+              if len(junction.endpoints) + len(junction.interiors) > 1]
+    return bool(shared) and all(len(junction.interiors) < 2 for junction in shared)
 
 def get_distance_between():
     """Returns the distance between two geometries."""
@@ -179,22 +225,10 @@ def skew(geometry_a, geometry_b) -> bool:
 def _coincident_point(point: Point,
                       other: Point | Line | LineSegment | Plane) -> bool:
     if isinstance(other, Point):
-        return point.is_equal(other)
+        return predicates.coincident(point, other, **_TOLERANCES)
     if isinstance(other, Line):
-        if other.reference_point.is_equal(point):
-            # Cover the edge cases where point is the zero vector or if the
-            # point is the reference_point
-            return True
-
-        point_vector = np.array(point)
-        reference_vector = np.array(other.reference_point)
-        direction_vector = np.array(other.direction)
-
-        ref_pt_to_pt = (np.dot(point_vector, direction_vector)
-                        * direction_vector)
-        check_point_tuple = trig.to_1d_tuple(ref_pt_to_pt + reference_vector)
-
-        return np.allclose(check_point_tuple, tuple(point))
+        return predicates.on_line(point, other.reference_point, other.direction,
+                                  **_TOLERANCES)
     if isinstance(other, LineSegment):
         return coincident(point, other.get_line())
     if isinstance(other, Plane):
@@ -247,11 +281,7 @@ def _collinear_point(point: Point, *other: Point | Line | LineSegment) -> bool:
         if len(other) == 1:
             # 2 Points are always collinear
             return True
-        coordinates = []
-        coordinates.append(tuple(point))
-        coordinates.extend(map(tuple, other))
-        check_matrix = np.column_stack(coordinates)
-        return np.linalg.matrix_rank(check_matrix) < 2
+        return predicates.collinear(point, *other, **_TOLERANCES)
     if all(isinstance(g, (Line, LineSegment)) for g in other):
         points = [point]
         for line in other:
@@ -318,8 +348,7 @@ def _coplanar_point(point: Point, *other: Point | Line | LineSegment) -> bool:
     if all(isinstance(g, Point) for g in other):
         if len(other) in [1, 2]:
             return True # Any set of 2 or 3 points are always coplanar
-        coord_matrix = np.stack([point, *other])
-        return np.linalg.matrix_rank(coord_matrix) == 2
+        return predicates.coplanar(point, *other, **_TOLERANCES)
     if all(isinstance(g, (Line, LineSegment)) for g in other):
         if len(other) == 1:
             return True # Any point and line by themselves are always coplanar
@@ -344,9 +373,10 @@ def _equal_linesegment(line_segment: LineSegment, *other: LineSegment) -> bool:
 @parallel.register
 def _parallel_line(line: Line, other: Line | LineSegment | Plane) -> bool:
     if isinstance(other, Line):
-        return np.allclose(line.direction, other.direction)
+        return predicates.parallel(line.direction, other.direction, codirectional=True,
+                                   **_TOLERANCES)
     if isinstance(other, LineSegment):
-        return np.allclose(line.direction, other.get_line().direction)
+        return parallel(line, other.get_line())
     if isinstance(other, Plane):
         return parallel(other, line)
     raise NotImplementedError(f"Unsupported 2nd type: {other.__class__}")
@@ -365,11 +395,12 @@ def _parallel_linesegment(line_segment: LineSegment,
 @parallel.register
 def _parallel_plane(plane: Plane, other: Line | LineSegment | Plane) -> bool:
     if isinstance(other, Line):
-        return np.isclose(np.dot(other.direction, plane.normal), 0)
+        return predicates.perpendicular(other.direction, plane.normal, **_TOLERANCES)
     if isinstance(other, LineSegment):
         return parallel(plane, other.get_line())
     if isinstance(other, Plane):
-        return np.allclose(plane.normal, other.normal)
+        return predicates.parallel(plane.normal, other.normal, codirectional=True,
+                                   **_TOLERANCES)
     raise NotImplementedError(f"Unsupported 2nd type: {other.__class__}")
 
 @perpendicular.register
@@ -377,7 +408,7 @@ def _perpendicular_line(line: Line, other: Line | LineSegment | Plane) -> bool:
     if isinstance(other, Line):
         if skew(line, other):
             return False
-        return np.isclose(np.dot(line.direction, other.direction), 0)
+        return predicates.perpendicular(line.direction, other.direction, **_TOLERANCES)
     if isinstance(other, LineSegment):
         return perpendicular(line, other.get_line())
     if isinstance(other, Plane):
@@ -398,14 +429,11 @@ def _perpendicular_line_segment(line_segment: LineSegment,
 @perpendicular.register
 def _perpendicular_plane(plane: Plane, other: Line | LineSegment | Plane) -> bool:
     if isinstance(other, Line):
-        vector_1, vector_2 = conversion.get_2_vectors_on_plane(plane)
-        dot_x = np.dot(vector_1, other.direction)
-        dot_y = np.dot(vector_2, other.direction)
-        return np.isclose(dot_x, 0) and np.isclose(dot_y, 0)
+        return predicates.parallel(plane.normal, other.direction, **_TOLERANCES)
     if isinstance(other, LineSegment):
         return perpendicular(plane, other.get_line())
     if isinstance(other, Plane):
-        return np.isclose(np.dot(other.normal, plane.normal), 0)
+        return predicates.perpendicular(other.normal, plane.normal, **_TOLERANCES)
     raise NotImplementedError(f"Unsupported 2nd type: {other.__class__}")
 
 @project.register
@@ -646,3 +674,289 @@ def _get_intersect_plane(plane: Plane,
         return Line(Point(coordinates),
                     np.cross(plane.normal, other.normal))
     raise NotImplementedError(f"Unsupported 2nd type: {other.__class__}")
+
+###############################################################################
+# Batched Queries
+###############################################################################
+
+def pairwise_coincident(points_a: Sequence[Point] | np.ndarray,
+                        points_b: Sequence[Point] | np.ndarray) -> np.ndarray:
+    """Returns whether each of M points is coincident to each of N other points.
+
+    :param points_a: M Points or an (M, d) array of point coordinates.
+    :param points_b: N Points or an (N, d) array of point coordinates.
+    :returns: An (M, N) boolean array.
+    :raises ValueError: When the point dimensions do not match.
+    """
+    array_a, array_b = _as_point_array(points_a), _as_point_array(points_b)
+    if not _pairwise_dimension(array_a, array_b):
+        return np.zeros((len(array_a), len(array_b)), dtype=bool)
+    difference = np.abs(array_a[:, None, :] - array_b[None, :, :])
+    scale = np.maximum(np.abs(array_a)[:, None, :], np.abs(array_b)[None, :, :])
+    return np.all(difference <= np.maximum(RELATIVE_TOLERANCE * scale, ABSOLUTE_TOLERANCE),
+                  axis=-1)
+
+def pairwise_distance(points_a: Sequence[Point] | np.ndarray,
+                      points_b: Sequence[Point] | np.ndarray) -> np.ndarray:
+    """Returns the distance between each of M points and each of N other points.
+
+    :param points_a: M Points or an (M, d) array of point coordinates.
+    :param points_b: N Points or an (N, d) array of point coordinates.
+    :returns: An (M, N) float array.
+    :raises ValueError: When the point dimensions do not match.
+    """
+    array_a, array_b = _as_point_array(points_a), _as_point_array(points_b)
+    if not _pairwise_dimension(array_a, array_b):
+        return np.zeros((len(array_a), len(array_b)))
+    return np.linalg.norm(array_a[:, None, :] - array_b[None, :, :], axis=-1)
+
+def pairwise_parallel(geometry_a: Sequence[Line | LineSegment | Plane] | np.ndarray,
+                      geometry_b: Sequence[Line | LineSegment | Plane] | np.ndarray
+                      ) -> np.ndarray:
+    """Returns whether the directions of each of M geometries are parallel to the directions of
+    each of N other geometries. Anti-parallel directions are treated as parallel, and Plane
+    normals are used as their directions. Pairs too close to call in floating point are resolved
+    with :func:`pancad.utils.predicates.parallel`.
+
+    :param geometry_a: M Lines, LineSegments or Planes, an (M, d) array of direction vectors or
+        an (M, 2, d) array of segment start and end points.
+    :param geometry_b: N Lines, LineSegments or Planes, or an array like geometry_a.
+    :returns: An (M, N) boolean array.
+    :raises ValueError: When the direction dimensions do not match.
+    """
+    dirs_a, dirs_b = _as_direction_array(geometry_a), _as_direction_array(geometry_b)
+    if not (dimension := _pairwise_dimension(dirs_a, dirs_b)):
+        return np.zeros((len(dirs_a), len(dirs_b)), dtype=bool)
+    if dimension == 2:
+        projections = [(0, 1)]
+    else:
+        projections = [(1, 2), (2, 0), (0, 1)]
+    left = np.stack([np.outer(dirs_a[:, i], dirs_b[:, j]) for i, j in projections], axis=-1)
+    right = np.stack([np.outer(dirs_a[:, j], dirs_b[:, i]) for i, j in projections], axis=-1)
+    errbound = predicates.ORIENT2D_ERRBOUND * (np.abs(left) + np.abs(right))
+    scale = np.outer(np.max(np.abs(dirs_a), axis=1), np.max(np.abs(dirs_b), axis=1))
+    return _resolve_pairwise_zero(
+        np.abs(left - right), errbound, scale[:, :, None],
+        lambda i, j: predicates.parallel(dirs_a[i], dirs_b[j], **_TOLERANCES)
+    )
+
+def pairwise_perpendicular(geometry_a: Sequence[Line | LineSegment | Plane] | np.ndarray,
+                           geometry_b: Sequence[Line | LineSegment | Plane] | np.ndarray
+                           ) -> np.ndarray:
+    """Returns whether the directions of each of M geometries are perpendicular to the directions
+    of each of N other geometries. Unlike :func:`perpendicular`, 3D lines are not checked for
+    intersection, use :func:`pairwise_intersect` for that. Plane normals are used as their
+    directions.
+
+    :param geometry_a: M Lines, LineSegments or Planes, an (M, d) array of direction vectors or
+        an (M, 2, d) array of segment start and end points.
+    :param geometry_b: N Lines, LineSegments or Planes, or an array like geometry_a.
+    :returns: An (M, N) boolean array.
+    :raises ValueError: When the direction dimensions do not match.
+    """
+    dirs_a, dirs_b = _as_direction_array(geometry_a), _as_direction_array(geometry_b)
+    if not (dimension := _pairwise_dimension(dirs_a, dirs_b)):
+        return np.zeros((len(dirs_a), len(dirs_b)), dtype=bool)
+    gamma = dimension * predicates.EPSILON / (1 - dimension * predicates.EPSILON)
+    errbound = gamma * (np.abs(dirs_a) @ np.abs(dirs_b).T)
+    scale = np.outer(np.max(np.abs(dirs_a), axis=1), np.max(np.abs(dirs_b), axis=1))
+    return _resolve_pairwise_zero(
+        np.abs(dirs_a @ dirs_b.T)[:, :, None], errbound[:, :, None], scale[:, :, None],
+        lambda i, j: predicates.perpendicular(dirs_a[i], dirs_b[j], **_TOLERANCES)
+    )
+
+def pairwise_angle_between(geometry_a: Sequence[Line | LineSegment | Plane] | np.ndarray,
+                           geometry_b: Sequence[Line | LineSegment | Plane] | np.ndarray,
+                           opposite: bool=False,
+                           convention: AC=AC.PLUS_PI) -> np.ndarray:
+    """Returns the angle between the directions of each of M geometries and each of N other
+    geometries. Follows the same conventions as :func:`get_angle_between` for direction vectors,
+    but skew 3D lines are not detected and return the angle between their directions.
+
+    :param geometry_a: M Lines, LineSegments or Planes, an (M, d) array of direction vectors or
+        an (M, 2, d) array of segment start and end points.
+    :param geometry_b: N Lines, LineSegments or Planes, or an array like geometry_a.
+    :param opposite: Whether to return the supplement/explement of the angles.
+    :param convention: The angle convention the output will follow.
+    :returns: An (M, N) float array of angles.
+    :raises ValueError: When the direction dimensions do not match.
+    """
+    dirs_a, dirs_b = _as_direction_array(geometry_a), _as_direction_array(geometry_b)
+    if not (dimension := _pairwise_dimension(dirs_a, dirs_b)):
+        return np.zeros((len(dirs_a), len(dirs_b)))
+    dot = dirs_a @ dirs_b.T
+    if dimension == 2:
+        cross = np.outer(dirs_a[:, 0], dirs_b[:, 1]) - np.outer(dirs_a[:, 1], dirs_b[:, 0])
+        angle = np.arctan2(np.abs(cross), dot)
+        clockwise = cross < 0
+    else:
+        cross_3d = np.cross(dirs_a[:, None, :], dirs_b[None, :, :])
+        angle = np.arctan2(np.linalg.norm(cross_3d, axis=-1), dot)
+        clockwise = np.zeros(angle.shape, dtype=bool)
+    if convention in (AC.PLUS_TAU, AC.PLUS_360):
+        angle = np.where(clockwise, math.tau - angle, angle)
+        if opposite:
+            angle = math.tau - angle
+    elif opposite:
+        angle = math.pi - angle
+    if convention in (AC.SIGN_PI, AC.SIGN_180):
+        angle = np.where(clockwise ^ opposite, -angle, angle)
+    if convention in (AC.PLUS_180, AC.PLUS_360, AC.SIGN_180):
+        return np.degrees(angle)
+    return angle
+
+def pairwise_intersect(geometry_a: Sequence[Line | LineSegment] | np.ndarray,
+                       geometry_b: Sequence[Line | LineSegment] | np.ndarray,
+                       bounded: bool=True) -> tuple[np.ndarray, np.ndarray]:
+    """Returns where each of M lines or line segments intersects each of N others. Parallel
+    pairs, including overlapping collinear pairs, are reported as not intersecting.
+
+    :param geometry_a: M Lines or LineSegments, or an (M, 2, d) array of segment start and end
+        points.
+    :param geometry_b: N Lines or LineSegments, or an array like geometry_a.
+    :param bounded: Whether LineSegments only intersect within their start and end points. If
+        False, all inputs are treated as infinitely long like :func:`get_intersect`. Lines are
+        always unbounded.
+    :returns: An (M, N) boolean array of whether each pair intersects and an (M, N, d) array of
+        the intersection points, NaN where there is no intersection.
+    :raises ValueError: When the dimensions do not match.
+    """
+    (start_a, dirs_a, bound_a), (start_b, dirs_b, bound_b) = map(
+        _as_parametric_arrays, (geometry_a, geometry_b)
+    )
+    if not (dimension := _pairwise_dimension(start_a, start_b)):
+        shape = (len(start_a), len(start_b))
+        return np.zeros(shape, dtype=bool), np.empty((*shape, 0))
+    intersects, points, t, u = _intersect_unbounded(start_a, dirs_a, start_b, dirs_b,
+                                                    dimension)
+    if bounded:
+        intersects &= _within_bounds(bound_a[:, None], t)
+        intersects &= _within_bounds(bound_b[None, :], u)
+    points = np.where(intersects[:, :, None], points, np.nan)
+    return intersects, points
+
+def _intersect_unbounded(start_a: np.ndarray, dirs_a: np.ndarray, start_b: np.ndarray,
+                         dirs_b: np.ndarray, dimension: int
+                         ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Returns whether each pair of infinite lines intersects, the (M, N, d) intersection
+    points, and the (M, N) parameters of the points along each line of a and of b.
+    """
+    if dimension == 2:
+        start_a, dirs_a, start_b, dirs_b = (
+            np.pad(array, ((0, 0), (0, 1))) for array in (start_a, dirs_a, start_b, dirs_b)
+        )
+    start_to_start = start_b[None, :, :] - start_a[:, None, :]
+    normal = np.cross(dirs_a[:, None, :], dirs_b[None, :, :])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal_sq = np.sum(normal**2, axis=-1)
+        t = np.sum(np.cross(start_to_start, dirs_b[None, :, :]) * normal, axis=-1) / normal_sq
+        u = np.sum(np.cross(start_to_start, dirs_a[:, None, :]) * normal, axis=-1) / normal_sq
+    points_a = start_a[:, None, :] + t[:, :, None] * dirs_a[:, None, :]
+    points_b = start_b[None, :, :] + u[:, :, None] * dirs_b[None, :, :]
+    scale = np.maximum(np.abs(points_a), np.abs(points_b))
+    intersects = (~pairwise_parallel(dirs_a[:, :dimension], dirs_b[:, :dimension])
+                  & np.all(np.abs(points_a - points_b)
+                           <= np.maximum(RELATIVE_TOLERANCE * scale, ABSOLUTE_TOLERANCE),
+                           axis=-1))
+    return intersects, points_a[:, :, :dimension], t, u
+
+def _within_bounds(bounded: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """Returns whether each parameter is between the start and end of its element, always
+    True for unbounded elements.
+    """
+    lower, upper = -RELATIVE_TOLERANCE, 1 + RELATIVE_TOLERANCE
+    return ~bounded | ((lower <= params) & (params <= upper))
+
+def _get_tangent_direction(curve: LineSegment | CircularArc | Circle,
+                           point: tuple[float, float]) -> tuple[float, float]:
+    """Returns a direction along the curve at a point on it."""
+    if isinstance(curve, LineSegment):
+        return curve.direction
+    return (curve.center[1] - point[1], point[0] - curve.center[0])
+
+def _as_point_array(points: Sequence[Point] | np.ndarray) -> np.ndarray:
+    """Returns an (M, d) float array from M Points or an existing coordinate array."""
+    if isinstance(points, np.ndarray):
+        array = points.astype(np.float64, copy=False)
+    else:
+        array = _stack_rows([point.cartesian for point in points])
+    if array.ndim != 2:
+        raise ValueError(f"Expected an (M, d) array of points, got shape {array.shape}")
+    return array
+
+def _as_direction_array(geometry: Sequence[Line | LineSegment | Plane] | np.ndarray
+                        ) -> np.ndarray:
+    """Returns an (M, d) float array of directions, which are not necessarily unit vectors."""
+    if isinstance(geometry, np.ndarray):
+        array = geometry.astype(np.float64, copy=False)
+        if array.ndim == 3:
+            return array[:, 1, :] - array[:, 0, :]
+        if array.ndim == 2:
+            return array
+        raise ValueError(f"Expected an (M, d) or (M, 2, d) array, got shape {array.shape}")
+    directions = []
+    for element in geometry:
+        if isinstance(element, LineSegment):
+            directions.append(np.subtract(element.end.cartesian, element.start.cartesian))
+        elif isinstance(element, Line):
+            directions.append(element.direction)
+        elif isinstance(element, Plane):
+            directions.append(element.normal)
+        else:
+            raise NotImplementedError(f"Unsupported type: {element.__class__}")
+    return _stack_rows(directions)
+
+def _as_parametric_arrays(geometry: Sequence[Line | LineSegment] | np.ndarray
+                          ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the (M, d) start points, (M, d) start to end vectors, and (M,) boolean array of
+    whether each element is bounded.
+    """
+    if isinstance(geometry, np.ndarray):
+        array = geometry.astype(np.float64, copy=False)
+        if array.ndim != 3 or array.shape[1] != 2:
+            raise ValueError(f"Expected an (M, 2, d) array of segments, got shape {array.shape}")
+        return array[:, 0, :], array[:, 1, :] - array[:, 0, :], np.ones(len(array), dtype=bool)
+    starts, directions, bounded = [], [], []
+    for element in geometry:
+        if isinstance(element, LineSegment):
+            starts.append(element.start.cartesian)
+            directions.append(np.subtract(element.end.cartesian, element.start.cartesian))
+            bounded.append(True)
+        elif isinstance(element, Line):
+            starts.append(element.reference_point.cartesian)
+            directions.append(element.direction)
+            bounded.append(False)
+        else:
+            raise NotImplementedError(f"Unsupported type: {element.__class__}")
+    return _stack_rows(starts), _stack_rows(directions), np.array(bounded, dtype=bool)
+
+def _stack_rows(rows: Sequence[Sequence[float]]) -> np.ndarray:
+    """Returns the rows as an (M, d) float array, with an empty input returned as shape (0, 0)."""
+    if len(rows) == 0:
+        return np.empty((0, 0))
+    return np.array(rows, dtype=np.float64)
+
+def _pairwise_dimension(array_a: np.ndarray, array_b: np.ndarray) -> int:
+    """Returns the shared dimension of the batched inputs, or 0 if either input is empty.
+
+    :raises ValueError: When the inputs do not have matching 2D/3D dimensions.
+    """
+    if len(array_a) == 0 or len(array_b) == 0:
+        return 0
+    if array_a.shape[1] != array_b.shape[1] or array_a.shape[1] not in (2, 3):
+        raise ValueError("Expected all 2D or all 3D geometry, got"
+                         f" {array_a.shape[1]}D and {array_b.shape[1]}D")
+    return array_a.shape[1]
+
+def _resolve_pairwise_zero(magnitude: np.ndarray, errbound: np.ndarray, scale: np.ndarray,
+                           exact: Callable[[int, int], bool]) -> np.ndarray:
+    """Returns an (M, N) boolean array of whether all the (M, N, k) float magnitudes are within
+    tolerance of zero. Pairs the float error bound cannot decide are passed to exact.
+    """
+    tolerance = np.maximum(RELATIVE_TOLERANCE * scale, ABSOLUTE_TOLERANCE)
+    certain_zero = np.all(magnitude + errbound <= tolerance, axis=-1)
+    certain_nonzero = np.any(magnitude - errbound > tolerance, axis=-1)
+    result = certain_zero.copy()
+    for i, j in zip(*np.nonzero(~certain_zero & ~certain_nonzero)):
+        result[i, j] = exact(int(i), int(j))
+    return result
@@ -0,0 +1,622 @@
+"""A module providing a Bentley-Ottmann sweep-line engine to find where 2D sketch
+curves meet, and a profile check built on it to validate that a sketch's
+geometry forms closed loops before features like Extrude use it.
+
+The sweep works on x-monotone pieces of the curves: LineSegments are used as
+they are while CircularArcs and Circles are split at their leftmost and
+rightmost points. Event points are processed from left to right and the pieces
+crossing the sweep line are kept ordered by height, so only neighbouring pieces
+are ever tested against each other. All the junctions between n curves meeting
+at k points are found in O((n + k) log n) comparisons instead of the O(n^2) of
+checking every pair.
+
+Points closer together than the tolerance are merged into a single event point,
+so shared endpoints and T-junctions do not depend on float rounding. The
+tolerance follows the math.isclose convention of pancad's other spatial checks:
+it is the larger of ``abs_tol`` and ``rel_tol`` times the largest coordinate of
+the geometry.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+import heapq
+import math
+from typing import TYPE_CHECKING
+
+from pancad.geometry.circle import Circle
+from pancad.geometry.circular_arc import CircularArc
+from pancad.geometry.line_segment import LineSegment
+from pancad.geometry.point import Point
+from pancad.geometry.sketch import Sketch
+from pancad.geometry.system import SketchGeometrySystem
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pancad.abstract import AbstractGeometry
+
+RELATIVE_TOLERANCE = 1e-9
+ABSOLUTE_TOLERANCE = 1e-9
+
+@dataclass(frozen=True)
+class Junction:
+    """A point where sketch curves meet.
+
+    :param point: The (x, y) location of the junction.
+    :param endpoints: The curves with their start or end at the junction. A
+        curve is listed twice if both its start and end are at the junction.
+    :param interiors: The curves passing through the junction.
+    """
+    point: tuple[float, float]
+    endpoints: tuple[AbstractGeometry, ...]
+    interiors: tuple[AbstractGeometry, ...]
+
+@dataclass
+class SweepResult:
+    """The junctions and overlapping curve pairs found by a sweep.
+
+    :param junctions: Every point where a curve ends or two curves meet, in
+        sweep order.
+    :param overlaps: The pairs of curves that share a stretch of their length
+        instead of meeting at isolated points. At least one pair is listed for
+        every stretch shared by several curves.
+    """
+    junctions: list[Junction] = field(default_factory=list)
+    overlaps: list[tuple[AbstractGeometry, AbstractGeometry]] = field(
+        default_factory=list
+    )
+
+@dataclass
+class ProfileReport:
+    """The result of checking whether a set of curves forms closed loops.
+
+    :param geometry: The curves that were checked.
+    :param crossings: Junctions where two or more curves pass through each
+        other, including tangent contacts between curve interiors.
+    :param t_junctions: Junctions where a curve ends on the interior of another.
+    :param open_endpoints: Junctions where a curve ends without connecting to
+        any other curve.
+    :param branches: Junctions where more than two curve ends meet.
+    :param overlaps: Pairs of curves that share a stretch of their length.
+    """
+    geometry: tuple[AbstractGeometry, ...]
+    crossings: list[Junction] = field(default_factory=list)
+    t_junctions: list[Junction] = field(default_factory=list)
+    open_endpoints: list[Junction] = field(default_factory=list)
+    branches: list[Junction] = field(default_factory=list)
+    overlaps: list[tuple[AbstractGeometry, AbstractGeometry]] = field(
+        default_factory=list
+    )
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the curves form one or more closed, non-intersecting loops."""
+        defects = [self.crossings, self.t_junctions, self.open_endpoints,
+                   self.branches, self.overlaps]
+        return bool(self.geometry) and not any(defects)
+
+def sweep_junctions(geometry: Sequence[AbstractGeometry], *,
+                    rel_tol: float=RELATIVE_TOLERANCE,
+                    abs_tol: float=ABSOLUTE_TOLERANCE) -> SweepResult:
+    """Returns every junction between a set of 2D curves.
+
+    :param geometry: LineSegments, CircularArcs and Circles.
+    :param rel_tol: The tolerance relative to the largest coordinate of the
+        geometry for two points to be treated as the same point.
+    :param abs_tol: The minimum absolute tolerance for two points to be treated
+        as the same point.
+    :returns: The junctions and overlaps found between the curves.
+    :raises NotImplementedError: When given a geometry type other than
+        LineSegment, CircularArc or Circle.
+    :raises ValueError: When given 3D geometry or a tolerance that is not
+        positive.
+    """
+    geometry = list(geometry)
+    tol = max(rel_tol * _get_extent(geometry), abs_tol)
+    if not tol > 0:
+        raise ValueError(f"Sweep tolerance must be positive, got {tol}")
+    return _SweepLine(geometry, tol).run()
+
+def check_profile(profile: Sketch | SketchGeometrySystem | Sequence[AbstractGeometry],
+                  *,
+                  rel_tol: float=RELATIVE_TOLERANCE,
+                  abs_tol: float=ABSOLUTE_TOLERANCE) -> ProfileReport:
+    """Returns a report on whether the profile's curves form closed loops.
+    Construction geometry and Points are ignored when given a Sketch or a
+    SketchGeometrySystem.
+
+    :param profile: A Sketch, its geometry system, or a sequence of curves.
+    :param rel_tol: See :func:`sweep_junctions`.
+    :param abs_tol: See :func:`sweep_junctions`.
+    :returns: The crossings, T-junctions, open endpoints, branches and overlaps
+        that stop the profile from being closed.
+    """
+    geometry = _get_profile_geometry(profile)
+    result = sweep_junctions(geometry, rel_tol=rel_tol, abs_tol=abs_tol)
+    report = ProfileReport(tuple(geometry), overlaps=result.overlaps)
+    for junction in result.junctions:
+        if len(junction.interiors) > 1:
+            report.crossings.append(junction)
+        elif junction.interiors:
+            report.t_junctions.append(junction)
+        elif len(junction.endpoints) == 1:
+            report.open_endpoints.append(junction)
+        elif len(junction.endpoints) > 2:
+            report.branches.append(junction)
+    return report
+
+def is_closed_profile(profile: Sketch | SketchGeometrySystem | Sequence[AbstractGeometry],
+                      *,
+                      rel_tol: float=RELATIVE_TOLERANCE,
+                      abs_tol: float=ABSOLUTE_TOLERANCE) -> bool:
+    """Returns whether the profile's curves form closed, non-intersecting loops
+    that can be used to define a solid feature like an Extrude.
+
+    :param profile: A Sketch, its geometry system, or a sequence of curves.
+    :param rel_tol: See :func:`sweep_junctions`.
+    :param abs_tol: See :func:`sweep_junctions`.
+    """
+    return check_profile(profile, rel_tol=rel_tol, abs_tol=abs_tol).is_closed
+
+# Private Functions #
+def _get_profile_geometry(profile: Sketch | SketchGeometrySystem
+                                   | Sequence[AbstractGeometry]
+                          ) -> list[AbstractGeometry]:
+    """Returns the curves of a profile, skipping construction geometry and points
+    of sketches.
+    """
+    if isinstance(profile, Sketch):
+        profile = profile.geometry_system
+    if isinstance(profile, SketchGeometrySystem):
+        return [g for g in profile.get_non_construction_geometry()
+                if not isinstance(g, Point)]
+    return list(profile)
+
+def _get_extent(geometry: Sequence[AbstractGeometry]) -> float:
+    """Returns the largest absolute coordinate reached by the geometry."""
+    extent = 0.0
+    for curve in geometry:
+        if isinstance(curve, LineSegment):
+            if len(curve) != 2:
+                raise ValueError(f"Only 2D geometry can be swept, got {curve}")
+            values = [*map(abs, curve.start), *map(abs, curve.end)]
+        elif isinstance(curve, (CircularArc, Circle)):
+            if len(curve) != 2:
+                raise ValueError(f"Only 2D geometry can be swept, got {curve}")
+            values = [abs(value) + curve.radius for value in curve.center]
+        else:
+            raise NotImplementedError(f"Unsupported type {curve.__class__}")
+        extent = max(extent, *values)
+    return extent
+
+@dataclass(eq=False, slots=True)
+class _Piece:
+    """An x-monotone piece of a curve. Pieces without a center are straight and
+    pieces with a center are arcs lying on one half of their circle.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # A flat slotted record is read in the sweep's inner loops
+
+    owner: int
+    left: tuple[float, float]
+    right: tuple[float, float]
+    left_is_end: bool
+    right_is_end: bool
+    center: tuple[float, float] | None = None
+    radius: float = 0.0
+    upper: bool = True
+
+    def y_at(self, x: float) -> float:
+        """Returns the height of the piece at x. Not valid for vertical pieces."""
+        if self.center is None:
+            (lx, ly), (rx, ry) = self.left, self.right
+            return ly + (ry - ly) * (x - lx) / (rx - lx)
+        dx = x - self.center[0]
+        height = math.sqrt(max(self.radius**2 - dx * dx, 0.0))
+        return self.center[1] + height if self.upper else self.center[1] - height
+
+    def sweep_y(self, px: float, py: float, tol: float) -> float:
+        """Returns the height of the piece on the sweep line through (px, py),
+        snapped to py when the piece passes within tol of the point.
+        """
+        if self.center is None:
+            (lx, ly), (rx, ry) = self.left, self.right
+            if lx == rx:
+                return min(max(py, ly), ry)
+            slope = (ry - ly) / (rx - lx)
+            y = ly + slope * (px - lx)
+            if abs(y - py) <= tol * math.sqrt(1.0 + slope * slope):
+                return py
+            return y
+        cx, cy = self.center
+        on_half = py >= cy - tol if self.upper else py <= cy + tol
+        if on_half and abs(math.hypot(px - cx, py - cy) - self.radius) <= tol:
+            return py
+        return self.y_at(px)
+
+    def order_after(self, px: float) -> tuple[float, float]:
+        """Returns the slope and curvature of the piece at px, which orders
+        pieces meeting at the same point by their height just after it.
+        Vertical pieces are ordered above every other piece.
+        """
+        if self.center is None:
+            (lx, ly), (rx, ry) = self.left, self.right
+            if lx == rx:
+                return (math.inf, math.inf)
+            return ((ry - ly) / (rx - lx), 0.0)
+        dx = px - self.center[0]
+        sign = -1.0 if self.upper else 1.0
+        height_2 = self.radius**2 - dx * dx
+        if height_2 <= 0:
+            return (math.copysign(math.inf, sign * dx), sign * math.inf)
+        height = math.sqrt(height_2)
+        return (sign * dx / height, sign * self.radius**2 / height**3)
+
+    def contains(self, point: tuple[float, float], tol: float) -> bool:
+        """Returns whether a point already known to lie on the piece's line or
+        circle is within the piece's extent.
+        """
+        x, y = point
+        if not self.left[0] - tol <= x <= self.right[0] + tol:
+            return False
+        if self.center is None:
+            low, high = sorted((self.left[1], self.right[1]))
+            return low - tol <= y <= high + tol
+        if self.upper:
+            return y >= self.center[1] - tol
+        return y <= self.center[1] + tol
+
+class _PointSnapper:
+    """Merges points closer than the tolerance into the first of them to be
+    seen, using a grid of tolerance sized cells.
+    """
+    # pylint: disable=too-few-public-methods
+    # The grid is state shared by every snap of one sweep
+
+    def __init__(self, tol: float) -> None:
+        self._tol = tol
+        self._grid: dict[tuple[int, int], list[tuple[float, float]]] = {}
+
+    def snap(self, x: float, y: float) -> tuple[float, float]:
+        """Returns the existing point within tolerance of (x, y), or registers
+        and returns (x, y) if there is none.
+        """
+        tol = self._tol
+        cell_x, cell_y = math.floor(x / tol), math.floor(y / tol)
+        for i in (cell_x - 1, cell_x, cell_x + 1):
+            for j in (cell_y - 1, cell_y, cell_y + 1):
+                for point in self._grid.get((i, j), ()):
+                    if abs(point[0] - x) <= tol and abs(point[1] - y) <= tol:
+                        return point
+        point = (x, y)
+        self._grid.setdefault((cell_x, cell_y), []).append(point)
+        return point
+
+class _SweepLine:
+    """A single left to right sweep over a list of curves."""
+    # pylint: disable=too-many-instance-attributes, too-few-public-methods
+    # The event queue, status and results of one sweep live for one run call
+
+    def __init__(self, geometry: list[AbstractGeometry], tol: float) -> None:
+        self._geometry = geometry
+        self._tol = tol
+        self._snapper = _PointSnapper(tol)
+        self._queue: list[tuple[float, float]] = []
+        self._starts: dict[tuple[float, float], list[_Piece]] = {}
+        self._ends: dict[tuple[float, float], list[_Piece]] = {}
+        self._status: list[_Piece] = []
+        self._overlaps: dict[tuple[int, int], None] = {}
+        self._junctions: list[Junction] = []
+        for piece in self._build_pieces():
+            self._push(piece.left)
+            self._push(piece.right)
+            self._starts[piece.left].append(piece)
+            self._ends[piece.right].append(piece)
+
+    def run(self) -> SweepResult:
+        """Processes every event point and returns the junctions found."""
+        while self._queue:
+            self._handle(heapq.heappop(self._queue))
+        overlaps = [(self._geometry[a], self._geometry[b]) for a, b in self._overlaps]
+        return SweepResult(self._junctions, overlaps)
+
+    def _push(self, point: tuple[float, float]) -> None:
+        """Adds an event point to the queue if it is not already in it."""
+        if point not in self._starts:
+            self._starts[point] = []
+            self._ends[point] = []
+            heapq.heappush(self._queue, point)
+
+    def _handle(self, point: tuple[float, float]) -> None:
+        """Records the junction at an event point, then swaps the order of the
+        pieces passing through it and replaces the pieces ending there with the
+        pieces starting there.
+        """
+        px, py = point
+        status, tol = self._status, self._tol
+        starting = self._starts.pop(point)
+        ending = self._ends.pop(point)
+        def key(piece: _Piece) -> float:
+            return piece.sweep_y(px, py, tol)
+        low = bisect_left(status, py, key=key)
+        high = bisect_right(status, py, key=key)
+        block = status[low:high]
+        low, high = self._remove_stray(ending, block, low, high)
+        passing = [piece for piece in block if piece.right != point]
+        self._record(point, starting, ending, passing)
+
+        new = sorted(passing + starting, key=lambda piece: piece.order_after(px))
+        status[low:high] = new
+        self._check_around(low, len(new), point)
+
+    def _remove_stray(self, ending: list[_Piece], block: list[_Piece],
+                      low: int, high: int) -> tuple[int, int]:
+        """Removes the ending pieces found outside the block of pieces at the
+        event point, and returns the block's bounds shifted for the removal.
+        This is only reached when rounding has put a piece out of order.
+        """
+        for piece in ending:
+            if piece not in block:
+                index = self._status.index(piece)
+                del self._status[index]
+                if index < low:
+                    low, high = low - 1, high - 1
+        return low, high
+
+    def _check_around(self, low: int, count: int,
+                      point: tuple[float, float]) -> None:
+        """Checks the neighbouring pieces around the count pieces placed at low
+        in the status. Neighbours inside the new block are also checked, since
+        overlapping pieces and arcs can meet again after the point.
+        """
+        status = self._status
+        if not count:
+            if 0 < low < len(status):
+                self._check(status[low - 1], status[low], point)
+            return
+        start = max(low - 1, 0)
+        end = min(low + count + 1, len(status))
+        for index in range(start, end - 1):
+            self._check(status[index], status[index + 1], point)
+
+    def _record(self, point: tuple[float, float], starting: list[_Piece],
+                ending: list[_Piece], passing: list[_Piece]) -> None:
+        """Adds a junction for the point if a curve ends at it or if more than
+        one curve passes through it.
+        """
+        endpoints = []
+        interiors = {}
+        for piece in starting:
+            if piece.left_is_end:
+                endpoints.append(piece.owner)
+            else:
+                interiors[piece.owner] = None
+        for piece in ending:
+            if piece.right_is_end:
+                endpoints.append(piece.owner)
+            else:
+                interiors[piece.owner] = None
+        for piece in passing:
+            interiors[piece.owner] = None
+        for owner in endpoints:
+            interiors.pop(owner, None)
+        if endpoints or len(interiors) > 1:
+            self._junctions.append(
+                Junction(point,
+                         tuple(self._geometry[i] for i in endpoints),
+                         tuple(self._geometry[i] for i in interiors))
+            )
+
+    def _check(self, piece_a: _Piece, piece_b: _Piece,
+               point: tuple[float, float]) -> None:
+        """Adds the intersections of two neighbouring pieces after the point to
+        the event queue.
+        """
+        if piece_a.owner == piece_b.owner:
+            return
+        intersections, overlap = _intersect(piece_a, piece_b, self._tol)
+        if overlap:
+            self._overlaps[tuple(sorted((piece_a.owner, piece_b.owner)))] = None
+        for x, y in intersections:
+            event = self._snapper.snap(x, y)
+            if event > point:
+                self._push(event)
+
+    def _build_pieces(self) -> list[_Piece]:
+        """Returns the x-monotone pieces of every curve. The true endpoints of
+        the curves are snapped first so that they are the points other nearby
+        points are merged into.
+        """
+        snap = self._snapper.snap
+        ends = {}
+        for i, curve in enumerate(self._geometry):
+            if isinstance(curve, (LineSegment, CircularArc)):
+                ends[i] = (snap(*curve.start), snap(*curve.end))
+        pieces = []
+        for i, curve in enumerate(self._geometry):
+            if isinstance(curve, LineSegment):
+                nodes = [(ends[i][0], True), (ends[i][1], True)]
+                pieces.extend(_make_pieces(i, nodes))
+            else:
+                pieces.extend(self._build_arc_pieces(i, curve, ends.get(i)))
+        return pieces
+
+    def _build_arc_pieces(self, owner: int, curve: CircularArc | Circle,
+                          ends: tuple[tuple[float, float], ...] | None
+                          ) -> list[_Piece]:
+        """Returns the pieces of an arc or circle split at its leftmost and
+        rightmost points, travelling counterclockwise.
+        """
+        # pylint: disable=too-many-locals
+        # The angles and snapped nodes are built side by side in one walk
+        center = tuple(map(float, curve.center))
+        radius = float(curve.radius)
+        if ends is None:
+            start_angle, sweep = 0.0, math.tau
+            start = end = self._snapper.snap(center[0] + radius, center[1])
+            is_end = False
+        else:
+            start, end = ends
+            if curve.is_clockwise:
+                start, end = end, start
+            start_angle = math.atan2(start[1] - center[1], start[0] - center[0])
+            end_angle = math.atan2(end[1] - center[1], end[0] - center[0])
+            sweep = (end_angle - start_angle) % math.tau
+            if start == end or sweep * radius <= self._tol:
+                sweep = math.tau
+            is_end = True
+        margin = self._tol / radius if radius else math.inf
+        angles = [start_angle]
+        nodes = [(start, is_end)]
+        half_turns = math.floor(start_angle / math.pi) + 1
+        while half_turns * math.pi < start_angle + sweep - margin:
+            if half_turns * math.pi > start_angle + margin:
+                x_offset = radius if half_turns % 2 == 0 else -radius
+                angles.append(half_turns * math.pi)
+                nodes.append(
+                    (self._snapper.snap(center[0] + x_offset, center[1]), False)
+                )
+            half_turns += 1
+        angles.append(start_angle + sweep)
+        nodes.append((end, is_end))
+        halves = [math.sin((angle_a + angle_b) / 2) > 0
+                  for angle_a, angle_b in zip(angles, angles[1:])]
+        return _make_pieces(owner, nodes, halves, center, radius)
+
+def _make_pieces(owner: int, nodes: list[tuple[tuple[float, float], bool]],
+                 halves: list[bool] | None=None,
+                 center: tuple[float, float] | None=None,
+                 radius: float=0.0) -> list[_Piece]:
+    """Returns the pieces between consecutive nodes of a curve, skipping the
+    pieces whose nodes were snapped to the same point.
+
+    :param halves: Whether each arc piece between the nodes lies on the upper
+        half of its circle. Ignored for straight curves.
+    """
+    if halves is None:
+        halves = [True] * (len(nodes) - 1)
+    pieces = []
+    merged_end = False
+    for (point_a, end_a), (point_b, end_b), upper in zip(nodes, nodes[1:],
+                                                         halves):
+        end_a = end_a or merged_end
+        if point_a == point_b:
+            merged_end = end_a or end_b
+            if pieces and merged_end:
+                _mark_end(pieces[-1], point_a)
+            continue
+        merged_end = False
+        if point_b < point_a:
+            point_a, end_a, point_b, end_b = point_b, end_b, point_a, end_a
+        pieces.append(
+            _Piece(owner, point_a, point_b, end_a, end_b, center, radius, upper)
+        )
+    return pieces
+
+def _mark_end(piece: _Piece, point: tuple[float, float]) -> None:
+    """Marks the side of the piece at the point as a true curve endpoint."""
+    if piece.left == point:
+        piece.left_is_end = True
+    else:
+        piece.right_is_end = True
+
+def _intersect(piece_a: _Piece, piece_b: _Piece, tol: float
+               ) -> tuple[list[tuple[float, float]], bool]:
+    """Returns the points where two pieces meet and whether they overlap."""
+    if piece_a.center is None and piece_b.center is None:
+        return _intersect_segments(piece_a, piece_b, tol)
+    if piece_a.center is None:
+        return _intersect_segment_arc(piece_a, piece_b, tol), False
+    if piece_b.center is None:
+        return _intersect_segment_arc(piece_b, piece_a, tol), False
+    return _intersect_arcs(piece_a, piece_b, tol)
+
+def _intersect_segments(piece_a: _Piece, piece_b: _Piece, tol: float
+                        ) -> tuple[list[tuple[float, float]], bool]:
+    """Returns the intersection of two straight pieces."""
+    # pylint: disable=too-many-locals
+    # Unpacked coordinates keep the parametric line formulas readable
+    (ax, ay), (bx, by) = piece_a.left, piece_b.left
+    ux, uy = piece_a.right[0] - ax, piece_a.right[1] - ay
+    vx, vy = piece_b.right[0] - bx, piece_b.right[1] - by
+    wx, wy = bx - ax, by - ay
+    length_a, length_b = math.hypot(ux, uy), math.hypot(vx, vy)
+    denominator = ux * vy - uy * vx
+    if abs(denominator) <= tol * length_a:
+        if abs(ux * wy - uy * wx) > tol * length_a:
+            return [], False
+        start = (wx * ux + wy * uy) / length_a
+        end = start + (vx * ux + vy * uy) / length_a
+        shared = min(length_a, max(start, end)) - max(0.0, min(start, end))
+        return [], shared > tol
+    t = (wx * vy - wy * vx) / denominator
+    u = (wx * uy - wy * ux) / denominator
+    if (-tol <= t * length_a <= length_a + tol
+            and -tol <= u * length_b <= length_b + tol):
+        t = min(max(t, 0.0), 1.0)
+        return [(ax + t * ux, ay + t * uy)], False
+    return [], False
+
+def _intersect_segment_arc(segment: _Piece, arc: _Piece, tol: float
+                           ) -> list[tuple[float, float]]:
+    """Returns the intersections of a straight piece with an arc piece."""
+    (sx, sy), (cx, cy) = segment.left, arc.center
+    length = math.hypot(segment.right[0] - sx, segment.right[1] - sy)
+    dx, dy = (segment.right[0] - sx) / length, (segment.right[1] - sy) / length
+    along = (cx - sx) * dx + (cy - sy) * dy
+    offset = abs((cx - sx) * dy - (cy - sy) * dx)
+    if offset > arc.radius + tol:
+        return []
+    if offset >= arc.radius - tol:
+        params = [along]
+    else:
+        half_chord = math.sqrt(arc.radius**2 - offset**2)
+        params = [along - half_chord, along + half_chord]
+    points = [(sx + param * dx, sy + param * dy) for param in params
+              if -tol <= param <= length + tol]
+    return [point for point in points if arc.contains(point, tol)]
+
+def _intersect_arcs(piece_a: _Piece, piece_b: _Piece, tol: float
+                    ) -> tuple[list[tuple[float, float]], bool]:
+    """Returns the intersections of two arc pieces."""
+    # pylint: disable=too-many-locals
+    # Tangent and crossing circles each need the centers, radii and axis
+    (ax, ay), (bx, by) = piece_a.center, piece_b.center
+    radius_a, radius_b = piece_a.radius, piece_b.radius
+    distance = math.hypot(bx - ax, by - ay)
+    if distance <= tol:
+        return [], _arcs_overlap(piece_a, piece_b, tol)
+    if (distance > radius_a + radius_b + tol
+            or distance < abs(radius_a - radius_b) - tol):
+        return [], False
+    ux, uy = (bx - ax) / distance, (by - ay) / distance
+    if abs(distance - radius_a - radius_b) <= tol:
+        points = [(ax + radius_a * ux, ay + radius_a * uy)]
+    elif abs(distance - abs(radius_a - radius_b)) <= tol:
+        if radius_a >= radius_b:
+            points = [(ax + radius_a * ux, ay + radius_a * uy)]
+        else:
+            points = [(bx - radius_b * ux, by - radius_b * uy)]
+    else:
+        along = (distance**2 + radius_a**2 - radius_b**2) / (2 * distance)
+        height = math.sqrt(max(radius_a**2 - along**2, 0.0))
+        base_x, base_y = ax + along * ux, ay + along * uy
+        points = [(base_x - height * uy, base_y + height * ux),
+                  (base_x + height * uy, base_y - height * ux)]
+    return [point for point in points
+            if piece_a.contains(point, tol) and piece_b.contains(point, tol)], False
+
+def _arcs_overlap(piece_a: _Piece, piece_b: _Piece, tol: float) -> bool:
+    """Returns whether two arc pieces on the same circle share a stretch of
+    their length.
+    """
+    if (abs(piece_a.radius - piece_b.radius) > tol
+            or piece_a.upper != piece_b.upper):
+        return False
+    low = max(piece_a.left[0], piece_b.left[0])
+    high = min(piece_a.right[0], piece_b.right[0])
+    if low > high:
+        return False
+    gap = math.hypot(high - low, piece_a.y_at(high) - piece_a.y_at(low))
+    return gap > tol
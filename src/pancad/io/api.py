@@ -1,5 +1,9 @@
 """Data I/O API"""
 
-from pancad.io.freecad import read_freecad
+from pancad.io.freecad import (
+    convert_freecad_many, read_freecad, read_freecad_incremental,
+    read_freecad_many
+)
 
-__all__ = ["read_freecad",]
+__all__ = ["convert_freecad_many", "read_freecad", "read_freecad_incremental",
+           "read_freecad_many",]
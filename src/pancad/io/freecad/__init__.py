@@ -2,7 +2,15 @@
 
 from pancad.io.freecad._base import (
     FCStd,
+    ReadResult,
     read_freecad,
+    read_freecad_incremental,
+    read_freecad_many,
+)
+from pancad.io.freecad._convert import (
+    ConvertResult, convert_freecad_many, find_freecad_files
 )
 
-__all__ = ["FCStd", "read_freecad"]
+__all__ = ["ConvertResult", "FCStd", "ReadResult", "convert_freecad_many",
+           "find_freecad_files", "read_freecad", "read_freecad_incremental",
+           "read_freecad_many"]
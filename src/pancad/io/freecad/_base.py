@@ -1,15 +1,40 @@
 """Module providing base input-output interfaces for FreeCAD."""
 from __future__ import annotations
 
+from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
+import traceback
 
 from pancad.cad.freecad.read_xml import FCStd
+from pancad.utils.parallel import run_parallel
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from os import PathLike
 
+    from pancad.cad.freecad._feature_translation import FreeCADTranslation
     from pancad.filetypes.part_file import PartFile
 
+@dataclass(frozen=True)
+class ReadResult:
+    """The outcome of reading one file with read_freecad_many.
+
+    :param path: The path to the FreeCAD file that was read.
+    :param part_file: The PartFile read from the file. None if the read failed.
+    :param error: The exception type and message if the read failed.
+    :param traceback: The formatted traceback if the read failed.
+    """
+    path: Path
+    part_file: PartFile | None = None
+    error: str | None = None
+    traceback: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was read without an exception."""
+        return self.error is None
+
 def read_freecad(path: PathLike) -> PartFile:
     """Reads a FreeCAD file into a pancad file object.
 
@@ -25,3 +50,69 @@ def read_freecad(path: PathLike) -> PartFile:
     from pancad.cad.freecad._feature_translation import new_part_from_document
     fcstd = FCStd.from_path(path)
     return new_part_from_document(fcstd)
+
+def read_freecad_incremental(path: PathLike,
+                             previous: FreeCADTranslation=None
+                             ) -> FreeCADTranslation:
+    """Reads a FreeCAD file into a translation holding its pancad file object.
+    Passing the translation of an earlier version of the same file only
+    translates the objects that changed since then and the objects depending on
+    them, which is much faster when a save only touched one sketch.
+
+    :param path: The path to a FreeCAD FCStd file.
+    :param previous: The result of reading an earlier version of the file. It is
+        updated in place and must not be used afterwards.
+    :returns: The translation, with the pancad file object as its part.
+    :raises ValueError: When the FreeCAD file is using features that pancad
+        recognizes but cannot parse.
+    :raises NotImplementedError: When the FreeCAD file is using known
+        unsupported application features.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pancad.cad.freecad._feature_translation import translate_document
+    return translate_document(FCStd.from_path(path), previous)
+
+def read_freecad_many(paths: Iterable[PathLike],
+                      workers: int | None=None,
+                      *,
+                      progress: Callable[[int, int, ReadResult], None]=None
+                      ) -> list[ReadResult]:
+    """Reads multiple FreeCAD files into pancad file objects in parallel
+    processes. Exceptions are captured on each file's result instead of stopping
+    the other reads.
+
+    :param paths: The paths to FreeCAD FCStd files.
+    :param workers: The number of worker processes. Defaults to None, which uses
+        the number of processors on the machine. When 1, the files are read in
+        this process without starting a pool.
+    :param progress: An optional function called with the number of finished
+        files, the total number of files, and the latest result each time a file
+        finishes. Files can finish out of order.
+    :returns: The results of each read in the same order as the paths.
+    """
+    return run_parallel(read_freecad_result, paths, workers, progress,
+                        error_result)
+
+def read_freecad_result(path: Path,
+                        read: Callable[[Path], PartFile]=None) -> ReadResult:
+    """Reads one FreeCAD file into a ReadResult, capturing any exception.
+
+    :param path: The path to a FreeCAD FCStd file.
+    :param read: The function reading the file into a pancad file object.
+        Defaults to None, which uses read_freecad. Must be importable by name
+        when the result is read in a worker process.
+    """
+    if read is None:
+        read = read_freecad
+    try:
+        return ReadResult(path, read(path))
+    except Exception as exc: # pylint: disable=broad-exception-caught
+        return error_result(path, exc)
+
+def error_result(path: Path, exc: Exception) -> ReadResult:
+    """Returns a failed ReadResult for the exception. The exception is stored as
+    strings since it may not be possible to pickle its arguments.
+    """
+    error = "".join(traceback.format_exception_only(exc)).strip()
+    return ReadResult(path, error=error,
+                      traceback="".join(traceback.format_exception(exc)))
@@ -0,0 +1,277 @@
+"""Module providing a pipelined batch converter that reads FreeCAD files into
+pancad and writes them back out as FreeCAD files.
+
+Files are read and translated in a process pool while a writer thread writes
+the finished files and the result log. Both stages are bounded, so reading
+pauses when the writer falls behind instead of holding every translated file in
+memory.
+"""
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+from pancad.cad.freecad.write_xml import write_fcstd
+from pancad.io.freecad._base import (
+    ReadResult, error_result, read_freecad_result
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import IO
+
+    from pancad.filetypes.part_file import PartFile
+
+FREECAD_SUFFIX = ".FCStd"
+"""The suffix of the files found in input directories."""
+LOG_NAME = "pancad_convert.jsonl"
+"""The default name of the result log inside the output directory."""
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ConvertResult:
+    """The outcome of converting one file with convert_freecad_many. Written to
+    the result log as one JSON line.
+
+    :param source: The resolved path to the FreeCAD file that was read.
+    :param destination: The path the converted file was written to.
+    :param error: The exception type and message if the conversion failed.
+    :param traceback: The formatted traceback if the conversion failed.
+    :param read_seconds: Seconds spent reading and translating the file.
+    :param write_seconds: Seconds spent writing the file.
+    """
+    source: Path
+    destination: Path
+    error: str | None = None
+    traceback: str | None = None
+    read_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was converted without an exception."""
+        return self.error is None
+
+    def to_json(self) -> str:
+        """Returns the result as a single line of JSON."""
+        data = asdict(self)
+        data.update(source=str(self.source), destination=str(self.destination),
+                    ok=self.ok)
+        return json.dumps(data)
+
+def find_freecad_files(inputs: Iterable[os.PathLike | str]
+                       ) -> list[tuple[Path, Path]]:
+    """Returns the FreeCAD files to convert from files and directories. The
+    files in directories are found recursively in sorted order.
+
+    :param inputs: Paths to FreeCAD files or directories containing them.
+    :returns: Each file's path paired with its path relative to the output
+        directory. Files in a directory keep their path relative to it.
+    :raises FileNotFoundError: When an input does not exist.
+    """
+    files = []
+    for input_ in map(Path, inputs):
+        if input_.is_dir():
+            files.extend((path, path.relative_to(input_))
+                         for path in sorted(input_.rglob(f"*{FREECAD_SUFFIX}")))
+        elif input_.is_file():
+            files.append((input_, Path(input_.name)))
+        else:
+            raise FileNotFoundError(f"No file or directory at '{input_}'")
+    return files
+
+def read_convert_log(path: os.PathLike | str) -> set[Path]:
+    """Returns the resolved sources of the files successfully converted in a
+    result log. Lines that cannot be read, like a line cut off by a crash, are
+    ignored.
+
+    :param path: The path to a convert_freecad_many result log.
+    """
+    completed = set()
+    try:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping unreadable log line: %r", line)
+                    continue
+                if data.get("ok"):
+                    completed.add(Path(data["source"]).resolve())
+    except FileNotFoundError:
+        pass
+    return completed
+
+def convert_freecad_many(inputs: Iterable[os.PathLike | str],
+                         output_dir: os.PathLike | str,
+                         workers: int | None=None,
+                         *,
+                         log: os.PathLike | str | None=None,
+                         resume: bool=False,
+                         max_pending: int | None=None,
+                         progress: Callable[[int, int, ConvertResult],
+                                            None]=None,
+                         read: Callable[[Path], PartFile]=None
+                         ) -> list[ConvertResult]:
+    """Reads FreeCAD files into pancad and writes them to an output directory as
+    FreeCAD files. Exceptions are captured on each file's result instead of
+    stopping the other conversions.
+
+    :param inputs: Paths to FreeCAD files or directories containing them.
+    :param output_dir: The directory to write the converted files to.
+    :param workers: The number of processes reading files. Defaults to None,
+        which uses the number of processors on the machine. When 1, the files
+        are read in this process without starting a pool.
+    :param log: The JSON lines file each result is appended to as soon as the
+        file is finished. Defaults to a log in the output directory.
+    :param resume: Whether to skip the files that the log records as already
+        converted, like after an interrupted run.
+    :param max_pending: The most files being read or waiting to be written at
+        once. Defaults to twice the number of workers.
+    :param progress: An optional function called with the number of finished
+        files, the total number of files, and the latest result each time a file
+        finishes. Files can finish out of order.
+    :param read: The function reading each file into a pancad file object.
+        Defaults to None, which uses read_freecad. Must be importable by name,
+        since it is sent to the worker processes.
+    :returns: The results of the files converted by this call in the order
+        they finished.
+    """
+    # pylint: disable=too-many-arguments
+    # Every option after workers is keyword only, so calls name each one.
+    output_dir = Path(output_dir)
+    log = output_dir / LOG_NAME if log is None else Path(log)
+    # Sources are resolved so the log matches them however they were given
+    files = [(source.resolve(), relative)
+             for source, relative in find_freecad_files(inputs)]
+    if resume:
+        completed = read_convert_log(log)
+        files = [(source, relative) for source, relative in files
+                 if source not in completed]
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    log.parent.mkdir(parents=True, exist_ok=True)
+    with open(log, "a", encoding="utf-8") as log_file:
+        writer = _Writer(log_file, len(files), max_pending, progress)
+        try:
+            for source, relative, result in _read(files, workers, max_pending,
+                                                  read):
+                writer.put(source, output_dir / relative, result)
+        finally:
+            writer.close()
+    return writer.results
+
+# Private Functions #
+def _read(files: list[tuple[Path, Path]], workers: int, max_pending: int,
+          read: Callable[[Path], PartFile] | None
+          ) -> Iterator[tuple[Path, Path, tuple[ReadResult, float]]]:
+    """Yields the read result of each file as it finishes, with at most
+    max_pending files being read at once.
+    """
+    if workers == 1:
+        for source, relative in files:
+            yield source, relative, _read_timed(source, read)
+        return
+    remaining = iter(files)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        while True:
+            for source, relative in remaining:
+                future = executor.submit(_read_timed, source, read)
+                pending[future] = (source, relative)
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                source, relative = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc: # pylint: disable=broad-exception-caught
+                    # The worker process itself failed, e.g. a crash or pickling
+                    result = (error_result(source, exc), 0.0)
+                yield source, relative, result
+
+def _read_timed(path: Path, read: Callable[[Path], PartFile] | None
+                ) -> tuple[ReadResult, float]:
+    """Reads one FreeCAD file, returning the result and the seconds it took."""
+    start = time.perf_counter()
+    result = read_freecad_result(path, read)
+    return result, time.perf_counter() - start
+
+class _Writer:
+    """A thread writing converted files and their log lines in the order they
+    are put. Putting blocks while max_pending files are waiting to be written.
+    """
+
+    def __init__(self, log_file: IO[str], total: int, max_pending: int,
+                 progress: Callable[[int, int, ConvertResult], None] | None
+                 ) -> None:
+        self.results: list[ConvertResult] = []
+        self._log_file = log_file
+        self._total = total
+        self._progress = progress
+        self._queue = queue.Queue(max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="pancad-convert-writer")
+        self._thread.start()
+
+    def put(self, source: Path, destination: Path,
+            read: tuple[ReadResult, float]) -> None:
+        """Queues a read result to be written."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put((source, destination, read))
+
+    def close(self) -> None:
+        """Waits for the queued files to be written."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            if self._error is not None:
+                continue # Keep draining so put never blocks
+            try:
+                self._finish(self._write(*item))
+            except BaseException as exc: # pylint: disable=broad-exception-caught
+                self._error = exc
+
+    @staticmethod
+    def _write(source: Path, destination: Path,
+               read: tuple[ReadResult, float]) -> ConvertResult:
+        read, read_seconds = read
+        if not read.ok:
+            return ConvertResult(source, destination, read.error,
+                                 read.traceback, read_seconds)
+        start = time.perf_counter()
+        try:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            write_fcstd(read.part_file, destination)
+        except Exception as exc: # pylint: disable=broad-exception-caught
+            failed = error_result(source, exc)
+            return ConvertResult(source, destination, failed.error,
+                                 failed.traceback, read_seconds,
+                                 time.perf_counter() - start)
+        return ConvertResult(source, destination, read_seconds=read_seconds,
+                             write_seconds=time.perf_counter() - start)
+
+    def _finish(self, result: ConvertResult) -> None:
+        self._log_file.write(result.to_json() + "\n")
+        self._log_file.flush()
+        self.results.append(result)
+        if self._progress is not None:
+            self._progress(len(self.results), self._total, result)
@@ -0,0 +1,112 @@
+"""A module providing a size-bounded on-disk cache of pickled python objects.
+Used to skip repeated work on inputs that have not changed between runs, like
+parsing the same CAD file in every run of a pipeline.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+import logging
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pancad.utils.initialize import write_atomic
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+class DiskCache:
+    """A directory of pickled values stored by string keys. Once the total size
+    of the values exceeds the maximum size, the least recently used values are
+    deleted.
+
+    :param directory: The directory to store the values in. Created on the
+        first write if missing.
+    :param max_bytes: The maximum total size of the stored values in bytes.
+    """
+    suffix = ".pickle"
+    """The file extension of the stored values."""
+
+    def __init__(self, directory: PathLike, max_bytes: int) -> None:
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        """The directory the values are stored in."""
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum total size of the stored values in bytes."""
+        return self._max_bytes
+
+    def get(self, key: str, default: Any=None) -> Any:
+        """Returns the value stored for the key and marks it as recently used.
+
+        :param key: The key of the value. Must be usable as a file name.
+        :param default: The value returned when the key is not stored or the
+            stored value cannot be read.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return default
+        except Exception as exc: # pylint: disable=broad-exception-caught
+            # Corrupt or outdated pickles can raise almost anything on load
+            logger.warning("Discarding unreadable cache entry '%s': %s", key, exc)
+            path.unlink(missing_ok=True)
+            return default
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Stores the value for the key, then deletes the least recently used
+        values until the cache fits in its maximum size. The value is written to
+        a temporary file first so partially written values are never read.
+
+        :param key: The key of the value. Must be usable as a file name.
+        :param value: A picklable value.
+        """
+        dump = partial(pickle.dump, value, protocol=pickle.HIGHEST_PROTOCOL)
+        write_atomic(self._get_path(key), dump, binary=True)
+        self.evict()
+
+    def evict(self) -> None:
+        """Deletes the least recently used values until the total size of the
+        stored values is at most the maximum size.
+        """
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError: # Deleted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Deletes all stored values."""
+        for path in self.directory.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
+
+    def __contains__(self, key: str) -> bool:
+        return self._get_path(key).exists()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob(f"*{self.suffix}"))
+
+    def _get_path(self, key: str) -> Path:
+        """Returns the path of the file storing the key's value."""
+        return self.directory / f"{key}{self.suffix}"
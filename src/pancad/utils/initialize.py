@@ -8,12 +8,16 @@ import shutil
 import logging
 import tomllib
 import json
+import tempfile
 from typing import TYPE_CHECKING, cast
 from functools import cache
 from importlib.util import find_spec
 from pathlib import Path
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import IO, Any
+
     from pancad.utils.pancad_types import PancadTomlConfig, PancadJsonCache
 
 PANCAD_RESOURCES_MODULE = "pancad.resources" # The name of the internal pancad resources module.
@@ -56,6 +60,11 @@ def get_cache_path() -> Path:
     """Returns the path where pancad stores user cache data."""
     return get_user_config_dir() / get_pancad_config()["filenames"]["cache"]
 
+@cache
+def get_document_cache_dir() -> Path:
+    """Returns the directory where pancad caches parsed documents."""
+    return get_user_config_dir() / get_pancad_config()["filenames"]["document_cache"]
+
 def get_user_config() -> dict[str, dict[str, str]]:
     """Reads the user configuration files and returns them as a dict. If the
     file isn't found, a default user config file is copied from pancad into
@@ -88,26 +97,44 @@ def get_cache() -> PancadJsonCache:
                 assert isinstance(data, dict)
                 return cast("PancadJsonCache", data)
         except FileNotFoundError:
-            path.parent.mkdir(exist_ok=True)
-            with open(path, "w", encoding="utf-8") as file:
-                json.dump({}, file)
+            write_cache({})
         except json.decoder.JSONDecodeError as err:
             # Handle when the cache was corrupted somehow
             logger.warning("Failed to decode cache json: %s", err)
-            with open(path, "w", encoding="utf-8") as file:
-                json.dump({}, file)
+            write_cache({})
 
 
 def write_cache(data: dict[str, dict[str, str]]) -> None:
     """Writes a new cache to the pancad config directory. Creates the user
     config directory if it's missing.
+
+    The cache is written to a temporary file that then replaces the cache, so
+    concurrent pancad processes never read a partially written cache.
     """
-    path = get_cache_path()
-    while True:
+    write_atomic(get_cache_path(), lambda file: json.dump(data, file, indent=2))
+
+def write_atomic(path: Path, write: Callable[[IO[Any]], object], binary: bool=False) -> None:
+    """Writes a file through a temporary file in the same directory that then replaces it, so
+    readers never see a partially written file. Creates the parent directory if it's missing.
+
+    :param path: The path of the file to write.
+    :param write: A function writing the data to the open temporary file.
+    :param binary: Whether to open the temporary file in binary mode instead of utf-8 text mode.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode, encoding = ("wb", None) if binary else ("w", "utf-8")
+    with tempfile.NamedTemporaryFile(mode, encoding=encoding, dir=path.parent,
+                                     prefix=f".{path.name}.", suffix=".tmp",
+                                     delete=False) as file:
+        temp_path = Path(file.name)
         try:
-            with open(path, "w", encoding="utf-8") as file:
-                json.dump(data, file, indent=2)
-        except FileNotFoundError:
-            path.parent.mkdir()
-            continue
-        break
+            write(file)
+        except BaseException:
+            file.close()
+            temp_path.unlink()
+            raise
+    try:
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,66 @@
+"""A module providing a function for running work on many files in parallel
+processes, like reading or checking a folder of CAD files.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from os import PathLike
+
+R = TypeVar("R")
+
+def run_parallel(func: Callable[[Path], R],
+                 paths: Iterable[str | PathLike[str]],
+                 workers: int | None,
+                 progress: Callable[[int, int, R], None] | None,
+                 error_result: Callable[[Path, Exception], R]) -> list[R]:
+    """Calls a function with each path in parallel processes.
+
+    :param func: The function called with each path. It must be picklable and
+        should capture its own exceptions in its result.
+    :param paths: The paths to call the function with.
+    :param workers: The number of worker processes. None uses the number of
+        processors on the machine. When 1, the function is called in this
+        process without starting a pool.
+    :param progress: An optional function called with the number of finished
+        paths, the total number of paths, and the latest result each time a
+        path finishes. Paths can finish out of order.
+    :param error_result: The function called with the path and the exception
+        to make the result of a path whose worker process failed, e.g. from a
+        crash or a result that could not be pickled.
+    :returns: The results of each call in the same order as the paths.
+    """
+    files = [Path(path) for path in paths]
+    total = len(files)
+    if workers == 1:
+        return _run_serial(func, files, progress)
+    results_by_index: dict[int, R] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(func, path): i
+                   for i, path in enumerate(files)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc: # pylint: disable=broad-exception-caught
+                # The worker process itself failed, e.g. a crash or pickling
+                result = error_result(files[i], exc)
+            results_by_index[i] = result
+            if progress is not None:
+                progress(done, total, result)
+    return [results_by_index[i] for i in range(total)]
+
+# Private Functions #
+def _run_serial(func: Callable[[Path], R], paths: list[Path],
+                progress: Callable[[int, int, R], None] | None) -> list[R]:
+    """Calls a function with each path in this process. See run_parallel."""
+    results = []
+    for path in paths:
+        results.append(func(path))
+        if progress is not None:
+            progress(len(results), len(paths), results[-1])
+    return results
@@ -0,0 +1,275 @@
+"""A module providing robust geometric predicates for spatial relation checks.
+
+The orientation predicates follow Shewchuk's adaptive approach: the determinant is first evaluated
+in floating point alongside a forward error bound, and the result is only recomputed exactly when
+the float value is too close to zero (or to the requested tolerance) to trust its sign. Exact
+evaluation uses :class:`fractions.Fraction`, which represents any float without rounding, so the
+slow path is correct for every finite input while almost never being taken for typical CAD data.
+
+Relation predicates accept math.isclose style ``rel_tol`` and ``abs_tol`` arguments. The relative
+tolerance is scaled by the product of the largest components of the vectors in the determinant
+being tested, which makes the test independent of the magnitude of the coordinates. With both
+tolerances left at 0 the predicates are exact.
+"""
+from __future__ import annotations
+
+from fractions import Fraction
+import math
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+EPSILON = sys.float_info.epsilon / 2
+"""The unit roundoff of a 64 bit float, 2^-53."""
+
+ORIENT2D_ERRBOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+"""Relative forward error bound of a float 2x2 orientation determinant, scaled by its permanent."""
+ORIENT3D_ERRBOUND = (7.0 + 56.0 * EPSILON) * EPSILON
+"""Relative forward error bound of a float 3x3 orientation determinant, scaled by its permanent."""
+_SMALLEST_SUBNORMAL = math.ulp(0.0)
+_PROJECTIONS = ((1, 2), (2, 0), (0, 1))
+
+###############################################################################
+# Orientation Predicates
+###############################################################################
+
+def orient2d(pa: Sequence[float], pb: Sequence[float], pc: Sequence[float]) -> float:
+    """Returns a value whose sign is the exact orientation of three 2D points.
+
+    :param pa: The first 2D point.
+    :param pb: The second 2D point.
+    :param pc: The third 2D point.
+    :returns: A positive value if pa, pb, and pc are in counter-clockwise order, a negative value
+        if they are in clockwise order, and zero if they are collinear. The magnitude is
+        approximately twice the signed area of the triangle.
+    """
+    det, permanent = _det2_float(pa, pc, pb, pc, 0, 1)
+    if abs(det) > ORIENT2D_ERRBOUND * permanent or permanent == 0:
+        return det
+    return _to_signed_float(_det2_exact(pa, pc, pb, pc, 0, 1))
+
+def orient3d(pa: Sequence[float], pb: Sequence[float],
+             pc: Sequence[float], pd: Sequence[float]) -> float:
+    """Returns a value whose sign is the exact orientation of point pd relative to the plane
+    through points pa, pb, and pc.
+
+    :param pa: The first 3D point on the plane.
+    :param pb: The second 3D point on the plane.
+    :param pc: The third 3D point on the plane.
+    :param pd: The 3D point being tested.
+    :returns: A positive value if pd lies below the plane, where "above" is the side from which
+        pa, pb, and pc appear counter-clockwise. A negative value if pd lies above and zero if the
+        points are coplanar. The magnitude is approximately six times the signed volume of the
+        tetrahedron.
+    """
+    det, permanent = _det3_float(pa, pb, pc, pd)
+    if abs(det) > ORIENT3D_ERRBOUND * permanent or permanent == 0:
+        return det
+    return _to_signed_float(_det3_exact(pa, pb, pc, pd))
+
+###############################################################################
+# Relation Predicates
+###############################################################################
+
+def coincident(point_a: Sequence[float], point_b: Sequence[float],
+               *, rel_tol: float=0.0, abs_tol: float=0.0) -> bool:
+    """Returns whether two points are at the same location. Float subtraction of equal values is
+    exact, so the tolerance comparison never needs an exact stage.
+
+    :raises ValueError: When the points have different dimensions.
+    """
+    _check_dimensions(point_a, point_b)
+    return all(math.isclose(a, b, rel_tol=rel_tol, abs_tol=abs_tol)
+               for a, b in zip(point_a, point_b))
+
+def collinear(*points: Sequence[float], rel_tol: float=0.0, abs_tol: float=0.0) -> bool:
+    """Returns whether all the points lie on a single line. 3D points are collinear when their
+    projections onto each of the coordinate planes are collinear.
+
+    :raises ValueError: When the points do not all have the same dimension.
+    """
+    _check_dimensions(*points)
+    if len(points) < 3:
+        return True
+    origin = points[0]
+    base = next((p for p in points[1:] if tuple(p) != tuple(origin)), None)
+    if base is None:
+        return True # All points are at the same location
+    projections = [(0, 1)] if len(origin) == 2 else _PROJECTIONS
+    return all(
+        _det2_is_zero((base, origin), (point, origin), i, j, rel_tol, abs_tol)
+        for point in points[1:] for i, j in projections
+    )
+
+def coplanar(*points: Sequence[float], rel_tol: float=0.0, abs_tol: float=0.0) -> bool:
+    """Returns whether all the points lie on a single plane. 2D points and any set of 3 or fewer
+    points are always coplanar.
+
+    :raises ValueError: When the points do not all have the same dimension.
+    """
+    _check_dimensions(*points)
+    if len(points) < 4 or len(points[0]) == 2:
+        return True
+    pa = points[0]
+    pb = next((p for p in points[1:] if tuple(p) != tuple(pa)), None)
+    if pb is None:
+        return True
+    pc = next((p for p in points[1:] if not collinear(pa, pb, p)), None)
+    if pc is None:
+        return True # A set of collinear points lies on infinitely many planes
+    return all(_det3_is_zero(pa, pb, pc, pd, rel_tol, abs_tol) for pd in points[1:])
+
+def parallel(vector_a: Sequence[float], vector_b: Sequence[float],
+             *, codirectional: bool=False, rel_tol: float=0.0, abs_tol: float=0.0) -> bool:
+    """Returns whether two vectors are parallel by checking that their cross product is zero.
+    Zero vectors are parallel to every vector.
+
+    :param codirectional: Whether anti-parallel vectors should be treated as not parallel.
+    :raises ValueError: When the vectors have different dimensions.
+    """
+    _check_dimensions(vector_a, vector_b)
+    zero = (0.0,) * len(vector_a)
+    projections = [(0, 1)] if len(vector_a) == 2 else _PROJECTIONS
+    if not all(_det2_is_zero((vector_a, zero), (vector_b, zero), i, j, rel_tol, abs_tol)
+               for i, j in projections):
+        return False
+    if codirectional:
+        dot, errbound, _ = _dot_float(vector_a, vector_b)
+        if abs(dot) > errbound:
+            return dot > 0
+        return _dot_exact(vector_a, vector_b) >= 0
+    return True
+
+def perpendicular(vector_a: Sequence[float], vector_b: Sequence[float],
+                  *, rel_tol: float=0.0, abs_tol: float=0.0) -> bool:
+    """Returns whether two vectors are perpendicular by checking that their dot product is zero.
+    Zero vectors are perpendicular to every vector.
+
+    :raises ValueError: When the vectors have different dimensions.
+    """
+    _check_dimensions(vector_a, vector_b)
+    dot, errbound, _ = _dot_float(vector_a, vector_b)
+    scale = _span(vector_a) * _span(vector_b)
+    return _is_zero(dot, errbound, scale, lambda: _dot_exact(vector_a, vector_b),
+                    rel_tol, abs_tol)
+
+def on_line(point: Sequence[float], line_point: Sequence[float], direction: Sequence[float],
+            *, rel_tol: float=0.0, abs_tol: float=0.0) -> bool:
+    """Returns whether a point lies on the line through line_point in the given direction. When
+    direction is a unit vector, abs_tol is the largest allowed distance from the line.
+
+    :raises ValueError: When the point, line point and direction have different dimensions.
+    """
+    _check_dimensions(point, line_point, direction)
+    zero = (0.0,) * len(point)
+    projections = [(0, 1)] if len(point) == 2 else _PROJECTIONS
+    return all(_det2_is_zero((point, line_point), (direction, zero), i, j, rel_tol, abs_tol)
+               for i, j in projections)
+
+###############################################################################
+# Private Helpers
+###############################################################################
+
+def _check_dimensions(*vectors: Sequence[float]) -> None:
+    """Raises a ValueError when the vectors are not all 2D or all 3D."""
+    dimensions = {len(vector) for vector in vectors}
+    if len(dimensions) != 1 or not dimensions <= {2, 3}:
+        raise ValueError(f"Expected all 2D or all 3D vectors, got dimensions {dimensions}")
+
+def _span(tip: Sequence[float], tail: Sequence[float] | None=None) -> float:
+    """Returns the largest absolute component of the vector from tail to tip."""
+    if tail is None:
+        return float(max(map(abs, tip)))
+    return float(max(abs(a - b) for a, b in zip(tip, tail)))
+
+def _is_zero(approx: float, errbound: float, scale: float,
+             exact: Callable[[], Fraction], rel_tol: float, abs_tol: float) -> bool:
+    """Returns whether a determinant is within tolerance of zero, only calling exact when the
+    float approximation is ambiguous.
+    """
+    tolerance = max(rel_tol * scale, abs_tol)
+    if abs(approx) - errbound > tolerance:
+        return False
+    if abs(approx) + errbound <= tolerance:
+        return True
+    return abs(exact()) <= tolerance
+
+def _det2_is_zero(vector_a: tuple[Sequence[float], Sequence[float]],
+                  vector_b: tuple[Sequence[float], Sequence[float]],
+                  i: int, j: int, rel_tol: float, abs_tol: float) -> bool:
+    """Returns whether the i, j components of the cross product of two vectors are zero. Each
+    vector is given as a (tip, tail) pair of points.
+    """
+    (a_tip, a_tail), (b_tip, b_tail) = vector_a, vector_b
+    det, permanent = _det2_float(a_tip, a_tail, b_tip, b_tail, i, j)
+    scale = _span(a_tip, a_tail) * _span(b_tip, b_tail)
+    return _is_zero(det, ORIENT2D_ERRBOUND * permanent, scale,
+                    lambda: _det2_exact(a_tip, a_tail, b_tip, b_tail, i, j),
+                    rel_tol, abs_tol)
+
+def _det3_is_zero(pa: Sequence[float], pb: Sequence[float],
+                  pc: Sequence[float], pd: Sequence[float],
+                  rel_tol: float, abs_tol: float) -> bool:
+    det, permanent = _det3_float(pa, pb, pc, pd)
+    scale = _span(pa, pd) * _span(pb, pd) * _span(pc, pd)
+    return _is_zero(det, ORIENT3D_ERRBOUND * permanent, scale,
+                    lambda: _det3_exact(pa, pb, pc, pd), rel_tol, abs_tol)
+
+def _det2_float(a_tip: Sequence[float], a_tail: Sequence[float],
+                b_tip: Sequence[float], b_tail: Sequence[float],
+                i: int, j: int) -> tuple[float, float]:
+    """Returns the float approximation and permanent of the i, j components of the cross product
+    of (a_tip - a_tail) and (b_tip - b_tail).
+    """
+    left = (a_tip[i] - a_tail[i]) * (b_tip[j] - b_tail[j])
+    right = (a_tip[j] - a_tail[j]) * (b_tip[i] - b_tail[i])
+    return float(left - right), float(abs(left) + abs(right))
+
+def _det2_exact(a_tip: Sequence[float], a_tail: Sequence[float],
+                b_tip: Sequence[float], b_tail: Sequence[float],
+                i: int, j: int) -> Fraction:
+    ai, aj, bi, bj = (Fraction(tip[k]) - Fraction(tail[k])
+                      for tip, tail, k in ((a_tip, a_tail, i), (a_tip, a_tail, j),
+                                           (b_tip, b_tail, i), (b_tip, b_tail, j)))
+    return ai * bj - aj * bi
+
+def _dot_float(vector_a: Sequence[float], vector_b: Sequence[float]
+               ) -> tuple[float, float, float]:
+    """Returns the float approximation, error bound and permanent of a dot product."""
+    products = [a * b for a, b in zip(vector_a, vector_b)]
+    permanent = math.fsum(map(abs, products))
+    gamma = len(products) * EPSILON / (1 - len(products) * EPSILON)
+    return math.fsum(products), gamma * permanent, permanent
+
+def _dot_exact(vector_a: Sequence[float], vector_b: Sequence[float]) -> Fraction:
+    return sum((Fraction(a) * Fraction(b) for a, b in zip(vector_a, vector_b)), Fraction(0))
+
+def _det3_float(pa: Sequence[float], pb: Sequence[float],
+                pc: Sequence[float], pd: Sequence[float]) -> tuple[float, float]:
+    ad, bd, cd = ([point[k] - pd[k] for k in range(3)] for point in (pa, pb, pc))
+    terms = ((ad[2], bd[0] * cd[1], cd[0] * bd[1]),
+             (bd[2], cd[0] * ad[1], ad[0] * cd[1]),
+             (cd[2], ad[0] * bd[1], bd[0] * ad[1]))
+    det = sum(z * (left - right) for z, left, right in terms)
+    permanent = sum((abs(left) + abs(right)) * abs(z) for z, left, right in terms)
+    return float(det), float(permanent)
+
+def _det3_exact(pa: Sequence[float], pb: Sequence[float],
+                pc: Sequence[float], pd: Sequence[float]) -> Fraction:
+    adx, ady, adz = (Fraction(pa[k]) - Fraction(pd[k]) for k in range(3))
+    bdx, bdy, bdz = (Fraction(pb[k]) - Fraction(pd[k]) for k in range(3))
+    cdx, cdy, cdz = (Fraction(pc[k]) - Fraction(pd[k]) for k in range(3))
+    return (adz * (bdx * cdy - cdx * bdy)
+            + bdz * (cdx * ady - adx * cdy)
+            + cdz * (adx * bdy - bdx * ady))
+
+def _to_signed_float(value: Fraction) -> float:
+    """Returns the float nearest to an exact value without letting a nonzero value underflow to
+    zero, so the sign of the exact result is always preserved.
+    """
+    approx = float(value)
+    if approx == 0 and value != 0:
+        return math.copysign(_SMALLEST_SUBNORMAL, value)
+    return approx
@@ -788,7 +788,8 @@ class SystemSolver:
 
 def _update_location(geometry: Point, value: Numpy1D) -> None:
     """Updates a Point's location."""
-    geometry.cartesian = value
+    # The solver's x vector is already a validated float array
+    geometry._set_trusted(*value.tolist()) # pylint: disable=protected-access
 
 def _update_direction(geometry: Axis | Line,  value: Numpy1D) -> None:
     """Updates a Line or Axis direction."""
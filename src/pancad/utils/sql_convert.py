@@ -1,6 +1,11 @@
 """A module for reading and writing pancad objects from/to a sqlite database.
 Importing this module registers the converters to sqlite3.
+
+Values read back from sqlite were written by pancad's own conform methods, so
+points are created through Point's trusted fast path instead of being parsed
+again.
 """
+# pylint: disable=protected-access
 import sqlite3
 import tomllib
 from pathlib import Path
@@ -16,14 +21,14 @@ from pancad.geometry.ellipse import Ellipse
 from pancad.geometry.plane import Plane
 
 def _point(value: bytes) -> Point:
-    return Point(*map(float, value.split(b";")))
+    return Point._from_trusted(*map(float, value.split(b";")))
 
 def _circle(value: bytes) -> Circle:
     param_count_2d = 3
     if len(dimensions := value.split(b";")) != param_count_2d:
         raise NotImplementedError("3D Circles not implemented yet")
     *center, radius = dimensions
-    center = tuple(map(float, center))
+    center = Point._from_trusted(*map(float, center))
     radius = float(radius)
     return Circle(center, radius)
 
@@ -39,9 +44,9 @@ def _line(value: bytes) -> Line:
     else:
         class_ = Line.__name__
         raise ValueError(f"Wrong {class_} param count ({len(dimensions)})!")
-    closest = tuple(map(float, closest))
+    closest = Point._from_trusted(*map(float, closest))
     direction = tuple(map(float, direction))
-    return Line(Point(closest), direction)
+    return Line(closest, direction)
 
 def _line_segment(value: bytes) -> LineSegment:
     param_count_2d = 4
@@ -55,8 +60,8 @@ def _line_segment(value: bytes) -> LineSegment:
     else:
         class_ = Line.__name__
         raise ValueError(f"Wrong {class_} param count ({len(dimensions)})!")
-    a = tuple(map(float, a))
-    b = tuple(map(float, b))
+    a = Point._from_trusted(*map(float, a))
+    b = Point._from_trusted(*map(float, b))
     return LineSegment(a, b)
 
 def _circular_arc(value: bytes) -> CircularArc:
@@ -79,7 +84,8 @@ def _circular_arc(value: bytes) -> CircularArc:
         raise ValueError(f"Wrong {class_} param count ({len(dimensions)})!")
     is_clockwise = bool(int(is_clockwise))
     radius = float(radius)
-    return CircularArc(center, radius, start, end, is_clockwise, normal)
+    return CircularArc(Point._from_trusted(*center), radius, start, end,
+                       is_clockwise, normal)
 
 def _ellipse(value: bytes) -> Ellipse:
     raise NotImplementedError
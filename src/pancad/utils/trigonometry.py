@@ -4,11 +4,11 @@ between formats.
 from __future__ import annotations
 
 import decimal
-from functools import partial, singledispatch
+from functools import lru_cache, partial, singledispatch
 import math
 import sys
 from math import degrees
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, TypeGuard, cast, overload
 from collections.abc import Sequence
 
 import numpy as np
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
     from typing import Literal
     from collections.abc import Callable, Iterable, Collection
 
+    from numpy.typing import NDArray
+
     from pancad.utils.pancad_types import (
         Space3DVector, Space2DVector, SpaceVector, Numpy1D, Numpy2D
     )
@@ -174,12 +176,23 @@ def get_unit_vector(vector: Collection[float]) -> Numpy1D | Numpy2D:
     out_2d_vector: Numpy2D = unit_vector.reshape(*shape)
     return out_2d_vector
 
-def get_vector_angle(vector1: SpaceVector,
-                     vector2: SpaceVector,
+@overload
+def get_vector_angle(vector1: SpaceVector, vector2: SpaceVector, *,
+                     opposite: bool=..., convention: AngleConvention=...) -> float: ...
+@overload
+def get_vector_angle(vector1: NDArray[np.float64], vector2: NDArray[np.float64] | SpaceVector,
+                     *, opposite: bool=..., convention: AngleConvention=...
+                     ) -> NDArray[np.float64]: ...
+@overload
+def get_vector_angle(vector1: SpaceVector, vector2: NDArray[np.float64], *,
+                     opposite: bool=..., convention: AngleConvention=...
+                     ) -> NDArray[np.float64]: ...
+def get_vector_angle(vector1: SpaceVector | NDArray[np.float64],
+                     vector2: SpaceVector | NDArray[np.float64],
                      *,
                      opposite: bool=False,
                      convention: AngleConvention=AngleConvention.PLUS_PI
-                     ) -> float:
+                     ) -> float | NDArray[np.float64]:
     """Returns the angle between vector1 and vector2 based on the given angle
     convention.
 
@@ -191,8 +204,14 @@ def get_vector_angle(vector1: SpaceVector,
         :class:`~pancad.constants.AngleConvention` for
         available options.
     :raises TypeError: When non 2D/3D vectors or vectors of different lengths are provided.
-    :returns: The angle between vector1 and vector2.
+    :returns: The angle between vector1 and vector2. When either vector is an
+        (n, d) array the vectors broadcast against each other and an array of
+        angles is returned.
     """
+    if _is_batch(vector1) or _is_batch(vector2):
+        return _get_vector_angle_array(vector1, vector2, opposite, convention)
+    # Single vectors, including 1D arrays, are indexed like tuples from here on
+    vector1, vector2 = cast("SpaceVector", vector1), cast("SpaceVector", vector2)
     if len(vector1) == len(vector2) == 2:
         match convention:
             case AngleConvention.PLUS_PI | AngleConvention.PLUS_180:
@@ -224,63 +243,98 @@ def is_clockwise(vector1: Space2DVector, vector2: Space2DVector) -> bool:
     :returns: 'True' if vector2 is clockwise of vector1, otherwise 'False'.
     """
     if len(vector1) == len(vector2) == 2:
-        x1, y1 = vector1
-        vector1_90_ccw = (-y1, x1)
-        # numpy can output an array from dot, so float is called on it here to guarantee the type
-        return float(np.dot(vector1_90_ccw, vector2)) < 0
+        (x1, y1), (x2, y2) = vector1, vector2
+        # The cross product is written out instead of using np.dot, which can
+        # round differently, so that the batched angles get the same sign
+        return float(x1 * y2 - y1 * x2) < 0
     raise TypeError(f"Expected 2D vectors. Got: {vector1} and {vector2}")
 
-def multi_rotation(permutation: str, *angles: float) -> Numpy2D:
+@overload
+def multi_rotation(permutation: str, *angles: float) -> Numpy2D: ...
+@overload
+def multi_rotation(permutation: str, *angles: float | NDArray[np.float64]
+                   ) -> NDArray[np.float64]: ...
+def multi_rotation(permutation: str, *angles: float | NDArray[np.float64]
+                   ) -> NDArray[np.float64]:
     """Returns a rotation matrix of multiple rotations around the x, y, and z
-    axes.
+    axes. Matrices for scalar angles are cached, see :data:`ROTATION_CACHE_SIZE`.
 
     :param permutation: An arbitrary length string of letters x, y, and z in the
         order the rotations should be performed. Example: 'xyzzyx'.
     :param angles: The rotation angle corresponding to the rotation at the same
         index in permutation. The number of angles must be the same as the
-        number of permutations.
+        number of permutations. Angles can also be arrays that broadcast
+        together, which returns a stack of matrices with the broadcast shape
+        followed by (3, 3).
     :returns: A rotation matrix to perform the series of rotations.
     """
     if len(angles) != len(permutation):
         raise ValueError("Length of permutation must be the same as the number"
                          f" of angles ({len(permutation)}!={len(angles)})")
-    rotation_funcs: dict[str, Callable[[float], Numpy2D]] = {
-        "x": rotation_x,
-        "y": rotation_y,
-        "z": rotation_z,
-    }
     permutation = permutation.casefold()
-    matrix = np.identity(3, dtype=np.float64)
-    for angle, axis in zip(angles, list(permutation)):
-        matrix = matrix @ rotation_funcs[axis](angle)
-    return matrix.astype(np.float64)
+    if any(np.ndim(angle) for angle in angles):
+        matrices = np.identity(3, dtype=np.float64)
+        for angle, axis in zip(np.broadcast_arrays(*angles), permutation):
+            matrices = matrices @ _rotation_array(angle, _CANON_AXES[axis])
+        return matrices
+    return _multi_rotation_cached(permutation, tuple(map(float, angles))).copy()
 
-def rotation(angle: float,
-             around: Literal["x", "y", "z", "2"] | Space3DVector) -> Numpy2D:
+@overload
+def rotation(angle: float, around: Literal["x", "y", "z", "2"] | Space3DVector) -> Numpy2D: ...
+@overload
+def rotation(angle: float | NDArray[np.float64],
+             around: Literal["x", "y", "z", "2"] | Space3DVector | NDArray[np.float64]
+             ) -> NDArray[np.float64]: ...
+def rotation(angle: float | NDArray[np.float64],
+             around: Literal["x", "y", "z", "2"] | Space3DVector | NDArray[np.float64]
+             ) -> NDArray[np.float64]:
     """Returns a rotation matrix that rotates around the given axis/vector by the
-    angle. Assumes a right-handed coordinate system.
+    angle. Assumes a right-handed coordinate system. Matrices for scalar angles
+    are cached, see :data:`ROTATION_CACHE_SIZE`.
 
-    :param angle: The counter-clockwise rotation angle in radians.
+    :param angle: The counter-clockwise rotation angle in radians. An array of
+        angles returns a stack of matrices with the array's shape followed by
+        the matrix shape.
     :param around: The axis to rotate around. Options x, y, z, 2, and a
         tuple. 2 produces a 2D rotation matrix. If given tuple of 3 floats, the
-        rotation matrix will be for rotating around that vector.
+        rotation matrix will be for rotating around that vector. An (n, 3)
+        array of axes broadcasts against the angles.
     :returns: A numpy rotation matrix.
     """
+    if isinstance(around, np.ndarray) and around.ndim > 1:
+        if around.shape[-1] != 3:
+            raise TypeError(f"Expected an (n, 3) array of axes, got shape {around.shape}")
+        return _rotation_array(angle, around / norm(around, axis=-1, keepdims=True))
+    if np.ndim(angle):
+        if isinstance(around, str):
+            return _rotation_array(angle, _CANON_AXES.get(around, around))
+        return _rotation_array(angle, _parse_rotation_axis(tuple(to_1d_np(around))))
+    axis = around if isinstance(around, str) else tuple(to_1d_np(around).tolist())
+    return _rotation_cached(float(angle), axis).copy()
+
+ROTATION_CACHE_SIZE = 1024
+"""The number of scalar angle rotation matrices kept by each of rotation and
+multi_rotation. CAD data repeats a few angles like 0, 90, 180 and 270 degrees
+constantly, so most matrices are looked up instead of rebuilt.
+"""
+
+_CANON_AXES: dict[str, tuple[float, float, float]] = {
+    "x": (1.0, 0.0, 0.0), "y": (0.0, 1.0, 0.0), "z": (0.0, 0.0, 1.0),
+}
+
+@lru_cache(maxsize=ROTATION_CACHE_SIZE)
+def _rotation_cached(angle: float, around: str | tuple[float, ...]) -> Numpy2D:
+    """Returns the rotation matrix for a scalar angle. The returned array is
+    shared between calls and must be copied before being handed out.
+    """
     cost = math.cos(angle)
     sint = math.sin(angle)
-    around_axis: Numpy1D
-
     if around == "2":
         return np.array([[cost, -sint], [sint, cost]])
-    canon_axis_map = {"x": (1, 0, 0), "y": (0, 1, 0), "z": (0, 0, 1)}
     if isinstance(around, str):
-        around_axis = np.array(canon_axis_map[around])
+        x, y, z = _CANON_AXES[around]
     else:
-        if len(around) != 3:
-            raise TypeError(f"Expected 3D vector axis or axis letter for around, got: {around}")
-        around_axis = get_unit_vector(around)
-
-    x, y, z = around_axis
+        x, y, z = _parse_rotation_axis(around).tolist()
     mcost = 1 - cost
     matrix = [
         [x**2 * mcost + cost, x*y*mcost - z*sint, x*z*mcost + y*sint],
@@ -289,6 +343,49 @@ def rotation(angle: float,
     ]
     return np.array(matrix)
 
+@lru_cache(maxsize=ROTATION_CACHE_SIZE)
+def _multi_rotation_cached(permutation: str, angles: tuple[float, ...]) -> Numpy2D:
+    """Returns the multi rotation matrix for scalar angles. The returned array is
+    shared between calls and must be copied before being handed out.
+    """
+    matrix = np.identity(3, dtype=np.float64)
+    for angle, axis in zip(angles, permutation):
+        matrix = matrix @ _rotation_cached(angle, axis)
+    return matrix.astype(np.float64)
+
+def _parse_rotation_axis(around: tuple[float, ...]) -> Numpy1D:
+    """Returns the unit vector of a 3D rotation axis.
+
+    :raises TypeError: When the axis is not 3D.
+    """
+    if len(around) != 3:
+        raise TypeError(f"Expected 3D vector axis or axis letter for around, got: {around}")
+    return get_unit_vector(around)
+
+def _rotation_array(angles: float | NDArray[np.float64],
+                    around: str | Sequence[float] | NDArray[np.float64]
+                    ) -> NDArray[np.float64]:
+    """Returns a stack of rotation matrices for an array of angles around a
+    single axis or a broadcastable array of unit axes.
+    """
+    angle_array = np.asarray(angles, dtype=np.float64)
+    cost, sint = np.cos(angle_array), np.sin(angle_array)
+    if isinstance(around, str):
+        if around != "2":
+            raise KeyError(around)
+        return np.stack([np.stack([cost, -sint], axis=-1),
+                         np.stack([sint, cost], axis=-1)], axis=-2)
+    axes = np.asarray(around, dtype=np.float64)
+    x, y, z = axes[..., 0], axes[..., 1], axes[..., 2]
+    mcost = 1 - cost
+    rows = [
+        [x**2 * mcost + cost, x*y*mcost - z*sint, x*z*mcost + y*sint],
+        [x*y*mcost + z*sint, y**2 * mcost + cost, y*z*mcost - x*sint],
+        [x*z*mcost - y*sint, y*z*mcost + x*sint, z**2 * mcost + cost],
+    ]
+    return np.stack([np.stack(np.broadcast_arrays(*row), axis=-1) for row in rows],
+                    axis=-2)
+
 # Special Case Rotation Matrices
 rotation_x: Callable[[float], Numpy2D] = partial(rotation, around="x")
 """Returns a rotation matrix for rotation about the x axis. Requires only 1
@@ -406,27 +503,50 @@ def theta_of_cartesian(cartesian: Space3DVector) -> float:
         return math.pi + math.atan(math.hypot(x, y) / z)
     raise ValueError(f"Unhandled exception, cartesian: {cartesian}")
 
-def cartesian_to_polar(cartesian: Space2DVector) -> PolarVector:
+@overload
+def cartesian_to_polar(cartesian: Space2DVector) -> PolarVector: ...
+@overload
+def cartesian_to_polar(cartesian: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def cartesian_to_polar(cartesian: Space2DVector | NDArray[np.float64]
+                       ) -> PolarVector | NDArray[np.float64]:
     """Returns the polar version of the given cartesian vector.
 
-    :param cartesian: A 2D vector with cartesian components x and y.
+    :param cartesian: A 2D vector with cartesian components x and y, or an
+        (n, 2) array of them.
     :returns: An equivalent 2D vector with polar components r (radial distance)
-              and phi (azimuth) in radians.
+              and phi (azimuth) in radians. Arrays return an (n, 2) array.
     """
+    if _is_batch(cartesian):
+        x, y = _split_components(cartesian, 2, "cartesian_to_spherical")
+        r = np.hypot(x, y)
+        return np.stack([r, np.where(r == 0, np.nan, np.arctan2(y, x))], axis=-1)
+    cartesian = cast("Space2DVector", cartesian)
     if len(cartesian) == 2:
         return PolarVector(r_of_cartesian(cartesian), phi_of_cartesian(cartesian))
     if len(cartesian) == 3:
         raise ValueError("2D, use cartesian_to_spherical for 3D points")
     raise ValueError("Invalid cartesian vector, must be 2 long to return")
 
-def polar_to_cartesian(polar: Space2DVector) -> Space2DVector:
+@overload
+def polar_to_cartesian(polar: Space2DVector) -> Space2DVector: ...
+@overload
+def polar_to_cartesian(polar: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def polar_to_cartesian(polar: Space2DVector | NDArray[np.float64]
+                       ) -> Space2DVector | NDArray[np.float64]:
     """Returns the cartesian version of the given polar vector.
 
     :param polar: A 2D vector with polar components r (radial distance) and phi
-        (azimuth angle) in radians.
-    :returns: An equivalent 2D vector with cartesian components x and y.
+        (azimuth angle) in radians, or an (n, 2) array of them.
+    :returns: An equivalent 2D vector with cartesian components x and y. Arrays
+        return an (n, 2) array.
     """
-    r, phi = polar
+    if _is_batch(polar):
+        radii, phis = _split_components(polar, 2, "spherical_to_cartesian")
+        valid = ((radii > 0) & ~np.isnan(phis)) | (radii == 0)
+        _check_batch_valid(polar, valid, "polar")
+        phis = np.where(np.isnan(phis), 0.0, phis)
+        return np.stack([radii * np.cos(phis), radii * np.sin(phis)], axis=-1)
+    r, phi = cast("Space2DVector", polar)
     if r == 0 and math.isnan(phi):
         return (0, 0)
     if r < 0:
@@ -435,14 +555,23 @@ def polar_to_cartesian(polar: Space2DVector) -> Space2DVector:
         raise ValueError("phi cannot be NaN if r is non-zero")
     return (r * math.cos(phi), r * math.sin(phi))
 
-def spherical_to_cartesian(spherical: Space3DVector) -> Space3DVector:
+@overload
+def spherical_to_cartesian(spherical: Space3DVector) -> Space3DVector: ...
+@overload
+def spherical_to_cartesian(spherical: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def spherical_to_cartesian(spherical: Space3DVector | NDArray[np.float64]
+                           ) -> Space3DVector | NDArray[np.float64]:
     """Returns the cartesian version of the given spherical vector.
 
     :param spherical: A 3D vector with spherical components r (radial distance),
-        phi (azimuth in radians), and theta (inclination in radians).
+        phi (azimuth in radians), and theta (inclination in radians), or an
+        (n, 3) array of them.
     :returns: An equivalent 3D vector with cartesian components x, y, and z.
+        Arrays return an (n, 3) array.
     """
-    r, phi, theta = spherical
+    if _is_batch(spherical):
+        return _spherical_to_cartesian_array(spherical)
+    r, phi, theta = cast("Space3DVector", spherical)
     if r == 0 and math.isnan(phi) and math.isnan(theta):
         return (0, 0, 0)
     if r > 0 and not math.isnan(phi) and (0 <= theta <= math.pi):
@@ -468,13 +597,28 @@ def spherical_to_cartesian(spherical: Space3DVector) -> Space3DVector:
         raise ValueError("If phi is NaN, theta must be pi/2 or NaN")
     raise ValueError(f"Unhandled spherical case! Got: {spherical}")
 
-def cartesian_to_spherical(cartesian: Space3DVector) -> SphericalVector:
+@overload
+def cartesian_to_spherical(cartesian: Space3DVector) -> SphericalVector: ...
+@overload
+def cartesian_to_spherical(cartesian: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def cartesian_to_spherical(cartesian: Space3DVector | NDArray[np.float64]
+                           ) -> SphericalVector | NDArray[np.float64]:
     """Returns the spherical version of the given cartesian vector.
 
-    :param cartesian: A 3D vector with cartesian components x, y, z.
+    :param cartesian: A 3D vector with cartesian components x, y, z, or an
+        (n, 3) array of them.
     :returns: A 3D vector with spherical components r (radial distance), phi
-        (azimuth in radians), and theta (inclination in radians).
+        (azimuth in radians), and theta (inclination in radians). Arrays return
+        an (n, 3) array.
     """
+    if _is_batch(cartesian):
+        x, y, z = _split_components(cartesian, 3, "cartesian_to_polar")
+        planar = np.hypot(x, y)
+        r = np.hypot(planar, z)
+        phi = np.where(planar == 0, np.nan, np.arctan2(y, x))
+        theta = np.where(r == 0, np.nan, np.arctan2(planar, z))
+        return np.stack([r, phi, theta], axis=-1)
+    cartesian = cast("Space3DVector", cartesian)
     if len(cartesian) == 3:
         return SphericalVector(r_of_cartesian(cartesian),
                                phi_of_cartesian(cartesian),
@@ -483,6 +627,89 @@ def cartesian_to_spherical(cartesian: Space3DVector) -> SphericalVector:
         raise ValueError("2D, use cartesian_to_polar for 2D points")
     raise ValueError("Invalid cartesian vector, must be 3 long")
 
+def _is_batch(value: object) -> TypeGuard[NDArray[np.float64]]:
+    """Returns whether the value is an array of row vectors rather than a single
+    row or column vector.
+    """
+    return isinstance(value, np.ndarray) and value.ndim > 1 and value.shape[-1] != 1
+
+def _split_components(array: NDArray[np.float64], length: int, alternative: str
+                      ) -> tuple[NDArray[np.float64], ...]:
+    """Returns the component columns of an array of row vectors.
+
+    :raises ValueError: When the rows are not the expected length.
+    """
+    array = np.asarray(array, dtype=np.float64)
+    if array.shape[-1] != length:
+        raise ValueError(f"Expected {length} long rows, got shape {array.shape}."
+                         f" Use {alternative} for {array.shape[-1]} long rows")
+    return tuple(np.moveaxis(array, -1, 0))
+
+def _check_batch_valid(array: NDArray[np.float64], valid: NDArray[np.bool_], name: str
+                       ) -> None:
+    """Raises a ValueError naming the first invalid row of an array."""
+    if not np.all(valid):
+        index = tuple(int(i) for i in np.argwhere(~valid)[0])
+        raise ValueError(f"Invalid {name} vector at index {index}: {array[index]}")
+
+def _spherical_to_cartesian_array(spherical: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Returns the cartesian rows of an array of spherical rows."""
+    r, phi, theta = _split_components(spherical, 3, "polar_to_cartesian")
+    phi_nan, theta_nan = np.isnan(phi), np.isnan(theta)
+    general = (r > 0) & ~phi_nan & (theta >= 0) & (theta <= math.pi)
+    pole = (r > 0) & phi_nan & ((theta == 0) | (theta == math.pi))
+    _check_batch_valid(spherical, general | pole | ((r == 0) & phi_nan & theta_nan),
+                       "spherical")
+    sin_theta = np.where(general, np.sin(theta), 0.0)
+    phi = np.where(general, phi, 0.0)
+    z = np.where(pole, np.where(theta == 0, r, -r),
+                 np.where(general, r * np.cos(np.where(general, theta, 0.0)), 0.0))
+    return np.stack([r * sin_theta * np.cos(phi), r * sin_theta * np.sin(phi), z],
+                    axis=-1)
+
+def _get_vector_angle_array(vector1: NDArray[np.float64] | SpaceVector,
+                            vector2: NDArray[np.float64] | SpaceVector,
+                            opposite: bool,
+                            convention: AngleConvention) -> NDArray[np.float64]:
+    """Returns the angles between broadcast arrays of vectors, following the same
+    conventions as get_vector_angle does for single vectors.
+    """
+    vectors1 = np.asarray(vector1, dtype=np.float64)
+    vectors2 = np.asarray(vector2, dtype=np.float64)
+    length = vectors1.shape[-1]
+    if length != vectors2.shape[-1] or length not in (2, 3):
+        raise TypeError("Expected 2D/3D vectors of the same length, got shapes"
+                        f" {vectors1.shape}, {vectors2.shape}")
+    unit_dot = (np.sum(vectors1 * vectors2, axis=-1)
+                / (norm(vectors1, axis=-1) * norm(vectors2, axis=-1)))
+    unit_dot = np.where(np.isclose(np.abs(unit_dot), 1), np.round(unit_dot), unit_dot)
+    angle: NDArray[np.float64] = np.arccos(unit_dot)
+    if length == 3:
+        if opposite:
+            angle = math.pi - angle
+    else:
+        clockwise = (vectors1[..., 0] * vectors2[..., 1]
+                     - vectors1[..., 1] * vectors2[..., 0]) < 0
+        match convention:
+            case AngleConvention.PLUS_PI | AngleConvention.PLUS_180:
+                if opposite:
+                    angle = math.pi - angle
+            case AngleConvention.SIGN_PI | AngleConvention.SIGN_180:
+                if opposite:
+                    angle = math.pi - angle
+                angle = np.where(clockwise ^ opposite, -angle, angle)
+            case AngleConvention.PLUS_TAU | AngleConvention.PLUS_360:
+                angle = np.where(clockwise, math.tau - angle, angle)
+                if opposite:
+                    angle = math.tau - angle
+            case _:
+                raise ValueError(f"Convention {convention} not recognized")
+    if convention in (AngleConvention.PLUS_180,
+                      AngleConvention.PLUS_360,
+                      AngleConvention.SIGN_180):
+        return np.degrees(angle)
+    return angle
+
 def _get_angle_between_2d_vectors_2pi(vector1: Space2DVector,
                                       vector2: Space2DVector,
                                       explementary: bool=False) -> float:
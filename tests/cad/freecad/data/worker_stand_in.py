@@ -0,0 +1,30 @@
+"""A stand-in for FreeCAD-independent scripts called by FreeCAD workers, used
+to test the worker pool with a regular Python executable.
+"""
+import os
+import sys
+import time
+
+def echo(*args):
+    return list(args)
+
+def pid():
+    return os.getpid()
+
+def fail(message):
+    raise ValueError(message)
+
+def crash():
+    os._exit(3)
+
+def sleep(seconds):
+    time.sleep(seconds)
+    return os.getpid()
+
+def noisy(value):
+    print("FreeCAD prints to stdout too", flush=True)
+    sys.stdout.write("more noise\n")
+    return value
+
+def unserializable():
+    return object()
@@ -9,7 +9,8 @@ from dataclasses import astuple
 import pytest
 
 from pancad.cad.freecad import api_utils, xml_utils
-from pancad.cad.freecad.api import freecad, freecad_part
+from pancad.cad.freecad.api import freecad, freecad_part, freecad_sketcher
+from pancad.cad.freecad.constants import ConstraintType
 
 # Testing Reading Content
 
@@ -113,6 +114,54 @@ def test_get_by_uid(freecad_doc, uid_pairs):
         found_obj = api_utils.get_by_uid(uid, freecad_doc)
         assert found_obj.Content == obj.Content
 
+def test_document_index_get_by_uid(freecad_doc, uid_pairs):
+    """Test that DocumentIndex finds the same api objects as get_by_uid."""
+    index = api_utils.DocumentIndex(freecad_doc)
+    for uid, obj in uid_pairs:
+        assert index.get_by_uid(uid).Content == obj.Content
+
+def test_document_index_reference_index(freecad_doc, sketches):
+    """Test that DocumentIndex reference indices match reading them from the
+    sketch xml.
+    """
+    index = api_utils.DocumentIndex(freecad_doc)
+    for sketch in sketches:
+        for list_ in ["Geometry", "ExternalGeo"]:
+            for geometry in getattr(sketch, list_):
+                uid = api_utils.read_geometry_uid(geometry, list_, sketch,
+                                                  freecad_doc)
+                expected = api_utils.get_reference_index_by_uid(uid, freecad_doc)
+                assert index.get_reference_index(uid) == expected
+
+def test_document_index_added_geometry(freecad_doc, sketches):
+    """Test that DocumentIndex finds geometry added after it was created."""
+    index = api_utils.DocumentIndex(freecad_doc)
+    for sketch in sketches:
+        index.read_geometry(sketch, "Geometry")
+        line = freecad_part.LineSegment(freecad.Vector(0, 0, 0),
+                                        freecad.Vector(1, 1, 0))
+        new_index = sketch.addGeometry(line)
+        uid = index.read_geometry(sketch, "Geometry")[new_index]
+        assert index.get_reference_index(uid) == new_index
+
+def test_document_index_duplicate_constraints(freecad_doc, sketches):
+    """Test that DocumentIndex finds constraints added after a duplicate
+    constraint at their index in the sketch.
+    """
+    index = api_utils.DocumentIndex(freecad_doc)
+    for sketch in sketches:
+        line = freecad_part.LineSegment(freecad.Vector(0, 0, 0),
+                                        freecad.Vector(1, 1, 0))
+        line_index = sketch.addGeometry(line)
+        empty = (xml_utils.EMPTY_CONSTRAINED, 0)
+        definitions = []
+        for type_ in ["Horizontal", "Horizontal", "Vertical"]:
+            sketch.addConstraint(freecad_sketcher.Constraint(type_, line_index))
+            type_int = int(getattr(ConstraintType, type_.upper()))
+            definitions.append((type_int, [(line_index, 0), empty, empty]))
+            uids = index.add_constraints(sketch, definitions[-1:])
+        assert index.get_constraint_index(uids[0]) == len(sketch.Constraints) - 1
+
 # Testing FreeCADUID
 
 @pytest.fixture(
@@ -180,3 +229,31 @@ def test_from_sketch_constraint(freecad_doc, sketches):
             uids.append(uid)
     if len(uids) != len(set(uids)):
         raise ValueError("Duplicate uids were created!", uids)
+
+def test_read_geometry_uids(freecad_doc, sketches):
+    """Test reading all the uids of a sketch list at once matches reading them
+    one geometry at a time.
+    """
+    for sketch in sketches:
+        for list_ in ["Geometry", "ExternalGeo"]:
+            expected = [
+                api_utils.read_geometry_uid(geometry, list_, sketch, freecad_doc)
+                for geometry in getattr(sketch, list_)
+            ]
+            assert api_utils.read_geometry_uids(sketch, list_,
+                                                freecad_doc) == expected
+
+def test_read_constraint_uids(freecad_doc, sketches):
+    """Test reading constraint uids from their reference pairs matches reading
+    them from the constraint api objects.
+    """
+    for sketch in sketches:
+        constraints = []
+        for element in api_utils.get_sketch_constraint_list_xml(sketch):
+            pairs = [(int(element.attrib[name]), int(element.attrib[name + "Pos"]))
+                     for name in ["First", "Second", "Third"]]
+            constraints.append((int(element.attrib["Type"]), pairs))
+        expected = [api_utils.read_constraint_uid(constraint, sketch, freecad_doc)
+                    for constraint in sketch.Constraints]
+        assert api_utils.read_constraint_uids(constraints, sketch,
+                                              freecad_doc) == expected
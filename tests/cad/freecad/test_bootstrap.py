@@ -1,5 +1,4 @@
 import tomllib
-import os
 import shutil
 from platform import system
 from unittest import TestCase
@@ -9,13 +8,14 @@ from importlib.util import find_spec
 
 import pytest
 
-from pancad.utils.initialize import write_cache
-from pancad.cad.freecad._bootstrap import get_app_dir, find_app_dir
+from pancad.utils.initialize import get_user_config_dir, write_cache
+from pancad.cad.freecad import _bootstrap
+from pancad.cad.freecad._bootstrap import get_app_dir, find_app_dir, FREECAD_PYD
 
 RESOURCES_PATH = Path(find_spec("pancad.resources").origin).parent
 with open(RESOURCES_PATH / "pancad.toml", "rb") as file:
     CONFIG = tomllib.load(file)
-USER_DIR = Path(os.path.expandvars(CONFIG["paths"]["user_dir"]))
+USER_DIR = get_user_config_dir()
 FILENAMES = CONFIG["filenames"]
 CONFIG_PATH = USER_DIR / FILENAMES["user_config"]
 CACHE_PATH = USER_DIR / FILENAMES["cache"]
@@ -80,4 +80,56 @@ class TestMissingUserConfigAndCache(TestCase):
 class TestFreeCADSetUp(TestCase):
     def test_get_app_dir(self):
         path = get_app_dir()
-        print(path)
\ No newline at end of file
+        print(path)
+
+class TestAppDirDiscovery:
+    """Tests for reusing the validated FreeCAD directory within a process."""
+
+    @pytest.fixture(name="fake_bin")
+    def fixture_fake_bin(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        (bin_dir / FREECAD_PYD).touch()
+        monkeypatch.setattr(_bootstrap, "_discovered", {})
+        write_cache({"application_paths": {"freecad": str(bin_dir)}})
+        yield bin_dir
+        CACHE_PATH.unlink(missing_ok=True)
+
+    @staticmethod
+    def count_finds(monkeypatch: pytest.MonkeyPatch) -> list:
+        calls = []
+        def find(search_environment: bool=False) -> Path:
+            calls.append(search_environment)
+            return find_app_dir(search_environment)
+        monkeypatch.setattr(_bootstrap, "find_app_dir", find)
+        return calls
+
+    def test_reused(self, fake_bin: Path, monkeypatch: pytest.MonkeyPatch):
+        calls = self.count_finds(monkeypatch)
+        assert get_app_dir() == fake_bin
+        assert get_app_dir() == fake_bin
+        assert len(calls) == 1
+
+    def test_cache_replaced(self, fake_bin: Path, tmp_path: Path,
+                            monkeypatch: pytest.MonkeyPatch):
+        calls = self.count_finds(monkeypatch)
+        get_app_dir()
+        other_bin = tmp_path / "other" / "bin"
+        other_bin.mkdir(parents=True)
+        (other_bin / FREECAD_PYD).touch()
+        write_cache({"application_paths": {"freecad": str(other_bin)}})
+        assert get_app_dir() == other_bin
+        assert len(calls) == 2
+
+    def test_freecad_removed(self, fake_bin: Path,
+                             monkeypatch: pytest.MonkeyPatch):
+        calls = self.count_finds(monkeypatch)
+        get_app_dir()
+        (fake_bin / FREECAD_PYD).unlink()
+        (fake_bin / FREECAD_PYD).touch()
+        get_app_dir()
+        assert len(calls) == 1
+        (fake_bin / FREECAD_PYD).unlink()
+        monkeypatch.setattr(_bootstrap, "_validate_app_path", lambda path: path)
+        get_app_dir()
+        assert len(calls) == 2
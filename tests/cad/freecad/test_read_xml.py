@@ -0,0 +1,609 @@
+"""Tests for reading FreeCAD FCStd files directly from their xml."""
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+from xml.etree import ElementTree as ET
+from zipfile import BadZipFile, ZIP_STORED, ZipFile
+import mmap
+
+import numpy as np
+import pytest
+
+from pancad.cad.freecad import read_xml, xml_cache, xml_utils
+from pancad.cad.freecad.read_xml import (
+    FCStd, FreeCADDocumentXML, FreeCADPropertyXML
+)
+from pancad.cad.freecad.xml_geometry_arrays import GeometryListArrays
+from pancad.cad.freecad.xml_properties import FreeCADGeometryXML
+from pancad.cad.freecad.xml_utils import FreeCADUID
+from pancad.utils.disk_cache import DiskCache
+
+FCSTD_FILES = [
+    "cube_1x1x1.FCStd",
+    "cube_1x1x1_PointOnObject.FCStd",
+    "one_of_each_sketch_geometry.FCStd",
+]
+
+class _TrickleStream(BytesIO):
+    """A stream returning at most a few bytes per read to exercise parsing
+    elements split across many reads.
+    """
+    def read(self, size: int=-1) -> bytes:
+        return super().read(min(size, 7) if size > 0 else 7)
+
+def _summarize(document: FreeCADDocumentXML) -> list[tuple]:
+    """Returns a comparable summary of every object and property value."""
+    summary = [(p.name, repr(p.value)) for p in document.properties]
+    for obj in document.objects:
+        summary.append((obj.name, obj.id_, obj.type_))
+        summary.extend((p.name, repr(p.value)) for p in obj.properties)
+    return summary
+
+@pytest.fixture(name="document_xml", params=FCSTD_FILES)
+def fixture_document_xml(request, shared_datadir: Path) -> bytes:
+    with ZipFile(shared_datadir / request.param) as file:
+        yield file.read("Document.xml")
+
+class TestStreamingRead:
+    """Tests for incrementally parsing Document.xml."""
+
+    def test_matches_full_read(self, document_xml: bytes) -> None:
+        """Test streaming reads the same data as parsing the full string."""
+        expected = _summarize(FreeCADDocumentXML.from_string(document_xml))
+        streamed = FreeCADDocumentXML.from_stream(BytesIO(document_xml))
+        assert _summarize(streamed) == expected
+
+    def test_small_reads(self, document_xml: bytes) -> None:
+        """Test elements split across many stream reads are still read."""
+        expected = _summarize(FreeCADDocumentXML.from_string(document_xml))
+        streamed = FreeCADDocumentXML.from_stream(_TrickleStream(document_xml))
+        assert _summarize(streamed) == expected
+
+    def test_object_data_cleared(self, document_xml: bytes) -> None:
+        """Test the streamed document does not keep the ObjectData elements."""
+        document = FreeCADDocumentXML.from_stream(BytesIO(document_xml))
+        assert len(document.objects) > 0
+        assert document._tree.find("ObjectData") is None
+        assert document._tree.find("Objects") is not None
+
+    def test_empty_stream(self) -> None:
+        """Test an empty stream fails to parse instead of reading no element."""
+        with pytest.raises(ET.ParseError):
+            FreeCADDocumentXML.from_stream(BytesIO(b""))
+
+    def test_no_object_data(self) -> None:
+        """Test a document without an ObjectData list is read from its root."""
+        data = (b'<Document SchemaVersion="4"><Properties Count="0"/>'
+                b'<Objects Count="0"/></Document>')
+        document = FreeCADDocumentXML.from_stream(BytesIO(data))
+        assert document._tree.tag == "Document"
+        assert not document.objects
+
+    @pytest.mark.parametrize("filename", FCSTD_FILES)
+    def test_fcstd(self, filename: str, shared_datadir: Path) -> None:
+        """Test FCStd files are streamed with the file set on the document."""
+        fcstd = FCStd.from_path(shared_datadir / filename)
+        assert fcstd.document.file is fcstd
+        assert len(fcstd.get_topo_uids()) == len(fcstd.document.objects)
+
+class TestPropertyDecoding:
+    """Tests for decoding property values on first access."""
+
+    def test_decoded_on_access(self, document_xml: bytes) -> None:
+        """Test streamed properties keep only their own subtree until their
+        value is accessed, then release it.
+        """
+        document = FreeCADDocumentXML.from_stream(BytesIO(document_xml))
+        sketch = next(o for o in document.objects if o.name == "Sketch")
+        geometry = sketch.get_property("Geometry")
+        assert geometry._element is not None
+        assert geometry._element.tag == "Property"
+        assert len(geometry.value) > 0
+        assert geometry._element is None
+        assert geometry.value is geometry.value
+
+    def test_invalid_value_on_access(self) -> None:
+        """Test invalid values only raise once the value is accessed."""
+        element = ET.fromstring('<Property name="Label" type="App::PropertyString"/>')
+        prop = FreeCADPropertyXML(element, None)
+        with pytest.raises(ValueError):
+            _ = prop.value
+
+    def test_invalid_value_other_properties(self, shared_datadir: Path,
+                                            tmp_path: Path) -> None:
+        """Test a property with an invalid value only raises when it is
+        accessed, and the other properties of the object still read.
+        """
+        path = tmp_path / "invalid_property.FCStd"
+        with (ZipFile(shared_datadir / "cube_1x1x1.FCStd") as source,
+              ZipFile(path, "w") as target):
+            for info in source.infolist():
+                data = source.read(info)
+                if info.filename == "Document.xml":
+                    start = data.index(b'name="AllowMultiFace"')
+                    end = data.index(b"</Property>", start)
+                    # Remove the Bool element holding the value
+                    data = (data[:start] + data[start:end].replace(b'<Bool value="true"/>', b"")
+                            + data[end:])
+                target.writestr(info, data)
+        with FCStd.from_path(path, use_cache=False) as fcstd:
+            pad = fcstd.document.get_object("Pad")
+            with pytest.raises(ValueError, match="Expected 1 subelement"):
+                _ = pad.get_property("AllowMultiFace").value
+            assert pad.get_property("AlongSketchNormal").value is not None
+
+    def test_not_implemented_type(self) -> None:
+        """Test unknown property types still raise when read."""
+        element = ET.fromstring('<Property name="Label" type="App::NotAType"/>')
+        with pytest.raises(NotImplementedError):
+            FreeCADPropertyXML(element, None)
+
+    def test_private_not_decoded(self) -> None:
+        """Test private properties have no value."""
+        element = ET.fromstring('<_Property name="Label" type="App::PropertyString"/>')
+        assert FreeCADPropertyXML(element, None).value is None
+
+def _make_chain_document(count: int) -> str:
+    """Returns Document.xml text with a chain of objects, each linking to the
+    object before it as its child.
+    """
+    objects = "".join(f'<Object type="App::FeaturePython" name="Obj{i}" id="{i + 10}"/>'
+                      for i in range(count))
+    object_data = []
+    for i in range(count):
+        child = f"Obj{i - 1}" if i > 0 else ""
+        object_data.append(
+            f'<Object name="Obj{i}"><Properties Count="2">'
+            f'<Property name="Label" type="App::PropertyString">'
+            f'<String value="Label{i}"/></Property>'
+            f'<Property name="Base" type="App::PropertyLink">'
+            f'<Link value="{child}"/></Property>'
+            "</Properties></Object>"
+        )
+    return (
+        '<Document SchemaVersion="4" ProgramVersion="1.0" FileVersion="1">'
+        '<Properties Count="1"><Property name="Uid" type="App::PropertyUUID">'
+        '<Uuid value="a3d6e6fb-2a4b-4a5e-9b1e-4f2c8f3a9c11"/></Property></Properties>'
+        f'<Objects Count="{count}">{objects}</Objects>'
+        f'<ObjectData Count="{count}">{"".join(object_data)}</ObjectData>'
+        "</Document>"
+    )
+
+class TestLookups:
+    """Tests for looking up objects, properties, and links in a document."""
+
+    @pytest.fixture(name="chain")
+    def fixture_chain(self) -> FreeCADDocumentXML:
+        return FreeCADDocumentXML.from_string(_make_chain_document(50))
+
+    @pytest.mark.parametrize("id_", ["Obj7", 17, "17"])
+    def test_get_object(self, chain: FreeCADDocumentXML, id_: str | int) -> None:
+        """Test objects are found by name, integer id, and string integer id."""
+        assert chain.get_object(id_).name == "Obj7"
+
+    @pytest.mark.parametrize("id_", ["Obj50", 9, "Missing"])
+    def test_get_object_missing(self, chain: FreeCADDocumentXML, id_: str | int) -> None:
+        """Test missing objects raise a LookupError."""
+        with pytest.raises(LookupError):
+            chain.get_object(id_)
+
+    @pytest.mark.parametrize("id_", ["Obj7", 17, "17"])
+    def test_get_object_info(self, chain: FreeCADDocumentXML, id_: str | int
+                             ) -> None:
+        """Test the Objects list info is found without reading the objects."""
+        info = chain.get_object_info(id_)
+        assert (info.name, info.id_, info.type_) == ("Obj7", "17",
+                                                     "App::FeaturePython")
+        assert len(chain.get_object_info()) == 50
+        with pytest.raises(LookupError):
+            chain.get_object_info("Missing")
+
+    def test_get_property(self, chain: FreeCADDocumentXML) -> None:
+        """Test object properties are found by name."""
+        obj = chain.get_object("Obj3")
+        assert obj.has_property("Label")
+        assert not obj.has_property("Missing")
+        assert obj.get_property("Label").value == "Label3"
+        with pytest.raises(LookupError):
+            obj.get_property("Missing")
+        with pytest.raises(LookupError):
+            chain.get_property("Missing")
+
+    def test_get_object_parents(self, chain: FreeCADDocumentXML) -> None:
+        """Test parents are found from links defined on the parent."""
+        assert chain.get_object_parents("Obj3") == {"Obj4"}
+        assert chain.get_object_parents("Obj49") == set()
+        chain.get_object_parents("Obj3").add("Obj0")
+        assert chain.get_object_parents("Obj3") == {"Obj4"}
+
+    def test_get_topo_order(self, chain: FreeCADDocumentXML) -> None:
+        """Test the children are ordered after their parents."""
+        assert chain.get_topo_order() == [f"Obj{i}" for i in reversed(range(50))]
+
+class TestDocumentCache:
+    """Tests for caching parsed documents on disk."""
+
+    @pytest.fixture(name="cache")
+    def fixture_cache(self, tmp_path: Path,
+                      monkeypatch: pytest.MonkeyPatch) -> DiskCache:
+        cache = DiskCache(tmp_path, max_bytes=2**24)
+        monkeypatch.setattr(xml_cache, "get_document_cache",
+                            lambda enabled=None: None if enabled is False else cache)
+        return cache
+
+    @pytest.mark.parametrize("filename", FCSTD_FILES)
+    def test_cache_hit(self, filename: str, shared_datadir: Path,
+                       cache: DiskCache, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a cached document is read without parsing the xml again."""
+        first = FCStd.from_path(shared_datadir / filename)
+        _ = first.document
+        assert len(cache) == 1
+        def fail_parse(*_args, **_kwargs) -> None:
+            raise AssertionError("Document.xml was parsed again")
+        monkeypatch.setattr(FreeCADDocumentXML, "from_stream", fail_parse)
+        second = FCStd.from_path(shared_datadir / filename)
+        assert second.document.file is second
+        assert _summarize(second.document) == _summarize(first.document)
+        assert second.get_topo_uids() == first.get_topo_uids()
+
+    def test_disabled(self, shared_datadir: Path, cache: DiskCache) -> None:
+        """Test the cache is not used when disabled."""
+        _ = FCStd.from_path(shared_datadir / FCSTD_FILES[0], use_cache=False).document
+        assert len(cache) == 0
+
+    def test_disabled_by_default(self) -> None:
+        """Test the document cache is opt-in through the user config."""
+        assert xml_cache.get_document_cache() is None
+        assert isinstance(xml_cache.get_document_cache(True), DiskCache)
+
+    @pytest.mark.parametrize("stale", ["schema", "unpickleable"])
+    def test_stale_entry_reparsed(self, stale: str, shared_datadir: Path,
+                                  cache: DiskCache,
+                                  monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test cached documents from another schema or that cannot be read
+        are parsed again and replaced.
+        """
+        fcstd = FCStd.from_path(shared_datadir / FCSTD_FILES[0])
+        key = xml_cache.get_cache_key(fcstd)
+        if stale == "schema":
+            with monkeypatch.context() as patch:
+                patch.setattr(xml_cache, "DOCUMENT_CACHE_SCHEMA", 0)
+                cache.put(key, fcstd.document)
+        else:
+            cache.put(key, None)
+            cache._get_path(key).write_bytes(b"not a pickle")
+        parsed = []
+        from_stream = FreeCADDocumentXML.from_stream
+        def count_parse(*args, **kwargs) -> FreeCADDocumentXML:
+            parsed.append(args)
+            return from_stream(*args, **kwargs)
+        monkeypatch.setattr(FreeCADDocumentXML, "from_stream", count_parse)
+        document = FCStd.from_path(shared_datadir / FCSTD_FILES[0]).document
+        assert len(parsed) == 1
+        assert document.file.path == fcstd.path
+        assert cache.get(key)._cache_schema == xml_cache.DOCUMENT_CACHE_SCHEMA
+
+    def test_key_changes_with_content(self, shared_datadir: Path) -> None:
+        """Test files with different Document.xml data have different keys."""
+        keys = set()
+        for filename in FCSTD_FILES:
+            fcstd = FCStd.from_path(shared_datadir / filename)
+            keys.add(xml_cache.get_cache_key(fcstd))
+        assert len(keys) == len(FCSTD_FILES)
+
+class TestUidLookup:
+    """Tests for interned uids and finding file elements by uid."""
+
+    def test_interned(self) -> None:
+        """Test uids created from equal strings are the same parsed object."""
+        uid = FreeCADUID("a3d6e6fb_sketchgeo_5_0_2")
+        assert FreeCADUID("a3d6e6fb_sketchgeo_5_0_2") is uid
+        assert FreeCADUID(uid) is uid
+        assert uid.data.geometry_id == 2
+
+    @pytest.mark.parametrize("filename", FCSTD_FILES)
+    def test_get_by_uid(self, filename: str, shared_datadir: Path) -> None:
+        """Test every object, geometry, and constraint is found by its uid."""
+        fcstd = FCStd.from_path(shared_datadir / filename, use_cache=False)
+        assert fcstd.get_by_uid(str(fcstd.uid)) is fcstd
+        for obj in fcstd.document.objects:
+            assert fcstd.get_by_uid(str(obj.uid)) is obj
+            for name in ["Geometry", "ExternalGeo", "Constraints"]:
+                if not obj.has_property(name):
+                    continue
+                for element in obj.get_property(name).value:
+                    assert fcstd.get_by_uid(str(element.uid)).uid == element.uid
+
+    @pytest.mark.parametrize(
+        "uid_format, message",
+        [
+            ("00000000-0000-0000-0000-000000000000_feature_1", "Document uid"),
+            ("{file}_feature_100000", "No feature id"),
+            ("{file}_sketchgeo_{sketch}_0_100000", "No sketchgeo"),
+        ]
+    )
+    def test_get_by_uid_missing(self, uid_format: str, message: str,
+                                shared_datadir: Path) -> None:
+        """Test missing uids raise a LookupError saying where the search failed."""
+        fcstd = FCStd.from_path(shared_datadir / FCSTD_FILES[0], use_cache=False)
+        sketch = fcstd.document.get_object("Sketch")
+        uid = uid_format.format(file=fcstd.uid.file_uid, sketch=sketch.id_)
+        with pytest.raises(LookupError, match=message):
+            fcstd.get_by_uid(uid)
+
+class TestSelect:
+    """Tests for reading only some of the objects in a file."""
+
+    @pytest.fixture(name="fcstd")
+    def fixture_fcstd(self, shared_datadir: Path) -> FCStd:
+        return FCStd.from_path(shared_datadir / "cube_1x1x1.FCStd", use_cache=False)
+
+    def test_metadata_without_objects(self, fcstd: FCStd) -> None:
+        """Test reading metadata does not read the objects in the file."""
+        assert fcstd.metadata.label == "cube_1x1x1"
+        assert fcstd._document is None
+        assert fcstd._get_header().objects == []
+
+    def test_select_types(self, fcstd: FCStd) -> None:
+        """Test only objects of the selected types are read."""
+        selected = fcstd.select(types={"Sketcher::SketchObject"}, dependencies=False)
+        assert [o.name for o in selected] == ["Sketch"]
+        assert selected[0].document.objects == selected
+        assert fcstd._document is None
+
+    def test_select_dependencies(self, fcstd: FCStd) -> None:
+        """Test the objects linked to by the selected objects are also read."""
+        selected = fcstd.select(names={"Sketch"})
+        assert [o.name for o in selected] == ["XY_Plane", "Sketch"]
+
+    def test_select_read_document(self, fcstd: FCStd) -> None:
+        """Test selecting from an already read document matches reading only the
+        selected objects.
+        """
+        partial = [o.name for o in fcstd.select(types={"PartDesign::Pad"})]
+        _ = fcstd.document
+        assert [o.name for o in fcstd.select(types={"PartDesign::Pad"})] == partial
+
+    def test_select_nothing(self, fcstd: FCStd) -> None:
+        """Test selecting names that are not in the file returns no objects."""
+        assert fcstd.select(names={"Missing"}) == []
+
+    def test_select_dependencies_one_pass(self, fcstd: FCStd, monkeypatch
+                                          ) -> None:
+        """Test the selected objects are read once after their dependencies are
+        found, however deep the dependencies are.
+        """
+        reads = []
+        from_stream = FreeCADDocumentXML.from_stream
+        def counted(source, file=None, select=None):
+            reads.append(select)
+            return from_stream(source, file, select)
+        monkeypatch.setattr(FreeCADDocumentXML, "from_stream", counted)
+        fcstd._get_header()
+        reads.clear()
+        fcstd.select(types={"PartDesign::Pad"})
+        assert len(reads) == 1
+
+    @pytest.mark.parametrize("filename", FCSTD_FILES)
+    def test_link_graph(self, shared_datadir: Path, filename: str) -> None:
+        """Test the streamed link graph matches the links of the read
+        objects.
+        """
+        fcstd = FCStd.from_path(shared_datadir / filename, use_cache=False)
+        streamed = fcstd._get_link_graph()
+        _ = fcstd.document
+        assert streamed == fcstd._get_link_graph()
+
+class TestMemoryMapped:
+    """Tests for reading memory mapped FCStd files."""
+
+    @pytest.fixture(name="stored_path")
+    def fixture_stored_path(self, shared_datadir: Path, tmp_path: Path) -> Path:
+        """Rewrites a sample file with uncompressed members, the way FreeCAD
+        saves files with a compression level of 0.
+        """
+        path = tmp_path / "cube_1x1x1.FCStd"
+        with (ZipFile(shared_datadir / "cube_1x1x1.FCStd") as source,
+              ZipFile(path, "w", ZIP_STORED) as stored):
+            for info in source.infolist():
+                stored.writestr(info.filename, source.read(info))
+        return path
+
+    def test_zero_copy_members(self, stored_path: Path) -> None:
+        """Test stored members are read as memoryviews equal to their data."""
+        fcstd = FCStd.from_path(stored_path, use_cache=False, memory_map=True)
+        with ZipFile(stored_path) as file:
+            expected = file.read("Pad.Shape.brp")
+        data = fcstd.read_member("Pad.Shape.brp")
+        assert isinstance(data, memoryview)
+        assert data == expected
+        data.release()
+
+    def test_matches_file_reads(self, stored_path: Path) -> None:
+        """Test memory mapped files read the same document as normal reads."""
+        mapped = FCStd.from_path(stored_path, use_cache=False, memory_map=True)
+        normal = FCStd.from_path(stored_path, use_cache=False)
+        assert mapped.path == stored_path
+        assert _summarize(mapped.document) == _summarize(normal.document)
+        assert mapped.metadata == normal.metadata
+        mapped.close()
+
+    def test_compressed_members(self, shared_datadir: Path) -> None:
+        """Test compressed members are decompressed into bytes."""
+        fcstd = FCStd.from_path(shared_datadir / "cube_1x1x1.FCStd",
+                                use_cache=False, memory_map=True)
+        assert isinstance(fcstd.read_member("Document.xml"), bytes)
+        assert len(fcstd.document.objects) == 10
+
+    def test_shape_members(self, stored_path: Path) -> None:
+        """Test shape sidecar files are found without reading their data."""
+        fcstd = FCStd.from_path(stored_path, use_cache=False, memory_map=True)
+        shape = fcstd.document.get_object("Pad").get_property("Shape").value
+        members = fcstd.get_shape_members(shape)
+        assert members.brp.name == "Pad.Shape.brp"
+        assert members.txt.name == "Pad.Shape.Map.txt"
+        assert members.brp.is_stored
+        with members.brp.open() as file:
+            assert file.read() == members.brp.read()
+
+    def test_close_releases_views(self, stored_path: Path) -> None:
+        """Test closing releases the memoryviews still held from the map."""
+        with FCStd.from_path(stored_path, use_cache=False,
+                             memory_map=True) as fcstd:
+            data = fcstd.read_member("Pad.Shape.brp")
+        assert fcstd._mapping is None
+        with pytest.raises(ValueError):
+            bytes(data)
+
+    def test_close_exported_buffer(self, stored_path: Path) -> None:
+        """Test the archive is closed when an exported buffer keeps the map
+        open, and the map is closed by closing again once it is deleted.
+        """
+        fcstd = FCStd.from_path(stored_path, use_cache=False, memory_map=True)
+        array = np.frombuffer(fcstd.read_member("Pad.Shape.brp"), np.uint8)
+        with pytest.raises(BufferError):
+            fcstd.close()
+        assert fcstd.archive.fp is None
+        del array
+        fcstd.close()
+        assert fcstd._mapping is None
+
+    def test_invalid_zip_closes_map(self, tmp_path: Path, monkeypatch) -> None:
+        """Test the memory map is closed when the file is not a zip file."""
+        mappings = []
+        class _Mapping(mmap.mmap):
+            def __init__(self, *args, **kwargs):
+                mappings.append(self)
+        monkeypatch.setattr(read_xml.mmap, "mmap", _Mapping)
+        path = tmp_path / "invalid.FCStd"
+        path.write_bytes(b"not a zip file")
+        with pytest.raises(BadZipFile):
+            FCStd.from_path(path, use_cache=False, memory_map=True)
+        assert [m.closed for m in mappings] == [True]
+
+_GEOMETRY_XML = {
+    "Part::GeomPoint": '<GeomPoint X="{0}" Y="{1}" Z="0"/>',
+    "Part::GeomLineSegment": ('<LineSegment StartX="{0}" StartY="{1}" StartZ="0"'
+                              ' EndX="{1}" EndY="{0}" EndZ="0"/>'),
+    "Part::GeomCircle": ('<Circle CenterX="{0}" CenterY="{1}" CenterZ="0"'
+                         ' NormalX="0" NormalY="0" NormalZ="1" AngleXU="-0"'
+                         ' Radius="{2}"/>'),
+    "Part::GeomArcOfCircle": ('<ArcOfCircle CenterX="{0}" CenterY="{1}"'
+                              ' CenterZ="0" NormalX="0" NormalY="0" NormalZ="1"'
+                              ' AngleXU="0" Radius="{2}" StartAngle="0.25"'
+                              ' EndAngle="1.5"/>'),
+}
+
+def _make_geometry_list(types: list[str]) -> ET.Element:
+    """Returns a GeometryList element with one geometry of each type."""
+    geometry = []
+    for i, type_ in enumerate(types, start=1):
+        data = _GEOMETRY_XML.get(type_, "<Unknown/>").format(i, -i, i / 3)
+        geometry.append(
+            f'<Geometry type="{type_}" id="{i}"><GeoExtensions count="1">'
+            f'<GeoExtension type="Sketcher::SketchGeometryExtension" id="{i}"'
+            ' internalGeometryType="0" geometryModeFlags="0" geometryLayer="0"/>'
+            f'</GeoExtensions>{data}<Construction value="{i % 2}"/></Geometry>'
+        )
+    return ET.fromstring(f'<GeometryList count="{len(types)}">'
+                         + "".join(geometry) + "</GeometryList>")
+
+def _summarize_geometry(geometry: list[FreeCADGeometryXML]
+                        ) -> list[tuple]:
+    """Returns a comparable summary of decoded geometry."""
+    return [(g.type_, g.id_, g.is_construction, g.internal_type,
+             g._sketch_ext.geometry_mode_flags, repr(g.geometry))
+            for g in geometry]
+
+class TestGeometryArrays:
+    """Tests for decoding whole geometry lists into arrays."""
+
+    @pytest.mark.parametrize("filename", FCSTD_FILES)
+    def test_matches_element_decode(self, filename: str,
+                                    shared_datadir: Path) -> None:
+        """Test geometry built from the arrays matches decoding each element."""
+        fcstd = FCStd.from_path(shared_datadir / filename)
+        for obj in fcstd.document.objects:
+            for name in ["Geometry", "ExternalGeo"]:
+                if not obj.has_property(name):
+                    continue
+                prop = obj.get_property(name)
+                with ZipFile(shared_datadir / filename) as file:
+                    root = ET.fromstring(file.read("Document.xml"))
+                xpath = (f".//ObjectData/Object[@name='{obj.name}']"
+                         f"/Properties/Property[@name='{name}']/GeometryList")
+                expected = [FreeCADGeometryXML(element, prop)
+                            for element in root.find(xpath)]
+                assert (_summarize_geometry(prop.value)
+                        == _summarize_geometry(expected))
+
+    def test_large_list(self) -> None:
+        """Test a large mixed list keeps each type's rows in list order."""
+        types = list(_GEOMETRY_XML) * 5000
+        arrays = GeometryListArrays.from_element(
+            _make_geometry_list(types)
+        )
+        assert len(arrays) == len(types)
+        assert arrays.ids.tolist() == list(range(1, len(types) + 1))
+        assert arrays.is_construction.tolist() == [bool(i % 2) for i in
+                                                   range(1, len(types) + 1)]
+        lines = arrays.indices["Part::GeomLineSegment"]
+        starts = arrays.get_values("Part::GeomLineSegment", "StartX", "StartY")
+        assert starts.tolist() == [[i + 1, -(i + 1)] for i in lines.tolist()]
+        radii = arrays.get_values("Part::GeomCircle", "Radius")[:, 0]
+        assert radii.tolist() == [
+            (i + 1) / 3 for i in arrays.indices["Part::GeomCircle"].tolist()
+        ]
+
+    def test_unsupported_skipped(self, caplog) -> None:
+        """Test unsupported geometry types are skipped with a warning."""
+        types = ["Part::GeomPoint", "Part::GeomBSplineCurve", "Part::GeomPoint"]
+        arrays = GeometryListArrays.from_element(
+            _make_geometry_list(types)
+        )
+        assert arrays.ids.tolist() == [1, 3]
+        assert "Part::GeomBSplineCurve" in caplog.text
+
+    def test_non_zero_z(self) -> None:
+        """Test geometry out of the sketch plane raises a ValueError."""
+        element = _make_geometry_list(["Part::GeomPoint"])
+        element.find(".//GeomPoint").set("Z", "1.0")
+        with pytest.raises(ValueError):
+            GeometryListArrays.from_element(element)
+
+    def test_not_geometry(self, shared_datadir: Path) -> None:
+        """Test properties that are not geometry lists raise a TypeError."""
+        fcstd = FCStd.from_path(shared_datadir / FCSTD_FILES[0])
+        with pytest.raises(TypeError):
+            fcstd.document.get_property("Uid").get_geometry_arrays()
+
+class TestFingerprints:
+    """Tests for fingerprinting object xml to find changed objects."""
+
+    def test_stable(self, document_xml: bytes) -> None:
+        """Test streaming and full reads give the same fingerprints."""
+        full = FreeCADDocumentXML.from_string(document_xml)
+        streamed = FreeCADDocumentXML.from_stream(BytesIO(document_xml))
+        fingerprints = full.get_fingerprints()
+        assert fingerprints == streamed.get_fingerprints()
+        assert len(set(fingerprints.values())) == len(full.objects)
+
+    def test_formatting_ignored(self) -> None:
+        """Test attribute order and whitespace do not change the fingerprint."""
+        first = ET.fromstring('<Object a="1" b="2"> <Child c="3"/> </Object>')
+        second = ET.fromstring('<Object b="2" a="1"><Child c="3"/></Object>')
+        assert (xml_utils.fingerprint_element(first)
+                == xml_utils.fingerprint_element(second))
+
+    @pytest.mark.parametrize("changed", [
+        '<Object a="1" b="2"><Child c="4"/></Object>',
+        '<Object a="1" b="2"><Child c="3"/><Child c="3"/></Object>',
+        '<Object a="1" b="2"><Child c="3"><Child c="3"/></Child></Object>',
+        '<Object a="1" b="2"><Child c="3">text</Child></Object>',
+    ])
+    def test_content_changed(self, changed: str) -> None:
+        """Test content and structure changes change the fingerprint."""
+        original = ET.fromstring('<Object a="1" b="2"><Child c="3"/></Object>')
+        assert (xml_utils.fingerprint_element(original)
+                != xml_utils.fingerprint_element(ET.fromstring(changed)))
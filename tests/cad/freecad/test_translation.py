@@ -2,11 +2,12 @@
 
 from importlib.util import find_spec
 from pathlib import Path
+from zipfile import ZipFile
 
 import pytest
 
 from pancad.cad.freecad._feature_translation import (
-    new_document_from_part, new_part_from_document
+    new_document_from_part, new_part_from_document, translate_document
 )
 from pancad.cad.freecad.read_xml import FCStd
 
@@ -68,3 +69,40 @@ def test_angle_sweep_sketches(angle_dimension_sweep_part_file, tmp_path):
     document = new_document_from_part(angle_dimension_sweep_part_file)
     document.recompute()
     document.saveAs(str(tmp_path / "angle_sweep.FCStd"))
+
+def _relabel_sketch(source: Path, destination: Path, label: str) -> None:
+    """Copies an FCStd file with the label of its Sketch object changed."""
+    with ZipFile(source) as zin, ZipFile(destination, "w") as zout:
+        for info in zin.infolist():
+            data = zin.read(info)
+            if info.filename == "Document.xml":
+                xml = data.decode()
+                start = xml.index('<Property name="Label"',
+                                  xml.index('<Object name="Sketch"'))
+                start = xml.index('value="', start) + len('value="')
+                end = xml.index('"', start)
+                data = (xml[:start] + label + xml[end:]).encode()
+            zout.writestr(info, data)
+
+def test_translate_document_unchanged(freecad_doc):
+    first = translate_document(FCStd.from_path(freecad_doc))
+    features = dict(first.features)
+    second = translate_document(FCStd.from_path(freecad_doc), first)
+    assert second.part is first.part
+    assert all(second.features[uid] is feature
+               for uid, feature in features.items())
+
+def test_translate_document_changed_sketch(shared_datadir, tmp_path):
+    path = shared_datadir / "cube_1x1x1.FCStd"
+    changed = tmp_path / "cube_1x1x1.FCStd"
+    _relabel_sketch(path, changed, "Relabeled")
+    first = translate_document(FCStd.from_path(path))
+    old_sketch = first.part.container.feature_system.features[0]
+    second = translate_document(FCStd.from_path(changed), first)
+    expected = new_part_from_document(FCStd.from_path(changed))
+    features = second.part.container.feature_system.features
+    assert old_sketch not in list(features)
+    assert [f.name for f in features] == [
+        f.name for f in expected.container.feature_system.features
+    ]
+    assert "Relabeled" in [f.name for f in features]
@@ -0,0 +1,115 @@
+"""Tests for the map recording what translations created from each uid."""
+from __future__ import annotations
+
+import pytest
+
+from pancad.cad.freecad.translation_map import TranslationMap
+
+class Thing:
+    """A value that compares equal to every other Thing, like geometry that
+    is at the same location.
+    """
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Thing)
+
+    __hash__ = None
+
+@pytest.fixture(name="things")
+def fixture_things() -> list[Thing]:
+    return [Thing() for _ in range(3)]
+
+@pytest.fixture(name="uid_map")
+def fixture_uid_map(things: list[Thing]) -> TranslationMap[str, Thing]:
+    uid_map = TranslationMap()
+    uid_map.add("body", things[0], "PartDesign::Body")
+    uid_map.add("x", things[1])
+    uid_map.add("y", things[1])
+    return uid_map
+
+class TestLookups:
+    """Tests for forward, reverse and type lookups."""
+
+    def test_forward(self, uid_map: TranslationMap, things: list[Thing]):
+        assert uid_map["body"] is things[0]
+        assert list(uid_map) == ["body", "x", "y"]
+        assert len(uid_map) == 3
+
+    def test_reverse(self, uid_map: TranslationMap, things: list[Thing]):
+        assert uid_map.get_keys(things[1]) == ["x", "y"]
+        assert uid_map.get_keys(things[2]) == []
+
+    def test_reverse_by_identity(self, uid_map: TranslationMap):
+        """Test equal but different values are not found by reverse lookup."""
+        assert uid_map.get_keys(Thing()) == []
+
+    def test_types(self, uid_map: TranslationMap):
+        assert uid_map.get_typed_keys("PartDesign::Body") == ["body"]
+        assert uid_map.get_typed_keys("App::Origin") == []
+        assert uid_map.get_type("body") == "PartDesign::Body"
+        assert uid_map.get_type("x") is None
+
+    def test_replace(self, uid_map: TranslationMap, things: list[Thing]):
+        uid_map["x"] = things[2]
+        assert list(uid_map) == ["body", "x", "y"]
+        assert uid_map.get_keys(things[1]) == ["y"]
+        assert uid_map.get_keys(things[2]) == ["x"]
+
+    def test_delete(self, uid_map: TranslationMap, things: list[Thing]):
+        del uid_map["body"]
+        assert "body" not in uid_map
+        assert uid_map.get_keys(things[0]) == []
+        assert uid_map.get_typed_keys("PartDesign::Body") == []
+        with pytest.raises(KeyError):
+            del uid_map["body"]
+
+class TestSavepoints:
+    """Tests for undoing changes without copying the map."""
+
+    def test_rollback(self, uid_map: TranslationMap, things: list[Thing]):
+        uid_map.savepoint()
+        uid_map.add("sketch", things[2], "Sketcher::SketchObject")
+        uid_map["x"] = things[2]
+        del uid_map["body"]
+        uid_map.rollback()
+        assert set(uid_map) == {"body", "x", "y"}
+        assert uid_map["x"] is things[1]
+        assert uid_map.get_keys(things[2]) == []
+        assert uid_map.get_typed_keys("PartDesign::Body") == ["body"]
+        assert uid_map.get_typed_keys("Sketcher::SketchObject") == []
+
+    def test_nested(self, uid_map: TranslationMap, things: list[Thing]):
+        uid_map.savepoint()
+        uid_map["a"] = things[2]
+        uid_map.savepoint()
+        uid_map["b"] = things[2]
+        uid_map.rollback()
+        assert uid_map.get_keys(things[2]) == ["a"]
+        uid_map.savepoint()
+        uid_map["c"] = things[2]
+        uid_map.release()
+        uid_map.rollback()
+        assert "a" not in uid_map and "c" not in uid_map
+
+    def test_transaction(self, uid_map: TranslationMap, things: list[Thing]):
+        with pytest.raises(ValueError):
+            with uid_map.transaction():
+                uid_map["a"] = things[2]
+                raise ValueError
+        assert "a" not in uid_map
+        with uid_map.transaction():
+            uid_map["a"] = things[2]
+        assert "a" in uid_map
+
+    def test_added_keys(self, uid_map: TranslationMap, things: list[Thing]):
+        with uid_map.transaction():
+            uid_map["a"] = things[2]
+            uid_map["x"] = things[2]
+            uid_map["b"] = things[2]
+            del uid_map["b"]
+            assert uid_map.get_added_keys() == ["a"]
+
+    def test_no_savepoint(self, uid_map: TranslationMap):
+        with pytest.raises(RuntimeError):
+            uid_map.rollback()
+        with pytest.raises(RuntimeError):
+            uid_map.release()
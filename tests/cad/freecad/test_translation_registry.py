@@ -0,0 +1,107 @@
+"""Tests for the tables FreeCAD translation dispatches through."""
+from __future__ import annotations
+
+import pytest
+
+from pancad.cad.freecad.constants import ConstraintType as CT
+from pancad.cad.freecad.translation_registry import (
+    CONSTRAINT_TRANSLATORS,
+    TranslatorRegistry,
+    get_translation_stats,
+    reset_translation_stats,
+)
+
+def _default(value: str) -> str:
+    return f"default {value}"
+
+def _custom(value: str) -> str:
+    return f"custom {value}"
+
+@pytest.fixture(name="registry")
+def fixture_registry() -> TranslatorRegistry:
+    registry = TranslatorRegistry("Object translation")
+    registry.register("PartDesign::Pad", default=True)(_default)
+    return registry
+
+class TestRegister:
+
+    def test_translate(self, registry: TranslatorRegistry):
+        assert registry.translate("PartDesign::Pad", "pad") == "default pad"
+
+    def test_register_new_type(self, registry: TranslatorRegistry):
+        @registry.register("PartDesign::Pocket", "PartDesign::Revolution")
+        def translate(value):
+            return f"new {value}"
+        assert registry.translate("PartDesign::Revolution", "a") == "new a"
+        assert list(registry) == ["PartDesign::Pad", "PartDesign::Pocket",
+                                  "PartDesign::Revolution"]
+
+    def test_replaces_default(self, registry: TranslatorRegistry):
+        registry.add("PartDesign::Pad", _custom)
+        assert registry.get("PartDesign::Pad") is _custom
+
+    def test_default_does_not_replace(self):
+        """Test registering a default after a custom translator, like when a
+        third party registers before pancad's translators are imported.
+        """
+        registry = TranslatorRegistry("Object translation")
+        registry.add("PartDesign::Pad", _custom)
+        registry.add("PartDesign::Pad", _default, default=True)
+        assert registry.get("PartDesign::Pad") is _custom
+
+    def test_duplicate(self, registry: TranslatorRegistry):
+        registry.add("PartDesign::Pad", _custom)
+        with pytest.raises(ValueError):
+            registry.add("PartDesign::Pad", _default)
+        registry.add("PartDesign::Pad", _default, replace=True)
+        assert registry.get("PartDesign::Pad") is _default
+
+    def test_remove(self, registry: TranslatorRegistry):
+        registry.remove("PartDesign::Pad")
+        assert "PartDesign::Pad" not in registry
+        with pytest.raises(KeyError):
+            registry.remove("PartDesign::Pad")
+
+    @pytest.mark.parametrize("key, name", [
+        ("PartDesign::Pocket", "PartDesign::Pocket"),
+        (CT.SYMMETRIC, "SYMMETRIC"),
+    ])
+    def test_unsupported(self, registry: TranslatorRegistry, key, name):
+        with pytest.raises(NotImplementedError, match=f"for {name} is not"):
+            registry.translate(key, "value")
+
+class TestStats:
+
+    def test_counts(self, registry: TranslatorRegistry):
+        for _ in range(3):
+            registry.translate("PartDesign::Pad", "pad")
+        stats = registry.get_stats()
+        assert stats["PartDesign::Pad"].count == 3
+        assert stats["PartDesign::Pad"].seconds >= 0
+
+    def test_failed_translation_counted(self, registry: TranslatorRegistry):
+        registry.add("PartDesign::Pocket", lambda value: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            registry.translate("PartDesign::Pocket", "pocket")
+        assert registry.get_stats()["PartDesign::Pocket"].count == 1
+
+    def test_reset(self, registry: TranslatorRegistry):
+        registry.translate("PartDesign::Pad", "pad")
+        stats = registry.get_stats()
+        registry.reset_stats()
+        assert not registry.get_stats()
+        assert stats["PartDesign::Pad"].count == 1
+
+    def test_module_stats(self):
+        reset_translation_stats()
+        CONSTRAINT_TRANSLATORS.add(CT.SYMMETRIC, _custom)
+        try:
+            CONSTRAINT_TRANSLATORS.translate(CT.SYMMETRIC, "symmetric")
+            stats = get_translation_stats()
+        finally:
+            CONSTRAINT_TRANSLATORS.remove(CT.SYMMETRIC)
+            reset_translation_stats()
+        assert stats["Constraint translation"][CT.SYMMETRIC].count == 1
+        assert set(stats) == {"Object translation",
+                              "Sketch geometry translation",
+                              "Constraint translation"}
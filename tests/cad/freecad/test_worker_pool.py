@@ -0,0 +1,96 @@
+"""Tests for the persistent FreeCAD worker pool. A regular Python executable and
+a stand-in script replace FreeCAD's Python and error_detection.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+from pancad.cad.freecad import worker_pool
+from pancad.cad.freecad.worker_pool import FreeCADWorkerPool
+from pancad.exceptions import FreeCADWorkerError, FreeCADWorkerCrashedError
+
+@pytest.fixture(name="stand_in")
+def fixture_stand_in(shared_datadir: Path) -> Path:
+    return shared_datadir / "worker_stand_in.py"
+
+@pytest.fixture(name="pool")
+def fixture_pool() -> FreeCADWorkerPool:
+    with FreeCADWorkerPool(1, sys.executable, startup_timeout=30) as pool:
+        yield pool
+
+class TestWorkerPool:
+    """Tests for calling functions in the pool's workers."""
+
+    def test_call(self, pool: FreeCADWorkerPool, stand_in: Path):
+        assert pool.call(stand_in, "echo", 1, "a", [2.5]) == [1, "a", [2.5]]
+
+    def test_workers_reused(self, pool: FreeCADWorkerPool, stand_in: Path):
+        assert pool.call(stand_in, "pid") == pool.call(stand_in, "pid")
+
+    def test_function_error(self, pool: FreeCADWorkerPool, stand_in: Path):
+        with pytest.raises(FreeCADWorkerError, match="ValueError: bad file"):
+            pool.call(stand_in, "fail", "bad file")
+        assert pool.call(stand_in, "echo", 1) == [1]
+
+    def test_unserializable_result(self, pool: FreeCADWorkerPool,
+                                   stand_in: Path):
+        with pytest.raises(FreeCADWorkerError):
+            pool.call(stand_in, "unserializable")
+
+    def test_stdout_noise(self, pool: FreeCADWorkerPool, stand_in: Path):
+        """Test printing in the worker does not corrupt the responses."""
+        assert pool.call(stand_in, "noisy", {"a": 1}) == {"a": 1}
+
+    def test_restart_after_crash(self, pool: FreeCADWorkerPool,
+                                 stand_in: Path):
+        first = pool.call(stand_in, "pid")
+        with pytest.raises(FreeCADWorkerCrashedError):
+            pool.call(stand_in, "crash")
+        assert pool.call(stand_in, "pid") != first
+
+    def test_timeout(self, pool: FreeCADWorkerPool, stand_in: Path):
+        first = pool.call(stand_in, "pid")
+        with pytest.raises(TimeoutError):
+            pool.call(stand_in, "sleep", 10, timeout=0.2)
+        assert pool.call(stand_in, "sleep", 0) != first
+
+    def test_check_health(self, pool: FreeCADWorkerPool, stand_in: Path):
+        assert pool.check_health() == 0
+        worker, = pool._workers
+        worker.process.kill()
+        worker.process.wait()
+        assert pool.check_health() == 1
+        assert pool.call(stand_in, "echo", 1) == [1]
+
+    def test_submit_parallel(self, stand_in: Path):
+        with FreeCADWorkerPool(2, sys.executable) as pool:
+            futures = [pool.submit(stand_in, "sleep", 0.2) for _ in range(4)]
+            pids = {future.result() for future in futures}
+        assert len(pids) == 2
+
+    def test_close(self):
+        pool = FreeCADWorkerPool(2, sys.executable).start()
+        processes = [worker.process for worker in pool._workers]
+        pool.close()
+        assert all(process.poll() is not None for process in processes)
+
+    def test_reader_start_failure(self, monkeypatch):
+        """Test a worker process is killed when its reader thread cannot be
+        started.
+        """
+        processes = []
+        original_popen = worker_pool.Popen
+        def popen(*args, **kwargs):
+            processes.append(original_popen(*args, **kwargs))
+            return processes[-1]
+        def start(_):
+            raise RuntimeError("can't start new thread")
+        monkeypatch.setattr(worker_pool, "Popen", popen)
+        monkeypatch.setattr(worker_pool.threading.Thread, "start", start)
+        with pytest.raises(RuntimeError):
+            worker_pool._Worker([sys.executable, "-c",
+                                 "import time; time.sleep(30)"])
+        assert [process.poll() is not None for process in processes] == [True]
@@ -0,0 +1,160 @@
+"""Tests for writing FreeCAD FCStd files directly as xml."""
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from pancad.cad.freecad import write_xml
+from pancad.cad.freecad.read_xml import FCStd
+from pancad.constants import ConstraintReference as CR
+from pancad.constraints.state_constraint import AlignAxes
+from pancad.filetypes.part_file import PartFile
+from pancad.geometry.feature_container import FeatureContainer
+
+from tests.testing_utils import sketch_gen
+
+def _write(part: PartFile, tmp_path: Path) -> FCStd:
+    """Writes the part and returns the file read back."""
+    path = tmp_path / "written.FCStd"
+    write_xml.write_fcstd(part, path)
+    return FCStd.from_path(path)
+
+def _add_square_sketch(container: FeatureContainer) -> None:
+    """Adds a square sketch aligned to the container's coordinate system."""
+    sketch = sketch_gen.square()
+    system = container.feature_system
+    system.features.append(sketch)
+    system.constraints.append(AlignAxes(system.coordinate_system,
+                                        sketch.pose.coordinate_system))
+
+def _get_objects(fcstd: FCStd, type_: str) -> list:
+    return [obj for obj in fcstd.document.objects if obj.type_ == type_]
+
+class TestWriteFCStd:
+    """Tests for the structure of the written files."""
+
+    def test_only_document_xml(self, cube_part_file: PartFile, tmp_path: Path):
+        path = tmp_path / "cube.FCStd"
+        write_xml.write_fcstd(cube_part_file, path)
+        with ZipFile(path) as file:
+            assert file.namelist() == ["Document.xml"]
+
+    def test_same_objects_as_freecad(self, cube_part_file: PartFile,
+                                     tmp_path: Path, shared_datadir: Path):
+        """Test a written cube has the same object types as one saved by
+        FreeCAD.
+        """
+        written = _write(cube_part_file, tmp_path)
+        saved = FCStd.from_path(shared_datadir / "cube_1x1x1.FCStd")
+        assert (Counter(obj.type_ for obj in written.document.objects)
+                == Counter(obj.type_ for obj in saved.document.objects))
+
+    def test_metadata(self, cube_part_file: PartFile, tmp_path: Path):
+        metadata = _write(cube_part_file, tmp_path).metadata
+        assert metadata.label == cube_part_file.name
+        assert metadata.unit_system == write_xml.UNIT_SYSTEMS[0]
+
+    def test_body_links(self, cube_part_file: PartFile, tmp_path: Path):
+        fcstd = _write(cube_part_file, tmp_path)
+        body, = _get_objects(fcstd, "PartDesign::Body")
+        assert body.get_property("Label").value == cube_part_file.container.name
+        group = [link.name for link in body.get_property("Group").value]
+        assert group == ["Sketch", "Pad"]
+        assert body.get_property("Tip").value.name == "Pad"
+
+    def test_pad(self, cube_part_file: PartFile, tmp_path: Path):
+        pad, = _get_objects(_write(cube_part_file, tmp_path), "PartDesign::Pad")
+        profile, = pad.get_property("Profile").value
+        assert profile.name == "Sketch" and profile.sub is None
+        assert pad.get_property("Length").value == 1
+        assert pad.get_property("Type").value == 0
+        assert not pad.get_property("Reversed").value
+
+    def test_sketch_support(self, square_sketch_part_file: PartFile,
+                            tmp_path: Path):
+        fcstd = _write(square_sketch_part_file, tmp_path)
+        sketch, = _get_objects(fcstd, "Sketcher::SketchObject")
+        support, = sketch.get_property("AttachmentSupport").value
+        assert support.name == "XY_Plane"
+
+    def test_second_body_sketch_support(self, tmp_path: Path):
+        """Test a sketch in a nested body is supported by that body's XY plane,
+        which is renamed to keep object names unique.
+        """
+        part = PartFile("TwoBodyTest")
+        inner = FeatureContainer(name="InnerBody")
+        for container in (part.container, inner):
+            _add_square_sketch(container)
+        part.container.feature_system.features.append(inner)
+        fcstd = _write(part, tmp_path)
+        supports = [sketch.get_property("AttachmentSupport").value[0].name
+                    for sketch in _get_objects(fcstd, "Sketcher::SketchObject")]
+        assert supports == ["XY_Plane", "XY_Plane001"]
+
+    def test_non_plane_sketch_support(self,
+                                      square_sketch_part_file: PartFile,
+                                      monkeypatch: pytest.MonkeyPatch):
+        """Test a sketch supported by something other than an origin plane
+        raises a clear error.
+        """
+        system = square_sketch_part_file.container.feature_system
+        sketch = system.features[0]
+        monkeypatch.setattr(sketch, "get_support",
+                            lambda: system.children[CR.X])
+        with pytest.raises(NotImplementedError, match="not an origin plane"):
+            write_xml.document_xml_from_part(square_sketch_part_file)
+
+    @pytest.mark.parametrize(
+        "part_fixture",
+        ["square_sketch_part_file", "cube_part_file", "cylinder_part_file",
+         "rounded_edge_cube_part_file"]
+    )
+    def test_sketch_contents(self, part_fixture: str, tmp_path: Path,
+                             request: pytest.FixtureRequest):
+        part = request.getfixturevalue(part_fixture)
+        pc_sketch = next(f for f in part.container.feature_system.features
+                         if hasattr(f, "geometry_system"))
+        sketch, = _get_objects(_write(part, tmp_path),
+                               "Sketcher::SketchObject")
+        geometry = sketch.get_property("Geometry").value
+        constraints = sketch.get_property("Constraints").value
+        assert len(geometry) == len(pc_sketch.geometry_system.geometry)
+        assert len(constraints) == len(pc_sketch.geometry_system.constraints)
+
+    def test_ellipse_not_implemented(self, ellipse_part_file: PartFile,
+                                     tmp_path: Path):
+        with pytest.raises(NotImplementedError):
+            write_xml.write_fcstd(ellipse_part_file, tmp_path / "e.FCStd")
+
+    def test_square_constraints(self, square_sketch_part_file: PartFile,
+                                tmp_path: Path):
+        """Test the written constraints are in the same order with the
+        equivalent FreeCAD types.
+        """
+        pc_sketch, = square_sketch_part_file.container.feature_system.features
+        expected = [write_xml.get_constraint_type_from_pancad(c)
+                    for c in pc_sketch.geometry_system.constraints]
+        fcstd = _write(square_sketch_part_file, tmp_path)
+        sketch, = _get_objects(fcstd, "Sketcher::SketchObject")
+        constraints = sketch.get_property("Constraints").value
+        assert [c.type_ for c in constraints] == expected
+
+class TestUnits:
+    """Tests for converting pancad values to FreeCAD's stored units."""
+
+    @pytest.mark.parametrize("value, unit, expected", [
+        (1, "mm", 1),
+        (1, None, 1),
+        (1, "in", 25.4),
+        (2, "cm", 20),
+    ])
+    def test_to_millimeters(self, value: float, unit: str, expected: float):
+        assert write_xml.to_millimeters(value, unit) == pytest.approx(expected)
+
+    def test_unknown_unit(self):
+        with pytest.raises(ValueError):
+            write_xml.to_millimeters(1, "furlong")
+
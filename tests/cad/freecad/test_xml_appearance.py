@@ -0,0 +1,137 @@
+"""Tests for reading FreeCAD appearance files."""
+from __future__ import annotations
+
+from pathlib import Path
+from zipfile import ZIP_STORED, ZipFile
+import struct
+
+import numpy as np
+import pytest
+
+from pancad.cad.freecad.read_xml import FCStd
+from pancad.cad.freecad.xml_appearance import (
+    ShapeAppearance,
+    read_color_array,
+    read_shape_appearance,
+    read_string_hasher,
+)
+
+def _pack_color(red: int, green: int, blue: int, fourth: int) -> int:
+    return red << 24 | green << 16 | blue << 8 | fourth
+
+def _material_list(diffuse: list[tuple[int, ...]], uuid: str="") -> bytes:
+    """Returns MaterialList file data with a material per diffuse color."""
+    data = struct.pack("<I", len(diffuse))
+    for color in diffuse:
+        data += struct.pack("<4I2f", _pack_color(85, 85, 85, 255),
+                            _pack_color(*color), _pack_color(136, 136, 136, 0),
+                            0, 0.5, 0.25)
+    for _ in diffuse:
+        data += struct.pack("<II", 0, 0)
+        data += struct.pack("<I", len(uuid)) + uuid.encode()
+    return data
+
+@pytest.fixture(name="fcstd")
+def fixture_fcstd(shared_datadir: Path) -> FCStd:
+    fcstd = FCStd.from_path(shared_datadir / "cube_1x1x1.FCStd", use_cache=False)
+    yield fcstd
+    fcstd.close()
+
+class TestShapeAppearance:
+
+    def test_per_face(self):
+        colors = [(255, 0, 0, 255), (0, 255, 0, 255), (0, 0, 255, 128)]
+        appearance = read_shape_appearance(_material_list(colors, "abc"))
+        assert len(appearance) == 3
+        np.testing.assert_array_equal(appearance.diffuse, colors)
+        np.testing.assert_array_equal(appearance.ambient,
+                                      [[85, 85, 85, 255]] * 3)
+        np.testing.assert_array_equal(appearance.shininess, [0.5] * 3)
+        np.testing.assert_array_equal(appearance.transparency, [0.25] * 3)
+        assert appearance.uuids == ("abc", "abc", "abc")
+        assert appearance.images == ("", "", "")
+
+    def test_without_strings(self):
+        """Test older files that end after the material records."""
+        data = _material_list([(1, 2, 3, 4)])[:4 + 24]
+        assert read_shape_appearance(data).uuids == ("",)
+
+    @pytest.mark.parametrize("size", [2, 20, 4 + 24 + 6])
+    def test_truncated(self, size: int):
+        with pytest.raises(ValueError):
+            read_shape_appearance(_material_list([(1, 2, 3, 4)], "abc")[:size])
+
+class TestColorArray:
+
+    def test_read(self):
+        colors = [(25, 25, 25, 0), (255, 128, 0, 255)]
+        data = struct.pack("<3I", 2, *(_pack_color(*c) for c in colors))
+        result = read_color_array(data)
+        assert result.dtype == np.uint8
+        np.testing.assert_array_equal(result, colors)
+
+    def test_wrong_size(self):
+        with pytest.raises(ValueError):
+            read_color_array(struct.pack("<2I", 2, 0))
+
+class TestStringHasher:
+
+    def test_read(self):
+        data = b"StringTableStart v1 3\n-1.0 0:g\n-1.c.1 g10v1\n-5.2c.5.d\n"
+        entries = read_string_hasher(data)
+        assert [e.id_ for e in entries] == [1, 2, 7]
+        assert entries[1].flags == 0xc
+        assert entries[2].sids == (5, 0xd)
+        assert [e.data for e in entries] == ["0:g", "g10v1", ""]
+
+    @pytest.mark.parametrize("data", [
+        b"StringTable v1 1\n-1.0 g\n",
+        b"StringTableStart v1 2\n-1.0 g\n",
+        b"StringTableStart v1 1\n-x.0 g\n",
+    ])
+    def test_invalid(self, data: bytes):
+        with pytest.raises(ValueError):
+            read_string_hasher(data)
+
+class TestFCStdAppearance:
+
+    def test_get_appearance(self, fcstd: FCStd):
+        appearance = fcstd.get_appearance()
+        assert set(appearance["Pad"]) == {"ShapeAppearance", "LineColorArray",
+                                          "PointColorArray"}
+        shape = appearance["Pad"]["ShapeAppearance"].read()
+        assert isinstance(shape, ShapeAppearance)
+        np.testing.assert_array_equal(shape.diffuse, [[204, 204, 230, 255]])
+        assert shape.uuids == ("7f9fd73b-50c9-41d8-b7b2-575a030c1eeb",)
+        line_colors = appearance["Body"]["LineColorArray"].read()
+        np.testing.assert_array_equal(line_colors, [[25, 25, 25, 0]])
+        assert "Origin" not in appearance
+
+    def test_memory_mapped(self, shared_datadir: Path, tmp_path: Path):
+        """Test appearance files read from a memory map do not keep views of
+        the map open.
+        """
+        path = tmp_path / "stored.FCStd"
+        with (ZipFile(shared_datadir / "cube_1x1x1.FCStd") as source,
+              ZipFile(path, "w", ZIP_STORED) as stored):
+            for info in source.infolist():
+                stored.writestr(info.filename, source.read(info))
+        fcstd = FCStd.from_path(path, use_cache=False, memory_map=True)
+        shape = fcstd.get_appearance()["Pad"]["ShapeAppearance"].read()
+        fcstd.close()
+        np.testing.assert_array_equal(shape.diffuse, [[204, 204, 230, 255]])
+
+    def test_string_table(self, fcstd: FCStd):
+        table = fcstd.get_string_table()
+        assert len(table) == 17
+        assert table[0].data == "0:;SKT;:Ha72,E"
+
+    def test_missing_files(self, shared_datadir: Path, tmp_path: Path):
+        path = tmp_path / "document_only.FCStd"
+        with (ZipFile(shared_datadir / "cube_1x1x1.FCStd") as source,
+              ZipFile(path, "w") as target):
+            target.writestr("Document.xml", source.read("Document.xml"))
+        fcstd = FCStd.from_path(path, use_cache=False)
+        assert not fcstd.get_appearance()
+        assert fcstd.get_string_table() is None
+        fcstd.close()
@@ -0,0 +1,95 @@
+"""Tests for checking FreeCAD files for errors without FreeCAD. The expected
+reports match what error_detection reports with FreeCAD for the same files.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pancad import cli
+from pancad.cad.freecad.error_detection import ErrorCategory
+from pancad.cad.freecad.xml_validation import (
+    check_fcstd, check_fcstd_many, validate_fcstd
+)
+
+VALID_FILES = [
+    "cube_1x1x1.FCStd",
+    "cube_1x1x1_PointOnObject.FCStd",
+    "one_of_each_sketch_geometry.FCStd",
+]
+
+class TestCheckFCStd:
+    """Tests for the reports of the headless checks."""
+
+    def test_invalid_sketches(self, shared_datadir: Path):
+        report = check_fcstd(shared_datadir / "invalid_sketches.FCStd")
+        assert report[ErrorCategory.DETACHED] == ["622: unattached"]
+        assert len(report[ErrorCategory.UNCONSTRAINED]) == 5
+        assert report[ErrorCategory.ERROR] == {
+            "624: redundant": "Redundant constraints: 1",
+            "625: malformed": "Conflicting constraints: 1",
+            "626: solver_error": "Conflicting constraints: 2",
+            "627: conflicting": "Conflicting constraints: 5",
+        }
+
+    def test_invalid_pads(self, shared_datadir: Path):
+        report = check_fcstd(shared_datadir / "invalid_pads.FCStd")
+        assert report[ErrorCategory.UNCONSTRAINED] == [
+            "4271: incomplete_rectangle"
+        ]
+        assert report[ErrorCategory.ERROR] == {
+            "4272: Pad": "Profile is not closed"
+        }
+
+    @pytest.mark.parametrize("filename", VALID_FILES)
+    def test_valid(self, shared_datadir: Path, filename: str):
+        assert check_fcstd(shared_datadir / filename) == {}
+
+    def test_validate(self, shared_datadir: Path):
+        validate_fcstd(shared_datadir / "cube_1x1x1.FCStd",
+                       unconstrained_error=True)
+        with pytest.raises(ValueError):
+            validate_fcstd(shared_datadir / "invalid_pads.FCStd")
+
+class TestCheckFCStdMany:
+    """Tests for checking batches of files."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_order(self, shared_datadir: Path, workers: int):
+        paths = [shared_datadir / "missing.FCStd",
+                 *sorted(shared_datadir.glob("*.FCStd"))]
+        calls = []
+        results = check_fcstd_many(paths, workers,
+                                   progress=lambda *args: calls.append(args))
+        assert [result.path for result in results] == paths
+        assert not results[0].ok and not results[0].is_valid()
+        assert [result.is_valid() for result in results[1:]] == [
+            path.name in VALID_FILES for path in paths[1:]
+        ]
+        assert sorted(done for done, _, _ in calls) == list(
+            range(1, len(paths) + 1)
+        )
+
+    def test_unconstrained_error(self, shared_datadir: Path):
+        result, = check_fcstd_many([shared_datadir / "invalid_sketches.FCStd"],
+                                   1)
+        result.report.pop(ErrorCategory.ERROR)
+        result.report.pop(ErrorCategory.DETACHED)
+        assert result.is_valid()
+        assert not result.is_valid(unconstrained_error=True)
+
+class TestValidateCLI:
+    """Tests for the pancad validate command."""
+
+    def test_valid(self, shared_datadir: Path, capsys: pytest.CaptureFixture):
+        paths = [str(shared_datadir / name) for name in VALID_FILES]
+        assert cli.main(["validate", *paths, "-j", "1"]) == 0
+        assert "Checked 3 files, 0 invalid" in capsys.readouterr().err
+
+    def test_invalid(self, shared_datadir: Path,
+                     capsys: pytest.CaptureFixture):
+        assert cli.main(["validate", str(shared_datadir), "-q"]) == 1
+        err = capsys.readouterr().err
+        assert "invalid_pads.FCStd: INVALID" in err
+        assert "cube_1x1x1.FCStd" not in err
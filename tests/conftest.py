@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import math
 import os
+import shutil
+import tempfile
 from functools import cache
 from typing import TYPE_CHECKING
 import tomllib
@@ -20,7 +22,7 @@ from pancad.filetypes.part_file import PartFile
 from pancad.constraints.state_constraint import AlignAxes
 from pancad.constants import FeatureType as FT
 from pancad.geometry.extrude import Extrude, ExtrudeSettings
-from pancad.utils import trigonometry as trig, quat
+from pancad.utils import initialize, trigonometry as trig, quat
 
 from tests.testing_utils import sketch_gen
 
@@ -31,6 +33,27 @@ if TYPE_CHECKING:
     from pancad.utils.pancad_types import SpaceVector
     from tests._typing import GeometrySampleData, SampleTestGroup, ChangeTestGroup
 
+_USER_DIR_PATCH = pytest.MonkeyPatch()
+
+def pytest_configure() -> None:
+    """Points the pancad user directory to a temporary directory before any test module is
+    imported, so tests never read or write the real user config and caches.
+    """
+    user_dir = Path(tempfile.mkdtemp(prefix="pancad_user_")) / "pancad"
+    _USER_DIR_PATCH.setattr(initialize, "get_user_config_dir", lambda: user_dir)
+    _clear_user_path_caches()
+
+def pytest_unconfigure() -> None:
+    """Deletes the temporary user directory and restores the pancad user directory."""
+    shutil.rmtree(initialize.get_user_config_dir().parent, ignore_errors=True)
+    _USER_DIR_PATCH.undo()
+    _clear_user_path_caches()
+
+def _clear_user_path_caches() -> None:
+    # The cached user paths are derived from the user directory
+    initialize.get_cache_path.cache_clear()
+    initialize.get_document_cache_dir.cache_clear()
+
 @cache
 def read_test_data_file(path: Path) -> dict[str, Any]:
     """Returns the data from the test's toml file."""
@@ -86,6 +86,39 @@ class TestPointInitialization:
         np.testing.assert_array_equal(point.vector(True),
                                       np.array(coordinate).reshape(len(coordinate), 1))
 
+class TestPointFastConstruction:
+    """Tests for the internal trusted construction path and array factories."""
+    # pylint: disable=protected-access
+
+    @pytest.mark.parametrize("coordinate", [(0.0, 1.5), (1.0, 2.0, 3.0)])
+    def test_from_trusted(self, coordinate: SpaceVector) -> None:
+        """Test a trusted Point matches one made through the validating init."""
+        point = Point._from_trusted(*coordinate, uid="trusted")
+        assert point.cartesian == coordinate
+        assert point.uid == "trusted"
+        assert point.is_equal(Point(coordinate))
+        assert point.parent is None
+
+    def test_set_trusted(self) -> None:
+        """Test a Point's location can be overwritten in place."""
+        point = Point(1, 2)
+        point._set_trusted(3.0, 4.0)
+        assert point.cartesian == (3.0, 4.0)
+
+    def test_from_array(self) -> None:
+        """Test a Point is made for every row of an array."""
+        points = Point.from_array(np.arange(6).reshape(3, 2))
+        assert [point.cartesian for point in points] == [(0, 1), (2, 3), (4, 5)]
+        values = [value for point in points for value in point]
+        assert all(isinstance(value, float) and not isinstance(value, np.floating)
+                   for value in values), "Coordinates should be python floats"
+
+    @pytest.mark.parametrize("shape", [(4,), (2, 4), (2, 3, 1)])
+    def test_from_array_shape_error(self, shape: tuple[int, ...]) -> None:
+        """Test arrays that are not (n, 2) or (n, 3) are rejected."""
+        with pytest.raises(ValueError):
+            Point.from_array(np.zeros(shape))
+
 @pytest.mark.parametrize("polar_coordinate", [(1, 0), (1, 45)])
 class TestPolarPointInitialization:
     """Tests for how Point handles being initialized by a polar vector."""
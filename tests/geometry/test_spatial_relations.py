@@ -5,7 +5,11 @@ from math import radians, degrees
 import os
 import unittest
 
+import numpy as np
+
 from pancad.geometry import spatial_relations
+from pancad.geometry.circle import Circle
+from pancad.geometry.circular_arc import CircularArc
 from pancad.geometry.point import Point
 from pancad.geometry.line import Line
 from pancad.geometry.line_segment import LineSegment
@@ -786,6 +790,8 @@ class TestCollinear(unittest.TestCase):
             [(0, 0), (1, 1), (2, 2), True],
             [(0, 0), (1, 1), (0, 1), False],
             [(0, 0), (1, 1), (2, 2), (3, 3), (4, 4), True],
+            [(0, 1), (1, 1), (2, 1), True],
+            [(0, 1), (1, 1), (2, 1.5), False],
         ]
         self.constructors = [Line.from_two_points, LineSegment]
         self.tests = [
@@ -917,5 +923,137 @@ class TestProjectOntoPlane(unittest.TestCase):
         line_project = spatial_relations.project(line, pln)
         self.assertTrue(line_project.is_equal(Point(0, 0, 0)))
 
+class TestPairwise(unittest.TestCase):
+    
+    def setUp(self):
+        self.segments = [
+            LineSegment((0, 0), (2, 2)),
+            LineSegment((0, 2), (2, 0)),
+            LineSegment((3, 0), (4, 0)),
+            LineSegment((1, 1), (1, 5)),
+            LineSegment((5, 5), (6, 6)),
+        ]
+    
+    def test_coincident_and_distance(self):
+        points = [Point(0, 0), Point(3, 4), Point(3, 4)]
+        np.testing.assert_array_equal(
+            spatial_relations.pairwise_coincident(points, np.array(points)),
+            [[True, False, False], [False, True, True], [False, True, True]]
+        )
+        distances = spatial_relations.pairwise_distance(points, points)
+        self.assertEqual(distances.shape, (3, 3))
+        self.assertAlmostEqual(distances[0, 1], 5)
+    
+    def test_matches_single_dispatch(self):
+        relations = [
+            (spatial_relations.pairwise_parallel, spatial_relations.parallel),
+            (spatial_relations.pairwise_perpendicular, spatial_relations.perpendicular),
+        ]
+        for pairwise, single in relations:
+            result = pairwise(self.segments, self.segments)
+            for (i, seg1), (j, seg2) in itertools.product(enumerate(self.segments),
+                                                          repeat=2):
+                with self.subTest(func=single.__name__, seg1=seg1, seg2=seg2):
+                    self.assertEqual(result[i, j], single(seg1, seg2))
+    
+    def test_angle_matches_single_dispatch(self):
+        result = spatial_relations.pairwise_angle_between(
+            self.segments, self.segments, convention=AC.SIGN_180
+        )
+        for (i, seg1), (j, seg2) in itertools.product(enumerate(self.segments), repeat=2):
+            with self.subTest(seg1=seg1, seg2=seg2):
+                expected = spatial_relations.get_angle_between(seg1, seg2,
+                                                               convention=AC.SIGN_180)
+                self.assertAlmostEqual(result[i, j], expected, ROUNDING_PLACES)
+    
+    def test_intersect_bounded(self):
+        intersects, points = spatial_relations.pairwise_intersect(self.segments,
+                                                                  self.segments)
+        expected = [
+            [False, True, False, True, False],
+            [True, False, False, True, False],
+            [False, False, False, False, False],
+            [True, True, False, False, False],
+            [False, False, False, False, False],
+        ]
+        np.testing.assert_array_equal(intersects, expected)
+        np.testing.assert_array_almost_equal(points[0, 1], (1, 1))
+        self.assertTrue(np.all(np.isnan(points[0, 2])))
+    
+    def test_intersect_unbounded_matches_get_intersect(self):
+        lines = [Line.from_two_points((0, 0), (1, 1)), *self.segments[1:4]]
+        intersects, points = spatial_relations.pairwise_intersect(lines, lines,
+                                                                  bounded=False)
+        for (i, geo1), (j, geo2) in itertools.product(enumerate(lines), repeat=2):
+            with self.subTest(geo1=geo1, geo2=geo2):
+                expected = spatial_relations.get_intersect(geo1, geo2)
+                self.assertEqual(intersects[i, j], expected is not None)
+                if expected is not None:
+                    np.testing.assert_array_almost_equal(points[i, j], tuple(expected))
+    
+    def test_intersect_3d_array_input(self):
+        segments = np.array([
+            [(0, 0, 0), (1, 1, 1)],
+            [(1, 0, 0), (0, 1, 1)],
+            [(0, 0, 5), (1, 0, 5)],
+        ])
+        intersects, points = spatial_relations.pairwise_intersect(segments, segments)
+        np.testing.assert_array_equal(
+            intersects, [[False, True, False], [True, False, False], [False, False, False]]
+        )
+        np.testing.assert_array_almost_equal(points[0, 1], (0.5, 0.5, 0.5))
+    
+    def test_dimension_mismatch(self):
+        with self.assertRaises(ValueError):
+            spatial_relations.pairwise_distance([Point(0, 0)], [Point(0, 0, 0)])
+
+class TestCurveContacts(unittest.TestCase):
+    
+    def setUp(self):
+        self.diagonal = LineSegment((0, 0), (2, 2))
+        self.cross = LineSegment((0, 2), (2, 0))
+        self.corner = LineSegment((2, 2), (2, 4))
+        self.stem = LineSegment((1, 1), (3, -1))
+        self.circle = Circle((0, 0), 1)
+        self.fillet = CircularArc.from_angles((1, 1), 1, -math.pi / 2, 0, False)
+    
+    def test_crosses(self):
+        tests = [
+            (self.diagonal, self.cross, True),
+            (self.diagonal, self.corner, False),
+            (self.diagonal, self.stem, False),
+            (self.circle, LineSegment((-2, 0.5), (2, 0.5)), True),
+            (self.diagonal, LineSegment((1, 1), (3, 3)), False),
+        ]
+        for geo1, geo2, expected in tests:
+            with self.subTest(geo1=geo1, geo2=geo2):
+                self.assertEqual(spatial_relations.crosses(geo1, geo2), expected)
+    
+    def test_touches(self):
+        tests = [
+            (self.diagonal, self.cross, False),
+            (self.diagonal, self.corner, True),
+            (self.diagonal, self.stem, True),
+            (self.circle, LineSegment((-2, 1), (2, 1)), False),
+            (self.circle, LineSegment((1, 0), (2, 0)), True),
+            (self.diagonal, LineSegment((5, 5), (6, 6)), False),
+        ]
+        for geo1, geo2, expected in tests:
+            with self.subTest(geo1=geo1, geo2=geo2):
+                self.assertEqual(spatial_relations.touches(geo1, geo2), expected)
+    
+    def test_tangent(self):
+        tests = [
+            (self.circle, LineSegment((-2, 1), (2, 1)), True),
+            (self.circle, LineSegment((-2, 0.5), (2, 0.5)), False),
+            (self.circle, Circle((3, 0), 2), True),
+            (self.circle, Circle((0.5, 0), 0.5), True),
+            (LineSegment((0, 0), (1, 0)), self.fillet, True),
+            (LineSegment((0, 0), (1, 0)), LineSegment((1, 0), (1, 1)), False),
+        ]
+        for geo1, geo2, expected in tests:
+            with self.subTest(geo1=geo1, geo2=geo2):
+                self.assertEqual(spatial_relations.tangent(geo1, geo2), expected)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""Tests for the sweep-line junction finder and closed profile checks."""
+from __future__ import annotations
+
+import itertools
+import math
+import random
+
+import pytest
+
+from pancad.geometry import sweep_line
+from pancad.geometry.circle import Circle
+from pancad.geometry.circular_arc import CircularArc
+from pancad.geometry.line import Line
+from pancad.geometry.line_segment import LineSegment
+from tests.testing_utils import sketch_gen
+
+def _slot() -> list[LineSegment | CircularArc]:
+    """Returns a closed slot profile of two lines and two semicircles."""
+    return [
+        LineSegment((0, 0), (4, 0)),
+        CircularArc.from_angles((4, 1), 1, -math.pi / 2, math.pi / 2, False),
+        LineSegment((4, 2), (0, 2)),
+        CircularArc.from_angles((0, 1), 1, math.pi / 2, -math.pi / 2, False),
+    ]
+
+def _segments_cross(segment_a: LineSegment, segment_b: LineSegment) -> bool:
+    """Returns whether the interiors of two line segments cross."""
+    (ax, ay), (bx, by) = segment_a.start, segment_b.start
+    ux, uy = segment_a.end[0] - ax, segment_a.end[1] - ay
+    vx, vy = segment_b.end[0] - bx, segment_b.end[1] - by
+    denominator = ux * vy - uy * vx
+    t = ((bx - ax) * vy - (by - ay) * vx) / denominator
+    u = ((bx - ax) * uy - (by - ay) * ux) / denominator
+    return 0 < t < 1 and 0 < u < 1
+
+class TestCheckProfile:
+    """Tests for classifying profile defects."""
+
+    @pytest.mark.parametrize(
+        "sketch", [sketch_gen.square, sketch_gen.rounded_square, sketch_gen.circle]
+    )
+    def test_closed_sketches(self, sketch) -> None:
+        """Test the generated test sketches are closed profiles."""
+        assert sweep_line.is_closed_profile(sketch())
+
+    def test_closed_slot(self) -> None:
+        """Test a profile mixing lines and arcs that is split at its extremes."""
+        report = sweep_line.check_profile(_slot())
+        assert report.is_closed
+        assert len(report.geometry) == 4
+
+    def test_open_endpoints(self) -> None:
+        """Test the unconnected ends of a polyline are reported."""
+        report = sweep_line.check_profile(
+            [LineSegment((0, 0), (1, 0)), LineSegment((1, 0), (1, 1))]
+        )
+        assert not report.is_closed
+        assert [j.point for j in report.open_endpoints] == [(0.0, 0.0), (1.0, 1.0)]
+
+    def test_nearly_coincident_endpoints(self) -> None:
+        """Test endpoints closer than the tolerance are treated as connected."""
+        triangle = [
+            LineSegment((0, 0), (1, 0)),
+            LineSegment((1, 1e-12), (0, 1)),
+            LineSegment((0, 1), (0, 0)),
+        ]
+        assert sweep_line.is_closed_profile(triangle)
+        assert not sweep_line.is_closed_profile(triangle, abs_tol=1e-15, rel_tol=0)
+
+    def test_grid(self) -> None:
+        """Test crossings and T-junctions are counted for a 6x6 line grid."""
+        grid = [LineSegment((0, i), (5, i)) for i in range(6)]
+        grid += [LineSegment((i, 0), (i, 5)) for i in range(6)]
+        report = sweep_line.check_profile(grid)
+        assert (len(report.crossings), len(report.t_junctions)) == (16, 16)
+        assert not report.open_endpoints and not report.branches
+
+    def test_branch(self) -> None:
+        """Test three curve ends meeting at one point are reported as a branch."""
+        profile = [*sketch_gen.square().geometry_system.geometry,
+                   LineSegment((0, 0), (-1, -1)), LineSegment((-1, -1), (0, 0))]
+        report = sweep_line.check_profile(profile)
+        assert [j.point for j in report.branches] == [(0.0, 0.0)]
+
+    def test_overlap(self) -> None:
+        """Test collinear curves sharing a stretch are reported as overlaps."""
+        report = sweep_line.check_profile(
+            [LineSegment((0, 0), (2, 0)), LineSegment((1, 0), (3, 0)),
+             LineSegment((3, 0), (3, 1)), LineSegment((3, 1), (0, 0))]
+        )
+        assert report.overlaps
+        assert not report.is_closed
+
+    def test_unsupported(self) -> None:
+        """Test geometry other than 2D curves raises errors."""
+        with pytest.raises(NotImplementedError):
+            sweep_line.check_profile([Line.from_two_points((0, 0), (1, 1))])
+        with pytest.raises(ValueError):
+            sweep_line.check_profile([LineSegment((0, 0, 0), (1, 1, 1))])
+
+class TestSweepJunctions:
+    """Tests for the junctions found by the sweep."""
+
+    def test_star(self) -> None:
+        """Test many segments crossing at a single point give one junction."""
+        star = [LineSegment((math.cos(t), math.sin(t)), (-math.cos(t), -math.sin(t)))
+                for t in (i * math.pi / 8 for i in range(8))]
+        crossings = [j for j in sweep_line.sweep_junctions(star).junctions
+                     if j.interiors]
+        assert len(crossings) == 1
+        assert crossings[0].point == pytest.approx((0, 0), abs=1e-12)
+        assert len(crossings[0].interiors) == 8
+
+    def test_circles(self) -> None:
+        """Test circle/circle and circle/vertical line intersections."""
+        result = sweep_line.sweep_junctions(
+            [Circle((0, 0), 1), Circle((1, 0), 1), LineSegment((-1, -1), (-1, 1))]
+        )
+        points = [j.point for j in result.junctions if len(j.interiors) == 2]
+        expected = [(-1, 0), (0.5, -math.sqrt(3) / 2), (0.5, math.sqrt(3) / 2)]
+        assert points == pytest.approx(expected)
+
+    def test_matches_pairwise(self) -> None:
+        """Test the sweep finds the same crossing pairs as checking every pair
+        of random line segments.
+        """
+        rng = random.Random(0)
+        segments = [LineSegment((rng.uniform(0, 10), rng.uniform(0, 10)),
+                                (rng.uniform(0, 10), rng.uniform(0, 10)))
+                    for _ in range(60)]
+        index = {id(segment): i for i, segment in enumerate(segments)}
+        found = set()
+        for junction in sweep_line.sweep_junctions(segments).junctions:
+            owners = sorted(index[id(g)] for g in junction.interiors)
+            found.update(itertools.combinations(owners, 2))
+        expected = {(i, j) for (i, a), (j, b)
+                    in itertools.combinations(enumerate(segments), 2)
+                    if _segments_cross(a, b)}
+        assert found == expected
@@ -0,0 +1,136 @@
+"""Tests for batch converting FreeCAD files through pancad."""
+from __future__ import annotations
+
+from pathlib import Path
+import json
+
+import pytest
+
+import pancad
+from pancad import cli
+from pancad.filetypes.part_file import PartFile
+from pancad.io.freecad import _base
+from pancad.io.freecad._convert import LOG_NAME, read_convert_log
+
+def _fake_read_freecad(path: Path) -> PartFile:
+    if "bad" in path.stem:
+        raise ValueError("Unsupported feature", path)
+    return PartFile(path.stem)
+
+@pytest.fixture(autouse=True)
+def fake_reader(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace read_freecad with a fake that fails on paths named bad for the
+    files read in this process. Worker processes are not patched under spawn,
+    so pooled conversions pass the fake as their read function instead.
+    """
+    monkeypatch.setattr(_base, "read_freecad", _fake_read_freecad)
+
+@pytest.fixture(name="inputs")
+def fixture_inputs(tmp_path: Path) -> Path:
+    """Returns a directory of empty FCStd files, two of them named bad."""
+    inputs = tmp_path / "inputs"
+    for name in ["a", "bad_b", "sub/c", "sub/bad_d", "e"]:
+        path = inputs / f"{name}.FCStd"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    (inputs / "notes.txt").touch()
+    return inputs
+
+def _read_log(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+class TestConvertFreeCADMany:
+    """Tests for the pipelined batch converter."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_convert(self, inputs: Path, tmp_path: Path, workers: int):
+        """Test every file is converted or has its failure captured, keeping its
+        path relative to the input directory.
+        """
+        output = tmp_path / "output"
+        results = pancad.convert_freecad_many([inputs], output, workers,
+                                              max_pending=1,
+                                              read=_fake_read_freecad)
+        by_name = {result.source.stem: result for result in results}
+        assert sorted(by_name) == ["a", "bad_b", "bad_d", "c", "e"]
+        assert [name for name, result in sorted(by_name.items())
+                if result.ok] == ["a", "c", "e"]
+        assert by_name["bad_d"].error.startswith("ValueError: ")
+        assert by_name["c"].destination == output / "sub" / "c.FCStd"
+        assert all(result.destination.is_file()
+                   for result in results if result.ok)
+        assert not (output / "bad_b.FCStd").exists()
+
+    def test_log(self, inputs: Path, tmp_path: Path):
+        """Test every result is logged in order with failure tracebacks."""
+        output = tmp_path / "output"
+        results = pancad.convert_freecad_many([inputs], output, 1)
+        lines = _read_log(output / LOG_NAME)
+        assert [line["source"] for line in lines] == [
+            str(result.source) for result in results
+        ]
+        assert [line["ok"] for line in lines] == [r.ok for r in results]
+        assert "Traceback" in lines[1]["traceback"]
+
+    def test_resume(self, inputs: Path, tmp_path: Path):
+        """Test resuming only converts the files that have not succeeded."""
+        output = tmp_path / "output"
+        log = output / LOG_NAME
+        first = pancad.convert_freecad_many([inputs / "a.FCStd"], output, 1)
+        with open(log, "a", encoding="utf-8") as file:
+            file.write('{"source": "cut off')
+        results = pancad.convert_freecad_many([inputs], output, 1, resume=True)
+        assert [result.source.stem for result in results] == [
+            "bad_b", "e", "bad_d", "c"
+        ]
+        assert read_convert_log(log) == {
+            result.source for result in first + results if result.ok
+        }
+
+    def test_resolved_sources(self, inputs: Path, tmp_path: Path,
+                              monkeypatch: pytest.MonkeyPatch):
+        """Test resuming skips converted files given by a different path."""
+        output = tmp_path / "output"
+        monkeypatch.chdir(inputs)
+        pancad.convert_freecad_many(["a.FCStd"], output, 1)
+        results = pancad.convert_freecad_many([inputs / "a.FCStd"], output, 1,
+                                              resume=True)
+        assert not results
+        assert read_convert_log(output / LOG_NAME) == {
+            (inputs / "a.FCStd").resolve()
+        }
+
+    def test_progress(self, inputs: Path, tmp_path: Path):
+        """Test progress is reported once per file with the total count."""
+        calls = []
+        pancad.convert_freecad_many([inputs], tmp_path / "output", 2,
+                                    progress=lambda *args: calls.append(args),
+                                    read=_fake_read_freecad)
+        assert sorted(done for done, _, _ in calls) == [1, 2, 3, 4, 5]
+        assert {total for _, total, _ in calls} == {5}
+
+    def test_missing_input(self, tmp_path: Path):
+        """Test an input path that does not exist raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            pancad.convert_freecad_many([tmp_path / "missing"], tmp_path, 1)
+
+class TestCLI:
+    """Tests for the pancad console script."""
+
+    def test_convert(self, inputs: Path, tmp_path: Path,
+                     capsys: pytest.CaptureFixture):
+        """Test converting a file writes its output, log and summary."""
+        output = tmp_path / "output"
+        log = tmp_path / "log.jsonl"
+        code = cli.main(["convert", str(inputs / "a.FCStd"), "-o", str(output),
+                         "-j", "1", "--log", str(log)])
+        assert code == 0
+        assert (output / "a.FCStd").is_file()
+        assert len(_read_log(log)) == 1
+        assert "Converted 1 of 1 files" in capsys.readouterr().err
+
+    def test_convert_failures(self, inputs: Path, tmp_path: Path):
+        """Test the exit code is 1 when any file fails to convert."""
+        code = cli.main(["convert", str(inputs), "-o", str(tmp_path / "out"),
+                         "-j", "1", "-q"])
+        assert code == 1
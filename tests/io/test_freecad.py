@@ -0,0 +1,58 @@
+"""Tests for reading FreeCAD files through pancad's I/O api."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import pancad
+from pancad.filetypes.part_file import PartFile
+from pancad.io.freecad import _base
+from pancad.io.freecad import ReadResult
+
+FREECAD_DATA = Path(__file__).parents[1] / "cad" / "freecad" / "data"
+
+def _fake_read_freecad(path: Path) -> PartFile:
+    if "bad" in path.stem:
+        raise ValueError("Unsupported feature", path)
+    return PartFile(path.stem)
+
+class TestReadFreeCADMany:
+    """Tests for reading batches of FreeCAD files."""
+
+    paths = ["a.FCStd", "bad_b.FCStd", "c.FCStd", "bad_d.FCStd", "e.FCStd"]
+
+    @pytest.fixture(autouse=True)
+    def fake_reader(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace read_freecad with a fake that fails on paths named bad."""
+        monkeypatch.setattr(_base, "read_freecad", _fake_read_freecad)
+
+    def test_in_process(self) -> None:
+        """Test results are in order and failed reads do not stop the batch."""
+        results = pancad.read_freecad_many(self.paths, workers=1)
+        assert [r.path for r in results] == [Path(p) for p in self.paths]
+        assert [r.ok for r in results] == [True, False, True, False, True]
+        assert [r.part_file.name for r in results if r.ok] == ["a", "c", "e"]
+        assert results[1].error.startswith("ValueError: ")
+        assert "Traceback" in results[1].traceback
+
+    def test_progress(self) -> None:
+        """Test the progress callback is called once per file."""
+        calls = []
+        pancad.read_freecad_many(self.paths, workers=1,
+                                 progress=lambda *args: calls.append(args))
+        assert [(done, total) for done, total, _ in calls] == [(i, 5) for i in range(1, 6)]
+        assert all(isinstance(result, ReadResult) for *_, result in calls)
+
+def test_process_pool_order() -> None:
+    """Test the pool returns a result for each path in order. The reads may fail
+    when FreeCAD is not available, but the failures must be captured.
+    """
+    paths = [FREECAD_DATA / "missing.FCStd", *sorted(FREECAD_DATA.glob("*.FCStd"))]
+    calls = []
+    results = pancad.read_freecad_many(paths, workers=2,
+                                       progress=lambda *args: calls.append(args))
+    assert [r.path for r in results] == paths
+    assert not results[0].ok
+    assert all(r.ok == (r.part_file is not None) for r in results)
+    assert sorted(done for done, _, _ in calls) == list(range(1, len(paths) + 1))
@@ -0,0 +1,64 @@
+"""Tests for pancad's size-bounded on-disk pickle cache."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pancad.utils.disk_cache import DiskCache
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path: Path) -> DiskCache:
+    """Returns an empty cache in a temporary directory."""
+    return DiskCache(tmp_path / "cache", max_bytes=10_000)
+
+def _set_last_used(cache: DiskCache, key: str, time: float) -> None:
+    os.utime(cache.directory / f"{key}{cache.suffix}", (time, time))
+
+class TestDiskCache:
+    """Tests for storing, reading, and evicting cached values."""
+
+    def test_round_trip(self, cache: DiskCache) -> None:
+        """Test stored values are read back equal and missing keys return the
+        default.
+        """
+        assert cache.get("missing") is None
+        assert cache.get("missing", 5) == 5
+        cache.put("key", {"a": [1, 2, 3]})
+        assert "key" in cache
+        assert cache.get("key") == {"a": [1, 2, 3]}
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self, cache: DiskCache) -> None:
+        """Test the least recently used values are deleted past the max size."""
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, bytes(4000))
+            _set_last_used(cache, key, 1000 + i)
+        assert "a" not in cache
+        assert "b" in cache and "c" in cache
+        cache.get("b") # b is now the most recently used
+        _set_last_used(cache, "c", 1005)
+        cache.put("d", bytes(4000))
+        assert "c" not in cache
+        assert "b" in cache and "d" in cache
+
+    def test_corrupt_entry(self, cache: DiskCache) -> None:
+        """Test unreadable values are deleted and treated as missing."""
+        cache.put("key", [1])
+        (cache.directory / f"key{cache.suffix}").write_bytes(b"not a pickle")
+        assert cache.get("key", "default") == "default"
+        assert "key" not in cache
+
+    def test_unpicklable_value(self, cache: DiskCache) -> None:
+        """Test a failed write does not leave partial files behind."""
+        with pytest.raises(Exception):
+            cache.put("key", lambda: None)
+        assert not list(cache.directory.iterdir())
+
+    def test_clear(self, cache: DiskCache) -> None:
+        """Test clearing deletes every value."""
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.clear()
+        assert len(cache) == 0
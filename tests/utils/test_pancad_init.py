@@ -1,6 +1,7 @@
 """Tests for initializing pancad and its configuration directories."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 import shutil
 
@@ -37,3 +38,18 @@ class TestDeletedUserDir:
         test_cache_dict = {"test": {"settings": "here"}}
         initialize.write_cache(test_cache_dict)
         assert initialize.get_cache() == test_cache_dict
+
+    def test_write_cache_replaces_file(self) -> None:
+        """Test that the cache is replaced without leaving temporary files."""
+        initialize.write_cache({"first": {}})
+        initialize.write_cache({"second": {}})
+        assert initialize.get_cache() == {"second": {}}
+        cache_path = initialize.get_cache_path()
+        assert not list(cache_path.parent.glob(f".{cache_path.name}*"))
+
+    def test_concurrent_write_cache(self) -> None:
+        """Test that concurrent writers never leave a partially written cache."""
+        caches = [{"writer": {str(i): "x" * 1000}} for i in range(8)]
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(initialize.write_cache, caches * 10))
+        assert initialize.get_cache() in caches
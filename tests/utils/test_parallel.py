@@ -0,0 +1,38 @@
+"""Tests for running work on many files in parallel processes."""
+from __future__ import annotations
+
+from pathlib import Path
+import threading
+
+import pytest
+
+from pancad.utils.parallel import run_parallel
+
+def _stem(path: Path) -> str:
+    return path.stem
+
+def _unpicklable(_: Path) -> threading.Lock:
+    return threading.Lock()
+
+def _error_result(path: Path, exc: Exception) -> str:
+    return f"{path.stem} failed: {type(exc).__name__}"
+
+class TestRunParallel:
+    """Tests for calling a function with each path in worker processes."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_order(self, workers: int) -> None:
+        """Test results are in path order with progress reported per path."""
+        calls = []
+        results = run_parallel(_stem, ["a.txt", "b.txt", "c.txt"], workers,
+                               lambda *args: calls.append(args), _error_result)
+        assert results == ["a", "b", "c"]
+        assert sorted(done for done, _, _ in calls) == [1, 2, 3]
+        assert {total for _, total, _ in calls} == {3}
+
+    def test_worker_failure(self) -> None:
+        """Test a result that cannot be returned from its worker process is
+        replaced by the error result.
+        """
+        assert run_parallel(_unpicklable, ["a.txt"], 2, None,
+                            _error_result) == ["a failed: TypeError"]
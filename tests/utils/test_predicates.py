@@ -0,0 +1,109 @@
+"""Tests for pancad's adaptive precision geometric predicates."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pancad.utils import predicates
+
+if TYPE_CHECKING:
+    from pancad.utils.pancad_types import SpaceVector
+
+class TestOrientation:
+    """Tests for the orient2d and orient3d sign predicates."""
+
+    @pytest.mark.parametrize(
+        "pa, pb, pc, sign",
+        [
+            [(0, 0), (1, 0), (0, 1), 1],
+            [(0, 0), (0, 1), (1, 0), -1],
+            [(0, 0), (1, 1), (2, 2), 0],
+            [(0, 1), (1, 1), (5, 1), 0],
+        ]
+    )
+    def test_orient2d(self, pa: SpaceVector, pb: SpaceVector, pc: SpaceVector,
+                      sign: int) -> None:
+        """Test orient2d returns values with the expected orientation sign."""
+        result = predicates.orient2d(pa, pb, pc)
+        assert (result > 0) - (result < 0) == sign
+
+    def test_orient2d_near_degenerate(self) -> None:
+        """Test orient2d returns the exact sign where the naive float determinant rounds to zero.
+        The points are almost on the line y = x, so only the exact stage can tell them apart.
+        """
+        pa, pb, pc = (0.5, 0.5 + 2.0**-53), (12.0, 12.0), (24.0, 24.0)
+        naive = (pa[0] - pc[0]) * (pb[1] - pc[1]) - (pa[1] - pc[1]) * (pb[0] - pc[0])
+        assert naive == 0
+        assert predicates.orient2d(pa, pb, pc) > 0
+        assert predicates.orient2d(pa=pb, pb=pa, pc=pc) < 0
+        assert predicates.orient2d((0.5, 0.5), pb, pc) == 0
+
+    @pytest.mark.parametrize(
+        "pd, sign",
+        [
+            [(0, 0, -1), 1],
+            [(0, 0, 1), -1],
+            [(5, 7, 0), 0],
+        ]
+    )
+    def test_orient3d(self, pd: SpaceVector, sign: int) -> None:
+        """Test orient3d returns the side of the xy plane the point is on."""
+        result = predicates.orient3d((0, 0, 0), (1, 0, 0), (0, 1, 0), pd)
+        assert (result > 0) - (result < 0) == sign
+
+class TestRelations:
+    """Tests for the tolerance aware relation predicates."""
+
+    @pytest.mark.parametrize(
+        "points, expected",
+        [
+            [[(0, 0), (1, 1), (2, 2)], True],
+            [[(0, 1), (1, 1), (2, 1)], True],
+            [[(0, 0), (1, 1), (0, 1)], False],
+            [[(1, 1), (1, 1), (1, 1)], True],
+            [[(1, 1, 1), (2, 2, 2), (3, 3, 3)], True],
+            [[(1, 1, 1), (2, 2, 2), (3, 3, 4)], False],
+        ]
+    )
+    def test_collinear(self, points: list[SpaceVector], expected: bool) -> None:
+        """Test collinear points are found regardless of whether the line passes the origin."""
+        assert predicates.collinear(*points) == expected
+
+    @pytest.mark.parametrize(
+        "points, expected",
+        [
+            [[(0, 0, 1), (1, 0, 1), (0, 1, 1), (5, 5, 1)], True],
+            [[(0, 0, 1), (1, 0, 1), (0, 1, 1), (5, 5, 2)], False],
+            [[(0, 0, 0), (1, 1, 1), (2, 2, 2), (3, 3, 3)], True],
+        ]
+    )
+    def test_coplanar(self, points: list[SpaceVector], expected: bool) -> None:
+        """Test coplanar points are found regardless of whether the plane passes the origin."""
+        assert predicates.coplanar(*points) == expected
+
+    @pytest.mark.parametrize(
+        "vector_a, vector_b, codirectional, expected",
+        [
+            [(1, 0), (2, 0), False, True],
+            [(1, 0), (-2, 0), False, True],
+            [(1, 0), (-2, 0), True, False],
+            [(1, 1, 0), (1, 0, 0), False, False],
+        ]
+    )
+    def test_parallel(self, vector_a: SpaceVector, vector_b: SpaceVector,
+                      codirectional: bool, expected: bool) -> None:
+        """Test parallel checks with and without requiring the same direction."""
+        assert predicates.parallel(vector_a, vector_b, codirectional=codirectional) == expected
+
+    def test_tolerances(self) -> None:
+        """Test that the relative tolerance is scaled by the magnitude of the inputs."""
+        assert not predicates.perpendicular((1e6, 1.0), (0.0, 1e6))
+        assert predicates.perpendicular((1e6, 1e-4), (0.0, 1e6), rel_tol=1e-9)
+        assert predicates.on_line((3.0, 1e-10), (0.0, 0.0), (1.0, 0.0), abs_tol=1e-9)
+        assert not predicates.on_line((3.0, 1e-10), (0.0, 0.0), (1.0, 0.0))
+
+    def test_dimension_mismatch(self) -> None:
+        """Test that mixing 2D and 3D inputs raises an error."""
+        with pytest.raises(ValueError):
+            predicates.parallel((1, 0), (1, 0, 0))
@@ -12,9 +12,9 @@ from pancad.utils import trigonometry as trig
 from pancad.constants import AngleConvention as AC
 
 if TYPE_CHECKING:
-    from typing import Type
+    from typing import Literal, Type
 
-    from pancad.utils.pancad_types import SpaceVector
+    from pancad.utils.pancad_types import Space3DVector, SpaceVector
 
 class TestVectors:
     """Tests for vector operation helpers"""
@@ -167,6 +167,123 @@ class TestRotationMatrices:
         expected = trig.rotation_z(angle)
         np.testing.assert_array_equal(matrix, expected)
 
+    def test_rotation_array(self) -> None:
+        """Test an array of angles returns the stack of matching matrices."""
+        angles = np.radians([0, 90, 180, 270, 33])
+        arounds: list[Literal["x", "2"] | Space3DVector] = ["x", "2", (1, 2, 3)]
+        for around in arounds:
+            stack = trig.rotation(angles, around)
+            expected = [trig.rotation(angle, around) for angle in angles]
+            np.testing.assert_array_almost_equal(stack, expected)
+
+    def test_rotation_axes_array(self) -> None:
+        """Test an array of axes broadcasts against the angles."""
+        axes = np.array([(1, 0, 0), (0, 2, 0), (0, 0, 3)])
+        stack = trig.rotation(radians(30), axes)
+        expected = [trig.rotation(radians(30), tuple(axis)) for axis in axes]
+        np.testing.assert_array_almost_equal(stack, expected)
+
+    def test_multi_rotation_array(self) -> None:
+        """Test multi_rotation broadcasts array and scalar angles together."""
+        yaws = np.radians([0, 90, 180])
+        stack = trig.multi_rotation("zyx", yaws, radians(10), 0)
+        expected = [trig.multi_rotation("zyx", yaw, radians(10), 0) for yaw in yaws]
+        np.testing.assert_array_almost_equal(stack, expected)
+
+    def test_cached_matrices_are_copies(self) -> None:
+        """Test modifying a returned matrix does not change the cached matrix."""
+        matrix = trig.rotation(radians(90), "z")
+        matrix[:] = 0
+        assert trig.rotation(radians(90), "z")[2, 2] == 1
+        matrix = trig.yaw_pitch_roll(radians(90), 0, 0)
+        matrix[:] = 0
+        assert trig.yaw_pitch_roll(radians(90), 0, 0)[2, 2] == 1
+
+class TestBatchConversions:
+    """Tests for converting arrays of vectors at once."""
+
+    cartesian_3d = np.array([(1, 0, 0), (0, 0, 2), (0, 0, -1), (0, 0, 0), (1, 2, 3),
+                             (-1, -1, -1)], dtype=np.float64)
+    cartesian_2d = np.array([(1, 0), (0, 0), (-1, 1), (3, -4)], dtype=np.float64)
+
+    def test_cartesian_to_spherical(self) -> None:
+        """Test each row matches the single vector conversion."""
+        result = trig.cartesian_to_spherical(self.cartesian_3d)
+        expected = [tuple(trig.cartesian_to_spherical(tuple(row)))
+                    for row in self.cartesian_3d]
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_spherical_round_trip(self) -> None:
+        """Test converting an array to spherical and back is lossless."""
+        spherical = trig.cartesian_to_spherical(self.cartesian_3d)
+        np.testing.assert_array_almost_equal(trig.spherical_to_cartesian(spherical),
+                                             self.cartesian_3d)
+
+    def test_polar_round_trip(self) -> None:
+        """Test converting an array to polar and back is lossless."""
+        polar = trig.cartesian_to_polar(self.cartesian_2d)
+        expected = [tuple(trig.cartesian_to_polar(tuple(row))) for row in self.cartesian_2d]
+        np.testing.assert_array_almost_equal(polar, expected)
+        np.testing.assert_array_almost_equal(trig.polar_to_cartesian(polar),
+                                             self.cartesian_2d)
+
+    @pytest.mark.parametrize(
+        "spherical",
+        [
+            [(1, 0, 0), (-1, 0, 0)],
+            [(1, 0, 0), (1, np.nan, 1)],
+            [(1, 0, 4), (1, 0, 0)],
+        ]
+    )
+    def test_spherical_errors(self, spherical: list[SpaceVector]) -> None:
+        """Test invalid rows raise the same errors as single vectors."""
+        with pytest.raises(ValueError):
+            trig.spherical_to_cartesian(np.array(spherical, dtype=np.float64))
+
+    @pytest.mark.parametrize("convention", [AC.PLUS_PI, AC.SIGN_180, AC.PLUS_TAU])
+    @pytest.mark.parametrize("opposite", [False, True])
+    def test_get_vector_angle(self, convention: AC, opposite: bool) -> None:
+        """Test an array of vectors broadcast against one vector matches the
+        single vector angles.
+        """
+        vectors = np.array([(0, 1), (-1, 1), (-1, -1), (1, -2)], dtype=np.float64)
+        result = trig.get_vector_angle(vectors, (1, 0), opposite=opposite,
+                                       convention=convention)
+        expected = [trig.get_vector_angle(tuple(row), (1, 0), opposite=opposite,
+                                          convention=convention)
+                    for row in vectors]
+        np.testing.assert_array_almost_equal(result, expected)
+
+    @pytest.mark.parametrize("convention", [AC.SIGN_PI, AC.SIGN_180, AC.PLUS_TAU])
+    @pytest.mark.parametrize("opposite", [False, True])
+    def test_get_vector_angle_collinear(self, convention: AC, opposite: bool
+                                        ) -> None:
+        """Test parallel and anti-parallel vectors, whose cross products are
+        only rounding error, get the same signed angle as single vectors.
+        """
+        vectors = np.array([(-3.656357558875988, 3.4743373693723267),
+                            (-2.449309742605783, -0.04564912908059071),
+                            (4.014274576114836, -4.694100169664464),
+                            (0.4141247279349658, 4.391491627785106),
+                            (1, 0)], dtype=np.float64)
+        others = np.array([(14.049537952614175, -13.35012616933118),
+                           (5.639550910846966, 0.1051074035299141),
+                           (0.901946154593153, -1.0546925769590938),
+                           (0.814956368772903, 8.642019732370054),
+                           (-2, 0)], dtype=np.float64)
+        result = trig.get_vector_angle(vectors, others, opposite=opposite,
+                                       convention=convention)
+        expected = [trig.get_vector_angle(tuple(row), tuple(other),
+                                          opposite=opposite,
+                                          convention=convention)
+                    for row, other in zip(vectors, others)]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_get_vector_angle_mismatch(self) -> None:
+        """Test mixing 2D and 3D vector arrays raises a TypeError."""
+        with pytest.raises(TypeError):
+            trig.get_vector_angle(np.zeros((2, 2)), np.ones((2, 3)))
+
 class TestDecimalPrecision:
     """Tests for functions intended to provide extended precision compared to 64 bit floats."""
 